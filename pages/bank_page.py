@@ -7,6 +7,8 @@ Handles bank account management, transaction views, and reconciliation features
 from playwright.async_api import Page, expect
 import asyncio
 
+from utils.routes import goto_route
+
 
 class BankPage:
     """Page object for Bank section under Reconciliation"""
@@ -49,9 +51,12 @@ class BankPage:
         self.unreconciled_balance = page.locator(".unreconciled-balance, [data-testid*='unreconciled']")
     
     async def navigate_to_bank(self):
-        """Navigate to bank section from reconciliation page"""
+        """Navigate to bank section by its deep link, else via the reconciliation tabs"""
         try:
-            # First navigate to reconciliation
+            if await goto_route(self.page, self):
+                return True
+            
+            # Route not served - open reconciliation and use its Bank tab
             await self._navigate_to_reconciliation()
             
             # Wait a bit for reconciliation page to load
@@ -100,64 +105,8 @@ class BankPage:
             return False
     
     async def _navigate_to_reconciliation(self):
-        """Navigate to reconciliation tab using the working pattern from successful tests"""
-        try:
-            # Check if we're already on reconciliation page
-            current_url = self.page.url
-            if "reconciliation" in current_url.lower():
-                print("✅ Already on reconciliation page")
-                return True
-            
-            # Use the working pattern from successful tab navigation tests
-            await asyncio.sleep(3)
-            
-            # Handle menu opening with better error handling
-            try:
-                logo = self.page.locator("svg.viewz-logo")
-                box = await logo.bounding_box()
-                if box:
-                    await self.page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
-                await asyncio.sleep(1)
-
-                # Try to click pin button with better handling
-                pin_button = self.page.locator("button:has(svg.lucide-pin)")
-                if await pin_button.is_visible():
-                    # Use force click to bypass interception issues
-                    await pin_button.click(force=True)
-                    await asyncio.sleep(1)
-                    print("✅ Pin button clicked (forced)")
-                else:
-                    print("⚠️ Pin button not visible, trying to continue")
-                    
-            except Exception as e:
-                print(f"⚠️ Menu handling issue (continuing): {str(e)}")
-            
-            # Navigate to Reconciliation tab
-            reconciliation_selectors = [
-                "text=Reconciliation",
-                "button:has-text('Reconciliation')",
-                "a:has-text('Reconciliation')",
-                "[data-testid*='reconciliation']"
-            ]
-            
-            for selector in reconciliation_selectors:
-                try:
-                    element = self.page.locator(selector)
-                    if await element.is_visible():
-                        await element.click()
-                        await asyncio.sleep(2)
-                        print(f"✅ Clicked reconciliation: {selector}")
-                        return True
-                except Exception as e:
-                    print(f"⚠️ Failed to click {selector}: {str(e)}")
-                    continue
-            
-            print("⚠️ Could not find reconciliation navigation element")
-            return False
-            
-        except Exception as e:
-            print(f"⚠️ Error navigating to reconciliation: {str(e)}")
-            return False
+        """Navigate to the reconciliation screen by its deep link"""
+        return await goto_route(self.page, "ReconciliationPage")
     
     async def is_loaded(self):
         """Check if bank page is loaded"""
@@ -2,23 +2,23 @@
 Budgeting Page Object Model
 Handles Budget Group creation and Budget Builder operations
 """
-import asyncio
 import random
 import string
 from datetime import datetime
 from playwright.async_api import Page
 
+from utils.wait_engine import WaitEngine
+from utils.combobox import Combobox
+from utils.routes import goto_route
+
 
 class BudgetingPage:
     def __init__(self, page: Page):
         self.page = page
+        self.waits = WaitEngine(page)
         self.heading = 'Budgeting'
-        # Dynamic base_url - extract from current page or use default
-        current_url = page.url if hasattr(page, 'url') else ""
-        if "stage.viewz.co" in current_url:
-            self.base_url = "https://app.stage.viewz.co/budgeting"
-        else:
-            self.base_url = "https://app.viewz.co/budgeting"
+        self.dropdown_option_selector = "[role='option'], [role='menuitem']"
+        self.combobox = Combobox(page, self.waits, self.dropdown_option_selector)
     
     async def is_loaded(self) -> bool:
         """Check if the Budgeting page is loaded"""
@@ -32,16 +32,10 @@ class BudgetingPage:
             return 'budget' in self.page.url.lower()
     
     async def navigate_to_budgeting(self, entity_id: int = 1):
-        """Navigate to the Budgeting page via sidebar menu"""
+        """Navigate to the Budgeting page by its deep link (sidebar menu as fallback)"""
         try:
-            # First try direct URL navigation
-            url = f"{self.base_url}?entityId={entity_id}"
-            await self.page.goto(url)
-            await self.page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)
-            
-            # Check if we're on budgeting page
-            if 'budget' in self.page.url.lower():
+            # Deep link first - the sidebar is only a fallback
+            if await goto_route(self.page, self, entity_id, waits=self.waits):
                 print(f"📍 Navigated to Budgeting via URL: {self.page.url}")
                 return
             
@@ -63,7 +57,7 @@ class BudgetingPage:
                     if await link.count() > 0:
                         # Use force click to bypass any overlays
                         await link.click(force=True, timeout=5000)
-                        await asyncio.sleep(2)
+                        await self.waits.settled()
                         if 'budget' in self.page.url.lower():
                             print(f"📍 Navigated to Budgeting via: {selector}")
                             return
@@ -77,13 +71,13 @@ class BudgetingPage:
                     box = await logo.bounding_box()
                     if box:
                         await self.page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
-                        await asyncio.sleep(1)
+                        await self.waits.dom_quiet()
                 
                 # Click Budgeting in expanded sidebar
                 budgeting_link = self.page.locator("text=Budgeting").first
                 if await budgeting_link.count() > 0:
                     await budgeting_link.click(force=True)
-                    await asyncio.sleep(2)
+                    await self.waits.settled()
                     print(f"📍 Navigated to Budgeting via sidebar: {self.page.url}")
                 else:
                     print("⚠️ Budgeting link not found in sidebar")
@@ -121,7 +115,7 @@ class BudgetingPage:
                 if await btn.count() > 0 and await btn.is_visible():
                     await btn.click()
                     print(f"✅ Clicked: {selector}")
-                    await asyncio.sleep(1)
+                    await self.waits.dialog_open()
                     return True
             
             # Try clicking a + button
@@ -129,7 +123,7 @@ class BudgetingPage:
             if await plus_btn.count() > 0:
                 await plus_btn.click()
                 print("✅ Clicked + button")
-                await asyncio.sleep(1)
+                await self.waits.dialog_open()
                 return True
                 
             print("❌ Add Budget Group button not found")
@@ -164,7 +158,7 @@ class BudgetingPage:
             if not group_name:
                 group_name = f"QA Budget {suffix}"
             
-            await asyncio.sleep(1)
+            await self.waits.dialog_open()
             
             # 1. Fill Budget ID (first input with placeholder containing "REV" or first input)
             budget_id_input = self.page.locator("input[placeholder*='REV'], input[placeholder*='e.g']").first
@@ -206,77 +200,45 @@ class BudgetingPage:
     async def _select_dropdown(self, label: str, value: str = None, index: int = None):
         """Helper to select from a dropdown by label in a modal dialog"""
         try:
-            await asyncio.sleep(0.3)
+            await self.waits.dom_quiet(quiet_ms=150)
+            
+            # Map label to button index based on form layout
+            label_map = {
+                "Report Type": 0,
+                "Account Type": 1, 
+                "Group": 2,
+                "Department": 3,
+                "Tag 1": 4,
+                "Cash Flow": 5,
+            }
             
-            # Find dropdown button by looking for "Select" text near the label
-            # The modal has: Label text, then a button with "Select..." text
+            # The modal has: Label text, then a button with "Select..." text;
+            # by position among the form's Select buttons as a last resort
             dropdown_selectors = [
                 f"button:has-text('Select'):near(:text('{label}'))",
                 f"button:below(:text('{label}')):has-text('Select')",
                 f"[role='combobox']:near(:text('{label}'))",
+                self.page.locator("button:has-text('Select')").nth(label_map.get(label, 0)),
             ]
+            # The modal's overlay intercepts pointer events on the trigger
+            if await self.combobox.open(dropdown_selectors, force=True) is None:
+                print(f"⚠️ {label}: dropdown not found")
+                return False
             
-            dropdown = None
-            for selector in dropdown_selectors:
-                try:
-                    d = self.page.locator(selector).first
-                    if await d.count() > 0 and await d.is_visible():
-                        dropdown = d
-                        break
-                except:
-                    continue
-            
-            if not dropdown:
-                # Try by position - find all Select buttons in the form
-                select_buttons = self.page.locator("button:has-text('Select')")
-                count = await select_buttons.count()
-                
-                # Map label to button index based on form layout
-                label_map = {
-                    "Report Type": 0,
-                    "Account Type": 1, 
-                    "Group": 2,
-                    "Department": 3,
-                    "Tag 1": 4,
-                    "Cash Flow": 5,
-                }
-                
-                idx = label_map.get(label, 0)
-                if idx < count:
-                    dropdown = select_buttons.nth(idx)
-            
-            if dropdown and await dropdown.count() > 0:
-                await dropdown.click(force=True)
-                await asyncio.sleep(0.5)
-                
-                # Find and click option
-                if value:
-                    option = self.page.locator(f"[role='option']:has-text('{value}'), [role='menuitem']:has-text('{value}')").first
-                    if await option.count() > 0:
-                        await option.click()
-                        print(f"✅ {label}: {value}")
-                        await asyncio.sleep(0.3)
-                        return True
-                
-                # Select first available option
-                options = self.page.locator("[role='option'], [role='menuitem']")
-                option_count = await options.count()
-                if option_count > 0:
-                    target_idx = index if index is not None else 0
-                    await options.nth(target_idx).click()
-                    print(f"✅ {label}: selected option {target_idx}")
-                    await asyncio.sleep(0.3)
-                    return True
-                else:
-                    # Close dropdown by pressing Escape
-                    await self.page.keyboard.press("Escape")
-                    
-            print(f"⚠️ {label}: dropdown not found")
-            return False
+            # The requested value, else the requested (or first) option
+            picked = await self.combobox.choose(text=value) if value else None
+            if picked is None:
+                picked = await self.combobox.choose(index=index if index is not None else 0)
+            if picked is None:
+                await self.combobox.close()
+                print(f"⚠️ {label}: no options")
+                return False
+            print(f"✅ {label}: {picked}")
+            return True
             
         except Exception as e:
             print(f"⚠️ Dropdown {label}: {str(e)[:40]}")
-            await self.page.keyboard.press("Escape")
+            await self.combobox.close()
             return False
     
     async def save_budget_group(self) -> bool:
@@ -304,7 +266,7 @@ class BudgetingPage:
                     print(f"✅ Clicked: {selector}")
                     
                     # Wait for modal to close or success message
-                    await asyncio.sleep(3)
+                    await self.waits.dialog_closed()
                     
                     # Check if there's an error message
                     error_msg = self.page.locator("text=Error, text=error, text=failed, [role='alert']")
@@ -351,14 +313,14 @@ class BudgetingPage:
             return None
         
         # Wait for modal to close
-        await asyncio.sleep(2)
+        await self.waits.dialog_closed()
         
         # Verify modal closed - check if overlay is gone
         overlay = self.page.locator("[data-state='open'][class*='fixed inset-0']")
         if await overlay.count() > 0:
             # Try pressing Escape to close it
             await self.page.keyboard.press("Escape")
-            await asyncio.sleep(1)
+            await self.waits.dialog_closed(timeout=2000)
         
         print(f"✅ Budget Group created: {group_data['name']}")
         return group_data
@@ -392,7 +354,7 @@ class BudgetingPage:
             if await group.count() > 0:
                 await group.click()
                 print(f"✅ Selected budget group: {group_name}")
-                await asyncio.sleep(2)
+                await self.waits.settled()
                 return True
             
             # Try table row
@@ -400,7 +362,7 @@ class BudgetingPage:
             if await row.count() > 0:
                 await row.click()
                 print(f"✅ Clicked row for: {group_name}")
-                await asyncio.sleep(2)
+                await self.waits.settled()
                 return True
             
             print(f"❌ Budget group not found: {group_name}")
@@ -422,12 +384,12 @@ class BudgetingPage:
             if await overlay.count() > 0:
                 print("⏳ Waiting for modal overlay to close...")
                 await self.page.keyboard.press("Escape")
-                await asyncio.sleep(1)
+                await self.waits.dialog_closed(timeout=2000)
                 # Try again
                 if await overlay.count() > 0:
                     # Click outside to close
                     await self.page.mouse.click(0, 0)
-                    await asyncio.sleep(1)
+                    await self.waits.dialog_closed(timeout=2000)
             
             # If group name provided, select it first
             if group_name:
@@ -449,7 +411,7 @@ class BudgetingPage:
                     try:
                         await btn.click(timeout=5000)
                         print(f"✅ Opened Budget Builder: {selector}")
-                        await asyncio.sleep(2)
+                        await self.waits.settled()
                         return True
                     except Exception as click_err:
                         print(f"⚠️ Click failed for {selector}: {str(click_err)[:40]}")
@@ -509,7 +471,7 @@ class BudgetingPage:
             
             print(f"\n💰 Adding budget amount: ${amount:,.2f}")
             
-            await asyncio.sleep(2)  # Wait for table to fully load
+            await self.waits.row_count_stable()
             
             # Table structure from screenshot:
             # [expand] | Budget Group | % | Annual | Jan | Feb | Mar | ... | Dec
@@ -553,7 +515,6 @@ class BudgetingPage:
                 await target_row.scroll_into_view_if_needed()
             except:
                 pass
-            await asyncio.sleep(1)
             
             # Get all cells in this row
             cells = target_row.locator("td")
@@ -575,9 +536,9 @@ class BudgetingPage:
             
             # Click to select, then double-click to edit
             await annual_cell.click()
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             await annual_cell.dblclick()
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             
             # Find any visible input (editing mode creates an input)
             input_el = self.page.locator("input:visible").first
@@ -588,7 +549,6 @@ class BudgetingPage:
                 
                 # Clear and fill
                 await input_el.fill("")
-                await asyncio.sleep(0.2)
                 await input_el.fill(amount_str)
                 print(f"   Filled amount: {amount_str}")
                 
@@ -596,7 +556,7 @@ class BudgetingPage:
                 await self.page.keyboard.press("Enter")
                 print(f"   Pressed Enter to commit")
                 
-                await asyncio.sleep(2)
+                await self.waits.settled()
                 amount_filled = True
                 print(f"   ✅ Filled Annual Budget: ${amount:,.2f}")
             else:
@@ -604,7 +564,7 @@ class BudgetingPage:
                 print("   No input found, trying keyboard type...")
                 await self.page.keyboard.type(str(int(amount)), delay=50)
                 await self.page.keyboard.press("Enter")
-                await asyncio.sleep(2)
+                await self.waits.settled()
                 amount_filled = True
             
             if not amount_filled:
@@ -652,7 +612,7 @@ class BudgetingPage:
                         
                         await save_btn.click(timeout=5000)
                         print(f"✅ Budget saved via: {selector}")
-                        await asyncio.sleep(2)
+                        await self.waits.settled()
                         return True
             
             print("❌ No enabled Save button found")
@@ -685,7 +645,7 @@ class BudgetingPage:
         if not await self.open_budget_builder():
             return False
         
-        await asyncio.sleep(2)  # Wait for table to load
+        await self.waits.row_count_stable()
         
         # Add budget amount to a GL category row
         if budget_lines:
@@ -710,11 +670,11 @@ class BudgetingPage:
             chart_tab = self.page.locator("text=Chart Of Budget").first
             if await chart_tab.count() > 0:
                 await chart_tab.click()
-                await asyncio.sleep(1)
+                await self.waits.settled()
             
             # Reload the page to ensure fresh data
             await self.page.reload()
-            await asyncio.sleep(3)
+            await self.waits.settled()
             
             # Try using search box - look for the specific placeholder
             search_selectors = [
@@ -734,14 +694,13 @@ class BudgetingPage:
                 # Clear any existing text first
                 await search_input.click()
                 await search_input.fill("")
-                await asyncio.sleep(0.5)
                 
                 # Type the search term
                 await search_input.fill(group_name)
                 print(f"   🔍 Searching for: {group_name}")
                 
                 # Wait for search to filter results
-                await asyncio.sleep(2)
+                await self.waits.row_count_stable()
                 
                 # Take screenshot to debug
                 await self.take_screenshot("search_results")
@@ -760,7 +719,7 @@ class BudgetingPage:
             # Clear search
             if search_input:
                 await search_input.fill("")
-                await asyncio.sleep(0.5)
+                await self.waits.row_count_stable()
             
             print(f"{'✅' if exists else '❌'} Budget group '{group_name}' {'exists' if exists else 'not found'}")
             return exists
@@ -781,14 +740,14 @@ class BudgetingPage:
             delete_btn = row.locator("button:has-text('Delete'), button:has(svg[class*='trash']), [data-testid='delete']").first
             if await delete_btn.count() > 0:
                 await delete_btn.click()
-                await asyncio.sleep(1)
+                await self.waits.dialog_open()
                 
                 # Confirm deletion
                 confirm = self.page.locator("button:has-text('Confirm'), button:has-text('Delete'), button:has-text('Yes')").first
                 if await confirm.count() > 0:
                     await confirm.click()
                     print(f"✅ Deleted budget group: {group_name}")
-                    await asyncio.sleep(1)
+                    await self.waits.settled()
                     return True
             
             print(f"❌ Delete button not found for: {group_name}")
@@ -813,14 +772,14 @@ class BudgetingPage:
             
             if await fiscal_year_dropdown.count() > 0:
                 await fiscal_year_dropdown.click()
-                await asyncio.sleep(0.5)
+                await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                 
                 # Select the year
                 year_option = self.page.locator(f"[role='option']:has-text('{year}'), [role='menuitem']:has-text('{year}')").first
                 if await year_option.count() > 0:
                     await year_option.click()
                     print(f"✅ Changed Fiscal Year to: {year}")
-                    await asyncio.sleep(1)
+                    await self.waits.settled()
                     return True
                     
                 # Close dropdown if year not found
@@ -855,14 +814,14 @@ class BudgetingPage:
             
             if await version_dropdown.count() > 0:
                 await version_dropdown.click()
-                await asyncio.sleep(0.5)
+                await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                 
                 # Select the version
                 version_option = self.page.locator(f"[role='option']:has-text('{version_name}'), [role='menuitem']:has-text('{version_name}')").first
                 if await version_option.count() > 0:
                     await version_option.click()
                     print(f"✅ Changed Version to: {version_name}")
-                    await asyncio.sleep(1)
+                    await self.waits.settled()
                     return True
                 
                 await self.page.keyboard.press("Escape")
@@ -884,7 +843,7 @@ class BudgetingPage:
             version_dropdown = self.page.locator("button:right-of(:text('Version'))").first
             if await version_dropdown.count() > 0:
                 await version_dropdown.click()
-                await asyncio.sleep(0.5)
+                await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                 
                 # Get all options
                 options = self.page.locator("[role='option'], [role='menuitem']")
@@ -909,10 +868,9 @@ class BudgetingPage:
             if await search_input.count() > 0:
                 await search_input.click()
                 await search_input.fill("")
-                await asyncio.sleep(0.3)
                 await search_input.fill(search_term)
                 print(f"🔍 Searching: {search_term}")
-                await asyncio.sleep(1)
+                await self.waits.row_count_stable()
                 
                 # Count visible rows
                 rows = self.page.locator("table tbody tr:visible")
@@ -933,7 +891,7 @@ class BudgetingPage:
             search_input = self.page.locator("input[placeholder*='Search budget'], input[placeholder*='Search'], input[type='search']").first
             if await search_input.count() > 0:
                 await search_input.fill("")
-                await asyncio.sleep(0.5)
+                await self.waits.row_count_stable()
         except:
             pass
     
@@ -1038,12 +996,12 @@ class BudgetingPage:
             if await expand_btn.count() > 0:
                 await expand_btn.click()
                 print(f"✅ Expanded row: {row_name}")
-                await asyncio.sleep(1)
+                await self.waits.dom_quiet()
                 return True
             
             # Try clicking the row itself
             await row.click()
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             return True
             
         except Exception as e:
@@ -1059,7 +1017,7 @@ class BudgetingPage:
                 if await expand_btn.count() > 0:
                     await expand_btn.click()
                     print(f"✅ Collapsed row: {row_name}")
-                    await asyncio.sleep(0.5)
+                    await self.waits.dom_quiet()
                     return True
             return False
         except:
@@ -1116,7 +1074,7 @@ class BudgetingPage:
                 
                 # Double-click to edit
                 await month_cell.dblclick()
-                await asyncio.sleep(0.5)
+                await self.waits.dom_quiet()
                 
                 # Find and fill input
                 input_el = self.page.locator("input:visible").first
@@ -1124,7 +1082,7 @@ class BudgetingPage:
                     await input_el.fill(str(int(amount)))
                     await self.page.keyboard.press("Enter")
                     print(f"✅ Set {month} = ${amount:,.0f} for {row_name}")
-                    await asyncio.sleep(1)
+                    await self.waits.settled()
                     return True
                 else:
                     # Try keyboard typing
@@ -1202,7 +1160,7 @@ class BudgetingPage:
             if await bulk_btn.count() > 0:
                 await bulk_btn.click()
                 print("✅ Clicked Bulk Actions")
-                await asyncio.sleep(0.5)
+                await self.waits.dom_quiet()
                 return True
             
             print("❌ Bulk Actions button not found")
@@ -1271,7 +1229,7 @@ class BudgetingPage:
             if await month_header.count() > 0:
                 await month_header.scroll_into_view_if_needed()
                 print(f"✅ Scrolled to {month}")
-                await asyncio.sleep(0.5)
+                await self.waits.dom_quiet(quiet_ms=150)
                 return True
             
             print(f"⚠️ Month header {month} not found")
@@ -1306,7 +1264,7 @@ class BudgetingPage:
             if await customize_btn.count() > 0:
                 await customize_btn.click()
                 print("✅ Clicked Customize")
-                await asyncio.sleep(0.5)
+                await self.waits.dom_quiet()
                 return True
             
             print("❌ Customize button not found")
@@ -14,18 +14,22 @@ Instruction shown: "Press Tab or Enter to save • Escape to cancel"
 """
 
 from playwright.async_api import Page
-import asyncio
 import random
 import string
 from datetime import datetime
 
+from utils.wait_engine import WaitEngine
+from utils.combobox import Combobox
+from utils.routes import ROUTES
+
 
 class ChartOfAccountsPage:
     
     def __init__(self, page: Page):
         self.page = page
+        self.waits = WaitEngine(page)
         self.base_url = None
-        self.chart_of_accounts_path = "/ledger/chart-of-accounts"
+        self.chart_of_accounts_path = ROUTES["ChartOfAccountsPage"]
         
         # Selectors for tests
         self.add_gl_button_selectors = [
@@ -34,6 +38,9 @@ class ChartOfAccountsPage:
             "[data-testid='add-gl-account']"
         ]
         self.new_row_selector = "tr:has-text('Auto-generated'), tr:has-text('Auto')"
+        self.unsaved_row_selector = "tr:has-text('Auto-generated')"
+        self.dropdown_option_selector = "[role='option'], [cmdk-item]"
+        self.combobox = Combobox(page, self.waits, self.dropdown_option_selector)
         self.cancel_button_selector = "button:has-text('Cancel'), button[aria-label='Cancel'], button.cancel"
     
     async def is_loaded(self):
@@ -51,7 +58,7 @@ class ChartOfAccountsPage:
             url = f"{self.base_url}{self.chart_of_accounts_path}"
             print(f"📊 Navigating to: {url}")
             await self.page.goto(url)
-            await asyncio.sleep(2)
+            await self.waits.settled()
             return self.chart_of_accounts_path in self.page.url
         except Exception as e:
             print(f"❌ Navigation error: {e}")
@@ -76,7 +83,7 @@ class ChartOfAccountsPage:
                 btn = self.page.locator(selector).first
                 if await btn.is_visible():
                     await btn.click()
-                    await asyncio.sleep(1.5)
+                    await self.waits.element_visible(self.new_row_selector)
                     print(f"✅ Clicked Add GL Account: {selector}")
                     return True
             
@@ -84,7 +91,7 @@ class ChartOfAccountsPage:
             btn = self.page.locator("button:has-text('+'), button[aria-label*='Add']").first
             if await btn.is_visible():
                 await btn.click()
-                await asyncio.sleep(1.5)
+                await self.waits.element_visible(self.new_row_selector)
                 print("✅ Clicked Add button (fallback)")
                 return True
                 
@@ -107,52 +114,14 @@ class ChartOfAccountsPage:
     async def _select_dropdown_option(self, option_text: str, field_name: str):
         """Select an option from an open dropdown (works with new inline edit UI)"""
         try:
-            await asyncio.sleep(0.5)
-            
-            # Try multiple selectors for dropdown options
-            selectors = [
-                f"[role='option']:has-text('{option_text}')",
-                f"[role='listbox'] [role='option']:has-text('{option_text}')",
-                f"div[data-radix-popper-content-wrapper] >> text='{option_text}'",
-                f"[cmdk-item]:has-text('{option_text}')",
-                f"div[role='listbox'] >> text='{option_text}'",
-            ]
-            
-            for selector in selectors:
-                try:
-                    option = self.page.locator(selector).first
-                    if await option.count() > 0 and await option.is_visible():
-                        await option.click()
-                        print(f"      ✅ {field_name}: {option_text}")
-                        await asyncio.sleep(0.3)
-                        return True
-                except:
-                    continue
-            
-            # Fallback: try clicking text directly (but be more specific)
-            try:
-                option = self.page.locator(f"[role='option'] >> text='{option_text}'").first
-                if await option.count() > 0 and await option.is_visible():
-                    await option.click()
-                    print(f"      ✅ {field_name}: {option_text} (role option)")
-                    await asyncio.sleep(0.3)
-                    return True
-            except:
-                pass
-            
-            # Try generic text match in any visible popup/dropdown
-            try:
-                popup_option = self.page.locator(f"[data-radix-popper-content-wrapper] >> text='{option_text}'").first
-                if await popup_option.count() > 0 and await popup_option.is_visible():
-                    await popup_option.click()
-                    print(f"      ✅ {field_name}: {option_text} (popup)")
-                    await asyncio.sleep(0.3)
-                    return True
-            except:
-                pass
-                
-            print(f"      ⚠️ {field_name}: '{option_text}' not found in dropdown")
-            return False
+            await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
+            
+            label = await self.combobox.choose(text=option_text)
+            if label is None:
+                print(f"      ⚠️ {field_name}: '{option_text}' not found in dropdown")
+                return False
+            print(f"      ✅ {field_name}: {label}")
+            return True
         except Exception as e:
             print(f"      ⚠️ {field_name}: {str(e)[:50]}")
             return False
@@ -201,7 +170,6 @@ class ChartOfAccountsPage:
                 print("❌ Failed to click Add GL Account")
                 return None
             
-            await asyncio.sleep(1)
             await self.take_screenshot("after_add_click")
             
             # Step 2: Find the inline edit row
@@ -230,7 +198,6 @@ class ChartOfAccountsPage:
             
             if await name_input.count() > 0:
                 await name_input.click()
-                await asyncio.sleep(0.2)
                 await name_input.fill(name)
                 print(f"      ✅ Name: {name}")
             else:
@@ -238,7 +205,7 @@ class ChartOfAccountsPage:
                 await self.page.keyboard.type(name)
                 print(f"      ✅ Name (typed): {name}")
             
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             
             # Step 4: Navigate through fields by clicking cells and selecting from dropdowns
             # Column order: Account ID(0), Name(1), Currency(2), Report Type(3), Type(4), Group(5), EBITDA(6), Cashflow(7), Budget(8)...
@@ -255,51 +222,47 @@ class ChartOfAccountsPage:
             # Currency (cell 2)
             print("   2️⃣ Currency...")
             await cells.nth(2).click()
-            await asyncio.sleep(0.8)
             if not await self._select_dropdown_option(currency, "Currency"):
                 # Try Tab fallback
                 await self.page.keyboard.press("Tab")
-                await asyncio.sleep(0.3)
+                await self.waits.dom_quiet(quiet_ms=150)
             
             # Report Type (cell 3) - usually auto-opens after currency selection
             print("   3️⃣ Report Type...")
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             # Just try to select - dropdown should be open after currency
             if not await self._select_dropdown_option(report_type, "Report Type"):
                 # If not found, click cell to open dropdown
                 row = await self._find_inline_row()
                 if row:
                     await row.locator("td").nth(3).click()
-                    await asyncio.sleep(0.5)
                     await self._select_dropdown_option(report_type, "Report Type")
             
             # Type (cell 4) - usually auto-opens after report type
             print("   4️⃣ Type...")
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             if not await self._select_dropdown_option(account_type, "Type"):
                 row = await self._find_inline_row()
                 if row:
                     await row.locator("td").nth(4).click()
-                    await asyncio.sleep(0.5)
                     await self._select_dropdown_option(account_type, "Type")
             
             # Group (cell 5) - usually auto-opens after type
             print("   5️⃣ Group...")
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             if not await self._select_dropdown_option(account_group, "Group"):
                 row = await self._find_inline_row()
                 if row:
                     await row.locator("td").nth(5).click()
-                    await asyncio.sleep(0.5)
                     await self._select_dropdown_option(account_group, "Group")
             
             # EBITDA (cell 6) - usually auto-selected based on Type
             print("   6️⃣ EBITDA: auto ✅")
-            await asyncio.sleep(0.3)
+            await self.waits.dom_quiet(quiet_ms=150)
             
             # Close any open dropdown before proceeding
             await self.page.keyboard.press("Escape")
-            await asyncio.sleep(0.3)
+            await self.waits.dom_quiet(quiet_ms=150)
             
             # Cashflow (cell 7)
             print("   7️⃣ Cashflow...")
@@ -308,22 +271,20 @@ class ChartOfAccountsPage:
                 try:
                     # Use force to bypass any intercepting elements
                     await row.locator("td").nth(7).click(force=True, timeout=5000)
-                    await asyncio.sleep(0.8)
                     await self._select_dropdown_option(cashflow, "Cashflow")
                 except Exception as e:
                     print(f"      ⚠️ Could not click Cashflow cell: {str(e)[:30]}")
                     # Try pressing Tab to get to Cashflow
                     await self.page.keyboard.press("Tab")
-                    await asyncio.sleep(0.5)
                     await self._select_dropdown_option(cashflow, "Cashflow")
             
             # Step 5: Save the account
             print("   8️⃣ Save...")
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             
             # Close any open dropdown first
             await self.page.keyboard.press("Escape")
-            await asyncio.sleep(0.3)
+            await self.waits.dom_quiet(quiet_ms=150)
             
             await self.take_screenshot("before_save")
             
@@ -372,7 +333,7 @@ class ChartOfAccountsPage:
             if not save_success:
                 print("      Trying Tab key to save...")
                 await self.page.keyboard.press("Tab")
-                await asyncio.sleep(1)
+                await self.waits.settled()
                 save_success = True
                 print("      ✅ Pressed Tab to save")
             
@@ -381,9 +342,9 @@ class ChartOfAccountsPage:
             if row_check:
                 print("      Row still in edit mode, trying Enter...")
                 await self.page.keyboard.press("Enter")
-                await asyncio.sleep(1)
+                await self.waits.settled()
             
-            await asyncio.sleep(2)
+            await self.waits.element_hidden(self.unsaved_row_selector)
             await self.take_screenshot("after_save")
             
             # Verify: Check if the inline row is gone (account saved)
@@ -411,7 +372,7 @@ class ChartOfAccountsPage:
                     
                     # Try one more time with Enter
                     await self.page.keyboard.press("Enter")
-                    await asyncio.sleep(2)
+                    await self.waits.row_count_stable()
                     
                     remaining = await self.page.locator("tr:has-text('Auto-generated')").count()
                     if remaining == 0:
@@ -462,7 +423,7 @@ class ChartOfAccountsPage:
                 if await search.is_visible():
                     await search.clear()
                     await search.fill(account_name)
-                    await asyncio.sleep(2)
+                    await self.waits.element_hidden(self.unsaved_row_selector)
                     
                     # Check if account appears in results
                     account_row = self.page.locator(f"tr:has-text('{account_name}')")
@@ -498,7 +459,6 @@ class ChartOfAccountsPage:
             if not await self.click_add_gl_account():
                 return None
             
-            await asyncio.sleep(1)
             
             # Find and fill name input
             name_input = self.page.locator("tr:has-text('Auto') input, input[placeholder*='Account']").first
@@ -510,9 +470,9 @@ class ChartOfAccountsPage:
                 print(f"   ✅ Name (typed): {name}")
             
             # Just press Enter to save with defaults
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             await self.page.keyboard.press("Enter")
-            await asyncio.sleep(2)
+            await self.waits.element_hidden(self.unsaved_row_selector)
             
             # Verify saved
             if await self.page.locator("tr:has-text('Auto-generated')").count() == 0:
@@ -1,6 +1,10 @@
 from playwright.async_api import Page, expect
 import asyncio
 
+from utils.deadline import budget_timeout
+from utils.routes import goto_route
+
+
 class CreditCardPage:
     """Page Object for Credit Cards section under Reconciliation"""
     
@@ -57,69 +61,21 @@ class CreditCardPage:
         self.sort_headers = page.locator("th[role='columnheader'], .sortable-header")
     
     async def navigate_to_credit_cards(self):
-        """Navigate to Credit Cards section"""
+        """Navigate to Credit Cards section by its deep link (entity of the current URL is kept)"""
         try:
             print("🏦 Navigating to Credit Cards section...")
             
             # Ensure we're not on the login page
-            current_url = self.page.url
-            if '/login' in current_url:
+            if '/login' in self.page.url:
                 print("⚠️ Currently on login page, waiting for authentication...")
-                await asyncio.sleep(3)
-                current_url = self.page.url
-            
-            # Check if already on credit cards page
-            if 'credit-card' in current_url.lower():
-                print(f"✅ Already on Credit Cards page: {current_url}")
-                return
-            
-            # Determine the base URL (works for both stage and production)
-            if 'stage.viewz.co' in current_url:
-                base_url = 'https://app.stage.viewz.co'
-            elif 'viewz.co' in current_url:
-                base_url = 'https://app.viewz.co'
-            else:
-                # Fallback: extract base from current URL
-                from urllib.parse import urlparse
-                parsed = urlparse(current_url)
-                base_url = f"{parsed.scheme}://{parsed.netloc}"
-            
-            # Try to navigate using UI first (preserves session better)
-            try:
-                # Look for Reconciliation menu
-                reconciliation = self.page.locator("text=Reconciliation").first
-                if await reconciliation.is_visible(timeout=5000):
-                    await reconciliation.click()
-                    await asyncio.sleep(1)
-                    print("✅ Clicked Reconciliation menu")
-                    
-                    # Try to find Credit Cards link
-                    credit_card_link = self.page.locator("[href*='credit-card']").first
-                    if await credit_card_link.is_visible(timeout=5000):
-                        await credit_card_link.click()
-                        await asyncio.sleep(2)
-                        print("✅ Clicked Credit Cards link")
-                        return
-            except Exception as e:
-                print(f"⚠️ UI navigation failed: {e}, trying direct URL...")
-            
-            # Fallback: Navigate directly to Credit Cards page
-            credit_cards_url = f"{base_url}/reconciliation/credit-cards"
-            print(f"🔗 Navigating to: {credit_cards_url}")
+                await self.page.wait_for_url(lambda url: '/login' not in url, timeout=budget_timeout(10000))
             
-            await self.page.goto(credit_cards_url, wait_until='domcontentloaded', timeout=30000)
-            await asyncio.sleep(3)
-            
-            # Check if we got redirected to login
-            final_url = self.page.url
-            if '/login' in final_url:
-                print(f"⚠️ Redirected to login page - session may have been lost")
-            else:
-                print(f"✅ Successfully navigated to: {final_url}")
+            return await goto_route(self.page, self)
             
         except Exception as e:
             print(f"⚠️ Error navigating to Credit Cards: {e}")
             # Continue anyway - we might already be on the page
+            return False
     
     async def verify_page_loads(self):
         """Verify Credit Cards page loads successfully"""
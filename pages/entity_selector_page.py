@@ -4,7 +4,9 @@ Handles entity selection functionality after login
 """
 
 from playwright.async_api import Page
-import asyncio
+
+from utils.selector_resolver import selector_resolver
+from utils.wait_engine import WaitEngine
 
 
 class EntitySelectorPage:
@@ -12,6 +14,7 @@ class EntitySelectorPage:
     
     def __init__(self, page: Page):
         self.page = page
+        self.waits = WaitEngine(page)
         
         # Entity selector elements (based on screenshot showing "Viewz Demo INC")
         self.entity_selectors = [
@@ -65,7 +68,7 @@ class EntitySelectorPage:
             print(f"🏢 Attempting to select entity: {entity_name}")
             
             # Wait for page to load after login
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # First, check if entity is already selected
             if await self._is_entity_selected(entity_name):
@@ -80,13 +83,13 @@ class EntitySelectorPage:
             
             # Click to open dropdown
             await entity_button.click()
-            await asyncio.sleep(1)
+            await self.waits.element_visible(", ".join(self.entity_option_selectors), timeout=2000)
             
             # Select the desired entity
             success = await self._select_entity_option(entity_name)
             if success:
                 print(f"✅ Successfully selected entity: {entity_name}")
-                await asyncio.sleep(2)  # Wait for entity change to process
+                await self.waits.settled()  # Wait for entity change to process
                 return True
             else:
                 print(f"⚠️ Could not find entity option: {entity_name}")
@@ -99,16 +102,13 @@ class EntitySelectorPage:
             return False
     
     async def _find_entity_selector(self):
-        """Find the entity selector button/dropdown"""
-        for selector in self.entity_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.is_visible():
-                    print(f"✅ Found entity selector: {selector}")
-                    return element
-            except Exception:
-                continue
-        return None
+        """Find the entity selector button/dropdown (last run's match is tried first)"""
+        selector, element = await selector_resolver.first_visible(
+            self.page, "EntitySelectorPage.entity_selectors", self.entity_selectors
+        )
+        if element:
+            print(f"✅ Found entity selector: {selector}")
+        return element
     
     async def _select_entity_option(self, entity_name: str):
         """Select entity option from dropdown"""
@@ -180,7 +180,7 @@ class EntitySelectorPage:
                 return []
             
             await entity_button.click()
-            await asyncio.sleep(1)
+            await self.waits.element_visible(", ".join(self.entity_option_selectors), timeout=2000)
             
             # Get all entity options
             entities = []
@@ -4,17 +4,32 @@ Page object for the Invoicing section - Create Customers, Products, and Generate
 """
 
 from playwright.async_api import Page, expect
-import asyncio
 import random
 import string
 from datetime import datetime, timedelta
 
+from utils.wait_engine import WaitEngine
+from utils.selector_resolver import selector_resolver
+from utils.selector_race import first_visible, any_visible, wait_any_visible
+from utils.deadline import budget_timeout
+from utils.combobox import Combobox
+from utils.form_fill import Field, FormFiller
+from utils.routes import goto_route
+
 
 class InvoicingPage:
     """Page object for Invoicing section"""
     
     def __init__(self, page: Page):
         self.page = page
+        self.waits = WaitEngine(page)
+        
+        # Wait targets for dropdowns, date pickers and row action menus
+        self.dropdown_option_selector = "[role='option'], [role='listbox'] > *, [cmdk-item]"
+        self.calendar_selector = "[role='grid'], [role='dialog'] table"
+        self.action_menu_selector = "[role='menu'], [role='menuitem']"
+        self.combobox = Combobox(page, self.waits, self.dropdown_option_selector)
+        self.forms = FormFiller(page, self.waits, self.combobox)
         
         # Navigation selectors
         self.nav_selectors = [
@@ -351,62 +366,30 @@ class InvoicingPage:
     # ==========================================
     
     async def navigate_to_invoicing(self, preserve_entity: bool = True):
-        """Navigate to the Invoicing page"""
+        """Navigate to the Invoicing page by its deep link (menu as fallback)"""
         try:
             current_url = self.page.url
             print(f"📍 Current URL: {current_url}")
             
-            # Extract entityId from current URL to preserve it
-            entity_id = None
-            if preserve_entity and "entityId=" in current_url:
-                import re
-                match = re.search(r'entityId=(\d+)', current_url)
-                if match:
-                    entity_id = match.group(1)
-                    print(f"🏢 Preserving entityId: {entity_id}")
-            
             # Check if already on invoicing page
             if "invoicing" in current_url.lower() or "invoice" in current_url.lower():
                 print("✅ Already on Invoicing page")
                 return True
             
-            # Try direct URL navigation first
-            base_url = current_url.split('/')[0] + '//' + current_url.split('/')[2]
-            
-            # Build URLs with entityId preserved
-            entity_param = f"?entityId={entity_id}" if entity_id else ""
-            invoicing_urls = [
-                f"{base_url}/invoicing{entity_param}",
-                f"{base_url}/invoices{entity_param}",
-                f"{base_url}/billing/invoicing{entity_param}",
-                f"{base_url}/billing/invoices{entity_param}"
-            ]
-            
-            for url in invoicing_urls:
-                try:
-                    print(f"🔄 Trying direct navigation to: {url}")
-                    await self.page.goto(url, timeout=10000)
-                    await asyncio.sleep(2)
-                    
-                    if "invoic" in self.page.url.lower():
-                        print(f"✅ Successfully navigated to: {self.page.url}")
-                        return True
-                except Exception as e:
-                    print(f"⚠️ URL {url} failed: {str(e)[:50]}")
-                    continue
+            # Deep link first, keeping the current entity unless told not to
+            if await goto_route(self.page, self, keep_entity=preserve_entity, waits=self.waits,
+                                timeout=10000):
+                return True
             
             # Try clicking navigation elements
-            await asyncio.sleep(2)
-            for selector in self.nav_selectors:
-                try:
-                    element = self.page.locator(selector).first
-                    if await element.is_visible():
-                        await element.click()
-                        await asyncio.sleep(2)
-                        print(f"✅ Clicked navigation: {selector}")
-                        return True
-                except:
-                    continue
+            await self.waits.settled()
+            selector = await selector_resolver.act_on_first_visible(
+                self.page, "InvoicingPage.nav_selectors", self.nav_selectors, lambda element: element.click()
+            )
+            if selector:
+                await self.waits.settled()
+                print(f"✅ Clicked navigation: {selector}")
+                return True
             
             print("❌ Could not navigate to Invoicing page")
             return False
@@ -445,16 +428,14 @@ class InvoicingPage:
     async def go_to_customers_tab(self):
         """Navigate to Customers tab/section"""
         try:
-            for selector in self.customer_tab_selectors:
-                try:
-                    element = self.page.locator(selector).first
-                    if await element.is_visible():
-                        await element.click()
-                        await asyncio.sleep(1)
-                        print(f"✅ Clicked Customers tab: {selector}")
-                        return True
-                except:
-                    continue
+            selector = await selector_resolver.act_on_first_visible(
+                self.page, "InvoicingPage.customer_tab_selectors", self.customer_tab_selectors,
+                lambda element: element.click()
+            )
+            if selector:
+                await self.waits.settled()
+                print(f"✅ Clicked Customers tab: {selector}")
+                return True
             print("⚠️ Customers tab not found, might already be on customers section")
             return True
         except Exception as e:
@@ -463,14 +444,14 @@ class InvoicingPage:
 
     async def click_add_customer(self):
         """Click Add Customer button"""
-        await asyncio.sleep(2)  # Wait for page to fully load
+        await self.waits.settled()
         
         # First try using get_by_role which is more reliable
         try:
             button = self.page.get_by_role("button", name="Add Customer")
-            await button.wait_for(state="visible", timeout=5000)
+            await button.wait_for(state="visible", timeout=budget_timeout(5000))
             await button.click()
-            await asyncio.sleep(1)
+            await self.waits.dialog_open()
             print("✅ Clicked Add Customer via get_by_role")
             return True
         except Exception as e:
@@ -479,9 +460,9 @@ class InvoicingPage:
         # Try using get_by_text
         try:
             button = self.page.get_by_text("Add Customer", exact=True)
-            await button.wait_for(state="visible", timeout=3000)
+            await button.wait_for(state="visible", timeout=budget_timeout(3000))
             await button.click()
-            await asyncio.sleep(1)
+            await self.waits.dialog_open()
             print("✅ Clicked Add Customer via get_by_text")
             return True
         except Exception as e:
@@ -490,9 +471,9 @@ class InvoicingPage:
         # Try locator with text
         try:
             button = self.page.locator("text=Add Customer").first
-            await button.wait_for(state="visible", timeout=3000)
+            await button.wait_for(state="visible", timeout=budget_timeout(3000))
             await button.click()
-            await asyncio.sleep(1)
+            await self.waits.dialog_open()
             print("✅ Clicked Add Customer via locator text")
             return True
         except Exception as e:
@@ -502,9 +483,9 @@ class InvoicingPage:
         for selector in self.add_customer_button_selectors:
             try:
                 element = self.page.locator(selector).first
-                await element.wait_for(state="visible", timeout=2000)
+                await element.wait_for(state="visible", timeout=budget_timeout(2000))
                 await element.click()
-                await asyncio.sleep(1)
+                await self.waits.dialog_open()
                 print(f"✅ Clicked Add Customer: {selector}")
                 return True
             except:
@@ -528,16 +509,49 @@ class InvoicingPage:
             pass
         return False
 
+    def _customer_form_spec(self) -> list:
+        """Customer dialog: all text inputs first (one batch), then the dropdowns and GL checkbox"""
+        return [
+            Field('name', placeholder="Enter customer name", selectors=self.customer_name_selectors),
+            Field('email', placeholder="Enter email address", selectors=self.customer_email_selectors),
+            Field('city', placeholder="Enter city", selectors=self.customer_city_selectors),
+            Field('address', placeholder="Enter customer address", selectors=self.customer_address_selectors),
+            Field('zip', placeholder="Enter zip code", selectors=self.customer_zip_selectors),
+            Field('registration', placeholder="Enter registration number",
+                  selectors=self.customer_registration_selectors),
+            Field('tax_id', placeholder="Enter tax ID", selectors=self.customer_tax_id_selectors),
+            # Required - first option (usually "Business" or similar)
+            Field('customer_type', Field.SELECT, index=0, triggers=[
+                "text=Select customer t",
+                "button:has-text('Select customer')",
+                "[role='combobox']:has-text('Select customer')",
+            ] + self._labeled_triggers("Customer Type", "Select customer")),
+            # Much more reliable than picking a receivables account from the dropdown
+            Field('create_gl_account', Field.CHECKBOX, default=True, triggers=[
+                "text=Create GL Account Automatically",
+                "label:has-text('Create GL Account Automatically')",
+                "[role='checkbox']:near(:text('Create GL Account'))",
+            ]),
+            Field('country', Field.SELECT, default="United States", search=6, triggers=[
+                self.page.get_by_text("Search countries...", exact=False),
+                "button:has-text('Search countries...')",
+                "text=Search countries",
+            ]),
+            Field('payment_terms', Field.SELECT, index=0,
+                  triggers=self._labeled_triggers("Payment Terms", "Select payment terms")),
+        ]
+    
     async def fill_customer_form(self, customer_data: dict):
         """
         Fill customer creation form
         
         Args:
             customer_data: dict with keys: name, email, city, address, zip, registration, tax_id
+                (optional: customer_type, country, payment_terms)
         """
         try:
             print(f"📝 Filling customer form with: {customer_data}")
-            await asyncio.sleep(1)  # Wait for form to be fully rendered
+            await self.waits.dialog_open()
             
             # Take screenshot of form
             try:
@@ -545,175 +559,24 @@ class InvoicingPage:
             except:
                 pass
             
-            # Fill name (required)
-            if customer_data.get('name'):
-                filled = await self._fill_field_by_placeholder("Enter customer name", customer_data['name'])
-                if not filled:
-                    await self._fill_field(self.customer_name_selectors, customer_data['name'])
+            result = await self.forms.fill("InvoicingPage.customer", self._customer_form_spec(), customer_data)
             
-            # Select Customer Type (required dropdown)
-            print("🔽 Selecting Customer Type...")
-            customer_type_selected = False
-            try:
-                # Try multiple approaches for Customer Type dropdown
-                customer_type_selectors = [
-                    "text=Select customer t",
-                    "button:has-text('Select customer')",
-                    "[role='combobox']:has-text('Select customer')",
-                    "text=Customer Type >> xpath=../following-sibling::* >> button",
-                ]
-                
-                for selector in customer_type_selectors:
-                    try:
-                        dropdown = self.page.locator(selector).first
-                        if await dropdown.is_visible():
-                            await dropdown.click()
-                            await asyncio.sleep(0.5)
-                            # Select first option (usually "Business" or similar)
-                            option = self.page.locator("[role='option']").first
-                            if await option.is_visible():
-                                await option.click()
-                                customer_type_selected = True
-                                print("✅ Customer Type selected")
-                                break
-                    except:
-                        continue
-                
-                # Fallback: try labeled dropdown approach
-                if not customer_type_selected:
-                    result = await self._select_labeled_dropdown("Customer Type", "Select customer")
-                    if result:
-                        customer_type_selected = True
-                        print("✅ Customer Type selected via labeled dropdown")
-                        
-            except Exception as e:
-                print(f"⚠️ Customer Type selection failed: {str(e)[:40]}")
-            
-            if not customer_type_selected:
+            if not result.ok('customer_type'):
                 print("⚠️ Could not select Customer Type - this is a required field!")
             
-            # Handle GL Account - Use the "Create GL Account Automatically" checkbox
-            # This is much more reliable than trying to select from the dropdown
-            print("🔽 Handling GL Account...")
-            
-            # Wait for the form to be fully loaded
-            await asyncio.sleep(1)
-            
-            gl_handled = False
-            
-            # BEST APPROACH: Check the "Create GL Account Automatically" checkbox
-            try:
-                # Try multiple selectors for the checkbox
-                checkbox_selectors = [
-                    "text=Create GL Account Automatically",
-                    "label:has-text('Create GL Account Automatically')",
-                    "input[type='checkbox'] >> xpath=../.. >> text=Create GL Account",
-                    "[role='checkbox']:near(:text('Create GL Account'))",
-                ]
-                
-                for selector in checkbox_selectors:
+            # Fallback: pick a receivables GL account if the auto-create checkbox is missing
+            if not result.ok('create_gl_account'):
+                print("⚠️ Checkbox not found, trying dropdown selection...")
+                receivable = await self.combobox.select(
+                    ["text=Select receivable", "button:has-text('Select receivable')"], index=0)
+                if receivable:
+                    print(f"✅ Selected GL Account from dropdown: {receivable}")
+                else:
+                    print("⚠️ Could not handle GL Account - form may fail validation")
                     try:
-                        checkbox = self.page.locator(selector).first
-                        if await checkbox.is_visible():
-                            # Check if it's already checked
-                            is_checked = await checkbox.is_checked() if hasattr(checkbox, 'is_checked') else False
-                            if not is_checked:
-                                await checkbox.click()
-                                await asyncio.sleep(0.5)
-                            gl_handled = True
-                            print("✅ Checked 'Create GL Account Automatically' checkbox")
-                            break
+                        await self.page.screenshot(path="debug_income_account_failed.png")
                     except:
-                        continue
-                
-                # Also try clicking directly on the checkbox input
-                if not gl_handled:
-                    checkbox_input = self.page.locator("input[type='checkbox']").first
-                    if await checkbox_input.is_visible():
-                        parent_text = await checkbox_input.locator("xpath=./..").text_content()
-                        if parent_text and "gl account" in parent_text.lower():
-                            await checkbox_input.check()
-                            gl_handled = True
-                            print("✅ Checked GL Account checkbox via input element")
-            except Exception as e:
-                print(f"⚠️ Checkbox approach failed: {str(e)[:40]}")
-            
-            # Fallback: Try to select from dropdown if checkbox didn't work
-            if not gl_handled:
-                print("⚠️ Checkbox not found, trying dropdown selection...")
-                try:
-                    # Click on the Receivables GL Account dropdown
-                    dropdown = self.page.locator("text=Select receivable, button:has-text('Select receivable')").first
-                    if await dropdown.is_visible():
-                        await dropdown.click()
-                        await asyncio.sleep(0.5)
-                        # Select first available option
-                        option = self.page.locator("[role='option']").first
-                        if await option.is_visible():
-                            await option.click()
-                            gl_handled = True
-                            print("✅ Selected GL Account from dropdown")
-                except Exception as e:
-                    print(f"⚠️ Dropdown selection failed: {str(e)[:40]}")
-            
-            if not gl_handled:
-                print("⚠️ Could not handle GL Account - form may fail validation")
-                # Take a debug screenshot
-                try:
-                    await self.page.screenshot(path="debug_income_account_failed.png")
-                except:
-                    pass
-            
-            # Fill email (required)
-            if customer_data.get('email'):
-                filled = await self._fill_field_by_placeholder("Enter email address", customer_data['email'])
-                if not filled:
-                    await self._fill_field(self.customer_email_selectors, customer_data['email'])
-            
-            # Select Country (required dropdown) - search for a country
-            print("🔽 Selecting Country...")
-            await self._select_labeled_dropdown_searchable("Country", "Search countries...", "United States")
-            
-            # Fill city
-            if customer_data.get('city'):
-                filled = await self._fill_field_by_placeholder("Enter city", customer_data['city'])
-                if not filled:
-                    await self._fill_field(self.customer_city_selectors, customer_data['city'])
-            
-            # Fill address
-            if customer_data.get('address'):
-                filled = await self._fill_field_by_placeholder("Enter customer address", customer_data['address'])
-                if not filled:
-                    await self._fill_field(self.customer_address_selectors, customer_data['address'])
-            
-            # Fill zip code
-            if customer_data.get('zip'):
-                filled = await self._fill_field_by_placeholder("Enter zip code", customer_data['zip'])
-                if not filled:
-                    await self._fill_field(self.customer_zip_selectors, customer_data['zip'])
-            
-            # Fill registration number
-            if customer_data.get('registration'):
-                filled = await self._fill_field_by_placeholder("Enter registration number", customer_data['registration'])
-                if not filled:
-                    await self._fill_field(self.customer_registration_selectors, customer_data['registration'])
-            
-            # Fill tax ID
-            if customer_data.get('tax_id'):
-                filled = await self._fill_field_by_placeholder("Enter tax ID", customer_data['tax_id'])
-                if not filled:
-                    await self._fill_field(self.customer_tax_id_selectors, customer_data['tax_id'])
-            
-            # Scroll down to see Payment Terms
-            try:
-                await self.page.evaluate("document.querySelector('[role=\"dialog\"]')?.scrollTo(0, 1000)")
-                await asyncio.sleep(0.5)
-            except:
-                pass
-            
-            # Select Payment Terms (required dropdown)
-            print("🔽 Selecting Payment Terms...")
-            await self._select_labeled_dropdown("Payment Terms", "Select payment terms")
+                        pass
             
             # Take screenshot after filling
             try:
@@ -728,165 +591,55 @@ class InvoicingPage:
             print(f"❌ Error filling customer form: {str(e)}")
             return False
     
+    def _placeholder_triggers(self, placeholder_text: str) -> list:
+        """Exact text, then a select-like element, then the containing div"""
+        return [
+            self.page.get_by_text(placeholder_text, exact=True),
+            f"[class*='select']:has-text('{placeholder_text}')",
+            f"div:has-text('{placeholder_text}')",
+        ]
+    
+    def _labeled_triggers(self, label_text: str, placeholder_text: str) -> list:
+        """Control next to its label (most reliable), then by placeholder, role or button text"""
+        label = self.page.get_by_text(label_text, exact=False).first
+        return [
+            label.locator("xpath=./parent::*").locator("button, [role='combobox'], [class*='select']"),
+            self.page.get_by_text(placeholder_text, exact=True),
+            self.page.get_by_role("combobox", name=label_text),
+            f"button:has-text('{placeholder_text}')",
+            f"[role='combobox']:has-text('{placeholder_text}')",
+        ]
+    
     async def _select_dropdown_option(self, placeholder_text: str, option_index: int = 0):
         """Select an option from a dropdown by clicking it and selecting the nth option"""
         try:
             print(f"🔽 Trying to select from dropdown: '{placeholder_text}'")
-            
-            # Try multiple ways to click the dropdown
-            dropdown_clicked = False
-            
-            # Method 1: By exact text
-            try:
-                dropdown = self.page.get_by_text(placeholder_text, exact=True).first
-                if await dropdown.is_visible():
-                    await dropdown.click()
-                    dropdown_clicked = True
-                    print(f"✅ Clicked dropdown by text: '{placeholder_text}'")
-            except:
-                pass
-            
-            # Method 2: By partial text within a select-like element
-            if not dropdown_clicked:
-                try:
-                    dropdown = self.page.locator(f"[class*='select']:has-text('{placeholder_text}')").first
-                    if await dropdown.is_visible():
-                        await dropdown.click()
-                        dropdown_clicked = True
-                        print(f"✅ Clicked dropdown by select class")
-                except:
-                    pass
-            
-            # Method 3: Click the parent container that contains the text
-            if not dropdown_clicked:
-                try:
-                    dropdown = self.page.locator(f"div:has-text('{placeholder_text}')").first
-                    if await dropdown.is_visible():
-                        await dropdown.click()
-                        dropdown_clicked = True
-                        print(f"✅ Clicked dropdown by div container")
-                except:
-                    pass
-            
-            if not dropdown_clicked:
-                print(f"❌ Could not find/click dropdown: '{placeholder_text}'")
+            label = await self.combobox.select(self._placeholder_triggers(placeholder_text), index=option_index)
+            if label is None:
+                print(f"⚠️ Could not select option {option_index} from dropdown '{placeholder_text}'")
                 return False
-            
-            await asyncio.sleep(1)
-            
-            # Wait for options to appear and click the requested one
-            # Try multiple option selectors
-            option_selectors = [
-                "[role='option']",
-                "[role='listbox'] > *",
-                "[class*='option']",
-                "[class*='menu'] > div",
-                "[class*='dropdown'] > div",
-                "li[class*='select']",
-                "[data-value]"
-            ]
-            
-            for selector in option_selectors:
-                options = self.page.locator(selector)
-                count = await options.count()
-                if count > option_index:
-                    await options.nth(option_index).click()
-                    print(f"✅ Selected option {option_index} from dropdown '{placeholder_text}' using {selector}")
-                    await asyncio.sleep(0.5)
-                    return True
-            
-            print(f"⚠️ No options found for dropdown '{placeholder_text}'")
-            await self.page.keyboard.press("Escape")
-            return False
+            print(f"✅ Selected option {option_index} from dropdown '{placeholder_text}': {label}")
+            return True
             
         except Exception as e:
             print(f"⚠️ Could not select from dropdown '{placeholder_text}': {str(e)[:50]}")
-            try:
-                await self.page.keyboard.press("Escape")
-            except:
-                pass
             return False
     
     async def _select_searchable_dropdown(self, placeholder_text: str, search_value: str):
         """Select an option from a searchable dropdown"""
         try:
             print(f"🔍 Trying to select '{search_value}' from searchable dropdown: '{placeholder_text}'")
-            
-            # Try multiple ways to click the dropdown
-            dropdown_clicked = False
-            
-            # Method 1: By exact text
-            try:
-                dropdown = self.page.get_by_text(placeholder_text, exact=True).first
-                if await dropdown.is_visible():
-                    await dropdown.click()
-                    dropdown_clicked = True
-                    print(f"✅ Clicked searchable dropdown by text")
-            except:
-                pass
-            
-            # Method 2: By partial text within a select-like element
-            if not dropdown_clicked:
-                try:
-                    dropdown = self.page.locator(f"[class*='select']:has-text('{placeholder_text}')").first
-                    if await dropdown.is_visible():
-                        await dropdown.click()
-                        dropdown_clicked = True
-                        print(f"✅ Clicked searchable dropdown by select class")
-                except:
-                    pass
-            
-            # Method 3: Click the parent container that contains the text
-            if not dropdown_clicked:
-                try:
-                    dropdown = self.page.locator(f"div:has-text('{placeholder_text}')").first
-                    if await dropdown.is_visible():
-                        await dropdown.click()
-                        dropdown_clicked = True
-                        print(f"✅ Clicked searchable dropdown by div container")
-                except:
-                    pass
-            
-            if not dropdown_clicked:
-                print(f"❌ Could not find/click searchable dropdown: '{placeholder_text}'")
+            # Type the first 5 chars to filter, then take the matching (or first) option
+            label = await self.combobox.select(self._placeholder_triggers(placeholder_text),
+                                               text=search_value, search=search_value[:5])
+            if label is None:
+                print(f"⚠️ Could not select '{search_value}' from searchable dropdown '{placeholder_text}'")
                 return False
-            
-            await asyncio.sleep(1)
-            
-            # Type to search
-            await self.page.keyboard.type(search_value[:5])  # Type first 5 chars to search
-            await asyncio.sleep(1)
-            print(f"⌨️ Typed search: '{search_value[:5]}'")
-            
-            # Click the first matching option
-            option_selectors = [
-                "[role='option']",
-                "[role='listbox'] > *",
-                "[class*='option']",
-                "[class*='menu'] > div",
-                "[class*='dropdown'] > div",
-                "li[class*='select']"
-            ]
-            
-            for selector in option_selectors:
-                options = self.page.locator(selector)
-                count = await options.count()
-                if count > 0:
-                    await options.first.click()
-                    print(f"✅ Selected '{search_value}' from searchable dropdown using {selector}")
-                    await asyncio.sleep(0.5)
-                    return True
-            
-            print(f"⚠️ No options found for '{search_value}' in dropdown")
-            await self.page.keyboard.press("Escape")
-            return False
+            print(f"✅ Selected '{label}' from searchable dropdown '{placeholder_text}'")
+            return True
             
         except Exception as e:
             print(f"⚠️ Could not select from searchable dropdown '{placeholder_text}': {str(e)[:50]}")
-            try:
-                await self.page.keyboard.press("Escape")
-            except:
-                pass
             return False
     
     async def _select_labeled_dropdown(self, label_text: str, placeholder_text: str, option_index: int = 0):
@@ -904,145 +657,22 @@ class InvoicingPage:
             # First, scroll the dialog to show all content
             try:
                 await self.page.evaluate("document.querySelector('[role=\"dialog\"]')?.scrollTo(0, 500)")
-                await asyncio.sleep(0.3)
+                await self.waits.dom_quiet(quiet_ms=150)
                 await self.page.evaluate("document.querySelector('[role=\"dialog\"]')?.scrollTo(0, 0)")
-                await asyncio.sleep(0.3)
+                await self.waits.dom_quiet(quiet_ms=150)
             except:
                 pass
             
-            dropdown_clicked = False
-            
-            # Method 1: Find label then click adjacent dropdown (MOST RELIABLE)
-            if not dropdown_clicked:
-                try:
-                    # Find the label first
-                    label = self.page.get_by_text(label_text, exact=False).first
-                    if await label.is_visible():
-                        # Get the parent container and find the dropdown within it
-                        parent = label.locator("xpath=./parent::*")
-                        # Look for button or select within or after the label
-                        dropdown = parent.locator("button, [role='combobox'], [class*='select']").first
-                        if await dropdown.is_visible():
-                            await dropdown.click()
-                            dropdown_clicked = True
-                            print(f"✅ Clicked dropdown via label parent: '{label_text}'")
-                except Exception as e:
-                    print(f"⚠️ Label parent method failed: {str(e)[:40]}")
-            
-            # Method 2: Click the dropdown directly by exact placeholder text
-            if not dropdown_clicked:
-                try:
-                    dropdown = self.page.get_by_text(placeholder_text, exact=True).first
-                    if await dropdown.is_visible():
-                        await dropdown.click()
-                        dropdown_clicked = True
-                        print(f"✅ Clicked dropdown by exact placeholder: '{placeholder_text}'")
-                except Exception as e:
-                    print(f"⚠️ Exact placeholder method failed: {str(e)[:40]}")
-            
-            # Method 3: Try get_by_role combobox with name
-            if not dropdown_clicked:
-                try:
-                    dropdown = self.page.get_by_role("combobox", name=label_text)
-                    if await dropdown.is_visible():
-                        await dropdown.click()
-                        dropdown_clicked = True
-                        print(f"✅ Clicked combobox by role: '{label_text}'")
-                except Exception as e:
-                    print(f"⚠️ Combobox role method failed: {str(e)[:40]}")
-            
-            # Method 4: Try partial placeholder with scroll
-            if not dropdown_clicked:
-                try:
-                    partial_placeholder = placeholder_text.split()[0]  # e.g., "Select"
-                    dropdowns = self.page.locator(f"button:has-text('{partial_placeholder}')")
-                    count = await dropdowns.count()
-                    # Click each one until we find our target
-                    for i in range(count):
-                        try:
-                            dd = dropdowns.nth(i)
-                            dd_text = await dd.inner_text()
-                            if placeholder_text.lower() in dd_text.lower():
-                                await dd.scroll_into_view_if_needed()
-                                await asyncio.sleep(0.3)
-                                await dd.click()
-                                dropdown_clicked = True
-                                print(f"✅ Clicked dropdown by matching text: '{dd_text[:30]}'")
-                                break
-                        except:
-                            continue
-                except Exception as e:
-                    print(f"⚠️ Partial placeholder method failed: {str(e)[:40]}")
-            
-            # Method 5: Use role combobox or listbox
-            if not dropdown_clicked:
-                try:
-                    # Find all combobox elements and click one that's visible and contains our text
-                    comboboxes = self.page.locator("[role='combobox']")
-                    count = await comboboxes.count()
-                    for i in range(count):
-                        try:
-                            cb = comboboxes.nth(i)
-                            text = await cb.inner_text()
-                            if placeholder_text.lower() in text.lower() or "select" in text.lower():
-                                await cb.scroll_into_view_if_needed()
-                                await cb.click()
-                                dropdown_clicked = True
-                                print(f"✅ Clicked combobox {i} containing '{placeholder_text}'")
-                                break
-                        except:
-                            continue
-                except Exception as e:
-                    print(f"⚠️ Combobox method failed: {str(e)[:40]}")
-            
-            if not dropdown_clicked:
-                print(f"❌ Could not click '{label_text}' dropdown")
+            label = await self.combobox.select(self._labeled_triggers(label_text, placeholder_text),
+                                               index=option_index, keyboard_fallback=True)
+            if label is None:
+                print(f"❌ Could not select from '{label_text}' dropdown")
                 return False
-            
-            await asyncio.sleep(1)
-            
-            # Now select an option
-            option_selectors = [
-                "[role='option']",
-                "[role='listbox'] > *",
-                "[class*='option']:not([class*='disabled'])",
-                "[class*='menu-item']",
-                "[class*='select__option']",
-                "[data-value]"
-            ]
-            
-            for selector in option_selectors:
-                try:
-                    options = self.page.locator(selector)
-                    count = await options.count()
-                    if count > option_index:
-                        await options.nth(option_index).click()
-                        print(f"✅ Selected option {option_index} from '{label_text}' using {selector}")
-                        await asyncio.sleep(0.5)
-                        return True
-                except:
-                    continue
-            
-            # Fallback: Use keyboard
-            try:
-                await self.page.keyboard.press("ArrowDown")
-                await asyncio.sleep(0.3)
-                await self.page.keyboard.press("Enter")
-                print(f"✅ Selected option via keyboard for '{label_text}'")
-                return True
-            except:
-                pass
-            
-            print(f"⚠️ No options found for '{label_text}'")
-            await self.page.keyboard.press("Escape")
-            return False
+            print(f"✅ Selected {label} from '{label_text}'")
+            return True
             
         except Exception as e:
             print(f"❌ Error selecting from '{label_text}': {str(e)[:50]}")
-            try:
-                await self.page.keyboard.press("Escape")
-            except:
-                pass
             return False
     
     async def _select_labeled_dropdown_searchable(self, label_text: str, placeholder_text: str, search_value: str):
@@ -1057,101 +687,32 @@ class InvoicingPage:
         try:
             print(f"🔍 Searching in '{label_text}' dropdown for '{search_value}'...")
             
-            dropdown_clicked = False
-            
-            # Method 1: Click by placeholder text (most reliable)
-            if not dropdown_clicked:
-                try:
-                    dropdown = self.page.get_by_text(placeholder_text, exact=False).first
-                    await dropdown.wait_for(state="visible", timeout=3000)
-                    await dropdown.click()
-                    dropdown_clicked = True
-                    print(f"✅ Clicked searchable dropdown by placeholder: '{placeholder_text}'")
-                except Exception as e:
-                    print(f"⚠️ Placeholder method failed: {str(e)[:40]}")
-            
-            # Method 2: Try button locator
-            if not dropdown_clicked:
-                try:
-                    dropdown = self.page.locator(f"button:has-text('{placeholder_text}')").first
-                    await dropdown.wait_for(state="visible", timeout=2000)
-                    await dropdown.click()
-                    dropdown_clicked = True
-                    print(f"✅ Clicked searchable dropdown via button")
-                except Exception as e:
-                    print(f"⚠️ Button method failed: {str(e)[:40]}")
-            
-            # Method 3: Use partial text match
-            if not dropdown_clicked:
-                try:
-                    partial_text = placeholder_text.split('...')[0].strip()  # e.g., "Search countries"
-                    dropdown = self.page.locator(f"text={partial_text}").first
-                    await dropdown.wait_for(state="visible", timeout=2000)
-                    await dropdown.click()
-                    dropdown_clicked = True
-                    print(f"✅ Clicked dropdown via partial text: '{partial_text}'")
-                except Exception as e:
-                    print(f"⚠️ Partial text method failed: {str(e)[:40]}")
-            
-            if not dropdown_clicked:
-                print(f"❌ Could not click '{label_text}' dropdown")
-                return False
-            
-            await asyncio.sleep(1)
-            
-            # Type to search
-            await self.page.keyboard.type(search_value[:6])  # Type first 6 chars
-            await asyncio.sleep(1)
-            print(f"⌨️ Typed: '{search_value[:6]}'")
-            
-            # Click the first matching option
-            option_selectors = [
-                "[role='option']",
-                "[role='listbox'] > *",
-                "[class*='option']:not([class*='disabled'])",
-                "[class*='menu-item']",
-                "[data-value]"
+            # Placeholder text (most reliable), a button with it, or its partial text
+            # (e.g. "Search countries") - waited for together, then resolved in list order
+            partial_text = placeholder_text.split('...')[0].strip()
+            triggers = [
+                self.page.get_by_text(placeholder_text, exact=False),
+                f"button:has-text('{placeholder_text}')",
+                f"text={partial_text}",
             ]
-            
-            for selector in option_selectors:
-                try:
-                    options = self.page.locator(selector)
-                    count = await options.count()
-                    if count > 0:
-                        await options.first.click()
-                        print(f"✅ Selected '{search_value}' from '{label_text}' using {selector}")
-                        await asyncio.sleep(0.5)
-                        return True
-                except:
-                    continue
-            
-            # Fallback: Use keyboard
-            try:
-                await self.page.keyboard.press("ArrowDown")
-                await asyncio.sleep(0.3)
-                await self.page.keyboard.press("Enter")
-                print(f"✅ Selected option via keyboard for '{label_text}'")
-                return True
-            except:
-                pass
-            
-            print(f"⚠️ No options found for '{label_text}'")
-            await self.page.keyboard.press("Escape")
-            return False
+            await wait_any_visible(self.page, triggers, timeout=3000)
+            label = await self.combobox.select(triggers, text=search_value, search=search_value[:6],
+                                               keyboard_fallback=True)
+            if label is None:
+                print(f"❌ Could not select '{search_value}' from '{label_text}' dropdown")
+                return False
+            print(f"✅ Selected '{label}' from '{label_text}'")
+            return True
             
         except Exception as e:
             print(f"❌ Error selecting from '{label_text}': {str(e)[:50]}")
-            try:
-                await self.page.keyboard.press("Escape")
-            except:
-                pass
             return False
     
     async def _fill_field_by_placeholder(self, placeholder: str, value: str):
         """Fill a form field by its placeholder text"""
         try:
             field = self.page.get_by_placeholder(placeholder)
-            await field.wait_for(state="visible", timeout=3000)
+            await field.wait_for(state="visible", timeout=budget_timeout(3000))
             await field.clear()
             await field.fill(value)
             print(f"✅ Filled '{placeholder}' with: {value[:30]}...")
@@ -1165,7 +726,7 @@ class InvoicingPage:
         try:
             # Try to find input by associated label
             field = self.page.get_by_label(label_text)
-            await field.wait_for(state="visible", timeout=3000)
+            await field.wait_for(state="visible", timeout=budget_timeout(3000))
             await field.clear()
             await field.fill(value)
             print(f"✅ Filled field by label '{label_text}' with: {value[:30]}...")
@@ -1216,14 +777,14 @@ class InvoicingPage:
             
             # Go to customers section (might already be there)
             await self.go_to_customers_tab()
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             
             # Click add customer
             if not await self.click_add_customer():
                 print("❌ Failed to click Add Customer button")
                 return None
             
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             
             # Fill form
             if not await self.fill_customer_form(customer_data):
@@ -1233,7 +794,7 @@ class InvoicingPage:
             # Scroll dialog to bottom to ensure button is visible
             try:
                 await self.page.evaluate("document.querySelector('[role=\"dialog\"]')?.scrollTo(0, 9999)")
-                await asyncio.sleep(0.5)
+                await self.waits.dom_quiet(quiet_ms=150)
             except:
                 pass
             
@@ -1246,7 +807,6 @@ class InvoicingPage:
                 try:
                     create_btn = self.page.get_by_role("button", name="Create Customer")
                     await create_btn.scroll_into_view_if_needed()
-                    await asyncio.sleep(0.5)
                     await create_btn.click()
                     create_clicked = True
                     print("✅ Create Customer clicked via retry")
@@ -1257,7 +817,7 @@ class InvoicingPage:
                 print("❌ Failed to save customer")
                 return None
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Check for form-specific error messages (inside the dialog)
             # NOTE: Be very careful here - don't catch required field labels (e.g., "Field *") as errors
@@ -1332,7 +892,7 @@ class InvoicingPage:
                     create_btn = self.page.get_by_role("button", name="Create Customer")
                     if await create_btn.is_visible():
                         await create_btn.click()
-                        await asyncio.sleep(2)
+                        await self.waits.settled()
                         print("🔄 Retried Create Customer click")
                 except:
                     pass
@@ -1374,7 +934,7 @@ class InvoicingPage:
     async def _click_customer_action_menu(self, customer_name: str, action: str):
         """Click action menu for a customer and select an action (Products/Invoices/Edit)"""
         try:
-            await asyncio.sleep(2)
+            await self.waits.row_count_stable()
             
             if customer_name:
                 # Use partial name (first few words) since names get truncated in UI
@@ -1442,7 +1002,7 @@ class InvoicingPage:
                         print("✅ Clicked on Actions cell")
                         action_clicked = True
                 
-                await asyncio.sleep(0.5)
+                await self.waits.element_visible(self.action_menu_selector, timeout=2000)
             else:
                 # Click the first row's actions menu
                 print("🔍 Looking for first customer's actions menu")
@@ -1481,13 +1041,13 @@ class InvoicingPage:
                         print("✅ Clicked on Actions cell")
                         action_clicked = True
                 
-                await asyncio.sleep(0.5)
+                await self.waits.element_visible(self.action_menu_selector, timeout=2000)
             
             # Now click the desired action (Products, Invoices, or Edit)
             action_option = self.page.get_by_text(action, exact=True)
-            await action_option.wait_for(state="visible", timeout=3000)
+            await action_option.wait_for(state="visible", timeout=budget_timeout(3000))
             await action_option.click()
-            await asyncio.sleep(1)
+            await self.waits.settled()
             print(f"✅ Clicked '{action}' from actions menu")
             return True
             
@@ -1508,7 +1068,7 @@ class InvoicingPage:
                 element = self.page.locator(selector).first
                 if await element.is_visible():
                     await element.click()
-                    await asyncio.sleep(1)
+                    await self.waits.settled()
                     print(f"✅ Clicked Add Product: {selector}")
                     return True
             except:
@@ -1525,22 +1085,12 @@ class InvoicingPage:
         """
         try:
             print(f"📝 Filling product form with: {product_data}")
-            
-            # Fill name
-            if product_data.get('name'):
-                await self._fill_field(self.product_name_selectors, product_data['name'])
-            
-            # Fill description
-            if product_data.get('description'):
-                await self._fill_field(self.product_description_selectors, product_data['description'])
-            
-            # Fill price
-            if product_data.get('price'):
-                await self._fill_field(self.product_price_selectors, str(product_data['price']))
-            
-            # Fill SKU
-            if product_data.get('sku'):
-                await self._fill_field(self.product_sku_selectors, product_data['sku'])
+            await self.forms.fill("InvoicingPage.product", [
+                Field('name', selectors=self.product_name_selectors),
+                Field('description', selectors=self.product_description_selectors),
+                Field('price', selectors=self.product_price_selectors),
+                Field('sku', selectors=self.product_sku_selectors),
+            ], {key: value for key, value in product_data.items() if value})
             
             print("✅ Product form filled")
             return True
@@ -1574,14 +1124,14 @@ class InvoicingPage:
             
             # Go to products section
             await self.go_to_products_tab()
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             
             # Click add product
             if not await self.click_add_product():
                 print("❌ Failed to click Add Product button")
                 return None
             
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             
             # Fill form
             if not await self.fill_product_form(product_data):
@@ -1593,7 +1143,7 @@ class InvoicingPage:
                 print("❌ Failed to save product")
                 return None
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Check for success
             if await self._check_success_message():
@@ -1619,7 +1169,7 @@ class InvoicingPage:
                     element = self.page.locator(selector).first
                     if await element.is_visible():
                         await element.click()
-                        await asyncio.sleep(1)
+                        await self.waits.settled()
                         print(f"✅ Clicked Invoices tab: {selector}")
                         return True
                 except:
@@ -1637,7 +1187,7 @@ class InvoicingPage:
                 element = self.page.locator(selector).first
                 if await element.is_visible():
                     await element.click()
-                    await asyncio.sleep(1)
+                    await self.waits.dom_quiet()
                     print(f"✅ Clicked Create Invoice: {selector}")
                     return True
             except:
@@ -1654,7 +1204,7 @@ class InvoicingPage:
                     element = self.page.locator(selector).first
                     if await element.is_visible():
                         await element.click()
-                        await asyncio.sleep(1)
+                        await self.waits.dom_quiet()
                         
                         # Try to select from dropdown options
                         option = self.page.locator(f"text={customer_name}").first
@@ -1670,7 +1220,7 @@ class InvoicingPage:
                 combobox = self.page.get_by_role("combobox").first
                 if await combobox.is_visible():
                     await combobox.fill(customer_name)
-                    await asyncio.sleep(1)
+                    await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                     # Click the option
                     option = self.page.locator(f"text={customer_name}").first
                     await option.click()
@@ -1695,7 +1245,7 @@ class InvoicingPage:
                     element = self.page.locator(selector).first
                     if await element.is_visible():
                         await element.click()
-                        await asyncio.sleep(1)
+                        await self.waits.dom_quiet(quiet_ms=150)
                         
                         # Try to select from dropdown options
                         option = self.page.locator(f"text={product_name}").first
@@ -1784,14 +1334,14 @@ class InvoicingPage:
             
             # Go to invoices section
             await self.go_to_invoices_tab()
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             
             # Click create invoice
             if not await self.click_create_invoice():
                 print("❌ Failed to click Create Invoice button")
                 return None
             
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             
             # Fill form
             if not await self.fill_invoice_form(invoice_data):
@@ -1803,7 +1353,7 @@ class InvoicingPage:
                 print("❌ Failed to save invoice")
                 return None
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Check for success
             if await self._check_success_message():
@@ -1851,7 +1401,7 @@ class InvoicingPage:
                 await self.page.screenshot(path="debug_invoicing_navigation.png")
                 return result
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Step 2: Create customer
             print("\n👤 STEP 2: Create Customer")
@@ -1863,7 +1413,7 @@ class InvoicingPage:
             result['customer'] = customer
             customer_name = customer.get('name')
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Step 3: Navigate to Products for this customer and create product
             print("\n📦 STEP 3: Create Product for Customer")
@@ -1884,7 +1434,7 @@ class InvoicingPage:
                     await self.page.goto(f"{base_url}/invoicing?entityId={entity_id}")
                 else:
                     await self.navigate_to_invoicing()
-                await asyncio.sleep(2)
+                await self.waits.settled()
                 
             # Verify we're on the right page and customer exists
             await self.page.screenshot(path="debug_before_products.png")
@@ -1894,7 +1444,7 @@ class InvoicingPage:
             if not customer_visible:
                 print(f"⚠️ Customer '{customer_name}' not visible, refreshing page...")
                 await self.page.reload()
-                await asyncio.sleep(2)
+                await self.waits.settled()
             
             # First, click the Actions menu → Products for our customer
             if not await self.go_to_products_for_customer(customer_name):
@@ -1902,7 +1452,7 @@ class InvoicingPage:
                 await self.page.screenshot(path="debug_products_navigation.png")
                 return result
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Now create the product
             product = await self.create_product_in_section(product_data)
@@ -1912,7 +1462,7 @@ class InvoicingPage:
                 return result
             result['product'] = product
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Step 4: Navigate to Invoices section
             print("\n🧾 STEP 4: Generate Invoice")
@@ -1925,11 +1475,11 @@ class InvoicingPage:
                 invoices_url = current_url.replace("/products", "/invoices")
                 print(f"🔄 Navigating to invoices URL: {invoices_url}")
                 await self.page.goto(invoices_url)
-                await asyncio.sleep(2)
+                await self.waits.settled()
             else:
                 # Navigate back to invoicing main page and then to invoices
                 await self.navigate_to_invoicing()
-                await asyncio.sleep(1)
+                await self.waits.settled()
                 
                 # Click Actions menu → Invoices for our customer
                 if not await self.go_to_invoices_for_customer(customer_name):
@@ -1937,7 +1487,7 @@ class InvoicingPage:
                     await self.page.screenshot(path="debug_invoices_navigation.png")
                     return result
                 
-                await asyncio.sleep(2)
+                await self.waits.settled()
             
             # Create the invoice
             invoice = await self.create_invoice_in_section(product.get('name'))
@@ -1984,23 +1534,23 @@ class InvoicingPage:
             # Look for Add Product button
             add_button = self.page.get_by_role("button", name="Add Product")
             try:
-                await add_button.wait_for(state="visible", timeout=5000)
+                await add_button.wait_for(state="visible", timeout=budget_timeout(5000))
                 await add_button.click()
-                await asyncio.sleep(1)
+                await self.waits.dialog_open()
                 print("✅ Clicked Add Product button")
             except:
                 # Try alternative selectors
                 try:
                     add_btn = self.page.locator("button:has-text('Add Product'), text=Add Product").first
                     await add_btn.click()
-                    await asyncio.sleep(1)
+                    await self.waits.dialog_open()
                     print("✅ Clicked Add Product via locator")
                 except Exception as e:
                     print(f"❌ Could not click Add Product: {str(e)[:50]}")
                     return None
             
             # Fill product form
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             
             # Take screenshot of the product form
             await self.page.screenshot(path="debug_product_form.png")
@@ -2077,7 +1627,7 @@ class InvoicingPage:
                 start_date_trigger = self.page.locator("text=Pick a date").first
                 if await start_date_trigger.is_visible():
                     await start_date_trigger.click()
-                    await asyncio.sleep(1)
+                    await self.waits.element_visible(self.calendar_selector, timeout=2000)
                     
                     # Navigate to current month if needed and select today
                     today = datetime.now()
@@ -2093,7 +1643,7 @@ class InvoicingPage:
                             next_btn = self.page.locator("button:has(svg)").last
                             if await next_btn.is_visible():
                                 await next_btn.click()
-                                await asyncio.sleep(0.5)
+                                await self.waits.dom_quiet(quiet_ms=150)
                         except:
                             break
                     
@@ -2120,9 +1670,8 @@ class InvoicingPage:
                             pass
                     
                     # Close the calendar by pressing Escape or clicking outside
-                    await asyncio.sleep(0.5)
                     await self.page.keyboard.press("Escape")
-                    await asyncio.sleep(0.5)
+                    await self.waits.dom_quiet(quiet_ms=150)
                     print("✅ Closed date picker")
                     
             except Exception as e:
@@ -2133,7 +1682,6 @@ class InvoicingPage:
                 except:
                     pass
             
-            await asyncio.sleep(0.5)
             
             # Select Contract (REQUIRED dropdown)
             print("🔽 Selecting Contract...")
@@ -2156,7 +1704,7 @@ class InvoicingPage:
                     dropdown = self.page.locator(selector).first
                     if await dropdown.is_visible():
                         await dropdown.click()
-                        await asyncio.sleep(0.5)
+                        await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                         # Select first option (usually "Monthly")
                         option = self.page.locator("[role='option']").first
                         if await option.is_visible():
@@ -2184,7 +1732,7 @@ class InvoicingPage:
                         btn = parent.locator("button, [role='combobox']").first
                         if await btn.is_visible():
                             await btn.click()
-                            await asyncio.sleep(0.5)
+                            await self.waits.dom_quiet(quiet_ms=150)
                             # Try to select "Monthly"
                             monthly = self.page.locator("[role='option']:has-text('Monthly')").first
                             if await monthly.is_visible():
@@ -2204,7 +1752,6 @@ class InvoicingPage:
             if not billing_period_selected:
                 print("⚠️ Could not select Billing Period - this may be required!")
             
-            await asyncio.sleep(0.5)
             
             # Select Currency (REQUIRED dropdown)
             print("🔽 Selecting Currency...")
@@ -2222,7 +1769,7 @@ class InvoicingPage:
                     dropdown = self.page.locator(selector).first
                     if await dropdown.is_visible():
                         await dropdown.click()
-                        await asyncio.sleep(0.5)
+                        await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                         # Select USD or first option
                         usd_option = self.page.locator("[role='option']:has-text('USD'), [role='option']:has-text('Dollar')").first
                         if await usd_option.is_visible():
@@ -2249,7 +1796,6 @@ class InvoicingPage:
             if not currency_selected:
                 print("⚠️ Could not select Currency - this may be required!")
             
-            await asyncio.sleep(0.5)
             
             # Select Product Income Account (REQUIRED dropdown)
             print("🔽 Selecting Product Income Account...")
@@ -2272,7 +1818,7 @@ class InvoicingPage:
                 print("❌ Could not click Create Product button")
                 return None
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Check for form validation errors BEFORE declaring success
             error_selectors = [
@@ -2308,7 +1854,7 @@ class InvoicingPage:
                     create_btn = self.page.get_by_role("button", name="Create Product")
                     if await create_btn.is_visible():
                         await create_btn.click()
-                        await asyncio.sleep(2)
+                        await self.waits.settled()
                         print("🔄 Clicked Create Product again")
                 except:
                     pass
@@ -2325,7 +1871,7 @@ class InvoicingPage:
             
             if not success_found:
                 # Check if dialog closed (indicates success)
-                await asyncio.sleep(1)
+                await self.waits.dialog_closed()
                 if not await dialog.is_visible():
                     print(f"✅ Product created (dialog closed): {product_data.get('name', 'Unknown')}")
                 else:
@@ -2336,7 +1882,7 @@ class InvoicingPage:
             await self._close_any_dialogs()
             
             # Verify product exists in list
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             product_name = product_data.get('name', '')
             try:
                 product_in_list = self.page.locator(f"text={product_name[:20]}").first
@@ -2381,18 +1927,18 @@ class InvoicingPage:
                 
                 if not overlay_visible:
                     print("✅ No overlays blocking - dialog closed")
-                    await asyncio.sleep(1)  # Extra wait to ensure UI is stable
+                    await self.waits.dom_quiet()
                     return True
                 
                 # Try to close
                 print(f"🔄 Attempt {attempt + 1}: Closing dialogs...")
                 await self.page.keyboard.press("Escape")
-                await asyncio.sleep(1)
+                await self.waits.dom_quiet(quiet_ms=150)
                 
                 # Try clicking outside the dialog
                 try:
                     await self.page.mouse.click(10, 10)
-                    await asyncio.sleep(0.5)
+                    await self.waits.dom_quiet(quiet_ms=150)
                 except:
                     pass
                 
@@ -2408,7 +1954,7 @@ class InvoicingPage:
                         close_btn = self.page.locator(close_sel).first
                         if await close_btn.is_visible():
                             await close_btn.click()
-                            await asyncio.sleep(0.5)
+                            await self.waits.dom_quiet(quiet_ms=150)
                             break
                     except:
                         continue
@@ -2430,7 +1976,7 @@ class InvoicingPage:
         try:
             # Try pressing Escape to close dialogs
             await self.page.keyboard.press("Escape")
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             
             # Try clicking X button if present
             close_buttons = [
@@ -2446,7 +1992,7 @@ class InvoicingPage:
                     close_btn = self.page.locator(selector).first
                     if await close_btn.is_visible():
                         await close_btn.click()
-                        await asyncio.sleep(0.5)
+                        await self.waits.dom_quiet(quiet_ms=150)
                         print("✅ Closed dialog")
                         break
                 except:
@@ -2454,7 +2000,7 @@ class InvoicingPage:
             
             # Press Escape again just to be safe
             await self.page.keyboard.press("Escape")
-            await asyncio.sleep(0.5)
+            await self.waits.dom_quiet(quiet_ms=150)
             
         except Exception as e:
             print(f"⚠️ Dialog close attempt: {str(e)[:50]}")
@@ -2463,7 +2009,7 @@ class InvoicingPage:
         """Create an invoice when already in the Invoices section"""
         try:
             print("🧾 Creating invoice...")
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Take screenshot to debug what's on the page
             try:
@@ -2496,9 +2042,9 @@ class InvoicingPage:
                 # Try get_by_role first with wait_for
                 try:
                     add_button = self.page.get_by_role("button", name=button_name)
-                    await add_button.wait_for(state="visible", timeout=3000)
+                    await add_button.wait_for(state="visible", timeout=budget_timeout(3000))
                     await add_button.click()
-                    await asyncio.sleep(1)
+                    await self.waits.dialog_open()
                     button_clicked = True
                     print(f"✅ Clicked '{button_name}' button via get_by_role")
                     break
@@ -2508,8 +2054,8 @@ class InvoicingPage:
                 # Try locator with force click
                 try:
                     add_btn = self.page.locator(f"button:has-text('{button_name}')").first
-                    await add_btn.click(timeout=3000)
-                    await asyncio.sleep(1)
+                    await add_btn.click(timeout=budget_timeout(3000))
+                    await self.waits.dialog_open()
                     button_clicked = True
                     print(f"✅ Clicked '{button_name}' button via locator")
                     break
@@ -2527,10 +2073,9 @@ class InvoicingPage:
                         if btn_text and "generate" in btn_text.lower():
                             # Try scrolling into view first
                             await btn.scroll_into_view_if_needed()
-                            await asyncio.sleep(0.5)
                             # Try force click
-                            await btn.click(force=True, timeout=5000)
-                            await asyncio.sleep(1)
+                            await btn.click(force=True, timeout=budget_timeout(5000))
+                            await self.waits.dialog_open()
                             button_clicked = True
                             print(f"✅ Clicked button {i}: '{btn_text}' (force click)")
                             break
@@ -2544,7 +2089,6 @@ class InvoicingPage:
                 try:
                     btn = buttons.nth(6)
                     await btn.scroll_into_view_if_needed()
-                    await asyncio.sleep(0.5)
                     await btn.click(force=True)
                     button_clicked = True
                     print("✅ Clicked button 6 directly (force click)")
@@ -2561,7 +2105,7 @@ class InvoicingPage:
                         pass
                 return None
             
-            await asyncio.sleep(1)
+            await self.waits.dialog_open()
             
             # Step 2: Select Month from the dropdown in the modal
             print("📅 Selecting invoice month...")
@@ -2579,7 +2123,7 @@ class InvoicingPage:
                 dropdown_trigger = self.page.get_by_text("Select month to invoice").first
                 if await dropdown_trigger.is_visible():
                     await dropdown_trigger.click()
-                    await asyncio.sleep(1)
+                    await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                     print("✅ Clicked month dropdown trigger")
                     
                     # Take screenshot after opening dropdown
@@ -2606,7 +2150,7 @@ class InvoicingPage:
                         if count > 0:
                             # Click the first option
                             await options.first.click()
-                            await asyncio.sleep(0.5)
+                            await self.waits.dom_quiet(quiet_ms=150)
                             month_selected = True
                             print(f"✅ Selected first month option via {selector}")
                             break
@@ -2620,7 +2164,7 @@ class InvoicingPage:
                     dropdown_trigger = self.page.locator("[class*='select'], [role='combobox']").first
                     if await dropdown_trigger.is_visible():
                         await dropdown_trigger.click()
-                        await asyncio.sleep(1)
+                        await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                     
                     # Look for specific month names
                     current_month = datetime.now().strftime("%B")  # e.g., "December"
@@ -2647,9 +2191,9 @@ class InvoicingPage:
                     dropdown_trigger = self.page.get_by_text("Select month to invoice").first
                     if await dropdown_trigger.is_visible():
                         await dropdown_trigger.click()
-                        await asyncio.sleep(0.5)
+                        await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                         await self.page.keyboard.press("ArrowDown")
-                        await asyncio.sleep(0.3)
+                        await self.waits.dom_quiet(quiet_ms=150)
                         await self.page.keyboard.press("Enter")
                         month_selected = True
                         print("✅ Selected month via keyboard navigation")
@@ -2663,7 +2207,7 @@ class InvoicingPage:
             except:
                 pass
             
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             
             # Step 3: Click "Continue" button
             print("📤 Clicking Continue button...")
@@ -2673,7 +2217,7 @@ class InvoicingPage:
                 continue_btn = self.page.get_by_role("button", name="Continue")
                 if await continue_btn.is_visible():
                     await continue_btn.click()
-                    await asyncio.sleep(2)
+                    await self.waits.settled()
                     continue_clicked = True
                     print("✅ Clicked Continue button")
             except Exception as e:
@@ -2683,14 +2227,14 @@ class InvoicingPage:
                 try:
                     continue_btn = self.page.locator("button:has-text('Continue')").first
                     await continue_btn.click()
-                    await asyncio.sleep(2)
+                    await self.waits.settled()
                     continue_clicked = True
                     print("✅ Clicked Continue via locator")
                 except:
                     pass
             
             # Step 4: Fill the Invoice Details form
-            await asyncio.sleep(2)
+            await self.waits.dom_quiet()
             print("📝 Filling Invoice Details form...")
             
             # Fill Invoice Date (required field) - This is a date picker component
@@ -2705,7 +2249,7 @@ class InvoicingPage:
                 date_trigger = self.page.get_by_text("Pick a date").first
                 if await date_trigger.is_visible():
                     await date_trigger.click()
-                    await asyncio.sleep(1)
+                    await self.waits.element_visible(self.calendar_selector, timeout=2000)
                     
                     # Take screenshot of calendar
                     await self.page.screenshot(path="debug_calendar_open.png")
@@ -2739,7 +2283,7 @@ class InvoicingPage:
                                 next_btn = self.page.locator(selector).first
                                 if await next_btn.is_visible():
                                     await next_btn.click()
-                                    await asyncio.sleep(0.5)
+                                    await self.waits.dom_quiet(quiet_ms=150)
                                     print(f"✅ Clicked next month button ({selector})")
                                     break
                             except:
@@ -2750,7 +2294,7 @@ class InvoicingPage:
                             print("✅ Navigated to December 2025")
                             break
                     
-                    await asyncio.sleep(0.5)
+                    await self.waits.dom_quiet(quiet_ms=150)
                     await self.page.screenshot(path="debug_calendar_december.png")
                     
                     # Now click on today's day (3)
@@ -2791,7 +2335,7 @@ class InvoicingPage:
                     
                     if day_clicked:
                         invoice_date_filled = True
-                        await asyncio.sleep(0.5)
+                        await self.waits.dom_quiet(quiet_ms=150)
                         
             except Exception as e:
                 print(f"⚠️ Method 1 (calendar picker) failed: {str(e)[:40]}")
@@ -2803,7 +2347,7 @@ class InvoicingPage:
                     date_trigger = self.page.get_by_text("Pick a date").first
                     if await date_trigger.is_visible():
                         await date_trigger.click()
-                        await asyncio.sleep(1)
+                        await self.waits.element_visible(self.calendar_selector, timeout=2000)
                     
                     # Find all day buttons that are not disabled
                     calendar_days = self.page.locator("button:not([disabled])").filter(has_text="25")
@@ -2818,11 +2362,11 @@ class InvoicingPage:
             if not invoice_date_filled:
                 try:
                     await self.page.keyboard.press("Escape")
-                    await asyncio.sleep(0.5)
+                    await self.waits.dom_quiet(quiet_ms=150)
                     # Try clicking the input and typing
                     date_input = self.page.locator("input").filter(has_text="Pick a date").first
                     await date_input.click()
-                    await asyncio.sleep(0.5)
+                    await self.waits.dom_quiet(quiet_ms=150)
                     await self.page.keyboard.type("12/03/2025")
                     await self.page.keyboard.press("Tab")
                     invoice_date_filled = True
@@ -2830,7 +2374,7 @@ class InvoicingPage:
                 except Exception as e:
                     print(f"⚠️ Method 3 (type date) failed: {str(e)[:40]}")
             
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             
             # Step 5: Add Invoice Lines (REQUIRED)
             print("📝 Adding Invoice Lines...")
@@ -2842,7 +2386,7 @@ class InvoicingPage:
                 
                 if await add_product.is_visible():
                     await add_product.click()
-                    await asyncio.sleep(1)
+                    await self.waits.dom_quiet()
                     print("✅ Clicked Add Product dropdown")
                     
                     # Take screenshot of dropdown
@@ -2859,7 +2403,7 @@ class InvoicingPage:
                         await options.first.click()
                         product_added = True
                         print(f"✅ Selected product: {prod_name}")
-                        await asyncio.sleep(1)
+                        await self.waits.dom_quiet()
                     else:
                         print("⚠️ No products available in dropdown")
                 else:
@@ -2867,7 +2411,7 @@ class InvoicingPage:
                     add_cell = self.page.locator("td:has-text('Add Product')")
                     if await add_cell.is_visible():
                         await add_cell.click()
-                        await asyncio.sleep(0.5)
+                        await self.waits.dom_quiet(quiet_ms=150)
                         
                         options = self.page.locator("[role='option']")
                         if await options.count() > 0:
@@ -2875,7 +2419,7 @@ class InvoicingPage:
                             product_added = True
                             print("✅ Selected product via table cell click")
                 
-                await asyncio.sleep(1)
+                await self.waits.dom_quiet()
                 
                 if product_added:
                     print("✅ Invoice line item added successfully")
@@ -2895,7 +2439,7 @@ class InvoicingPage:
                 create_btn = self.page.get_by_role("button", name="Create Invoice")
                 if await create_btn.is_visible():
                     await create_btn.click()
-                    await asyncio.sleep(3)
+                    await self.waits.settled()
                     invoice_created = True
                     print("✅ Clicked Create Invoice button")
             except Exception as e:
@@ -2906,7 +2450,7 @@ class InvoicingPage:
                     create_btn = self.page.locator("button:has-text('Create Invoice')").first
                     if await create_btn.is_visible():
                         await create_btn.click()
-                        await asyncio.sleep(3)
+                        await self.waits.settled()
                         invoice_created = True
                         print("✅ Clicked Create Invoice via locator")
                 except:
@@ -2952,16 +2496,15 @@ class InvoicingPage:
     
     async def _fill_field(self, selectors: list, value: str):
         """Helper to fill a form field trying multiple selectors"""
-        for selector in selectors:
+        index, element = await first_visible(self.page, selectors)
+        if element is not None:
             try:
-                element = self.page.locator(selector).first
-                if await element.is_visible():
-                    await element.clear()
-                    await element.fill(value)
-                    print(f"✅ Filled field {selector}: {value[:30]}...")
-                    return True
+                await element.first.clear()
+                await element.first.fill(value)
+                print(f"✅ Filled field {selectors[index]}: {value[:30]}...")
+                return True
             except:
-                continue
+                pass
         print(f"⚠️ Could not fill field with value: {value[:30]}...")
         return False
 
@@ -2971,7 +2514,7 @@ class InvoicingPage:
         # First scroll the dialog to the bottom to reveal button
         try:
             await self.page.evaluate("document.querySelector('[role=\"dialog\"]')?.scrollTo(0, 9999)")
-            await asyncio.sleep(0.3)
+            await self.waits.dom_quiet(quiet_ms=150)
         except:
             pass
         
@@ -2980,7 +2523,6 @@ class InvoicingPage:
             try:
                 button = self.page.get_by_role("button", name=button_text)
                 await button.scroll_into_view_if_needed()
-                await asyncio.sleep(0.3)
                 await button.click(force=True)
                 print(f"✅ Clicked button: {button_text}")
                 return True
@@ -2993,7 +2535,6 @@ class InvoicingPage:
                 button = self.page.get_by_role("button", name=name)
                 if await button.is_visible():
                     await button.scroll_into_view_if_needed()
-                    await asyncio.sleep(0.2)
                     await button.click(force=True)
                     print(f"✅ Clicked button via get_by_role: {name}")
                     return True
@@ -3006,7 +2547,6 @@ class InvoicingPage:
                 button = self.page.locator(f"button:has-text('{name}')").first
                 if await button.is_visible():
                     await button.scroll_into_view_if_needed()
-                    await asyncio.sleep(0.2)
                     await button.click(force=True)
                     print(f"✅ Clicked button via locator: {name}")
                     return True
@@ -3023,7 +2563,6 @@ class InvoicingPage:
                     text = await btn.inner_text()
                     if "create" in text.lower() or "save" in text.lower() or "submit" in text.lower():
                         await btn.scroll_into_view_if_needed()
-                        await asyncio.sleep(0.2)
                         await btn.click(force=True)
                         print(f"✅ Clicked colored button: {text}")
                         return True
@@ -3031,38 +2570,32 @@ class InvoicingPage:
             pass
         
         # Fall back to selectors
-        for selector in self.save_button_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.is_visible():
-                    await element.scroll_into_view_if_needed()
-                    await asyncio.sleep(0.2)
-                    await element.click(force=True)
-                    print(f"✅ Clicked save button: {selector}")
-                    return True
-            except:
-                continue
+        async def click_save(element):
+            await element.scroll_into_view_if_needed()
+            await element.click(force=True)
+
+        selector = await selector_resolver.act_on_first_visible(
+            self.page, "InvoicingPage.save_button_selectors", self.save_button_selectors, click_save
+        )
+        if selector:
+            print(f"✅ Clicked save button: {selector}")
+            return True
         
         print("❌ Save button not found")
         return False
 
     async def _check_success_message(self):
         """Helper to check for success message"""
-        for selector in self.success_message_selectors:
-            try:
-                element = self.page.locator(selector).first
-                if await element.is_visible():
-                    print(f"✅ Success message found: {selector}")
-                    return True
-            except:
-                continue
+        if await any_visible(self.page, self.success_message_selectors):
+            print("✅ Success message found")
+            return True
         return False
 
     async def get_invoice_list(self):
         """Get list of invoices displayed on page"""
         try:
             await self.go_to_invoices_tab()
-            await asyncio.sleep(2)
+            await self.waits.row_count_stable()
             
             # Try to find invoice table/list
             invoice_rows = self.page.locator("table tbody tr, [data-testid*='invoice-row'], .invoice-item")
@@ -3093,7 +2626,7 @@ class InvoicingPage:
         """
         try:
             await self.go_to_invoices_tab()
-            await asyncio.sleep(2)
+            await self.waits.row_count_stable()
             
             search_term = customer_name or invoice_number
             if not search_term:
@@ -7,6 +7,8 @@ Handles financial KPIs, dashboard metrics, and reporting features
 from playwright.async_api import Page, expect
 import asyncio
 
+from utils.routes import goto_route
+
 
 class LedgerPage:
     """Page object for Ledger section - Financial Dashboard"""
@@ -63,69 +65,13 @@ class LedgerPage:
         self.kpi_section = page.locator("text=Key Performance Indicators").locator("..")
 
     async def navigate_to_ledger(self):
-        """Navigate to ledger section (Financial Dashboard)"""
+        """Navigate to ledger section by its deep link (entity of the current URL is kept)"""
         try:
-            # Check if we're already on the page
-            current_url = self.page.url
-            if "home" in current_url.lower():
-                print("✅ Already on dashboard page, checking for ledger view")
-            
-            # Use the working pattern from successful tab navigation tests
-            await asyncio.sleep(3)
-            
-            # Handle menu opening with better error handling
-            try:
-                logo = self.page.locator("svg.viewz-logo")
-                box = await logo.bounding_box()
-                if box:
-                    await self.page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
-                await asyncio.sleep(1)
-
-                # Try to click pin button with better handling
-                pin_button = self.page.locator("button:has(svg.lucide-pin)")
-                if await pin_button.is_visible():
-                    # Use force click to bypass interception issues
-                    await pin_button.click(force=True)
-                    await asyncio.sleep(1)
-                    print("✅ Pin button clicked (forced)")
-                else:
-                    print("⚠️ Pin button not visible, trying to continue")
-                    
-            except Exception as e:
-                print(f"⚠️ Menu handling issue (continuing): {str(e)}")
-            
-            # Navigate to Ledger tab
-            ledger_selectors = [
-                "text=Ledger",
-                "button:has-text('Ledger')",
-                "a:has-text('Ledger')",
-                "[data-testid*='ledger']"
-            ]
-            
-            for selector in ledger_selectors:
-                try:
-                    element = self.page.locator(selector)
-                    if await element.is_visible():
-                        await element.click()
-                        await asyncio.sleep(3)
-                        print(f"✅ Clicked ledger element: {selector}")
-                        break
-                except Exception as e:
-                    print(f"⚠️ Failed to click {selector}: {str(e)}")
-                    continue
-            
-            # Verify we're on the financial dashboard
-            if await self.is_loaded():
-                print("✅ Successfully navigated to Ledger (Financial Dashboard)")
+            if await goto_route(self.page, self):
+                print("✅ Successfully navigated to Ledger")
                 return True
-            else:
-                print("⚠️ Ledger dashboard not fully loaded, but continuing")
-                # Check if we're at least on a dashboard URL
-                current_url = self.page.url
-                if "home" in current_url.lower():
-                    print("✅ On dashboard URL, continuing with tests")
-                    return True
-                return False
+            print("⚠️ Ledger route did not load")
+            return False
                 
         except Exception as e:
             print(f"❌ Error navigating to ledger: {str(e)}")
@@ -1,3 +1,6 @@
+from utils.selector_race import first_visible
+
+
 class LoginPage:
     def __init__(self, page):
         self.page = page
@@ -10,6 +13,30 @@ class LoginPage:
             'div[role="main"]',  # Main role fallback
             'svg.viewz-logo',  # Logo appears when logged in
         ]
+        # Post-submit states raced by utils/login_flow.py
+        self.two_fa_indicators = [
+            'text=Two-Factor Authentication',
+            'text=Authentication',
+            'text=verification',
+            'text=code',
+        ]
+        self.login_error_indicators = [
+            'text=Invalid username or password',
+            'text=Incorrect username or password',
+            '[role="alert"]:has-text("Invalid")',
+            '[role="alert"]:has-text("Incorrect")',
+        ]
+        self.otp_success_indicators = [
+            'text=SuccessOTP verified successfully',
+            'text=OTP verified successfully',
+            'text=Success',
+        ]
+        self.otp_error_indicators = [
+            'text=Invalid code',
+            'text=Invalid OTP',
+            '[role="alert"]:has-text("Invalid")',
+        ]
+        self.home_url_pattern = "**/home**"
 
     async def goto(self):
         await self.page.goto("/login")
@@ -31,3 +58,34 @@ class LoginPage:
                 continue
         return False
 
+
+    async def is_session_active(self, timeout=15000):
+        """Check whether the current tab is authenticated (app shell rendered, not bounced to login)"""
+        ready_selector = ", ".join(self.logged_in_selectors + [self.username_input])
+        try:
+            await self.page.wait_for_selector(ready_selector, timeout=timeout)
+        except Exception:
+            return False
+        if "/login" in self.page.url:
+            return False
+        return not await self.page.locator(self.username_input).is_visible()
+
+    def any_of(self, selectors):
+        """One locator matching any of the given selectors"""
+        locator = self.page.locator(selectors[0])
+        for selector in selectors[1:]:
+            locator = locator.or_(self.page.locator(selector))
+        return locator
+
+    async def fill_otp(self, otp):
+        """Enter the OTP into the 2FA textbox (falls back to the last visible input)"""
+        candidates = [
+            self.page.get_by_role("textbox"),
+            self.page.locator('input[type="text"]'),
+            self.page.locator('input'),
+        ]
+        index, field = await first_visible(self.page, candidates)
+        if field is None:
+            return False
+        await field.last.fill(otp)
+        return True
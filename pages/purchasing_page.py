@@ -5,24 +5,27 @@ Similar to Invoicing but for vendor/purchasing workflows
 """
 
 from playwright.async_api import Page
-import asyncio
 import random
 import string
 from datetime import datetime, timedelta
 
+from utils.wait_engine import WaitEngine
+from utils.combobox import Combobox
+from utils.routes import goto_route
+from utils.form_fill import Field, FormFiller
+
 
 class PurchasingPage:
     """Page object for Purchasing section"""
     
     def __init__(self, page: Page):
         self.page = page
+        self.waits = WaitEngine(page)
         self.heading = 'Purchasing'
-        # Dynamic base_url - extract from current page or use default
-        current_url = page.url if hasattr(page, 'url') else ""
-        if "stage.viewz.co" in current_url:
-            self.base_url = "https://app.stage.viewz.co/purchasing"
-        else:
-            self.base_url = "https://app.viewz.co/purchasing"
+        self.dropdown_option_selector = "[role='option'], [cmdk-item], [data-radix-collection-item]"
+        self.calendar_selector = "[role='grid'], [role='dialog'] table"
+        self.combobox = Combobox(page, self.waits, self.dropdown_option_selector)
+        self.forms = FormFiller(page, self.waits, self.combobox)
         
         # Navigation selectors
         self.nav_selectors = [
@@ -256,14 +259,8 @@ class PurchasingPage:
     async def navigate_to_purchasing(self, entity_id: int = 1) -> bool:
         """Navigate to the Purchasing page"""
         try:
-            # First try direct URL navigation
-            url = f"{self.base_url}?entityId={entity_id}"
-            await self.page.goto(url)
-            await self.page.wait_for_load_state("networkidle")
-            await asyncio.sleep(2)
-            
-            # Check if we're on purchasing page
-            if 'purchasing' in self.page.url.lower():
+            # Deep link first - the sidebar is only a fallback
+            if await goto_route(self.page, self, entity_id, waits=self.waits):
                 print(f"📍 Navigated to Purchasing via URL: {self.page.url}")
                 return True
             
@@ -276,19 +273,19 @@ class PurchasingPage:
                 box = await logo.bounding_box()
                 if box:
                     await self.page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
-                    await asyncio.sleep(1)
+                    await self.waits.dom_quiet()
             
             # Pin menu if possible
             pin_button = self.page.locator("button:has(svg.lucide-pin)")
             if await pin_button.count() > 0 and await pin_button.is_visible():
                 await pin_button.click()
-                await asyncio.sleep(0.5)
+                await self.waits.dom_quiet(quiet_ms=150)
             
             # Click Purchasing in sidebar
             purchasing_link = self.page.locator("text=Purchasing").first
             if await purchasing_link.count() > 0:
                 await purchasing_link.click()
-                await asyncio.sleep(2)
+                await self.waits.settled()
                 print(f"📍 Navigated to Purchasing via sidebar: {self.page.url}")
                 return True
             else:
@@ -335,7 +332,7 @@ class PurchasingPage:
         Similar to Invoicing's _click_customer_action_menu pattern.
         """
         try:
-            await asyncio.sleep(2)
+            await self.waits.row_count_stable()
             
             target_row = None
             
@@ -411,7 +408,7 @@ class PurchasingPage:
                         await last_cell.click()
                         print("✅ Clicked last cell (Actions column)")
                         action_clicked = True
-                    await asyncio.sleep(0.5)
+                    await self.waits.dom_quiet(quiet_ms=150)
                 except:
                     pass
             
@@ -420,7 +417,7 @@ class PurchasingPage:
                 await self.take_screenshot("actions_not_found")
                 return False
             
-            await asyncio.sleep(1)
+            await self.waits.element_visible("[role='menu'], [role='menuitem']", timeout=2000)
             
             # Take screenshot to see the menu
             await self.take_screenshot("actions_menu_state")
@@ -443,7 +440,7 @@ class PurchasingPage:
                     option = self.page.locator(selector).first
                     if await option.count() > 0 and await option.is_visible():
                         await option.click()
-                        await asyncio.sleep(2)
+                        await self.waits.settled()
                         print(f"✅ Clicked '{action}' via: {selector}")
                         return True
                 except:
@@ -459,7 +456,7 @@ class PurchasingPage:
                         action_btn = container.locator(f"text={action}").first
                         if await action_btn.count() > 0:
                             await action_btn.click()
-                            await asyncio.sleep(2)
+                            await self.waits.settled()
                             print(f"✅ Clicked '{action}' in {container_sel}")
                             return True
             except:
@@ -484,7 +481,7 @@ class PurchasingPage:
                 element = self.page.locator(selector).first
                 if await element.count() > 0 and await element.is_visible():
                     await element.click()
-                    await asyncio.sleep(1)
+                    await self.waits.settled()
                     print("✅ Clicked Add Vendor button")
                     return True
             except:
@@ -492,243 +489,134 @@ class PurchasingPage:
         print("⚠️ Add Vendor button not found")
         return False
     
-    async def _select_dropdown(self, trigger_text: str, option_text: str, field_name: str) -> bool:
-        """Select an option from a dropdown"""
-        try:
-            # Find and click the dropdown trigger
-            dropdown_selectors = [
-                f"text={trigger_text}",
-                f"[placeholder='{trigger_text}']",
-                f"button:has-text('{trigger_text}')",
-            ]
-            
-            clicked = False
-            for selector in dropdown_selectors:
-                try:
-                    dropdown = self.page.locator(selector).first
-                    if await dropdown.count() > 0 and await dropdown.is_visible():
-                        await dropdown.click()
-                        await asyncio.sleep(0.5)
-                        clicked = True
-                        break
-                except:
-                    continue
-            
-            if not clicked:
-                print(f"   ⚠️ Dropdown not found: {trigger_text}")
-                return False
-            
-            # Select the option
-            option_selectors = [
-                f"text={option_text}",
-                f"[role='option']:has-text('{option_text}')",
-                f"li:has-text('{option_text}')",
-                f"div:has-text('{option_text}')",
-            ]
-            
-            for selector in option_selectors:
-                try:
-                    option = self.page.locator(selector).first
-                    if await option.count() > 0 and await option.is_visible():
-                        await option.click()
-                        await asyncio.sleep(0.3)
-                        print(f"   ✅ {field_name}: {option_text}")
-                        return True
-                except:
-                    continue
-            
-            print(f"   ⚠️ Option not found: {option_text}")
-            return False
-            
-        except Exception as e:
-            print(f"   ⚠️ Dropdown error: {str(e)[:30]}")
-            return False
-
+    def _dropdown_triggers(self, trigger_text: str) -> list:
+        """Dropdown trigger by its text, placeholder or button text"""
+        return [
+            f"text={trigger_text}",
+            f"[placeholder='{trigger_text}']",
+            f"button:has-text('{trigger_text}')",
+        ]
+    
     async def fill_vendor_form(self, vendor_data: dict) -> bool:
         """Fill the vendor creation form including required dropdowns"""
         try:
-            filled_fields = 0
-            
-            # 1. COUNTRY (Required dropdown) - Already defaults to USA usually
-            country = vendor_data.get('country', 'USA')
-            # Only select if not already set
-            country_dropdown = self.page.locator("text=Search countries...").first
-            if await country_dropdown.count() > 0 and await country_dropdown.is_visible():
-                if await self._select_dropdown("Search countries...", country, "Country"):
-                    filled_fields += 1
-            else:
+            # Numeric registration; tax ID the same to avoid validation issues
+            reg_number = vendor_data.get('registration', str(random.randint(100000, 999999)))
+            data = {'registration': reg_number, 'tax_id': reg_number, **vendor_data}
+            
+            result = await self.forms.fill("PurchasingPage.vendor", [
+                Field('registration', placeholder="Enter registration number"),
+                Field('tax_id', placeholder="Enter tax ID"),
+                Field('name', placeholder="Enter vendor name", default=f"Vendor-{random.randint(1000, 9999)}"),
+                Field('email', placeholder="Enter email address",
+                      default=f"vendor{random.randint(100, 999)}@example.com"),
+                Field('city', placeholder="Enter city", default='Los Angeles'),
+                Field('address', placeholder="Enter vendor address", default='123 Test Street'),
+                Field('zip', placeholder="Enter zip code", default='90210'),
+                # Required; usually defaults to USA, then the search box is not shown
+                Field('country', Field.SELECT, default='USA', triggers=["text=Search countries..."]),
+                # Required - options: Company, Individual
+                Field('vendor_type', Field.SELECT, default='Company', triggers=self._dropdown_triggers("Select vendor type")),
+                Field('gl_account', Field.CUSTOM, action=self._select_vendor_gl_account),
+                # Required for USA
+                Field('state', Field.SELECT, default='California', triggers=self._dropdown_triggers("Select state")),
+                # Required - common options: Net 30, Net 60, Due on Receipt
+                Field('payment_terms', Field.SELECT, default='Net 30',
+                      triggers=self._dropdown_triggers("Select payment terms")),
+            ], data)
+            
+            if not result.ok('country'):
                 print(f"   ✅ Country: Already set")
-                filled_fields += 1
-            
-            await asyncio.sleep(0.3)
-            
-            # 2. VENDOR TYPE (Required dropdown) - Options: Company, Individual
-            vendor_type = vendor_data.get('vendor_type', 'Company')
-            if await self._select_dropdown("Select vendor type", vendor_type, "Vendor Type"):
-                filled_fields += 1
+            return result.filled > 0
             
-            await asyncio.sleep(0.3)
-            
-            # 3. Fill Registration Number (use numeric format)
-            reg_number = vendor_data.get('registration', str(random.randint(100000, 999999)))
-            reg_input = self.page.locator("input[placeholder='Enter registration number']").first
-            if await reg_input.count() > 0:
-                await reg_input.fill(reg_number)
-                print(f"   ✅ Registration: {reg_number}")
-                filled_fields += 1
-            
-            # 4. Fill Tax ID (same format as registration to avoid validation issues)
-            tax_id = vendor_data.get('tax_id', reg_number)  # Use same as registration if not provided
-            tax_input = self.page.locator("input[placeholder='Enter tax ID']").first
-            if await tax_input.count() > 0:
-                await tax_input.fill(tax_id)
-                print(f"   ✅ Tax ID: {tax_id}")
-                filled_fields += 1
-            
-            # 5. Fill Vendor Name
-            name_input = self.page.locator("input[placeholder='Enter vendor name']").first
-            if await name_input.count() > 0:
-                await name_input.fill(vendor_data.get('name', f"Vendor-{random.randint(1000, 9999)}"))
-                print(f"   ✅ Name: {vendor_data.get('name', 'auto')}")
-                filled_fields += 1
-            
-            await asyncio.sleep(0.3)
-            
-            # 6. GL Account - FIRST try dropdown, THEN checkbox if no options
-            gl_filled = False
-            
-            # Method 1: Try to select from dropdown first
-            try:
-                gl_dropdown = self.page.locator("text=Select payables account").first
-                if await gl_dropdown.count() > 0 and await gl_dropdown.is_visible():
-                    # Check if dropdown is NOT disabled
-                    parent_button = self.page.locator("button:has-text('Select payables account')").first
-                    is_disabled = await parent_button.is_disabled() if await parent_button.count() > 0 else True
-                    
-                    if not is_disabled:
-                        await gl_dropdown.click()
-                        await asyncio.sleep(1)
-                        
-                        # Check for options
-                        options = self.page.locator("[role='option'], [cmdk-item], li")
-                        option_count = await options.count()
-                        
-                        if option_count > 0:
-                            first_option = options.first
-                            option_text = await first_option.inner_text()
-                            await first_option.click()
-                            print(f"   ✅ GL Account: {option_text[:40]}...")
-                            filled_fields += 1
-                            gl_filled = True
-                            await asyncio.sleep(0.5)
-                        else:
-                            await self.page.keyboard.press("Escape")
-                            print(f"   ⚠️ GL Account dropdown: No options")
+        except Exception as e:
+            print(f"❌ Error filling vendor form: {e}")
+            await self.take_screenshot("vendor_form_error")
+            return False
+    
+    async def _select_vendor_gl_account(self, value=None) -> bool:
+        """GL Account - FIRST try dropdown, THEN the auto-create checkbox, THEN a JS click"""
+        gl_filled = False
+        
+        # Method 1: Try to select from dropdown first
+        try:
+            gl_dropdown = self.page.locator("text=Select payables account").first
+            if await gl_dropdown.count() > 0 and await gl_dropdown.is_visible():
+                # Check if dropdown is NOT disabled
+                parent_button = self.page.locator("button:has-text('Select payables account')").first
+                is_disabled = await parent_button.is_disabled() if await parent_button.count() > 0 else True
+        
+                if not is_disabled:
+                    await gl_dropdown.click()
+                    await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
+        
+                    # Check for options
+                    options = self.page.locator("[role='option'], [cmdk-item], li")
+                    option_count = await options.count()
+        
+                    if option_count > 0:
+                        first_option = options.first
+                        option_text = await first_option.inner_text()
+                        await first_option.click()
+                        print(f"   ✅ GL Account: {option_text[:40]}...")
+                        gl_filled = True
+                        await self.waits.dom_quiet(quiet_ms=150)
                     else:
-                        print(f"   ⚠️ GL Account dropdown is disabled")
+                        await self.page.keyboard.press("Escape")
+                        print(f"   ⚠️ GL Account dropdown: No options")
+                else:
+                    print(f"   ⚠️ GL Account dropdown is disabled")
+        except Exception as e:
+            print(f"   ⚠️ GL Account dropdown: {str(e)[:30]}")
+        
+        # Method 2: If dropdown failed, try the checkbox
+        if not gl_filled:
+            try:
+                # Click anywhere on the checkbox row
+                checkbox_row = self.page.locator("text=Create GL Account Automatically").first
+                if await checkbox_row.count() > 0 and await checkbox_row.is_visible():
+                    await checkbox_row.click()
+                    await self.waits.settled()
+                    print(f"   ✅ GL Account: Clicked auto-create checkbox")
+                    gl_filled = True
             except Exception as e:
-                print(f"   ⚠️ GL Account dropdown: {str(e)[:30]}")
-            
-            # Method 2: If dropdown failed, try the checkbox
-            if not gl_filled:
-                try:
-                    # Click anywhere on the checkbox row
-                    checkbox_row = self.page.locator("text=Create GL Account Automatically").first
-                    if await checkbox_row.count() > 0 and await checkbox_row.is_visible():
-                        await checkbox_row.click()
-                        await asyncio.sleep(1)
-                        print(f"   ✅ GL Account: Clicked auto-create checkbox")
-                        filled_fields += 1
-                        gl_filled = True
-                except Exception as e:
-                    print(f"   ⚠️ GL Account checkbox: {str(e)[:30]}")
-            
-            # Method 3: JavaScript fallback
-            if not gl_filled:
-                try:
-                    toggled = await self.page.evaluate("""
-                        () => {
-                            const labels = document.querySelectorAll('label, span, div');
-                            for (const label of labels) {
-                                if (label.textContent.includes('Create GL Account Automatically')) {
-                                    const container = label.closest('div');
-                                    const checkbox = container?.querySelector('input[type="checkbox"], [role="checkbox"], button');
-                                    if (checkbox) {
-                                        checkbox.click();
-                                        return 'clicked checkbox';
-                                    }
-                                    label.click();
-                                    return 'clicked label';
+                print(f"   ⚠️ GL Account checkbox: {str(e)[:30]}")
+        
+        # Method 3: JavaScript fallback
+        if not gl_filled:
+            try:
+                toggled = await self.page.evaluate("""
+                    () => {
+                        const labels = document.querySelectorAll('label, span, div');
+                        for (const label of labels) {
+                            if (label.textContent.includes('Create GL Account Automatically')) {
+                                const container = label.closest('div');
+                                const checkbox = container?.querySelector('input[type="checkbox"], [role="checkbox"], button');
+                                if (checkbox) {
+                                    checkbox.click();
+                                    return 'clicked checkbox';
                                 }
+                                label.click();
+                                return 'clicked label';
                             }
-                            return null;
                         }
-                    """)
-                    if toggled:
-                        print(f"   ✅ GL Account: {toggled} via JS")
-                        gl_filled = True
-                        filled_fields += 1
-                        await asyncio.sleep(1)
-                except Exception as e:
-                    print(f"   ⚠️ GL Account JS: {str(e)[:30]}")
-            
-            await asyncio.sleep(0.3)
-            
-            # 7. Fill Email
-            email_input = self.page.locator("input[placeholder='Enter email address']").first
-            if await email_input.count() > 0:
-                await email_input.fill(vendor_data.get('email', f"vendor{random.randint(100, 999)}@example.com"))
-                print(f"   ✅ Email: {vendor_data.get('email', 'auto')}")
-                filled_fields += 1
-            
-            # 8. STATE dropdown (required for USA)
-            state = vendor_data.get('state', 'California')
-            if await self._select_dropdown("Select state", state, "State"):
-                filled_fields += 1
-            
-            await asyncio.sleep(0.3)
-            
-            # 9. Fill City
-            city_input = self.page.locator("input[placeholder='Enter city']").first
-            if await city_input.count() > 0:
-                await city_input.fill(vendor_data.get('city', 'Los Angeles'))
-                print(f"   ✅ City: {vendor_data.get('city', 'Los Angeles')}")
-                filled_fields += 1
-            
-            # 10. Fill Address
-            address_input = self.page.locator("input[placeholder='Enter vendor address']").first
-            if await address_input.count() > 0:
-                await address_input.fill(vendor_data.get('address', '123 Test Street'))
-                print(f"   ✅ Address: {vendor_data.get('address', 'auto')}")
-                filled_fields += 1
-            
-            # 11. Fill Zip Code
-            zip_input = self.page.locator("input[placeholder='Enter zip code']").first
-            if await zip_input.count() > 0:
-                await zip_input.fill(vendor_data.get('zip', '90210'))
-                print(f"   ✅ Zip: {vendor_data.get('zip', '90210')}")
-                filled_fields += 1
-            
-            # 12. PAYMENT TERMS (Required dropdown) - Common options: Net 30, Net 60, Due on Receipt
-            payment_terms = vendor_data.get('payment_terms', 'Net 30')
-            if await self._select_dropdown("Select payment terms", payment_terms, "Payment Terms"):
-                filled_fields += 1
-            
-            await asyncio.sleep(0.3)
-            
-            print(f"   📝 Filled {filled_fields} vendor fields")
-            return filled_fields > 0
-            
-        except Exception as e:
-            print(f"❌ Error filling vendor form: {e}")
-            await self.take_screenshot("vendor_form_error")
-            return False
+                        return null;
+                    }
+                """)
+                if toggled:
+                    print(f"   ✅ GL Account: {toggled} via JS")
+                    gl_filled = True
+                    await self.waits.dom_quiet()
+            except Exception as e:
+                print(f"   ⚠️ GL Account JS: {str(e)[:30]}")
+        
+        return gl_filled
     
     async def _click_save(self, button_text: str = None) -> bool:
         """Click save/create button"""
         # Scroll to bottom to ensure button is visible
         await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await asyncio.sleep(0.5)
+        await self.waits.dom_quiet(quiet_ms=150)
         
         save_selectors = [
             f"button:has-text('{button_text}')" if button_text else None,
@@ -746,11 +634,10 @@ class PurchasingPage:
                 if await btn.count() > 0:
                     # Scroll into view and click
                     await btn.scroll_into_view_if_needed()
-                    await asyncio.sleep(0.3)
                     
                     if await btn.is_visible():
                         await btn.click(force=True)
-                        await asyncio.sleep(2)
+                        await self.waits.settled()
                         print(f"✅ Clicked: {selector}")
                         return True
             except Exception as e:
@@ -775,7 +662,7 @@ class PurchasingPage:
             """)
             if clicked:
                 print(f"✅ Clicked via JS: {clicked}")
-                await asyncio.sleep(2)
+                await self.waits.settled()
                 return True
         except:
             pass
@@ -807,7 +694,7 @@ class PurchasingPage:
             
             # Go to Vendors tab
             await self.go_to_vendors_tab()
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             
             # Click Add Vendor
             if not await self.click_add_vendor():
@@ -816,7 +703,7 @@ class PurchasingPage:
                 add_btn = self.page.locator("button:has-text('Add')").first
                 if await add_btn.count() > 0:
                     await add_btn.click()
-                    await asyncio.sleep(1)
+                    await self.waits.dom_quiet()
             
             # Fill form
             await self.fill_vendor_form(vendor_data)
@@ -824,7 +711,7 @@ class PurchasingPage:
             # Save - Click "Create Vendor" button
             await self._click_save("Create Vendor")
             
-            await asyncio.sleep(3)
+            await self.waits.settled()
             
             # Check if form is still open
             form_still_open = await self.page.locator("text=Create New Vendor").count() > 0
@@ -841,13 +728,12 @@ class PurchasingPage:
                     if not is_disabled:
                         # Try clicking again
                         await create_btn.scroll_into_view_if_needed()
-                        await asyncio.sleep(0.5)
                         await create_btn.click(force=True)
-                        await asyncio.sleep(3)
+                        await self.waits.settled()
                         print("   🔄 Clicked Create Vendor again")
             
             # Verify form closed (back on vendors list)
-            await asyncio.sleep(2)
+            await self.waits.dom_quiet()
             form_closed = await self.page.locator("text=Create New Vendor").count() == 0
             
             if form_closed:
@@ -868,7 +754,7 @@ class PurchasingPage:
         vendors = []
         try:
             await self.go_to_vendors_tab()
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             
             rows = self.page.locator("table tbody tr")
             count = await rows.count()
@@ -902,7 +788,7 @@ class PurchasingPage:
             result = await self._click_vendor_action_menu(vendor_name, "Products")
             
             if result:
-                await asyncio.sleep(2)
+                await self.waits.settled()
                 
                 # Check if URL changed (navigation to products page)
                 new_url = self.page.url
@@ -937,7 +823,7 @@ class PurchasingPage:
                 element = self.page.locator(selector).first
                 if await element.count() > 0 and await element.is_visible():
                     await element.click()
-                    await asyncio.sleep(1)
+                    await self.waits.dom_quiet()
                     print("✅ Clicked Add Product button")
                     return True
             except:
@@ -948,335 +834,89 @@ class PurchasingPage:
     async def fill_product_form(self, product_data: dict) -> bool:
         """Fill the product creation form including required fields"""
         try:
-            filled_fields = 0
-            
-            # Fill Product Name
-            name = product_data.get('name', f"Product-{random.randint(1000, 9999)}")
-            name_input = self.page.locator("input").filter(has=self.page.locator("[placeholder*='Product Name' i], [name='name']")).first
-            if await name_input.count() == 0:
-                # Try by position - first input in form
-                name_input = self.page.locator("[role='dialog'] input, .modal input").first
-            
-            if await name_input.count() > 0:
-                await name_input.fill(name)
-                filled_fields += 1
-                print(f"   ✅ Product Name: {name}")
-            
-            await asyncio.sleep(0.3)
-            
-            # Fill SKU
-            sku = product_data.get('sku', f"SKU-{random.randint(1000, 9999)}")
-            sku_input = self.page.locator("input[placeholder*='SKU' i], input[name*='sku' i]").first
-            if await sku_input.count() == 0:
-                # Try the second input
-                inputs = self.page.locator("[role='dialog'] input, .modal input")
-                if await inputs.count() > 1:
-                    sku_input = inputs.nth(1)
-            
-            if await sku_input.count() > 0 and await sku_input.is_visible():
-                await sku_input.fill(sku)
-                filled_fields += 1
-                print(f"   ✅ SKU: {sku}")
-            
-            await asyncio.sleep(0.3)
-            
-            # Fill Unit (REQUIRED - e.g., "licenses", "hours", "units")
-            unit = product_data.get('unit', 'units')
-            unit_input = self.page.locator("input[placeholder*='licenses' i], input[placeholder*='hours' i], input[placeholder*='unit' i]").first
-            if await unit_input.count() > 0 and await unit_input.is_visible():
-                await unit_input.fill(unit)
-                filled_fields += 1
-                print(f"   ✅ Unit: {unit}")
-            else:
-                # Try to find by label
-                unit_label = self.page.locator("text=Unit").first
-                if await unit_label.count() > 0:
-                    # Find the input near this label
-                    unit_input = self.page.locator("input").filter(has=self.page.locator("text=Unit")).first
-                    if await unit_input.count() == 0:
-                        # Try sibling input
-                        all_inputs = self.page.locator("[role='dialog'] input")
-                        for i in range(await all_inputs.count()):
-                            inp = all_inputs.nth(i)
-                            placeholder = await inp.get_attribute("placeholder") or ""
-                            if "licenses" in placeholder.lower() or "hours" in placeholder.lower():
-                                await inp.fill(unit)
-                                filled_fields += 1
-                                print(f"   ✅ Unit: {unit}")
-                                break
+            result = await self.forms.fill("PurchasingPage.product", [
+                Field('name', placeholder="Product Name", default=f"Product-{random.randint(1000, 9999)}",
+                      selectors=["input[name='name']", "[role='dialog'] input", ".modal input"]),
+                Field('sku', placeholder="SKU", default=f"SKU-{random.randint(1000, 9999)}",
+                      selectors=["input[name*='sku' i]"]),
+                # Required - e.g. "licenses", "hours", "units"
+                Field('unit', placeholder=["licenses", "hours", "unit"], default='units'),
+                Field('price', placeholder="price", default=round(random.uniform(50.0, 500.0), 2),
+                      selectors=["input[name*='price' i]"]),
+                # Might be required - first option
+                Field('product_type', Field.SELECT, index=0, triggers=["button:has-text('Select type')"]),
+                # Might be required - first option (e.g. "Monthly")
+                Field('billing_period', Field.SELECT, index=0, triggers=["button:has-text('Select period')"]),
+                Field('start_date', Field.CUSTOM, action=self._pick_start_date),
+                # Required - missing validation in UI but server requires it
+                Field('contract', Field.SELECT, index=0, triggers=[
+                    "button:has-text('Select Contract')",
+                    self.page.get_by_text("Select Contract", exact=True),
+                    self.page.locator("text=Contract").first.locator("xpath=./parent::*").locator("button, [role='combobox']"),
+                ]),
+                # Product Income Account - required; no options until GL accounts are set up
+                Field('gl_account', Field.SELECT, index=0, triggers=["button:has-text('Select GL Account')"]),
+                # Required - the requested currency, else the first one
+                Field('currency', Field.SELECT, default='US Dollar', index=0,
+                      triggers=["button:has-text('Select currency')"]),
+            ], product_data)
+            
+            return result.filled > 0
             
-            await asyncio.sleep(0.3)
-            
-            # Fill Price
-            price = product_data.get('price', round(random.uniform(50.0, 500.0), 2))
-            price_input = self.page.locator("input[placeholder*='price' i], input[name*='price' i]").first
-            if await price_input.count() == 0:
-                # Try to find input near "Price" label
-                price_inputs = self.page.locator("[role='dialog'] input[type='number'], [role='dialog'] input")
-                for i in range(await price_inputs.count()):
-                    inp = price_inputs.nth(i)
-                    placeholder = await inp.get_attribute("placeholder") or ""
-                    name_attr = await inp.get_attribute("name") or ""
-                    if "price" in placeholder.lower() or "price" in name_attr.lower():
-                        price_input = inp
-                        break
-            
-            if await price_input.count() > 0 and await price_input.is_visible():
-                await price_input.fill(str(price))
-                filled_fields += 1
-                print(f"   ✅ Price: {price}")
-            
-            await asyncio.sleep(0.3)
-            
-            # Select Product Type (might be required)
-            try:
-                type_dropdown = self.page.locator("button:has-text('Select type')").first
-                if await type_dropdown.count() > 0 and await type_dropdown.is_visible():
-                    await type_dropdown.click()
-                    await asyncio.sleep(1)
-                    
-                    # Click first option
-                    options = self.page.locator("[role='option'], [cmdk-item], [data-radix-collection-item]")
-                    if await options.count() > 0:
-                        opt = options.first
-                        opt_text = await opt.inner_text()
-                        await opt.click()
-                        filled_fields += 1
-                        print(f"   ✅ Product Type: {opt_text}")
-                    else:
-                        await self.page.keyboard.press("Escape")
-            except Exception as e:
-                print(f"   ⚠️ Product Type: {str(e)[:30]}")
-            
-            await asyncio.sleep(0.3)
-            
-            # Select Billing Period (might be required)
-            try:
-                period_dropdown = self.page.locator("button:has-text('Select period')").first
-                if await period_dropdown.count() > 0 and await period_dropdown.is_visible():
-                    await period_dropdown.click()
-                    await asyncio.sleep(1)
-                    
-                    # Click first option (e.g., "Monthly")
-                    options = self.page.locator("[role='option'], [cmdk-item], [data-radix-collection-item]")
-                    if await options.count() > 0:
-                        opt = options.first
-                        opt_text = await opt.inner_text()
-                        await opt.click()
-                        filled_fields += 1
-                        print(f"   ✅ Billing Period: {opt_text}")
-                    else:
-                        await self.page.keyboard.press("Escape")
-            except Exception as e:
-                print(f"   ⚠️ Billing Period: {str(e)[:30]}")
-            
-            await asyncio.sleep(0.3)
-            
-            # Select Start Date (REQUIRED for recurring products)
-            try:
-                # Find the "Pick a date" button for Start Date
-                start_date_btn = self.page.locator("button:has-text('Pick a date')").first
-                if await start_date_btn.count() > 0 and await start_date_btn.is_visible():
-                    await start_date_btn.click()
-                    await asyncio.sleep(1)
-                    
-                    # Wait for calendar to open
-                    calendar = self.page.locator("[role='dialog'] table, [class*='calendar'], [class*='picker']")
-                    if await calendar.count() > 0:
-                        # Click on a day (try multiple selectors)
-                        day_selectors = [
-                            "[role='gridcell'] button:not([disabled])",
-                            "button[name='day']",
-                            "[class*='day']:not([disabled])"
-                        ]
-                        
-                        for selector in day_selectors:
-                            try:
-                                day_btn = self.page.locator(selector).first
-                                if await day_btn.count() > 0 and await day_btn.is_visible():
-                                    await day_btn.click()
-                                    filled_fields += 1
-                                    print(f"   ✅ Start Date: Selected")
-                                    break
-                            except:
-                                continue
-                        else:
-                            # Try clicking today in footer
-                            today_btn = self.page.locator("button:has-text('Today')").first
-                            if await today_btn.count() > 0:
-                                await today_btn.click()
-                                filled_fields += 1
-                                print(f"   ✅ Start Date: Today")
-                            else:
-                                await self.page.keyboard.press("Escape")
-                                print(f"   ⚠️ Start Date: Could not select day")
-                    else:
-                        # Maybe it's a different date picker type
-                        await self.page.keyboard.press("Escape")
-                        print(f"   ⚠️ Start Date: Calendar not visible")
-                else:
-                    print(f"   ⚠️ Start Date: Button not found")
-            except Exception as e:
-                print(f"   ⚠️ Start Date: {str(e)[:40]}")
-            
-            await asyncio.sleep(0.3)
-            
-            # Select Contract (REQUIRED - missing validation in UI but server requires it)
-            contract_selected = False
-            
-            # Method 1: Click the dropdown button directly
-            try:
-                # Find the Contract section and click the dropdown
-                contract_button = self.page.locator("button:has-text('Select Contract')").first
-                if await contract_button.count() > 0 and await contract_button.is_visible():
-                    await contract_button.click()
-                    await asyncio.sleep(1)
-                    contract_selected = True
-                    print(f"   📍 Clicked Contract dropdown button")
-            except Exception as e:
-                print(f"   ⚠️ Contract button method: {str(e)[:30]}")
-            
-            # Method 2: Try text locator
-            if not contract_selected:
-                try:
-                    contract_text = self.page.get_by_text("Select Contract", exact=True).first
-                    if await contract_text.count() > 0 and await contract_text.is_visible():
-                        await contract_text.click()
-                        await asyncio.sleep(1)
-                        contract_selected = True
-                        print(f"   📍 Clicked Contract text")
-                except Exception as e:
-                    print(f"   ⚠️ Contract text method: {str(e)[:30]}")
-            
-            # Method 3: Find by label
-            if not contract_selected:
-                try:
-                    contract_label = self.page.locator("text=Contract").first
-                    if await contract_label.count() > 0:
-                        # Click the sibling dropdown
-                        parent = contract_label.locator("xpath=./parent::*")
-                        dropdown = parent.locator("button, [role='combobox']").first
-                        if await dropdown.count() > 0:
-                            await dropdown.click()
-                            await asyncio.sleep(1)
-                            contract_selected = True
-                            print(f"   📍 Clicked Contract via label")
-                except Exception as e:
-                    print(f"   ⚠️ Contract label method: {str(e)[:30]}")
-            
-            # Now select an option if dropdown is open
-            if contract_selected:
-                try:
-                    await asyncio.sleep(0.5)
-                    # Look for options in the dropdown
-                    options = self.page.locator("[role='option'], [cmdk-item], [data-radix-collection-item]")
-                    option_count = await options.count()
-                    print(f"   📋 Found {option_count} contract options")
-                    
-                    if option_count > 0:
-                        first_option = options.first
-                        option_text = await first_option.inner_text()
-                        await first_option.click()
-                        filled_fields += 1
-                        print(f"   ✅ Contract: {option_text[:30]}...")
+        except Exception as e:
+            print(f"❌ Error filling product form: {e}")
+            return False
+    
+    async def _pick_start_date(self, value=None) -> bool:
+        """Start Date (REQUIRED for recurring products) - first selectable day, else Today"""
+        picked = False
+        try:
+            # Find the "Pick a date" button for Start Date
+            start_date_btn = self.page.locator("button:has-text('Pick a date')").first
+            if await start_date_btn.count() > 0 and await start_date_btn.is_visible():
+                await start_date_btn.click()
+                await self.waits.element_visible(self.calendar_selector, timeout=2000)
+        
+                # Wait for calendar to open
+                calendar = self.page.locator("[role='dialog'] table, [class*='calendar'], [class*='picker']")
+                if await calendar.count() > 0:
+                    # Click on a day (try multiple selectors)
+                    day_selectors = [
+                        "[role='gridcell'] button:not([disabled])",
+                        "button[name='day']",
+                        "[class*='day']:not([disabled])"
+                    ]
+        
+                    for selector in day_selectors:
+                        try:
+                            day_btn = self.page.locator(selector).first
+                            if await day_btn.count() > 0 and await day_btn.is_visible():
+                                await day_btn.click()
+                                picked = True
+                                print(f"   ✅ Start Date: Selected")
+                                break
+                        except:
+                            continue
                     else:
-                        # Try clicking any visible list item
-                        list_items = self.page.locator("[class*='popover'] div, [class*='dropdown'] div").filter(has_text=lambda t: t and len(t) > 2)
-                        if await list_items.count() > 0:
-                            await list_items.first.click()
-                            filled_fields += 1
-                            print(f"   ✅ Contract: First available")
+                        # Try clicking today in footer
+                        today_btn = self.page.locator("button:has-text('Today')").first
+                        if await today_btn.count() > 0:
+                            await today_btn.click()
+                            picked = True
+                            print(f"   ✅ Start Date: Today")
                         else:
                             await self.page.keyboard.press("Escape")
-                            print(f"   ⚠️ Contract: No options found")
-                except Exception as e:
-                    print(f"   ⚠️ Contract option: {str(e)[:30]}")
+                            print(f"   ⚠️ Start Date: Could not select day")
+                else:
+                    # Maybe it's a different date picker type
                     await self.page.keyboard.press("Escape")
+                    print(f"   ⚠️ Start Date: Calendar not visible")
             else:
-                print(f"   ⚠️ Contract: Could not open dropdown")
-            
-            await asyncio.sleep(0.3)
-            
-            # Select Product Income Account (GL Account) - REQUIRED
-            try:
-                gl_dropdown = self.page.locator("button:has-text('Select GL Account')").first
-                if await gl_dropdown.count() > 0 and await gl_dropdown.is_visible():
-                    await gl_dropdown.click()
-                    await asyncio.sleep(1)
-                    
-                    # Look for options
-                    options = self.page.locator("[role='option'], [cmdk-item], [data-radix-collection-item]")
-                    option_count = await options.count()
-                    print(f"   📋 Found {option_count} GL Account options")
-                    
-                    if option_count > 0:
-                        first_opt = options.first
-                        opt_text = await first_opt.inner_text()
-                        await first_opt.click()
-                        filled_fields += 1
-                        print(f"   ✅ Product Income Account: {opt_text[:30]}...")
-                    else:
-                        await self.page.keyboard.press("Escape")
-                        print(f"   ⚠️ Product Income Account: No options - GL accounts need to be set up")
-                else:
-                    print(f"   ⚠️ Product Income Account: Dropdown not found")
-            except Exception as e:
-                print(f"   ⚠️ Product Income Account: {str(e)[:40]}")
-            
-            await asyncio.sleep(0.3)
-            
-            # Select Currency (REQUIRED - has asterisk *)
-            currency_selected = False
-            currency = product_data.get('currency', 'US Dollar')
-            
-            try:
-                # Method 1: Click "Select currency" dropdown
-                currency_dropdown = self.page.locator("button:has-text('Select currency')").first
-                if await currency_dropdown.count() > 0 and await currency_dropdown.is_visible():
-                    await currency_dropdown.click()
-                    await asyncio.sleep(1)
-                    
-                    # Look for the currency option
-                    options = self.page.locator("[role='option'], [cmdk-item], [data-radix-collection-item]")
-                    option_count = await options.count()
-                    print(f"   📋 Found {option_count} currency options")
-                    
-                    if option_count > 0:
-                        # Try to find specific currency or use first
-                        for i in range(option_count):
-                            opt = options.nth(i)
-                            opt_text = await opt.inner_text()
-                            if currency.lower() in opt_text.lower():
-                                await opt.click()
-                                filled_fields += 1
-                                currency_selected = True
-                                print(f"   ✅ Currency: {opt_text}")
-                                break
-                        
-                        if not currency_selected:
-                            # Use first option
-                            first_opt = options.first
-                            opt_text = await first_opt.inner_text()
-                            await first_opt.click()
-                            filled_fields += 1
-                            currency_selected = True
-                            print(f"   ✅ Currency: {opt_text}")
-                    else:
-                        await self.page.keyboard.press("Escape")
-                        print(f"   ⚠️ Currency: No options found")
-                else:
-                    print(f"   ⚠️ Currency dropdown not found")
-            except Exception as e:
-                print(f"   ⚠️ Currency: {str(e)[:40]}")
-            
-            await asyncio.sleep(0.3)
-            
-            print(f"   📝 Filled {filled_fields} product fields")
-            return filled_fields > 0
-            
+                print(f"   ⚠️ Start Date: Button not found")
         except Exception as e:
-            print(f"❌ Error filling product form: {e}")
-            return False
+            print(f"   ⚠️ Start Date: {str(e)[:40]}")
+        
+        return picked
     
     async def create_product_for_vendor(self, vendor_name: str = None, product_data: dict = None) -> dict:
         """Create a product for a vendor"""
@@ -1297,7 +937,7 @@ class PurchasingPage:
             if not await self.go_to_products_for_vendor(vendor_name):
                 # Try direct Products tab
                 await self.go_to_products_tab()
-                await asyncio.sleep(1)
+                await self.waits.row_count_stable()
             
             # Click Add Product
             await self.click_add_product()
@@ -1311,7 +951,7 @@ class PurchasingPage:
             # Save
             await self._click_save("Create Product")
             
-            await asyncio.sleep(3)
+            await self.waits.settled()
             
             # Take screenshot after save to see any errors
             await self.take_screenshot("after_create_product_click")
@@ -1332,7 +972,7 @@ class PurchasingPage:
                 cancel_btn = self.page.locator("button:has-text('Cancel')").first
                 if await cancel_btn.count() > 0 and await cancel_btn.is_visible():
                     await cancel_btn.click()
-                    await asyncio.sleep(1)
+                    await self.waits.dom_quiet()
                 
                 return None
             
@@ -1342,13 +982,13 @@ class PurchasingPage:
                     cancel_btn = self.page.locator("button:has-text('Cancel')").first
                     if await cancel_btn.count() > 0:
                         await cancel_btn.click()
-                        await asyncio.sleep(1)
+                        await self.waits.dom_quiet()
                 except:
                     await self.page.keyboard.press("Escape")
-                    await asyncio.sleep(1)
+                    await self.waits.dom_quiet()
             
             # Verify product appears in the list
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             product_name = product_data.get('name', '')
             product_in_list = self.page.locator(f"text={product_name[:15]}")  # Partial match
             
@@ -1385,7 +1025,7 @@ class PurchasingPage:
                 element = self.page.locator(selector).first
                 if await element.count() > 0 and await element.is_visible():
                     await element.click()
-                    await asyncio.sleep(1)
+                    await self.waits.settled()
                     print("✅ Clicked Create Purchase Order button")
                     return True
             except:
@@ -1429,18 +1069,18 @@ class PurchasingPage:
                 await self.take_screenshot("po_navigation_failed")
                 return None
             
-            await asyncio.sleep(2)
+            await self.waits.row_count_stable()
             
             # Click Generate PurchaseOrder button
             await self.click_create_purchase_order()
             
-            await asyncio.sleep(2)
+            await self.waits.dom_quiet()
             
             # Step 1: Select PurchaseOrder Month from the dialog
             month_dropdown = self.page.locator("text=Select month to purchase-order").first
             if await month_dropdown.count() > 0 and await month_dropdown.is_visible():
                 await month_dropdown.click()
-                await asyncio.sleep(1)
+                await self.waits.element_visible(self.dropdown_option_selector, timeout=2000)
                 
                 # Select first available month
                 options = self.page.locator("[role='option'], [cmdk-item], [data-radix-collection-item]")
@@ -1457,14 +1097,14 @@ class PurchasingPage:
                     await self.page.keyboard.press("Escape")
                     return None
                 
-                await asyncio.sleep(1)
+                await self.waits.dom_quiet()
                 
                 # Click Continue button
                 continue_btn = self.page.locator("button:has-text('Continue')").first
                 if await continue_btn.count() > 0 and await continue_btn.is_visible():
                     await continue_btn.click()
                     print("   ✅ Clicked Continue")
-                    await asyncio.sleep(3)
+                    await self.waits.settled()
                 else:
                     print("   ⚠️ Continue button not found")
             else:
@@ -1474,16 +1114,16 @@ class PurchasingPage:
             po_date_input = self.page.locator("text=Pick a date").first
             if await po_date_input.count() > 0 and await po_date_input.is_visible():
                 await po_date_input.click()
-                await asyncio.sleep(1)
+                await self.waits.element_visible(self.calendar_selector, timeout=2000)
                 
                 # Click today or first available date
                 today_btn = self.page.locator("button[name='day']:not([disabled])").first
                 if await today_btn.count() > 0:
                     await today_btn.click()
                     print("   ✅ Selected PO Date")
-                    await asyncio.sleep(1)
+                    await self.waits.dom_quiet(quiet_ms=150)
             
-            await asyncio.sleep(2)  # Wait for Due Date to become enabled
+            await self.waits.dom_quiet()
             
             # Step 2b: Fill Due Date (enabled after PO Date is selected)
             # Find the Due Date section and click on it
@@ -1496,7 +1136,7 @@ class PurchasingPage:
                 if await clickable.count() > 0:
                     try:
                         await clickable.click(force=True, timeout=5000)
-                        await asyncio.sleep(1)
+                        await self.waits.element_visible(self.calendar_selector, timeout=2000)
                         
                         # Click a date in the calendar
                         available_dates = self.page.locator("button[name='day']:not([disabled])")
@@ -1506,7 +1146,7 @@ class PurchasingPage:
                         elif date_count > 0:
                             await available_dates.last.click()
                         print("   ✅ Selected Due Date")
-                        await asyncio.sleep(0.5)
+                        await self.waits.dom_quiet(quiet_ms=150)
                     except Exception as e:
                         print(f"   ⚠️ Due Date click failed: {str(e)[:30]}")
                         # Try JavaScript click
@@ -1521,7 +1161,7 @@ class PurchasingPage:
                                     }
                                 }
                             """)
-                            await asyncio.sleep(1)
+                            await self.waits.dom_quiet(quiet_ms=150)
                             available_dates = self.page.locator("button[name='day']:not([disabled])")
                             if await available_dates.count() > 0:
                                 await available_dates.nth(min(7, await available_dates.count()-1)).click()
@@ -1531,7 +1171,7 @@ class PurchasingPage:
             else:
                 print("   ⚠️ Due Date label not found")
             
-            await asyncio.sleep(1)
+            await self.waits.dom_quiet()
             
             # Step 3: Click Create PurchaseOrder button
             create_po_btn = self.page.locator("button:has-text('Create PurchaseOrder')").first
@@ -1541,19 +1181,18 @@ class PurchasingPage:
                 if not is_disabled:
                     await create_po_btn.click()
                     print("   ✅ Clicked Create PurchaseOrder")
-                    await asyncio.sleep(3)
+                    await self.waits.settled()
                 else:
                     # Try Create Draft instead
                     draft_btn = self.page.locator("button:has-text('Create Draft')").first
                     if await draft_btn.count() > 0:
                         await draft_btn.click()
                         print("   ✅ Clicked Create Draft")
-                        await asyncio.sleep(3)
+                        await self.waits.settled()
             
             # Take screenshot of PO creation result
             await self.take_screenshot("po_created")
             
-            await asyncio.sleep(2)
             
             po_data = {
                 'vendor': vendor_name,
@@ -1575,7 +1214,7 @@ class PurchasingPage:
         orders = []
         try:
             await self.go_to_purchase_orders_tab()
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             
             rows = self.page.locator("table tbody tr")
             count = await rows.count()
@@ -1620,7 +1259,7 @@ class PurchasingPage:
             else:
                 print("   ⚠️ Vendor creation may have failed, continuing...")
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Step 2: Create Product
             print("\n📌 Step 2: Create Product for Vendor")
@@ -1634,7 +1273,7 @@ class PurchasingPage:
             else:
                 print("   ⚠️ Product creation may have failed, continuing...")
             
-            await asyncio.sleep(2)
+            await self.waits.settled()
             
             # Step 3: Create Purchase Order
             print("\n📌 Step 3: Create Purchase Order")
@@ -1672,7 +1311,7 @@ class PurchasingPage:
         """Verify a vendor exists in the list"""
         try:
             await self.go_to_vendors_tab()
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             
             vendor = self.page.locator(f"text={vendor_name}").first
             exists = await vendor.count() > 0
@@ -1685,7 +1324,7 @@ class PurchasingPage:
         """Verify a product exists"""
         try:
             await self.go_to_products_tab()
-            await asyncio.sleep(1)
+            await self.waits.row_count_stable()
             
             product = self.page.locator(f"text={product_name}").first
             exists = await product.count() > 0
@@ -6,6 +6,9 @@ Page object for the Receivables section under Reconciliation
 from playwright.async_api import Page, expect
 import asyncio
 
+from utils.deadline import budget_timeout
+from utils.routes import goto_route
+
 
 class ReceivablesPage:
     """Page object for Receivables section under Reconciliation"""
@@ -25,137 +28,24 @@ class ReceivablesPage:
         self.status_dropdowns = page.locator("select, [role='combobox']")
     
     async def navigate_to_receivables(self):
-        """Navigate to receivables section - uses direct URL for reliability"""
+        """Navigate to receivables section by its deep link (entity of the current URL is kept)"""
         try:
             print("📄 Navigating to Receivables section...")
             
             # Ensure we're not on the login page
-            current_url = self.page.url
-            if '/login' in current_url:
+            if '/login' in self.page.url:
                 print("⚠️ Currently on login page, waiting for authentication...")
-                await asyncio.sleep(3)
-                current_url = self.page.url
+                await self.page.wait_for_url(lambda url: '/login' not in url, timeout=budget_timeout(10000))
             
-            # Check if already on receivables page
-            if 'receivables' in current_url.lower():
-                print(f"✅ Already on Receivables page: {current_url}")
-                return True
-            
-            # Determine the base URL (works for both stage and production)
-            if 'stage.viewz.co' in current_url:
-                base_url = 'https://app.stage.viewz.co'
-            elif 'viewz.co' in current_url:
-                base_url = 'https://app.viewz.co'
-            else:
-                # Fallback: extract base from current URL
-                from urllib.parse import urlparse
-                parsed = urlparse(current_url)
-                base_url = f"{parsed.scheme}://{parsed.netloc}"
-            
-            # Try UI navigation first (preserves session better)
-            try:
-                # Look for Reconciliation menu
-                reconciliation = self.page.locator("text=Reconciliation").first
-                if await reconciliation.is_visible(timeout=5000):
-                    await reconciliation.click()
-                    await asyncio.sleep(1)
-                    print("✅ Clicked Reconciliation menu")
-                    
-                    # Try to find Receivables link
-                    receivables_link = self.page.locator("[href*='receivables'], text=Receivables").first
-                    if await receivables_link.is_visible(timeout=5000):
-                        await receivables_link.click()
-                        await asyncio.sleep(2)
-                        print("✅ Clicked Receivables link")
-                        
-                        # Check if navigation succeeded
-                        if 'receivables' in self.page.url.lower():
-                            return True
-            except Exception as e:
-                print(f"⚠️ UI navigation failed: {e}, trying direct URL...")
-            
-            # Fallback: Navigate directly to Receivables page
-            receivables_url = f"{base_url}/reconciliation/receivables"
-            print(f"🔗 Navigating to: {receivables_url}")
-            
-            await self.page.goto(receivables_url, wait_until='domcontentloaded', timeout=30000)
-            await asyncio.sleep(3)
-            
-            # Check if we got redirected to login
-            final_url = self.page.url
-            if '/login' in final_url:
-                print(f"⚠️ Redirected to login page - session may have been lost")
-                return False
-            else:
-                print(f"✅ Successfully navigated to: {final_url}")
-                return True
+            return await goto_route(self.page, self)
                 
         except Exception as e:
             print(f"❌ Error navigating to Receivables: {str(e)}")
             return False
     
     async def _navigate_to_reconciliation(self):
-        """Navigate to reconciliation tab using the working pattern from successful tests"""
-        try:
-            # Check if we're already on reconciliation page
-            current_url = self.page.url
-            if "reconciliation" in current_url.lower():
-                print("✅ Already on reconciliation page")
-                return True
-            
-            # Use the working pattern from successful tab navigation tests
-            await asyncio.sleep(3)
-            
-            # Handle menu opening with better error handling
-            try:
-                logo = self.page.locator("svg.viewz-logo")
-                logo_count = await logo.count()
-                if logo_count > 0:
-                    box = await logo.bounding_box()
-                    if box:
-                        await self.page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
-                        await asyncio.sleep(1)
-                        print("✅ Logo hover completed")
-
-                # Try to click pin button with better handling
-                pin_button = self.page.locator("button:has(svg.lucide-pin)")
-                pin_count = await pin_button.count()
-                if pin_count > 0 and await pin_button.is_visible():
-                    await pin_button.click()
-                    await asyncio.sleep(1)
-                    print("✅ Pin button clicked")
-                else:
-                    print("⚠️ Pin button not visible, trying to continue")
-                    
-            except Exception as e:
-                print(f"⚠️ Menu handling issue (continuing): {str(e)}")
-            
-            # Navigate to Reconciliation tab
-            reconciliation_selectors = [
-                "text=Reconciliation",
-                "button:has-text('Reconciliation')",
-                "a:has-text('Reconciliation')",
-                "[data-testid*='reconciliation']"
-            ]
-            
-            for selector in reconciliation_selectors:
-                try:
-                    element = self.page.locator(selector)
-                    if await element.is_visible():
-                        await element.click()
-                        await asyncio.sleep(2)
-                        print(f"✅ Clicked reconciliation: {selector}")
-                        return True
-                except Exception as e:
-                    print(f"⚠️ Failed to click {selector}: {str(e)}")
-                    continue
-            
-            print("⚠️ Could not find reconciliation navigation element")
-            return False
-            
-        except Exception as e:
-            print(f"⚠️ Error navigating to reconciliation: {str(e)}")
-            return False
+        """Navigate to the reconciliation screen by its deep link"""
+        return await goto_route(self.page, "ReconciliationPage")
     
     async def is_loaded(self):
         """Check if receivables page is loaded"""
@@ -9,8 +9,15 @@ import sys
 import os
 from pathlib import Path
 
-def run_full_regression_prod():
-    """Run full regression tests on production environment"""
+from utils.browser_server import BrowserServer
+
+def run_full_regression_prod(use_browser_server=True):
+    """
+    Run full regression tests on production environment
+    
+    Args:
+        use_browser_server: Launch one Chromium for all pytest subprocesses
+    """
     
     print("🏭 Full Regression Test Runner - PRODUCTION")
     print("Environment: Production (https://app.viewz.co)")
@@ -30,12 +37,19 @@ def run_full_regression_prod():
     print("🚀 Running PRODUCTION Full Regression")
     print("=" * 60)
     
+    # One Chromium for the main app and BO subprocesses instead of one each
+    browser_server = BrowserServer(headless=True)
+    if use_browser_server:
+        browser_server.start()
+        browser_server.apply_env(env)
+    
     # Run all tests with TestRail integration
     cmd = [
         "python3", "-m", "pytest", 
         "tests/", 
         "-v", "-s", "--tb=short",
-        "--headless"
+        "--headless",
+        "--browser-cache"
     ]
     
     print(f"Executing: {' '.join(cmd)}")
@@ -75,16 +89,20 @@ def run_full_regression_prod():
         print(f"Main App Tests: {'✅ PASSED' if result.returncode == 0 else '❌ FAILED'}")
         print(f"BO Tests: {'✅ PASSED' if bo_result.returncode == 0 else '❌ FAILED'}")
         print(f"Overall Result: {'✅ SUCCESS' if overall_success else '⚠️ ISSUES FOUND'}")
+        if browser_server.ws_endpoint:
+            print(browser_server.time_saved_report())
         
         return overall_success
         
     except Exception as e:
         print(f"❌ Error running production regression: {str(e)}")
         return False
+    finally:
+        browser_server.stop()
 
 if __name__ == "__main__":
     # Run the tests
-    success = run_full_regression_prod()
+    success = run_full_regression_prod(use_browser_server="--no-browser-server" not in sys.argv)
     
     # Exit with appropriate code
     sys.exit(0 if success else 1)
@@ -9,8 +9,15 @@ import sys
 import os
 from pathlib import Path
 
-def run_full_regression_stage():
-    """Run full regression tests on stage environment"""
+from utils.browser_server import BrowserServer
+
+def run_full_regression_stage(use_browser_server=True):
+    """
+    Run full regression tests on stage environment
+    
+    Args:
+        use_browser_server: Launch one Chromium for all pytest subprocesses
+    """
     
     print("🧪 Full Regression Test Runner - STAGE")
     print("Environment: Stage (https://app.stage.viewz.co)")
@@ -29,12 +36,19 @@ def run_full_regression_stage():
     print("🚀 Running STAGE Full Regression")
     print("=" * 60)
     
+    # One Chromium for the main app and BO subprocesses instead of one each
+    browser_server = BrowserServer(headless=True)
+    if use_browser_server:
+        browser_server.start()
+        browser_server.apply_env(env)
+    
     # Run all tests with TestRail integration
     cmd = [
         "python3", "-m", "pytest", 
         "tests/", 
         "-v", "-s", "--tb=short",
-        "--headless"
+        "--headless",
+        "--browser-cache"
     ]
     
     print(f"Executing: {' '.join(cmd)}")
@@ -74,16 +88,20 @@ def run_full_regression_stage():
         print(f"Main App Tests: {'✅ PASSED' if result.returncode == 0 else '❌ FAILED'}")
         print(f"BO Tests: {'✅ PASSED' if bo_result.returncode == 0 else '❌ FAILED'}")
         print(f"Overall Result: {'✅ SUCCESS' if overall_success else '⚠️ ISSUES FOUND'}")
+        if browser_server.ws_endpoint:
+            print(browser_server.time_saved_report())
         
         return overall_success
         
     except Exception as e:
         print(f"❌ Error running stage regression: {str(e)}")
         return False
+    finally:
+        browser_server.stop()
 
 if __name__ == "__main__":
     # Run the tests
-    success = run_full_regression_stage()
+    success = run_full_regression_stage(use_browser_server="--no-browser-server" not in sys.argv)
     
     # Exit with appropriate code
     sys.exit(0 if success else 1)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Basic Auth Injection Benchmark
+Compares BO stage page-load time with the legacy catch-all auth route
+("**/*" through a Python callback) against origin-scoped basic auth
+(native http_credentials for BO + a route for App requests only).
+
+Usage:
+    python scripts/benchmark_basic_auth_injection.py [--runs 5] [--path /login] [--headed]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+from playwright.async_api import async_playwright
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.basic_auth import OriginBasicAuth, origin_of, basic_auth_header
+
+BO_CONFIG_PATH = "configs/bo_stage_env_config.json"
+APP_CONFIG_PATH = "configs/stage_env_config.json"
+
+
+def load_credentials():
+    """BO and App origins with their basic auth credentials"""
+    with open(BO_CONFIG_PATH, "r") as f:
+        bo_config = json.load(f)
+    with open(APP_CONFIG_PATH, "r") as f:
+        app_config = json.load(f)
+
+    bo_origin = origin_of(bo_config["base_url"])
+    app_origin = origin_of(app_config["base_url"])
+    return bo_origin, {
+        bo_origin: (bo_config["basic_auth"]["username"], bo_config["basic_auth"]["password"]),
+        app_origin: (app_config["basic_auth"]["username"], app_config["basic_auth"]["password"]),
+    }
+
+
+async def legacy_context(browser, bo_origin, credentials):
+    """Context set up the way bo_page did before: every request through Python"""
+    context = await browser.new_context()
+    headers_by_origin = {origin: basic_auth_header(*creds) for origin, creds in credentials.items()}
+    stats = {"routed": 0}
+
+    async def handle_auth(route):
+        stats["routed"] += 1
+        headers = dict(route.request.headers)
+        header = headers_by_origin.get(origin_of(route.request.url))
+        if header:
+            headers["Authorization"] = header
+        await route.continue_(headers=headers)
+
+    await context.route("**/*", handle_auth)
+    return context, stats
+
+
+async def origin_scoped_context(browser, bo_origin, credentials):
+    """Context using OriginBasicAuth"""
+    origin_auth = OriginBasicAuth(bo_origin, credentials)
+    context = await browser.new_context(**origin_auth.context_options())
+    await origin_auth.install(context)
+    return context, origin_auth
+
+
+async def measure(browser, make_context, url):
+    """Load url in a fresh context; returns (seconds, requests, routed requests)"""
+    context, tracker = await make_context()
+    page = await context.new_page()
+    requests = []
+    page.on("request", lambda request: requests.append(request))
+
+    start = time.perf_counter()
+    await page.goto(url, wait_until="load")
+    await page.wait_for_load_state("networkidle")
+    elapsed = time.perf_counter() - start
+
+    routed = tracker["routed"] if isinstance(tracker, dict) else tracker.routed_requests
+    await context.close()
+    return elapsed, len(requests), routed
+
+
+async def run_benchmark(runs, path, headless):
+    bo_origin, credentials = load_credentials()
+    url = f"{bo_origin}{path}"
+
+    print("⏱️ Basic Auth Injection Benchmark")
+    print(f"URL: {url} | runs per mode: {runs}")
+    print("=" * 60)
+
+    modes = {
+        "legacy route **/*": lambda: legacy_context(browser, bo_origin, credentials),
+        "origin-scoped": lambda: origin_scoped_context(browser, bo_origin, credentials),
+    }
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        results = {name: [] for name in modes}
+
+        # Interleave modes so network jitter hits both equally; first round is warm-up
+        for run in range(runs + 1):
+            for name, make_context in modes.items():
+                elapsed, request_count, routed = await measure(browser, make_context, url)
+                if run > 0:
+                    results[name].append((elapsed, request_count, routed))
+
+        await browser.close()
+
+    print(f"{'Mode':<20} {'median':>9} {'mean':>9} {'requests':>9} {'via Python':>11}")
+    print("-" * 60)
+    for name, samples in results.items():
+        times = [sample[0] for sample in samples]
+        print(f"{name:<20} {statistics.median(times):>8.2f}s {statistics.mean(times):>8.2f}s "
+              f"{samples[-1][1]:>9} {samples[-1][2]:>11}")
+
+    legacy = statistics.median(t for t, _, _ in results["legacy route **/*"])
+    scoped = statistics.median(t for t, _, _ in results["origin-scoped"])
+    print("-" * 60)
+    print(f"📊 Origin-scoped is {legacy - scoped:+.2f}s per page load vs legacy "
+          f"({(legacy - scoped) / legacy * 100:+.0f}%)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark basic auth injection strategies")
+    parser.add_argument("--runs", type=int, default=5, help="Measured page loads per mode")
+    parser.add_argument("--path", default="/login", help="BO path to load")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.runs, args.path, not args.headed))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Export Reader Benchmark
+Compares reading an export the way the export validation tests used to (CSV:
+list(csv.reader(f)) then a filtered copy; Excel: openpyxl.load_workbook then
+a list of every row) against utils/export_reader.ExportReader (line-by-line
+CSV, read-only Excel, rows streamed). Writes a synthetic bank-transactions
+export - "Export Date" metadata rows, a blank row, the header, then the data -
+to a temp directory and checks both reads return the same rows. Reports
+time to the first row, total time and peak memory.
+
+Usage:
+    python scripts/benchmark_export_reader.py [--rows 200000] [--runs 3] [--format csv|xlsx|both]
+"""
+
+import argparse
+import csv
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.export_reader import ExportReader
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None  # Excel format skipped
+
+HEADERS = ["Date", "Description", "Amount", "GL Account", "Status", "Reference", "Bank Account", "Entity"]
+
+
+def synthetic_rows(count):
+    yield ["Export Date: 2025-06-01 10:00"] + [""] * (len(HEADERS) - 1)
+    yield [""] * len(HEADERS)
+    yield HEADERS
+    for i in range(count):
+        yield [f"{(i % 12) + 1:02d}/{(i % 28) + 1:02d}/2025", f"Payment to vendor {i} - invoice batch {i % 97}",
+               f"{(i % 5000) - 2500}.{i % 100:02d}", f"{6000 + i % 40} Operating expenses",
+               "Matched" if i % 3 else "Unmatched", f"REF-{i:08d}", "Checking ****1234", "Viewz Demo INC"]
+
+
+def write_csv(path, count):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(synthetic_rows(count))
+
+
+def write_xlsx(path, count):
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in synthetic_rows(count):
+        sheet.append(row)
+    workbook.save(path)
+
+
+def load_whole(path):
+    """The read the export tests did before: whole file in memory, then a filtered copy"""
+    with open(path, "rb") as f:
+        is_xlsx = f.read(2) == b"PK"
+    if is_xlsx:
+        sheet = openpyxl.load_workbook(path).active
+        rows = [[str(cell) if cell is not None else "" for cell in row] for row in sheet.iter_rows(values_only=True)]
+    else:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f))
+    header_index = next(i for i, row in enumerate(rows) if row and row[0].lower() == "date")
+    data = [row for row in rows[header_index + 1:] if any(str(cell).strip() for cell in row)]
+    yield from data
+
+
+def stream(path):
+    _, rows = ExportReader(path).open()
+    yield from rows
+
+
+def measure(strategy, path):
+    """(seconds to the first row, total seconds, rows, last row) - rows are consumed, not kept"""
+    start = time.perf_counter()
+    first = None
+    count = 0
+    last = None
+    for last in strategy(path):
+        if first is None:
+            first = time.perf_counter() - start
+        count += 1
+    return first, time.perf_counter() - start, count, last
+
+
+def peak_memory(strategy, path):
+    tracemalloc.start()
+    for _ in strategy(path):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run_benchmark(rows, runs, formats):
+    print("⏱️ Export Reader Benchmark")
+    strategies = {"load whole file": load_whole, "streaming reader": stream}
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in formats:
+            path = os.path.join(directory, f"export.{fmt}")
+            (write_xlsx if fmt == "xlsx" else write_csv)(path, rows)
+            print(f"\n{fmt.upper()}: {rows} rows, {os.path.getsize(path) / 1e6:.1f} MB | runs: {runs}")
+            print("=" * 72)
+
+            results = {name: {"first": [], "total": []} for name in strategies}
+            # Interleave strategies; first round is warm-up
+            for run in range(runs + 1):
+                outcomes = {}
+                for name, strategy in strategies.items():
+                    first, total, count, last = measure(strategy, path)
+                    outcomes[name] = (count, last)
+                    if run > 0:
+                        results[name]["first"].append(first)
+                        results[name]["total"].append(total)
+                assert len(set(map(repr, outcomes.values()))) == 1, f"Reads differ: {outcomes}"
+                assert outcomes["streaming reader"][0] == rows
+
+            for name, strategy in strategies.items():
+                times = results[name]
+                print(f"{name:<17} first row {statistics.median(times['first']) * 1000:>8.1f}ms  "
+                      f"total median {statistics.median(times['total']):>6.2f}s  "
+                      f"mean {statistics.mean(times['total']):>6.2f}s  "
+                      f"peak {peak_memory(strategy, path) / 1e6:>7.2f} MB")
+            speedup = (statistics.median(results["load whole file"]["total"])
+                       / statistics.median(results["streaming reader"]["total"]))
+            first_row = (statistics.median(results["load whole file"]["first"])
+                         / statistics.median(results["streaming reader"]["first"]))
+            print("-" * 72)
+            print(f"📊 Streaming reader is {speedup:.1f}x faster overall, first row {first_row:.0f}x sooner")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark streaming export reading")
+    parser.add_argument("--rows", type=int, default=200000, help="Data rows in the synthetic export")
+    parser.add_argument("--runs", type=int, default=3, help="Measured reads per strategy")
+    parser.add_argument("--format", choices=("csv", "xlsx", "both"), default="both", help="Export format(s)")
+    args = parser.parse_args()
+
+    formats = ["csv", "xlsx"] if args.format == "both" else [args.format]
+    if "xlsx" in formats and openpyxl is None:
+        print("⚠️ openpyxl not installed - benchmarking CSV only")
+        formats = [fmt for fmt in formats if fmt != "xlsx"]
+    run_benchmark(args.rows, args.runs, formats)
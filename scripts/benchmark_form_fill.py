@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Form Fill Benchmark
+Compares filling a dialog the way page objects used to (per field: wait for
+it to be visible, clear, fill) against utils/form_fill.FormFiller (all text
+inputs in one in-page call). Runs offline against a local dialog shaped like
+the customer form; every input counts the input events it receives, so the
+run also checks that the batched fill is seen like typing.
+
+Not run yet: there are no recorded results, so the expected several-fold
+drop in customer/vendor creation time is unverified until this is run
+against an installed Chromium.
+
+Usage:
+    python scripts/benchmark_form_fill.py [--runs 20] [--headed]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from playwright.async_api import async_playwright
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.form_fill import Field, FormFiller
+
+FIELDS = {
+    'name': "Enter customer name",
+    'email': "Enter email address",
+    'city': "Enter city",
+    'address': "Enter customer address",
+    'zip': "Enter zip code",
+    'registration': "Enter registration number",
+    'tax_id': "Enter tax ID",
+}
+
+PAGE_HTML = """
+<div role="dialog">
+  {inputs}
+</div>
+<script>
+  window.inputEvents = 0;
+  document.querySelectorAll('input').forEach(el =>
+    el.addEventListener('input', () => { window.inputEvents += 1; }));
+</script>
+"""
+
+
+async def field_by_field(page, data):
+    """The per-field loop page objects used before"""
+    for key, placeholder in FIELDS.items():
+        field = page.get_by_placeholder(placeholder)
+        await field.wait_for(state="visible", timeout=3000)
+        await field.clear()
+        await field.fill(data[key])
+
+
+async def batched(page, data):
+    spec = [Field(key, placeholder=placeholder) for key, placeholder in FIELDS.items()]
+    result = await FormFiller(page).fill("benchmark", spec, data)
+    assert result.filled == len(FIELDS), result.summary()
+
+
+async def run_benchmark(runs, headless):
+    print("⏱️ Form Fill Benchmark")
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        page = await browser.new_page()
+        inputs = "".join(f"<label>{key}<input placeholder='{placeholder}'></label>"
+                         for key, placeholder in FIELDS.items())
+        await page.set_content(PAGE_HTML.format(inputs=inputs))
+        print(f"Fields: {len(FIELDS)} | runs: {runs}")
+        print("=" * 60)
+
+        results = {"field by field": [], "batched": []}
+        strategies = {"field by field": field_by_field, "batched": batched}
+        # Interleave strategies; first round is warm-up
+        for run in range(runs + 1):
+            for name, strategy in strategies.items():
+                data = {key: f"{key}-{run}-{name[0]}" for key in FIELDS}
+                start = time.perf_counter()
+                await strategy(page, data)
+                elapsed = time.perf_counter() - start
+                values = await page.eval_on_selector_all("input", "els => els.map(el => el.value)")
+                assert values == list(data.values()), f"{name} left {values}"
+                if run > 0:
+                    results[name].append(elapsed)
+
+        events = await page.evaluate("window.inputEvents")
+        await browser.close()
+
+    for name, times in results.items():
+        print(f"{name:<16} median {statistics.median(times) * 1000:>7.1f}ms  "
+              f"mean {statistics.mean(times) * 1000:>7.1f}ms")
+    speedup = statistics.median(results["field by field"]) / statistics.median(results["batched"])
+    print("-" * 60)
+    print(f"📊 Batched fill is {speedup:.1f}x faster ({events} input events delivered)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched form filling")
+    parser.add_argument("--runs", type=int, default=20, help="Measured fills per strategy")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.runs, not args.headed))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Selector Race Benchmark
+Compares resolving a fallback chain the way page objects used to (one
+`locator(...).first.is_visible()` per candidate, in order) against
+utils/selector_race.first_visible() (all candidates in one concurrent round).
+Runs offline against a local page whose only match is the last candidate of
+EntitySelectorPage.entity_selectors - the worst case for the sequential loop.
+
+Usage:
+    python scripts/benchmark_selector_race.py [--runs 20] [--headed]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from playwright.async_api import async_playwright
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pages.entity_selector_page import EntitySelectorPage
+from utils.selector_race import first_visible
+
+PAGE_HTML = """
+<header>
+  <nav><a href="/home">Home</a></nav>
+  <div class="dropdown-toggle">Entity</div>
+</header>
+<main>{rows}</main>
+"""
+
+
+async def sequential(page, selectors):
+    """The loop page objects used before"""
+    for selector in selectors:
+        try:
+            element = page.locator(selector).first
+            if await element.is_visible():
+                return selector
+        except Exception:
+            continue
+    return None
+
+
+async def raced(page, selectors):
+    index, _ = await first_visible(page, selectors)
+    return selectors[index] if index is not None else None
+
+
+async def run_benchmark(runs, headless):
+    print("⏱️ Selector Race Benchmark")
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        page = await browser.new_page()
+        rows = "".join(f"<div class='row'><span>Row {i}</span><button>Edit</button></div>" for i in range(300))
+        await page.set_content(PAGE_HTML.format(rows=rows))
+
+        selectors = EntitySelectorPage(page).entity_selectors
+        print(f"Candidates: {len(selectors)} | winner: {selectors[-1]} | runs: {runs}")
+        print("=" * 60)
+
+        results = {"sequential is_visible": [], "raced": []}
+        strategies = {"sequential is_visible": sequential, "raced": raced}
+        # Interleave strategies; first round is warm-up
+        for run in range(runs + 1):
+            for name, strategy in strategies.items():
+                start = time.perf_counter()
+                winner = await strategy(page, selectors)
+                elapsed = time.perf_counter() - start
+                assert winner == selectors[-1], f"{name} resolved {winner}"
+                if run > 0:
+                    results[name].append(elapsed)
+
+        await browser.close()
+
+    for name, times in results.items():
+        print(f"{name:<24} median {statistics.median(times) * 1000:>7.1f}ms  "
+              f"mean {statistics.mean(times) * 1000:>7.1f}ms")
+    speedup = statistics.median(results["sequential is_visible"]) / statistics.median(results["raced"])
+    print("-" * 60)
+    print(f"📊 Raced resolution is {speedup:.1f}x faster")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark fallback selector resolution")
+    parser.add_argument("--runs", type=int, default=20, help="Measured resolutions per strategy")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.runs, not args.headed))
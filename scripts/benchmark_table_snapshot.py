@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Table Snapshot Benchmark
+Compares reading a grid the way the export validation tests used to (per row
+and per cell: rows.nth(i) -> cells.nth(j).inner_text()) against
+utils/table_snapshot.snapshot_table (whole grid in one in-page call). Runs
+offline against a local table shaped like the payables grid, with cells that
+repeat their text on nested lines, and checks both reads return the same rows.
+
+Usage:
+    python scripts/benchmark_table_snapshot.py [--rows 100] [--cols 10] [--runs 5] [--headed]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from playwright.async_api import async_playwright
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.table_snapshot import snapshot_table
+
+
+def build_table(rows, cols):
+    headers = "".join(f"<th>Column {c}</th>" for c in range(cols))
+    body = []
+    for r in range(rows):
+        # Nested duplicate line (tooltip-style copy of the label), as in the app's supplier cells
+        cells = "".join(f"<td><div>R{r}C{c}</div><div>R{r}C{c}</div></td>" for c in range(cols))
+        body.append(f"<tr data-row-key='{r}'>{cells}</tr>")
+    return f"<table><thead><tr>{headers}</tr></thead><tbody>{''.join(body)}</tbody></table>"
+
+
+async def cell_by_cell(page):
+    """The per-row, per-cell loop the export tests used before (without its 100-row cap)"""
+    table_data = []
+    rows = page.locator("table tbody tr, [role='row']")
+    for i in range(await rows.count()):
+        cells = rows.nth(i).locator("td, [role='cell']")
+        row_data = []
+        for j in range(await cells.count()):
+            lines = (await cells.nth(j).inner_text(timeout=1000)).strip().split('\n')
+            unique_lines = []
+            for line in lines:
+                line = line.strip()
+                if line and line not in unique_lines:
+                    unique_lines.append(line)
+            row_data.append(' '.join(unique_lines).strip())
+        if row_data and any(row_data):
+            table_data.append(row_data)
+    return table_data
+
+
+async def snapshot(page):
+    return (await snapshot_table(page, wait_for_rows=False)).rows
+
+
+async def run_benchmark(rows, cols, runs, headless):
+    print("⏱️ Table Snapshot Benchmark")
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        page = await browser.new_page()
+        await page.set_content(build_table(rows, cols))
+        print(f"Grid: {rows} rows x {cols} columns | runs: {runs}")
+        print("=" * 60)
+
+        results = {"cell by cell": [], "snapshot": []}
+        strategies = {"cell by cell": cell_by_cell, "snapshot": snapshot}
+        expected = None
+        # Interleave strategies; first round is warm-up
+        for run in range(runs + 1):
+            for name, strategy in strategies.items():
+                start = time.perf_counter()
+                data = await strategy(page)
+                elapsed = time.perf_counter() - start
+                expected = expected or data
+                assert data == expected, f"{name} read different rows"
+                if run > 0:
+                    results[name].append(elapsed)
+        await browser.close()
+
+    for name, times in results.items():
+        print(f"{name:<14} median {statistics.median(times) * 1000:>8.1f}ms  "
+              f"mean {statistics.mean(times) * 1000:>8.1f}ms")
+    speedup = statistics.median(results["cell by cell"]) / statistics.median(results["snapshot"])
+    print("-" * 60)
+    print(f"📊 Snapshot is {speedup:.0f}x faster ({len(expected)} identical rows read)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark one-call table extraction")
+    parser.add_argument("--rows", type=int, default=100, help="Rows in the grid")
+    parser.add_argument("--cols", type=int, default=10, help="Columns in the grid")
+    parser.add_argument("--runs", type=int, default=5, help="Measured reads per strategy")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.rows, args.cols, args.runs, not args.headed))
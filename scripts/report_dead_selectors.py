@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Dead Selector Report
+Lists fallback selectors that never matched in the learned selector cache
+(.selector_cache/selector_stats.json), per environment and page-object attribute.
+Candidates for removal from the page objects.
+
+Usage:
+    python scripts/report_dead_selectors.py [--min-misses 10] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.selector_resolver import DEAD_AFTER_MISSES, selector_resolver
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report selectors that never matched")
+    parser.add_argument("--min-misses", type=int, default=DEAD_AFTER_MISSES,
+                        help="Probes without a match before a selector counts as dead")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    dead = selector_resolver.dead_selectors(args.min_misses)
+    if args.json:
+        print(json.dumps(dead, indent=2))
+        return
+
+    if not dead:
+        print(f"✅ No selector missed {args.min_misses}+ times without ever matching")
+        return
+    for environment, keys in sorted(dead.items()):
+        print(f"🌐 {environment}")
+        for key, selectors in sorted(keys.items()):
+            winner = selector_resolver.stats[environment][key].get("winner")
+            print(f"   {key} (winner: {winner or 'none'})")
+            for selector in selectors:
+                misses = selector_resolver.stats[environment][key]["selectors"][selector]["misses"]
+                print(f"      ❌ {selector}  ({misses} misses)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,12 @@
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 import pyotp
 import json
 import os
-import asyncio
+import time
 import traceback
 from datetime import datetime
 from pages.login_page import LoginPage
@@ -17,6 +18,23 @@ load_dotenv()
 # Import TestRail integration
 from utils.testrail_integration import testrail, TestRailStatus
 from utils.screenshot_helper import screenshot_helper
+from utils.auth_state_cache import auth_state_cache
+from utils.asset_cache import asset_cache
+from utils.login_pool import LoginPool, SharedLoggedInPage, totp_ledger, get_worker_id
+from utils.network_profiles import (
+    NETWORK_PROFILES, NetworkProfileTracker, NetworkProfileStats,
+    get_network_profile, resource_size_catalog
+)
+from utils.har_replay import HarArchive, archive_name
+from utils.browser_server import BROWSER_WS_ENV, record_connection
+from utils.context_recycler import ContextRecycler
+from utils.wait_engine import wait_telemetry
+from utils.wait_profiler import wait_profiler
+from utils.selector_resolver import selector_resolver
+from utils.login_flow import LoginFlow, LoginState, LoginError, login_timings
+from utils import deadline as test_deadline
+from utils.form_fill import form_timings
+from utils.entity_matrix import entity_matrix, parse_entities
 
 # ---------- TESTRAIL PYTEST HOOKS ---------- #
 def pytest_configure(config):
@@ -91,11 +109,91 @@ def pytest_addoption(parser):
         default=False, 
         help="Run tests in headless mode (without browser UI)"
     )
+    parser.addoption(
+        "--browser-cache",
+        action="store_true",
+        default=False,
+        help="Serve static app assets (JS/CSS/fonts) from a persistent disk cache keyed by environment and build"
+    )
+    parser.addoption(
+        "--no-shared-pages",
+        action="store_true",
+        default=False,
+        help="Give @pytest.mark.read_only tests their own login instead of a shared page"
+    )
+    parser.addoption(
+        "--entities",
+        action="store",
+        default=None,
+        metavar="LIST",
+        help="Run tests using entity_page once per entity on one login, switching between them "
+             "(comma-separated names, ids or name=id); @pytest.mark.entities(...) overrides it"
+    )
+    parser.addoption(
+        "--no-auth-cache",
+        action="store_true",
+        default=False,
+        help="Always perform a full 2FA + entity login instead of reusing the cached auth state"
+    )
+    parser.addoption(
+        "--net-profile",
+        action="store",
+        default=None,
+        choices=sorted(NETWORK_PROFILES),
+        help="Network profile for page contexts (lean = no images/fonts/media/analytics); "
+             "suites marked @pytest.mark.net_profile('full') keep full loading"
+    )
+    parser.addoption(
+        "--recycle-contexts",
+        action="store",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Reset and reuse page contexts between tests; discard after a failure or N reuses (0 = off)"
+    )
+    parser.addoption(
+        "--profile-waits",
+        action="store_true",
+        default=False,
+        help="Attribute sleep/wait time to page-object methods; writes wait_profile.json "
+             "and a ranked wait_profile.txt summary"
+    )
+    parser.addoption(
+        "--test-deadline",
+        action="store",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Time budget per test that page-object waits shrink to as it runs out; "
+             "@pytest.mark.deadline(seconds) overrides it (0 = off)"
+    )
+    parser.addoption(
+        "--record-har",
+        action="store_true",
+        default=False,
+        help="Record each test's API traffic and the SPA shell into .har/<env>/ for offline replay"
+    )
+    parser.addoption(
+        "--keep-export-artifacts",
+        action="store_true",
+        default=False,
+        help="Write the exports captured by failed tests to export_artifacts/ (they are only held in memory otherwise)"
+    )
+    parser.addoption(
+        "--replay-har",
+        action="store_true",
+        default=False,
+        help="Serve API calls from recorded HARs and the SPA shell from a local server (no network)"
+    )
 
 @pytest.fixture(scope="session")
 def headless_mode(request):
     return request.config.getoption("--headless")
 
+@pytest.fixture(scope="session")
+def auth_cache_enabled(request):
+    return not request.config.getoption("--no-auth-cache")
+
 # ---------- ENV CONFIG ---------- #
 def load_config():
     """Load configuration from environment variables or config files"""
@@ -153,43 +251,231 @@ def load_config():
 def env_config():
     return load_config()
 
-# ---------- ASYNC PAGE FIXTURE ---------- #
-@pytest_asyncio.fixture
-async def page(env_config, headless_mode):
-    async with async_playwright() as p:
-        # Use headless_mode parameter, but keep slow_mo and args for non-headless
-        launch_options = {
-            "headless": headless_mode,
-        }
-        if not headless_mode:
-            launch_options.update({
-                "slow_mo": 200,
-                "args": ["--start-maximized"]
-            })
-        
-        browser = await p.chromium.launch(**launch_options)
-        
-        # Set up context options
-        context_options = {
-            "base_url": env_config["base_url"], 
-            "viewport": None
+# ---------- SHARED BROWSER (one per session / xdist worker) ---------- #
+def build_launch_options(headless_mode):
+    """Chromium launch options shared by every browser the suite starts"""
+    # Use headless_mode parameter, but keep slow_mo and args for non-headless
+    launch_options = {
+        "headless": headless_mode,
+    }
+    if not headless_mode:
+        launch_options.update({
+            "slow_mo": 200,
+            "args": ["--start-maximized"]
+        })
+    return launch_options
+
+def build_context_options(env_config):
+    """Context options for the main app (base_url, viewport, stage basic auth)"""
+    context_options = {
+        "base_url": env_config["base_url"], 
+        "viewport": None
+    }
+    
+    # Add HTTP basic authentication if configured (for stage environment)
+    if "basic_auth" in env_config and env_config["basic_auth"]:
+        basic_auth = env_config["basic_auth"]
+        context_options["http_credentials"] = {
+            "username": basic_auth["username"],
+            "password": basic_auth["password"]
         }
-        
-        # Add HTTP basic authentication if configured (for stage environment)
-        if "basic_auth" in env_config and env_config["basic_auth"]:
-            basic_auth = env_config["basic_auth"]
-            context_options["http_credentials"] = {
-                "username": basic_auth["username"],
-                "password": basic_auth["password"]
-            }
-            print(f"🔐 HTTP Basic Auth configured for: {basic_auth['username']}")
-        
-        context = await browser.new_context(**context_options)
-        page = await context.new_page()
-        yield page
-        await context.close()
+        print(f"🔐 HTTP Basic Auth configured for: {basic_auth['username']}")
+    return context_options
+
+# The shared browser is bound to the event loop it was launched on, so every
+# async test has to run on the session loop. pytest-asyncio resolves the loop
+# from the asyncio marker twice (fixture wiring and test setup), hence two hooks.
+SESSION_LOOP_MARKER = pytest.mark.asyncio(loop_scope="session")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_generate_tests(metafunc):
+    if metafunc.definition.get_closest_marker("asyncio"):
+        metafunc.definition.add_marker(SESSION_LOOP_MARKER, append=False)
+    
+    # Entity matrix: module-scoped params, so a module runs through all its tests
+    # per entity and switches entity once in between
+    if "entity" in metafunc.fixturenames:
+        marker = metafunc.definition.get_closest_marker("entities")
+        entities = parse_entities(marker.args if marker else metafunc.config.getoption("--entities"))
+        if entities:
+            metafunc.parametrize("entity", entities, ids=[e.label for e in entities],
+                                 indirect=True, scope="module")
+
+def pytest_collection_modifyitems(config, items):
+    """Run every async test on the session event loop"""
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(SESSION_LOOP_MARKER, append=False)
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_browser(headless_mode):
+    """
+    Chromium instance that stays alive for the whole run.
+    
+    Session scope means one browser per pytest process, so each xdist worker
+    gets its own. Tests never touch it directly - they get a fresh
+    BrowserContext from the `page` fixture.
+    
+    When a runner started a browser server (VIEWZ_BROWSER_WS_ENDPOINT), the
+    process connects to it instead of launching; closing then only drops
+    this process's contexts and connection.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    launch_options = build_launch_options(headless_mode)
+    ws_endpoint = os.getenv(BROWSER_WS_ENV)
+    async with async_playwright() as p:
+        browser = None
+        if ws_endpoint:
+            start = time.perf_counter()
+            try:
+                browser = await p.chromium.connect(ws_endpoint, slow_mo=launch_options.get("slow_mo"))
+                record_connection(time.perf_counter() - start)
+                print(f"🌐 Connected to shared browser server {ws_endpoint} (worker: {worker})")
+            except Exception as e:
+                print(f"⚠️ Browser server unreachable ({e}) - launching a local browser")
+        if browser is None:
+            browser = await p.chromium.launch(**launch_options)
+            print(f"🌐 Shared Chromium {browser.version} started (worker: {worker})")
+        yield browser
         await browser.close()
 
+# ---------- PERSISTENT ASSET CACHE ---------- #
+@pytest.fixture(scope="session")
+def browser_cache(request):
+    """Disk cache for the SPA's static assets (--browser-cache), or None"""
+    if not request.config.getoption("--browser-cache"):
+        yield None
+        return
+    yield asset_cache
+    print(f"\n{asset_cache.summary()}")
+
+# ---------- HAR RECORD / REPLAY ---------- #
+@pytest.fixture(scope="session")
+def har_archive(request, env_config):
+    """HarArchive for --record-har / --replay-har, or None"""
+    if request.config.getoption("--record-har"):
+        mode = "record"
+    elif request.config.getoption("--replay-har"):
+        mode = "replay"
+    else:
+        yield None
+        return
+    archive = HarArchive(mode, env_config.get("environment", "production"), env_config["base_url"])
+    yield archive
+    print(f"\n{archive.summary()}")
+    archive.close()
+
+@pytest.fixture(scope="session")
+def prepare_app_context(env_config, browser_cache, har_archive):
+    """Setup applied to every main-app context (page fixture, login pool, shared pages)"""
+    replaying = har_archive is not None and not har_archive.is_recording
+    
+    async def prepare(context):
+        # Replay is offline - the shell server already serves the assets
+        if browser_cache and not replaying:
+            await browser_cache.attach(context, env_config.get("environment", "production"), env_config["base_url"])
+    return prepare
+
+# ---------- NETWORK PROFILES ---------- #
+def resolve_network_profile(node, config):
+    """Profile for a test/module: @pytest.mark.net_profile wins over --net-profile"""
+    marker = node.get_closest_marker("net_profile")
+    name = marker.args[0] if marker else config.getoption("--net-profile") or "full"
+    return get_network_profile(name)
+
+@pytest.fixture(scope="session")
+def network_profile_stats(request):
+    """Run-wide blocked request/byte totals (only reported when --net-profile is used)"""
+    stats = NetworkProfileStats()
+    yield stats
+    if request.config.getoption("--net-profile"):
+        print(f"\n{stats.summary()}")
+        resource_size_catalog.save()
+
+def report_network_profile(tracker, stats):
+    """Add a context's blocked requests to the run totals and print them for the test"""
+    stats.add(tracker)
+    if tracker.profile.is_blocking:
+        print(f"\n{tracker.summary()}")
+
+def build_network_tracker(node, config):
+    """Tracker enforcing the node's profile; full-profile contexts measure sizes for the lean report"""
+    profile = resolve_network_profile(node, config)
+    learn = config.getoption("--net-profile") is not None
+    return NetworkProfileTracker(profile, resource_size_catalog,
+                                 learn_from=NETWORK_PROFILES["lean"] if learn else None)
+
+# ---------- CONTEXT RECYCLING ---------- #
+# Fixtures that seed the page's context with the pooled login session
+SEEDED_LOGIN_FIXTURES = ("perform_login_with_entity", "logged_in_page")
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def context_recycler(request, env_config, login_pool, har_archive):
+    """ContextRecycler for --recycle-contexts N, or None (HAR recording needs one context per test)"""
+    max_reuses = request.config.getoption("--recycle-contexts")
+    if max_reuses <= 0 or har_archive:
+        yield None
+        return
+    
+    def is_reusable(pooled):
+        # Init scripts can't be removed - a context seeding an outdated (or any, for
+        # login-free tests) session must not serve another test
+        _, needs_login = pooled.key
+        seeded = auth_state_cache.seeded_with(pooled.context)
+        return seeded in (None, login_pool.state_id) if needs_login else seeded is None
+    
+    recycler = ContextRecycler(env_config["base_url"], max_reuses, is_reusable=is_reusable)
+    yield recycler
+    print(f"\n{recycler.summary()}")
+    await recycler.close()
+
+def node_failed(node):
+    """True if setup or call of the current test failed (reports set by pytest_runtest_makereport)"""
+    return any(getattr(getattr(node, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+
+# ---------- ASYNC PAGE FIXTURE ---------- #
+# Playwright's own action timeout, kept within the test's deadline budget as it drains
+PLAYWRIGHT_DEFAULT_TIMEOUT_MS = 30000
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def page(request, shared_browser, env_config, prepare_app_context, network_profile_stats,
+               har_archive, context_recycler):
+    har_name = archive_name(request.node.nodeid)
+    
+    async def create_context():
+        context_options = build_context_options(env_config)
+        if har_archive:
+            context_options.update(har_archive.context_options(har_name))
+        context = await shared_browser.new_context(**context_options)
+        await prepare_app_context(context)
+        tracker = build_network_tracker(request.node, request.config)
+        await tracker.attach(context)
+        return context, tracker
+    
+    if context_recycler:
+        needs_login = any(name in request.fixturenames for name in SEEDED_LOGIN_FIXTURES)
+        key = (resolve_network_profile(request.node, request.config).name, needs_login)
+        pooled = await context_recycler.acquire(key, create_context)
+        default_timeout = test_deadline.DefaultTimeout(pooled.page, PLAYWRIGHT_DEFAULT_TIMEOUT_MS).start()
+        yield pooled.page
+        await default_timeout.stop()
+        tracker = pooled.extra
+        report_network_profile(tracker, network_profile_stats)
+        tracker.reset_counts()
+        await context_recycler.release(pooled, failed=node_failed(request.node))
+        return
+    
+    context, tracker = await create_context()
+    if har_archive and not await har_archive.prepare(context, har_name):
+        await context.close()
+        pytest.skip("No HAR recorded for this test - record it first with --record-har")
+    page = await context.new_page()
+    default_timeout = test_deadline.DefaultTimeout(page, PLAYWRIGHT_DEFAULT_TIMEOUT_MS).start()
+    yield page
+    await default_timeout.stop()
+    await context.close()
+    report_network_profile(tracker, network_profile_stats)
+
 # ---------- SYNC CONTEXT FIXTURE (optional) ---------- #
 @pytest.fixture(scope="session")
 def sync_browser_context():
@@ -200,9 +486,8 @@ def sync_browser_context():
         browser.close()
 
 # ---------- LOGIN DATA FIXTURE ---------- #
-@pytest.fixture
-def login_data(env_config):
-    """Load login data from environment configuration (supports both production and stage)"""
+def build_login_data(env_config):
+    """Login credentials from environment configuration (supports both production and stage)"""
     return {
         "username": env_config["username"],
         "password": env_config["password"],
@@ -210,24 +495,27 @@ def login_data(env_config):
         "environment": env_config.get("environment", "production")
     }
 
+@pytest.fixture
+def login_data(env_config):
+    """Load login data from environment configuration (supports both production and stage)"""
+    return build_login_data(env_config)
+
 # ---------- PERFORM LOGIN WITH OTP FIXTURE ---------- #
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def perform_login(page, login_data):
-    login = LoginPage(page)
-    await login.goto()
-    await login.login(login_data["username"], login_data["password"])
-
     # הזנת OTP - use from login_data (supports both production and stage)
     secret = login_data.get("otp_secret") or os.getenv('TEST_TOTP_SECRET')
     if not secret:
         raise ValueError("OTP secret is required (from config or TEST_TOTP_SECRET environment variable)")
-    otp = pyotp.TOTP(secret).now()
 
-    await page.wait_for_selector("text=Two-Factor Authentication", timeout=5000)
-    await page.get_by_role("textbox").fill(otp)
-    await asyncio.sleep(1)
-    #await page.get_by_role("button", name="Verify").click()
-    await page.wait_for_selector("text=SuccessOTP verified successfully", timeout=5000)
+    flow = LoginFlow(page)
+    try:
+        state = await flow.run(login_data["username"], login_data["password"],
+                               otp_source=lambda: totp_ledger.claim_code(secret))
+    finally:
+        login_timings.add(flow)
+    if state not in (LoginState.OTP_ACCEPTED, LoginState.HOME):
+        raise LoginError(f"OTP verification was not confirmed (state: {state})")
 
     return page
 
@@ -251,110 +539,32 @@ def is_valid_credentials_for_entity():
     except Exception:
         return False
 
-@pytest_asyncio.fixture
-async def perform_login_with_entity(page, login_data):
-    """Enhanced login fixture that includes entity selection after login"""
-    if not is_valid_credentials_for_entity():
-        pytest.skip("Valid credentials not available for entity login test")
-        
+async def login_with_entity(page, login_data, entity_name="Viewz Demo INC"):
+    """Full username/password + 2FA login followed by entity selection"""
     from pages.entity_selector_page import EntitySelectorPage
     
-    login = LoginPage(page)
-    await login.goto()
-    await login.login(login_data["username"], login_data["password"])
-
     # הזנת OTP - use from login_data (supports both production and stage)
     secret = login_data.get("otp_secret") or os.getenv('TEST_TOTP_SECRET')
     if not secret:
         raise ValueError("OTP secret is required (from config or TEST_TOTP_SECRET environment variable)")
     
     print(f"🔑 Using OTP secret from: {'config file' if login_data.get('otp_secret') else 'environment variable'}")
-    otp = pyotp.TOTP(secret).now()
-    print(f"🔐 Generated OTP: {otp}")
-
-    # Wait for 2FA page with multiple possible indicators
-    print("🔍 Waiting for 2FA page...")
-    try:
-        # Try multiple 2FA page indicators
-        await page.wait_for_selector("text=Two-Factor Authentication", timeout=3000)
-        print("✅ Found 2FA page: Two-Factor Authentication")
-    except:
-        try:
-            await page.wait_for_selector("text=Authentication", timeout=2000)
-            print("✅ Found 2FA page: Authentication")
-        except:
-            try:
-                await page.wait_for_selector("text=verification", timeout=2000)
-                print("✅ Found 2FA page: verification")
-            except:
-                try:
-                    await page.wait_for_selector("text=code", timeout=2000)
-                    print("✅ Found 2FA page: code")
-                except:
-                    try:
-                        # Check if already logged in (redirected)
-                        await page.wait_for_url("**/home**", timeout=2000)
-                        print("✅ Already logged in, skipping 2FA")
-                        return page  # Already logged in, skip 2FA
-                    except:
-                        print("⚠️ Could not detect 2FA page, attempting OTP entry anyway")
-    
-    # Try multiple ways to fill OTP
-    print(f"📝 Entering OTP: {otp}")
-    otp_filled = False
-    try:
-        await page.get_by_role("textbox").fill(otp)
-        print("✅ OTP filled via get_by_role('textbox')")
-        otp_filled = True
-    except:
-        try:
-            # Try finding any visible text input
-            await page.locator('input[type="text"]:visible').last.fill(otp)
-            print("✅ OTP filled via input[type='text']")
-            otp_filled = True
-        except:
-            try:
-                # Try finding any input that might accept OTP
-                await page.locator('input:visible').last.fill(otp)
-                print("✅ OTP filled via input:visible")
-                otp_filled = True
-            except:
-                print("❌ Could not find OTP input field")
     
-    if not otp_filled:
-        print("❌ CRITICAL: OTP was not entered!")
-        await page.screenshot(path="debug_otp_entry_failed.png")
-        
-    await asyncio.sleep(2)
-    print(f"🔍 Current URL after OTP entry: {page.url}")
+    async def select_entity():
+        print("🏢 Starting entity selection...")
+        return await EntitySelectorPage(page).select_entity(entity_name)
     
-    # Try to wait for various success indicators, don't fail if timeout
+    # 2FA prompt / home / error banner are raced instead of probed one after another
+    flow = LoginFlow(page)
     try:
-        await page.wait_for_selector("text=SuccessOTP verified successfully", timeout=5000)
-    except:
-        try:
-            # Alternative success indicators
-            await page.wait_for_selector("text=Success", timeout=2000)
-        except:
-            try:
-                # Check if we're redirected (indicates success)
-                await page.wait_for_url("**/home**", timeout=3000)
-            except:
-                # Continue anyway - some 2FA flows don't show success message
-                await asyncio.sleep(2)
-
-    # Entity Selection Step
-    print("🏢 Starting entity selection...")
-    entity_selector = EntitySelectorPage(page)
-    entity_selected = await entity_selector.select_entity("Viewz Demo INC")
-    
-    if entity_selected:
-        print("✅ Entity selection completed successfully")
-    else:
-        print("⚠️ Entity selection failed or not required")
+        await flow.run(login_data["username"], login_data["password"],
+                       otp_source=lambda: totp_ledger.claim_code(secret),
+                       select_entity=select_entity)
+    finally:
+        login_timings.add(flow)
+        print(flow.summary())
     
     # ⚠️ VERIFICATION: Check we're actually logged in
-    await asyncio.sleep(2)
     current_url = page.url
     print(f"🔍 Final URL after login: {current_url}")
     
@@ -371,8 +581,149 @@ async def perform_login_with_entity(page, login_data):
     
     return page
 
+# ---------- PER-WORKER LOGIN POOL ---------- #
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def login_pool(shared_browser, env_config, auth_cache_enabled, prepare_app_context, har_archive):
+    """One authenticated session per worker, reused to seed every test context"""
+    login_data = build_login_data(env_config)
+    
+    # HAR mode keeps the session next to the recordings - replay has no server to log in against
+    cache = auth_state_cache if auth_cache_enabled else None
+    if har_archive:
+        cache = har_archive.auth_cache
+    
+    async def login(page):
+        await login_with_entity(page, login_data)
+    
+    async def verify(page):
+        return await LoginPage(page).is_session_active()
+    
+    pool = LoginPool(
+        shared_browser,
+        environment=login_data["environment"],
+        context_options=build_context_options(env_config),
+        login=login,
+        verify=verify,
+        cache=cache,
+        prepare_context=prepare_app_context,
+        cache_key=login_data["environment"] if har_archive else None
+    )
+    yield pool
+    if pool.logins or pool.reuses:
+        print(f"\n🔐 Login pool [{get_worker_id()}]: {pool.logins} login(s), {pool.reuses} reused session(s)")
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def perform_login_with_entity(page, login_data, auth_cache_enabled, login_pool, har_archive):
+    """Enhanced login fixture that includes entity selection after login"""
+    if not is_valid_credentials_for_entity():
+        pytest.skip("Valid credentials not available for entity login test")
+    
+    if not auth_cache_enabled and not har_archive:
+        await login_with_entity(page, login_data)
+        return page
+    
+    if await login_pool.authenticate(page):
+        return page
+    
+    if har_archive and not har_archive.is_recording:
+        pytest.fail("Recorded session was not accepted in HAR replay - re-record with --record-har")
+    
+    # Pooled session was rejected - log in on this page and hand the new session to the pool
+    await login_with_entity(page, login_data)
+    await login_pool.adopt(page)
+    return page
+
+# ---------- READ-ONLY SHARED LOGGED-IN PAGE ---------- #
+def build_shared_page(request, login_pool, har_archive):
+    """Shared page for a module/class with its network profile and HAR recording/replay"""
+    tracker = build_network_tracker(request.node, request.config)
+    har_name = archive_name(request.node.nodeid)
+    
+    async def prepare(context):
+        await tracker.attach(context)
+        if har_archive and not await har_archive.prepare(context, har_name):
+            await context.close()
+            pytest.skip("No HAR recorded for this module - record it first with --record-har")
+    
+    context_options = har_archive.context_options(har_name) if har_archive else {}
+    return tracker, SharedLoggedInPage(login_pool, prepare_context=prepare, context_options=context_options)
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def _module_shared_page(request, login_pool, network_profile_stats, har_archive):
+    tracker, shared = build_shared_page(request, login_pool, har_archive)
+    await shared.open()
+    yield shared
+    print(f"\n📄 Shared read-only page reused {shared.resets} time(s) in module")
+    await shared.close()
+    network_profile_stats.add(tracker)
+    if tracker.profile.is_blocking:
+        print(tracker.summary())
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+async def _class_shared_page(request, login_pool, network_profile_stats, har_archive):
+    tracker, shared = build_shared_page(request, login_pool, har_archive)
+    await shared.open()
+    yield shared
+    await shared.close()
+    network_profile_stats.add(tracker)
+
+@pytest.fixture
+def _shared_page(request):
+    """Module- or class-wide shared page, chosen by @pytest.mark.read_only(scope=...)"""
+    marker = request.node.get_closest_marker("read_only")
+    scope = marker.kwargs.get("scope", "module") if marker else "module"
+    return request.getfixturevalue("_class_shared_page" if scope == "class" else "_module_shared_page")
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def read_only_page(_shared_page, entity):
+    """
+    Logged-in page shared by read-only tests of a module (or class).
+    
+    Only for tests that observe the page - state is reset by navigating back
+    to the landing view, not by a new context and login. Entity matrix tests
+    land on their entity's view when its id is known.
+    """
+    return await _shared_page.reset(entity.entity_id if entity else None)
+
+@pytest.fixture
+def logged_in_page(request):
+    """
+    Logged-in page with entity selected.
+    
+    Tests marked @pytest.mark.read_only share one page per module/class
+    (read_only_page); all others get their own login (perform_login_with_entity).
+    --no-shared-pages turns the sharing off.
+    """
+    if not is_valid_credentials_for_entity():
+        pytest.skip("Valid credentials not available for entity login test")
+    
+    if request.node.get_closest_marker("read_only") and not request.config.getoption("--no-shared-pages"):
+        return request.getfixturevalue("read_only_page")
+    return request.getfixturevalue("perform_login_with_entity")
+
+# ---------- ENTITY MATRIX ---------- #
+@pytest.fixture
+def entity(request):
+    """Entity of the matrix this test runs for (None without --entities / entities marker)"""
+    return getattr(request, "param", None)
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def entity_page(logged_in_page, entity):
+    """
+    logged_in_page switched to the test's entity.
+    
+    Read-only tests switch the shared page instead of logging in per entity;
+    without a matrix this is logged_in_page unchanged.
+    """
+    if entity is None:
+        return logged_in_page
+    switcher = entity_matrix.switcher(logged_in_page)
+    if not await switcher.switch(entity):
+        pytest.fail(f"Could not switch to entity {entity.label}")
+    return logged_in_page
+
 # ---------- GL ACCOUNT PRECONDITION FOR INVOICING ---------- #
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def perform_login_with_gl_account(perform_login_with_entity, env_config):
     """
     Enhanced login fixture that creates a GL Account (Trade Receivables) as a precondition
@@ -444,14 +795,70 @@ def screenshot_on_failure(request):
             else:
                 print(f"\n⚠️ Screenshot failed: {info}")
 
+# ---------- EXPORT ARTIFACTS FIXTURE ---------- #
+EXPORT_ARTIFACTS_DIR = "export_artifacts"
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def export_artifacts(request):
+    """Exports a test captured (utils/export_capture.py) - written to EXPORT_ARTIFACTS_DIR when
+    the test failed and --keep-export-artifacts is given, released either way"""
+    exports = []
+    yield exports
+    keep = request.config.getoption("--keep-export-artifacts") and node_failed(request.node)
+    for export in exports:
+        if keep:
+            print(f"\n📎 Export kept: {export.keep(EXPORT_ARTIFACTS_DIR, request.node.name)}")
+        await export.close()
+
 # ---------- TESTRAIL INTEGRATION HOOKS ---------- #
 def pytest_configure(config):
-    """Setup TestRail integration at the start of test session"""
+    """Register framework markers and setup TestRail integration at the start of test session"""
+    config.addinivalue_line(
+        "markers", "read_only(scope='module'): test only observes the page and may share a logged-in page (scope: module|class)"
+    )
+    if config.getoption("--record-har") and config.getoption("--replay-har"):
+        raise pytest.UsageError("--record-har and --replay-har cannot be combined")
+    
+    config.addinivalue_line(
+        "markers", "net_profile(name): pin the network profile of a test/suite regardless of --net-profile (e.g. 'full' for visual suites)"
+    )
+    
+    config.addinivalue_line(
+        "markers", "entities(*specs): entities to run entity_page tests for (names, ids or name=id), overriding --entities"
+    )
+    
+    config.addinivalue_line(
+        "markers", "deadline(seconds): time budget for the test; waits shrink as it runs out and the failure reports where the time went"
+    )
+    
+    if config.getoption("--profile-waits"):
+        wait_profiler.install()
+    
     if testrail._is_enabled():
         print("\n🔗 TestRail integration enabled")
         # Setup test run
         testrail.setup_test_run()
 
+def deadline_seconds(item) -> float:
+    """Budget of a test: its deadline marker, else --test-deadline (0 = none)"""
+    marker = item.get_closest_marker("deadline")
+    if marker and marker.args:
+        return float(marker.args[0])
+    return item.config.getoption("--test-deadline")
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Scope --profile-waits accounting and the deadline budget to one test (setup, call and teardown)"""
+    seconds = deadline_seconds(item)
+    token = test_deadline.start(seconds, item.nodeid) if seconds > 0 else None
+    if wait_profiler.installed:
+        wait_profiler.start_test(item.nodeid)
+    yield
+    if wait_profiler.installed:
+        wait_profiler.end_test()
+    if token is not None:
+        test_deadline.finish(token)
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Create test report and update TestRail with screenshots and detailed failure info"""
@@ -461,6 +868,14 @@ def pytest_runtest_makereport(item, call):
     # Store report in item for screenshot fixture
     setattr(item, f"rep_{call.when}", report)
     
+    deadline = test_deadline.current()
+    if deadline is not None:
+        deadline.phases[call.when] = report.duration
+        if deadline.exhausted and (report.failed or call.when == "call"):
+            # Where the budget went, next to the traceback (or as a warning if it still passed)
+            report.sections.append(("deadline", deadline.report()))
+            print(f"\n{deadline.report()}")
+    
     if call.when == 'call':
         # Get test case ID mapping - Updated with actual TestRail case IDs
         test_name = item.nodeid.split("::")[-1]
@@ -961,3 +1376,27 @@ def pytest_sessionfinish(session, exitstatus):
         time.sleep(2)
         testrail.finalize_test_run()
         print("🏁 TestRail test run completed")
+
+    if wait_telemetry.records:
+        print(f"\n{wait_telemetry.summary()}")
+
+    if login_timings.logins:
+        print(f"\n{login_timings.summary()}")
+    
+    if form_timings.forms:
+        print(f"\n{form_timings.summary()}")
+    
+    if entity_matrix.failed or any(entity_matrix.switches.values()):
+        print(f"\n{entity_matrix.summary()}")
+
+    if selector_resolver.lookups:
+        selector_resolver.save()
+        print(f"\n{selector_resolver.summary()}")
+        print(selector_resolver.report())
+
+    if wait_profiler.installed:
+        worker = get_worker_id()
+        profile_path = "wait_profile.json" if worker == "main" else f"wait_profile.{worker}.json"
+        print(f"\n{wait_profiler.write(profile_path)}")
+        print(f"💾 Wait profile written to {profile_path}")
+        wait_profiler.uninstall()
@@ -8,12 +8,13 @@ import pytest_asyncio
 import json
 import os
 import asyncio
-from playwright.async_api import Page, async_playwright
+from playwright.async_api import Page
 
 # Import BO-specific page objects
 from pages.bo_login_page import BOLoginPage
 from pages.bo_accounts_page import BOAccountsPage
 from utils.screenshot_helper import screenshot_helper
+from utils.basic_auth import OriginBasicAuth, origin_of
 
 
 async def fill_otp_boxes(page: Page, otp_code: str):
@@ -99,57 +100,42 @@ def bo_config():
         raise Exception(f"BO configuration file not found: {config_path}")
 
 
-@pytest_asyncio.fixture
-async def bo_page(bo_config, headless_mode):
+@pytest_asyncio.fixture(loop_scope="session")
+async def bo_page(bo_config, shared_browser, browser_cache):
     """Create BO-specific page with domain-specific basic authentication"""
-    import base64
+    # Set up context options for BO
+    context_options = {
+        "base_url": bo_config["base_url"], 
+        "viewport": None
+    }
     
-    async with async_playwright() as p:
-        # Use headless_mode parameter
-        launch_options = {
-            "headless": headless_mode,
-        }
-        if not headless_mode:
-            launch_options.update({
-                "slow_mo": 200,
-                "args": ["--start-maximized"]
-            })
-        
-        browser = await p.chromium.launch(**launch_options)
-        
-        # Set up context options for BO (without http_credentials - use route interception)
-        context_options = {
-            "base_url": bo_config["base_url"], 
-            "viewport": None
-        }
-        
-        context = await browser.new_context(**context_options)
-        
-        # Set up domain-specific Basic Auth via route interception
-        # BO and App have different passwords
-        if "basic_auth" in bo_config and bo_config["basic_auth"]:
-            basic_auth = bo_config["basic_auth"]
-            bo_auth = base64.b64encode(f"{basic_auth['username']}:{basic_auth['password']}".encode()).decode()
-            
-            # App credentials (different from BO)
-            app_auth = base64.b64encode("admin:38Uo0tuxA3pj*b0F".encode()).decode()
-            
-            async def handle_auth(route):
-                url = route.request.url
-                headers = dict(route.request.headers)
-                if "bo.stage.viewz.co" in url or "bo.viewz.co" in url:
-                    headers["Authorization"] = f"Basic {bo_auth}"
-                elif "app.stage.viewz.co" in url or "app.viewz.co" in url:
-                    headers["Authorization"] = f"Basic {app_auth}"
-                await route.continue_(headers=headers)
-            
-            await context.route("**/*", handle_auth)
-            print(f"🔐 Domain-specific Basic Auth configured (BO + App)")
-        
-        page = await context.new_page()
-        yield page
-        await context.close()
-        await browser.close()
+    # BO and App have different basic auth passwords. BO is authenticated
+    # natively by the browser; only App-origin requests go through a route.
+    origin_auth = None
+    if "basic_auth" in bo_config and bo_config["basic_auth"]:
+        basic_auth = bo_config["basic_auth"]
+        bo_origin = origin_of(bo_config["base_url"])
+        # App lives next to BO: bo.stage.viewz.co -> app.stage.viewz.co
+        app_origin = bo_origin.replace("://bo.", "://app.")
+        origin_auth = OriginBasicAuth(bo_origin, {
+            bo_origin: (basic_auth["username"], basic_auth["password"]),
+            app_origin: ("admin", "38Uo0tuxA3pj*b0F"),
+        })
+        context_options.update(origin_auth.context_options())
+    
+    context = await shared_browser.new_context(**context_options)
+    
+    # Static asset cache goes first so the App auth route below falls back into it
+    if browser_cache:
+        await browser_cache.attach(context, f"bo-{bo_config['test_env']}", bo_config["base_url"])
+    
+    if origin_auth:
+        await origin_auth.install(context)
+        print(f"🔐 Origin-scoped Basic Auth configured (BO native + App routed)")
+    
+    page = await context.new_page()
+    yield page
+    await context.close()
 
 @pytest.fixture
 def bo_login_page(bo_page: Page, bo_config):
@@ -169,7 +155,7 @@ def bo_screenshot_helper():
     return screenshot_helper
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def bo_authenticated_page(bo_page: Page, bo_config, bo_login_page):
     """
     Fixture that provides a page with completed BO authentication
@@ -196,7 +182,7 @@ async def bo_authenticated_page(bo_page: Page, bo_config, bo_login_page):
         raise
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def bo_accounts_ready_page(bo_authenticated_page: Page, bo_accounts_page):
     """
     Fixture that provides a page that's logged into BO and navigated to accounts
@@ -31,7 +31,7 @@ from utils.testrail_integration import testrail_case, testrail, TestRailStatus
 class TestBOCompleteFlow:
     """Complete BO environment test flow"""
     
-    @pytest_asyncio.fixture(autouse=True)
+    @pytest_asyncio.fixture(autouse=True, loop_scope="session")
     async def setup(self, bo_page: Page, bo_config):
         """Setup for BO tests"""
         self.page = bo_page
@@ -18,11 +18,14 @@ from pages.bo_accounts_page import BOAccountsPage
 from utils.screenshot_helper import screenshot_helper
 from utils.testrail_integration import testrail_case, testrail, TestRailStatus
 
+# Screenshots need images and fonts - never run these under a lean network profile
+pytestmark = pytest.mark.net_profile("full")
+
 
 class TestBOSnapshots:
     """BO environment snapshot testing for regression detection"""
     
-    @pytest_asyncio.fixture(autouse=True)
+    @pytest_asyncio.fixture(autouse=True, loop_scope="session")
     async def setup(self, page: Page):
         """Setup for BO snapshot tests"""
         self.page = page
@@ -19,7 +19,7 @@ from pages.chart_of_accounts_page import ChartOfAccountsPage
 class TestBudgetingOperations:
     """Test class for Budgeting page operations"""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def budgeting_page(self, perform_login_with_entity):
         """Fixture to get Budgeting page after login"""
         page = perform_login_with_entity
@@ -417,7 +417,7 @@ class TestBudgetToGLAccountIntegration:
 class TestBudgetBuilderFeatures:
     """Comprehensive tests for Budget Builder page features"""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def budget_builder_page(self, perform_login_with_entity):
         """Fixture to get Budget Builder page after login"""
         page = perform_login_with_entity
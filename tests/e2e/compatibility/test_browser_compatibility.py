@@ -10,6 +10,9 @@ from datetime import datetime
 
 from utils.screenshot_helper import ScreenshotHelper
 
+# Screenshots need images and fonts - never run these under a lean network profile
+pytestmark = pytest.mark.net_profile("full")
+
 
 class TestBrowserCompatibility:
     """Browser compatibility and device testing suite"""
@@ -16,7 +16,6 @@ Usage:
 """
 
 import pytest
-import pytest_asyncio
 import asyncio
 import json
 import os
@@ -24,6 +23,9 @@ from datetime import datetime
 from pathlib import Path
 from playwright.async_api import Page
 
+# Tests only navigate and inspect - share one logged-in page per module
+pytestmark = pytest.mark.read_only
+
 
 # Baseline file path
 BASELINE_DIR = Path(__file__).parent / "baselines"
@@ -293,12 +295,6 @@ def compare_with_baseline(current: dict, baseline: dict) -> list:
     return differences
 
 
-@pytest_asyncio.fixture
-async def logged_in_page(perform_login_with_entity):
-    """Get a logged-in page"""
-    return perform_login_with_entity
-
-
 class TestDOMStructure:
     """DOM Structure Tests for all pages"""
     
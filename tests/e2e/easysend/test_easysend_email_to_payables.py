@@ -22,7 +22,6 @@ import pytest
 import asyncio
 import os
 import json
-import base64
 import pyotp
 import time
 from playwright.async_api import async_playwright, Page
@@ -31,6 +30,8 @@ from datetime import datetime
 from pages.bo_login_page import BOLoginPage
 from pages.bo_accounts_page import BOAccountsPage
 from pages.payables_page import PayablesPage
+from utils.basic_auth import OriginBasicAuth, origin_of
+from utils import deadline as test_deadline
 
 
 async def fill_otp_boxes(page: Page, otp_code: str):
@@ -354,34 +355,21 @@ class TestEasySendEmailToPayables:
     
     async def create_auth_context(self, browser, bo_config, app_config):
         """Create browser context with domain-specific Basic Auth"""
-        context = await browser.new_context()
-        
         # Get credentials
         bo_creds = bo_config.get("basic_auth", {}) if bo_config else {}
         app_creds = app_config.get("basic_auth", {}) if app_config else {}
         
-        # Encode Basic Auth for each domain
-        bo_auth = base64.b64encode(
-            f"{bo_creds.get('username', 'admin')}:{bo_creds.get('password', '')}".encode()
-        ).decode()
+        bo_origin = origin_of((bo_config or {}).get("base_url", "https://bo.stage.viewz.co"))
+        app_origin = origin_of((app_config or {}).get("base_url", "https://app.stage.viewz.co"))
         
-        app_auth = base64.b64encode(
-            f"{app_creds.get('username', 'admin')}:{app_creds.get('password', '')}".encode()
-        ).decode()
+        # BO is authenticated natively by the browser; only App requests are routed
+        origin_auth = OriginBasicAuth(bo_origin, {
+            bo_origin: (bo_creds.get('username', 'admin'), bo_creds.get('password', '')),
+            app_origin: (app_creds.get('username', 'admin'), app_creds.get('password', '')),
+        })
         
-        # Route handler for domain-specific auth
-        async def handle_auth(route):
-            url = route.request.url
-            headers = dict(route.request.headers)
-            
-            if "bo.stage.viewz.co" in url or "bo.viewz.co" in url:
-                headers["Authorization"] = f"Basic {bo_auth}"
-            elif "app.stage.viewz.co" in url or "app.viewz.co" in url:
-                headers["Authorization"] = f"Basic {app_auth}"
-            
-            await route.continue_(headers=headers)
-        
-        await context.route("**/*", handle_auth)
+        context = await browser.new_context(**origin_auth.context_options())
+        await origin_auth.install(context)
         print(f"✅ Created context with domain-specific auth (BO + App)")
         
         return context
@@ -682,6 +670,7 @@ class TestEasySendEmailToPayables:
         return False
     
     @pytest.mark.asyncio
+    @pytest.mark.deadline(420)
     async def test_easysend_complete_flow(self):
         """
         Complete E2E test for EasySend Email to Payables on Stage:
@@ -725,6 +714,8 @@ class TestEasySendEmailToPayables:
                 if not login_success:
                     pytest.fail("Failed to login to Outlook")
                 
+                test_deadline.check("STEP 2")
+                
                 # ==========================================
                 # STEP 2: Send email with attachment
                 # ==========================================
@@ -747,6 +738,8 @@ class TestEasySendEmailToPayables:
                 # Close Outlook context
                 await outlook_context.close()
                 
+                test_deadline.check("STEP 3")
+                
                 # ==========================================
                 # STEP 3: Wait for EasySend processing
                 # ==========================================
@@ -758,6 +751,8 @@ class TestEasySendEmailToPayables:
                 await asyncio.sleep(60)
                 print("✅ Wait complete")
                 
+                test_deadline.check("STEP 4")
+                
                 # ==========================================
                 # STEP 4: Login to BO
                 # ==========================================
@@ -778,6 +773,8 @@ class TestEasySendEmailToPayables:
                 await bo_context.storage_state(path="bo_auth_state.json")
                 print("💾 Saved BO auth state")
                 
+                test_deadline.check("STEP 5")
+                
                 # ==========================================
                 # STEP 5: Find account and perform relogin
                 # ==========================================
@@ -789,6 +786,8 @@ class TestEasySendEmailToPayables:
                     bo_page, bo_config, self.BO_ACCOUNT_ID
                 )
                 
+                test_deadline.check("STEP 6")
+                
                 # ==========================================
                 # STEP 6: Navigate to Payables
                 # ==========================================
@@ -801,6 +800,8 @@ class TestEasySendEmailToPayables:
                     await app_page.screenshot(path="debug_payables_failure.png")
                     pytest.fail("Failed to navigate to Payables")
                 
+                test_deadline.check("STEP 7")
+                
                 # ==========================================
                 # STEP 7: Verify file in Payables
                 # ==========================================
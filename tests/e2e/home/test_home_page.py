@@ -9,6 +9,11 @@ import asyncio
 from playwright.async_api import Page, expect
 from pages.home_page import HomePage
 
+# Dashboard tests only observe the page - share one logged-in page per module.
+# KPI, chart and data tests take entity_page: with --entities they run per
+# entity on that same login.
+pytestmark = pytest.mark.read_only
+
 
 class TestHomePageElements:
     """Test suite for verifying home page elements are present"""
@@ -165,16 +170,16 @@ class TestHomePageKPIs:
     """Test suite for Key Performance Indicator cards"""
     
     @pytest.mark.asyncio
-    async def test_kpi_section_visible(self, logged_in_page: Page):
+    async def test_kpi_section_visible(self, entity_page: Page):
         """Verify KPI section header is visible"""
-        home = HomePage(logged_in_page)
+        home = HomePage(entity_page)
         
         assert await home.verify_kpi_section_visible(), "KPI section should be visible"
     
     @pytest.mark.asyncio
-    async def test_kpi_cards_count(self, logged_in_page: Page):
+    async def test_kpi_cards_count(self, entity_page: Page):
         """Verify multiple KPI cards are displayed"""
-        home = HomePage(logged_in_page)
+        home = HomePage(entity_page)
         
         # Should have at least 5 KPI cards based on screenshot
         kpi_count = await home.get_kpi_count()
@@ -184,10 +189,10 @@ class TestHomePageKPIs:
         assert kpi_count >= 5, f"Expected at least 5 KPI cards, got {kpi_count}"
     
     @pytest.mark.asyncio
-    async def test_kpi_values_displayed(self, logged_in_page: Page):
+    async def test_kpi_values_displayed(self, entity_page: Page):
         """Verify KPI cards show values (amounts)"""
-        home = HomePage(logged_in_page)
-        page = logged_in_page
+        home = HomePage(entity_page)
+        page = entity_page
         
         # Look for dollar amounts in KPI section
         kpi_values = page.locator("text=/\\$[0-9]+(\\.[0-9]+)?[KMB]?/")
@@ -197,9 +202,9 @@ class TestHomePageKPIs:
         assert count >= 3, "Should have at least 3 monetary values displayed"
     
     @pytest.mark.asyncio
-    async def test_kpi_trend_indicators(self, logged_in_page: Page):
+    async def test_kpi_trend_indicators(self, entity_page: Page):
         """Verify KPI cards show trend indicators (up/down arrows)"""
-        page = logged_in_page
+        page = entity_page
         
         # Look for arrow indicators or trend icons
         # These could be SVGs, icons, or text like ↑ ↓
@@ -214,25 +219,25 @@ class TestHomePageCharts:
     """Test suite for dashboard charts"""
     
     @pytest.mark.asyncio
-    async def test_total_income_chart_visible(self, logged_in_page: Page):
+    async def test_total_income_chart_visible(self, entity_page: Page):
         """Verify Total Income chart section is visible"""
-        home = HomePage(logged_in_page)
+        home = HomePage(entity_page)
         
         charts = await home.verify_charts_visible()
         assert charts["total_income"], "Total Income chart should be visible"
     
     @pytest.mark.asyncio
-    async def test_gross_profit_chart_visible(self, logged_in_page: Page):
+    async def test_gross_profit_chart_visible(self, entity_page: Page):
         """Verify Gross Profit chart section is visible"""
-        home = HomePage(logged_in_page)
+        home = HomePage(entity_page)
         
         charts = await home.verify_charts_visible()
         assert charts["gross_profit"], "Gross Profit chart should be visible"
     
     @pytest.mark.asyncio
-    async def test_chart_dropdown_selector(self, logged_in_page: Page):
+    async def test_chart_dropdown_selector(self, entity_page: Page):
         """Verify chart has dropdown to change displayed metric"""
-        page = logged_in_page
+        page = entity_page
         
         # Total income dropdown
         chart_dropdown = page.locator("text=Total income").locator("..").locator("button, [class*='select']")
@@ -388,9 +393,9 @@ class TestHomePageDataValidation:
     """Test suite for validating dashboard data"""
     
     @pytest.mark.asyncio
-    async def test_kpi_values_are_numeric(self, logged_in_page: Page):
+    async def test_kpi_values_are_numeric(self, entity_page: Page):
         """Verify KPI values contain valid numeric data"""
-        page = logged_in_page
+        page = entity_page
         
         # Find all monetary values
         values = page.locator("text=/\\$[0-9.,]+[KMB]?/")
@@ -409,9 +414,9 @@ class TestHomePageDataValidation:
         assert valid_values >= 1, "Should have at least 1 valid monetary value"
     
     @pytest.mark.asyncio
-    async def test_percentage_values_displayed(self, logged_in_page: Page):
+    async def test_percentage_values_displayed(self, entity_page: Page):
         """Verify percentage values are displayed correctly"""
-        page = logged_in_page
+        page = entity_page
         
         # Find percentage values
         percentages = page.locator("text=/[0-9.]+%/")
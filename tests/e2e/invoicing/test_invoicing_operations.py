@@ -442,6 +442,7 @@ class TestInvoicingOperations:
     # ==========================================
     
     @pytest.mark.asyncio
+    @pytest.mark.deadline(300)
     async def test_complete_invoice_flow(self, perform_login_with_gl_account):
         """Test complete invoice flow: customer → product → invoice
         
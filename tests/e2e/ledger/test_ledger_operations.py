@@ -18,7 +18,7 @@ from utils.screenshot_helper import screenshot_helper
 class TestLedgerOperations:
     """Test class for ledger operations - Financial Dashboard functionality"""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def ledger_page(self, perform_login_with_entity):
         """Initialize ledger page object with login and navigation to ledger dashboard"""
         page = perform_login_with_entity
@@ -18,7 +18,7 @@ import asyncio
 class TestLoginScenarios:
     """Test suite for login page scenarios"""
     
-    @pytest_asyncio.fixture(autouse=True)
+    @pytest_asyncio.fixture(autouse=True, loop_scope="session")
     async def setup(self, page: Page):
         """Setup for each test"""
         self.page = page
@@ -18,7 +18,7 @@ from utils.screenshot_helper import screenshot_helper
 class TestBankOperations:
     """Test class for bank operations within reconciliation functionality"""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def bank_page(self, perform_login_with_entity):
         """Initialize bank page object with login and navigation to reconciliation > bank"""
         page = perform_login_with_entity
@@ -15,7 +15,7 @@ class TestCreditCardOperations:
     22 test cases covering all credit card functionality
     """
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def credit_card_page(self, perform_login_with_entity):
         """Setup Credit Card page for tests"""
         page = perform_login_with_entity
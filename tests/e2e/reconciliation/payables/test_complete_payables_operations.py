@@ -19,7 +19,7 @@ from utils.screenshot_helper import screenshot_helper
 class TestCompletePayablesOperations:
     """Complete test class for all CSV payables operations"""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def payables_page(self, perform_login_with_entity):
         """Initialize payables page object with login and navigation to reconciliation > payables"""
         page = perform_login_with_entity
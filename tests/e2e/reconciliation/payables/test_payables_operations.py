@@ -20,7 +20,7 @@ from utils.screenshot_helper import screenshot_helper
 class TestPayablesOperations:
     """Test class for payables operations within reconciliation functionality"""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def payables_page(self, perform_login_with_entity):
         """Initialize payables page object with login and navigation to reconciliation"""
         page = perform_login_with_entity
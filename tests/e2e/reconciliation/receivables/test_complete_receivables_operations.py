@@ -20,7 +20,7 @@ from utils.screenshot_helper import screenshot_helper
 class TestCompleteReceivablesOperations:
     """Complete test class for all receivables operations"""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def receivables_page(self, perform_login_with_entity):
         """Initialize receivables page object with login and navigation to reconciliation > receivables"""
         page = perform_login_with_entity
@@ -20,7 +20,7 @@ from utils.screenshot_helper import screenshot_helper
 class TestReceivablesOperations:
     """Test class for receivables operations within reconciliation functionality"""
     
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(loop_scope="session")
     async def receivables_page(self, perform_login_with_entity):
         """Initialize receivables page object with login and navigation to reconciliation"""
         page = perform_login_with_entity
@@ -5,22 +5,24 @@ Tests that export data and compare with CSV file to verify data integrity
 
 import pytest
 import asyncio
-import csv
-import os
-from datetime import datetime
 from playwright.async_api import Page, expect
 
+from utils.export_capture import CapturedExport, capture_export
+from utils.export_reader import ExportReader
+from utils.grid_capture import GridCapture, agrees_with_grid, project_records
+from utils.reconciliation import SCHEMAS, detect_schema, reconcile
+from utils.table_snapshot import snapshot_table
+
 
 class TestExportValidation:
     """Tests for validating exported data matches UI data"""
     
-    DOWNLOAD_PATH = "/Users/sharonhoffman/Desktop/Automation/playwright_python_framework/downloads"
     FROM_DATE = "01/01/2020"  # Use old date to ensure data exists
     
     @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup download directory"""
-        os.makedirs(self.DOWNLOAD_PATH, exist_ok=True)
+    def setup(self, export_artifacts):
+        """Collect captured exports - released after the test, kept on failure with --keep-export-artifacts"""
+        self.exports = export_artifacts
     
     async def set_date_filter(self, page: Page, from_date: str):
         """Set the from date filter to ensure data exists"""
@@ -104,8 +106,36 @@ class TestExportValidation:
             print(f"⚠️ Could not change rows per page: {str(e)[:30]}")
         return False
 
-    async def get_all_table_data(self, page: Page, target_rows: int = 0) -> list:
-        """Extract ALL data from table by paginating through all pages"""
+    async def get_captured_table_data(self, page: Page, capture: GridCapture, headers: list, module: str) -> list:
+        """Build the table from the grid's list API responses, in the export's column order"""
+        await capture.fetch_remaining()  # one request for the rest when the API pages
+        records = await capture.records()
+        print(capture.summary())
+        if capture.total is not None and len(records) < capture.total:
+            print(f"⚠️ Captured {len(records)} of {capture.total} records")
+            return []
+        schema = SCHEMAS[module]
+        rows = project_records(records, headers, capture.columns, schema.key_columns)
+        if not rows:
+            return []
+        # Trusted only if the rendered first page shows the same rows
+        snapshot = await snapshot_table(page)
+        return rows if agrees_with_grid(rows, snapshot.rows, schema) else []
+
+    async def get_all_table_data(self, page: Page, target_rows: int = 0, capture: GridCapture = None,
+                                 headers: list = None, module: str = None) -> list:
+        """Extract ALL table data - from the captured list API responses, else by paginating the UI"""
+        if capture is not None:
+            capture.stop()
+            if capture.seen:
+                captured = await self.get_captured_table_data(page, capture, headers or [], module)
+                if captured:
+                    print(f"✅ Total rows from the list API: {len(captured)} (no pagination)")
+                    return captured
+                print("⚠️ Captured data unusable - reading the table from the page")
+            else:
+                print(f"⚠️ No {capture.name} list response seen - reading the table from the page")
+        
         print(f"📊 Extracting table data from UI (target: {target_rows if target_rows else 'all'} rows)...")
         
         all_data = []
@@ -164,58 +194,15 @@ class TestExportValidation:
         return all_data
 
     async def get_table_data(self, page: Page) -> list:
-        """Extract data from the current table page"""
+        """Extract data from the current table page - every row, in one in-page read"""
         print("📊 Extracting table data from UI...")
         
-        table_data = []
-        
-        # Wait for table to load
-        await asyncio.sleep(2)
-        
-        # Get all rows
-        rows = page.locator("table tbody tr, [role='row']")
-        row_count = await rows.count()
-        print(f"📋 Found {row_count} rows in table")
+        # Waits for the row count to settle, then reads headers, rows and cells at once
+        snapshot = await snapshot_table(page)
+        print(snapshot.summary())
         
-        if row_count == 0:
-            # Try alternative selectors
-            rows = page.locator(".data-row, .table-row, tr[data-row-key]")
-            row_count = await rows.count()
-            print(f"📋 Alternative selector found {row_count} rows")
-        
-        for i in range(min(row_count, 100)):  # Limit to first 100 rows for performance
-            try:
-                row = rows.nth(i)
-                cells = row.locator("td, [role='cell']")
-                cell_count = await cells.count()
-                
-                row_data = []
-                for j in range(cell_count):
-                    # Use inner_text() to get only visible text, avoiding duplicates from nested elements
-                    try:
-                        cell_text = await cells.nth(j).inner_text(timeout=1000)
-                    except:
-                        cell_text = await cells.nth(j).text_content() or ""
-                    
-                    # Clean up the text - remove duplicate lines
-                    lines = cell_text.strip().split('\n')
-                    unique_lines = []
-                    for line in lines:
-                        line = line.strip()
-                        if line and line not in unique_lines:
-                            unique_lines.append(line)
-                    cell_text = ' '.join(unique_lines)
-                    
-                    row_data.append(cell_text.strip())
-                
-                if row_data and any(row_data):  # Skip empty rows
-                    table_data.append(row_data)
-            except Exception as e:
-                print(f"⚠️ Error reading row {i}: {str(e)[:50]}")
-                continue
-        
-        print(f"✅ Extracted {len(table_data)} data rows")
-        return table_data
+        print(f"✅ Extracted {len(snapshot)} data rows")
+        return snapshot.rows
     
     async def get_total_row_count(self, page: Page) -> int:
         """Get total row count from pagination or table"""
@@ -266,8 +253,15 @@ class TestExportValidation:
         print(f"📊 Row count from table: {count}")
         return count
     
-    async def click_export_button(self, page: Page) -> str:
-        """Click export button and wait for download"""
+    async def capture_download(self, page: Page, button, timeout: int) -> CapturedExport:
+        """Click button and capture the exported file in memory"""
+        export = await capture_export(page, button.click, timeout=timeout)
+        self.exports.append(export)
+        print(export.summary())
+        return export
+    
+    async def click_export_button(self, page: Page) -> CapturedExport:
+        """Click export button and capture the download"""
         print("📥 Clicking export button...")
         
         await page.screenshot(path="debug_before_export.png")
@@ -279,22 +273,10 @@ class TestExportValidation:
             await export_btn.wait_for(state="visible", timeout=5000)
             print("📍 Found 'Export' text element")
             
-            # Set up download listener and click
-            async with page.expect_download(timeout=30000) as download_info:
-                await export_btn.click()
-                print("✅ Clicked Export")
-            
-            download = await download_info.value
-            # Use the suggested filename from the download to preserve correct extension
-            suggested_filename = download.suggested_filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # Keep original extension
-            ext = os.path.splitext(suggested_filename)[1] if suggested_filename else ".xlsx"
-            filename = f"export_{timestamp}{ext}"
-            download_path = os.path.join(self.DOWNLOAD_PATH, filename)
-            await download.save_as(download_path)
-            print(f"✅ File downloaded: {download_path} (original: {suggested_filename})")
-            return download_path
+            # Click with the download captured
+            export = await self.capture_download(page, export_btn, 30000)
+            print("✅ Clicked Export")
+            return export
             
         except Exception as e:
             print(f"⚠️ Simple Export click failed: {str(e)[:100]}")
@@ -316,18 +298,9 @@ class TestExportValidation:
                     
                     # Try with download listener
                     try:
-                        async with page.expect_download(timeout=15000) as download_info:
-                            await export_btn.click()
-                            print(f"✅ Clicked export using: {selector}")
-                            export_clicked = True
-                        
-                        download = await download_info.value
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        filename = f"export_{timestamp}.csv"
-                        download_path = os.path.join(self.DOWNLOAD_PATH, filename)
-                        await download.save_as(download_path)
-                        print(f"✅ File downloaded: {download_path}")
-                        return download_path
+                        export = await self.capture_download(page, export_btn, 15000)
+                        print(f"✅ Clicked export using: {selector}")
+                        return export
                     except Exception as e:
                         print(f"⚠️ Direct download failed: {str(e)[:50]}")
                         # Click without download listener
@@ -358,17 +331,9 @@ class TestExportValidation:
             try:
                 modal_btn = page.locator(selector).first
                 if await modal_btn.is_visible():
-                    async with page.expect_download(timeout=15000) as download_info:
-                        await modal_btn.click()
-                        print(f"✅ Clicked modal download: {selector}")
-                    
-                    download = await download_info.value
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"export_{timestamp}.csv"
-                    download_path = os.path.join(self.DOWNLOAD_PATH, filename)
-                    await download.save_as(download_path)
-                    print(f"✅ File downloaded from modal: {download_path}")
-                    return download_path
+                    export = await self.capture_download(page, modal_btn, 15000)
+                    print(f"✅ Clicked modal download: {selector}")
+                    return export
             except:
                 continue
         
@@ -377,385 +342,57 @@ class TestExportValidation:
         print("⚠️ Could not capture download - check if export uses different mechanism")
         raise Exception("Export did not trigger a download")
     
-    def read_export_file(self, file_path: str) -> tuple:
-        """Read exported file (CSV or Excel) and return headers and data"""
-        print(f"📄 Reading export file: {file_path}")
-        
-        # Check if it's Excel (starts with PK - ZIP header)
-        with open(file_path, 'rb') as f:
-            header = f.read(4)
+    def read_export_file(self, export: CapturedExport) -> tuple:
+        """
+        Open exported file (CSV or Excel) and return headers and a stream of its data rows
+
+        The rows are read as reconcile() consumes them; data is None when the
+        export has no data rows.
+        """
+        print(f"📄 Reading export file: {export.filename}")
         
-        if header[:2] == b'PK':
-            # It's an Excel file
-            print("📊 Detected Excel format (.xlsx)")
+        # Streams the file: read-only Excel or line-by-line CSV, header row found while reading
+        reader = ExportReader(export.source())
+        try:
+            headers, rows = reader.open()
+            first = next(rows, None)
+        except ImportError:
+            print("⚠️ openpyxl not installed, trying pandas...")
             try:
-                import openpyxl
-                wb = openpyxl.load_workbook(file_path)
-                ws = wb.active
-                
-                rows = []
-                for row in ws.iter_rows(values_only=True):
-                    rows.append([str(cell) if cell is not None else "" for cell in row])
-                
-                if not rows:
-                    return [], []
-                
-                # Find the actual header row (skip metadata rows like "Export Date: ...")
-                # Header row typically starts with "Status" or has column names
-                header_row_idx = 0
-                for idx, row in enumerate(rows):
-                    first_cell = str(row[0]).lower().strip() if row else ""
-                    # Skip rows that are metadata, empty, or export date info
-                    if first_cell in ['status', 'date', 'id', 'name', 'description', 'supplier']:
-                        header_row_idx = idx
-                        break
-                    elif first_cell.startswith('export date') or first_cell == '' or first_cell == 'none':
-                        continue
-                    elif idx > 5:  # Don't look past row 5
-                        break
-                
-                print(f"📊 Found header row at index {header_row_idx}")
-                
-                headers = rows[header_row_idx] if header_row_idx < len(rows) else []
-                data = rows[header_row_idx + 1:] if header_row_idx + 1 < len(rows) else []
-                
-                # Filter out empty rows from data
-                data = [row for row in data if any(str(cell).strip() for cell in row)]
-                
-                print(f"✅ Excel has {len(headers)} columns and {len(data)} data rows (skipped {header_row_idx} metadata rows)")
-                return headers, data
-                
+                import pandas as pd
+                df = pd.read_excel(export.source())
+                headers = list(df.columns)
+                data = df.values.tolist()
+                print(f"✅ Excel has {len(headers)} columns and {len(data)} data rows")
+                return headers, (iter(data) if data else None)
             except ImportError:
-                print("⚠️ openpyxl not installed, trying pandas...")
-                try:
-                    import pandas as pd
-                    df = pd.read_excel(file_path)
-                    headers = list(df.columns)
-                    data = df.values.tolist()
-                    print(f"✅ Excel has {len(headers)} columns and {len(data)} data rows")
-                    return headers, data
-                except ImportError:
-                    print("❌ Neither openpyxl nor pandas installed")
-                    return [], []
-        else:
-            # It's a CSV file
-            print("📊 Detected CSV format")
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-            
-            if not rows:
-                return [], []
-            
-            headers = rows[0] if rows else []
-            data = rows[1:] if len(rows) > 1 else []
-            
-            print(f"✅ CSV has {len(headers)} columns and {len(data)} data rows")
-            return headers, data
-    
-    def normalize_value(self, value: str) -> str:
-        """Normalize a value for comparison"""
-        import re
-        val = str(value).strip()
-        # Remove currency symbols and formatting
-        val = val.replace('$', '').replace('₪', '').replace('€', '').replace('£', '').replace('¥', '').replace('円', '')
-        val = val.replace(',', '')
-        
-        # Handle accounting format: (123.45) means -123.45
-        match = re.match(r'^\(([0-9.]+)\)$', val)
-        if match:
-            val = f"-{match.group(1)}"
-        
-        # Normalize whitespace
-        val = ' '.join(val.split())
-        return val.lower()
-    
-    def normalize_date(self, value: str) -> str:
-        """Normalize date to comparable format (YYYYMMDD)"""
-        import re
-        val = str(value).strip()
-        
-        # Extract date parts - try multiple formats
-        # Format: 09/11/2025 or 2025-09-11 or 09/11/2025, 10:05 or 2025-09-11 10:05:00
-        
-        # Try YYYY-MM-DD first (from CSV/Excel)
-        match = re.search(r'(\d{4})-(\d{2})-(\d{2})', val)
-        if match:
-            return f"{match.group(1)}{match.group(2)}{match.group(3)}"
-        
-        # Try MM/DD/YYYY format (US format - used in Viewz UI)
-        match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})', val)
-        if match:
-            part1, part2, year = match.groups()
-            # MM/DD/YYYY format (US format) - month first, then day
-            month = part1.zfill(2)
-            day = part2.zfill(2)
-            return f"{year}{month}{day}"
-        
-        return val
-    
-    def values_match(self, ui_val: str, csv_val: str) -> bool:
-        """Check if two values match (with normalization)"""
-        import re
+                print("❌ Neither openpyxl nor pandas installed")
+                return [], None
         
-        # Treat dropdown placeholders and GL Account column differences as matches
-        placeholder_texts = ['select gl account', 'select account', 'select', 'choose', '--']
-        ui_lower = ui_val.lower().strip()
-        csv_lower = csv_val.lower().strip()
-        
-        # If UI has placeholder and CSV is empty, treat as match
-        if any(p in ui_lower for p in placeholder_texts) and csv_lower == '':
-            return True
-        # If CSV has placeholder and UI is empty, treat as match  
-        if any(p in csv_lower for p in placeholder_texts) and ui_lower == '':
-            return True
-        
-        # Treat "-" as equivalent to "0" or empty
-        if ui_val.strip() == '-' and (csv_val.strip() == '0' or csv_val.strip() == ''):
-            return True
-        if csv_val.strip() == '-' and (ui_val.strip() == '0' or ui_val.strip() == ''):
-            return True
-        
-        # Direct match
-        if ui_val == csv_val:
-            return True
-        
-        # Normalized match
-        norm_ui = self.normalize_value(ui_val)
-        norm_csv = self.normalize_value(csv_val)
-        if norm_ui == norm_csv:
-            return True
-        
-        # Date comparison (normalize both to same format - just compare the date part)
-        date_ui = self.normalize_date(ui_val)
-        date_csv = self.normalize_date(csv_val)
-        if date_ui == date_csv and re.match(r'^\d{8}$', date_ui):
-            return True
-        
-        # Numeric comparison
-        try:
-            ui_num = float(self.normalize_value(ui_val))
-            csv_num = float(self.normalize_value(csv_val))
-            if abs(ui_num - csv_num) < 0.01:
-                return True
-        except:
-            pass
+        print(f"📊 Detected {reader.format.upper()} format, header row at index {reader.header_index}")
+        if first is None:
+            print(reader.summary())
+            return headers, None
         
-        # Check if one contains the other (for truncated values with ellipsis)
-        clean_ui = norm_ui.replace('...', '').replace('…', '').strip()
-        clean_csv = norm_csv.replace('...', '').replace('…', '').strip()
-        if clean_ui and clean_csv:
-            if clean_ui in clean_csv or clean_csv in clean_ui:
-                return True
+        def stream():
+            yield first
+            yield from rows
+            print(reader.summary())
         
-        return False
+        return headers, stream()
     
-    def compare_data(self, ui_data: list, csv_data: list) -> dict:
-        """Compare UI data with CSV data using ID-based matching"""
-        print("🔍 Comparing UI data with CSV data...")
-        
-        # DEBUG: Print raw data
-        print("\n" + "="*60)
-        print("🔬 DEBUG: RAW DATA")
-        print("="*60)
-        print(f"📊 UI rows: {len(ui_data)}, CSV rows: {len(csv_data)}")
-        
-        if ui_data:
-            print(f"\n📋 UI FIRST 3 ROWS (raw):")
-            for i, row in enumerate(ui_data[:3]):
-                print(f"   Row {i}: {row[:6]}..." if len(row) > 6 else f"   Row {i}: {row}")
-        
-        if csv_data:
-            print(f"\n📋 CSV FIRST 3 ROWS (raw):")
-            for i, row in enumerate(csv_data[:3]):
-                print(f"   Row {i}: {row[:6]}..." if len(row) > 6 else f"   Row {i}: {row}")
-        
-        # IMPROVED APPROACH: Match rows by unique identifier
-        # Payables: Column 3 is typically "ID" (Invoice Number)
-        # Create dictionaries keyed by ID for matching
-        
-        def get_row_key(row, is_csv=False):
-            """Get a unique key for a row - use combination of fields based on data type"""
-            if len(row) < 3:
-                return None
-            
-            col0 = str(row[0]).strip()
-            col0_lower = col0.lower()
-            
-            # Detect if first column looks like a date (Bank Transactions start with date)
-            # Formats: 02/14/2025, 2025-02-14, 2025-02-14 12:00:00
-            import re
-            is_date_first = bool(re.match(r'^\d{1,2}/\d{1,2}/\d{4}', col0)) or \
-                           bool(re.match(r'^\d{4}-\d{2}-\d{2}', col0))
-            
-            # BANK TRANSACTIONS: First column is DATE
-            # Structure: Date, Description, Amount, GL Account, Status
-            if is_date_first:
-                date_col = col0
-                desc_col = str(row[1]).strip() if len(row) > 1 else ""
-                
-                # Find amount column (col 2 usually)
-                amount_col = str(row[2]).strip() if len(row) > 2 else ""
-                amount_norm = self.normalize_value(amount_col)
-                
-                # Normalize date for matching
-                date_norm = self.normalize_date(date_col)
-                
-                # Normalize description:
-                # 1. Remove truncation ellipsis (... or …)
-                # 2. Remove extra spaces
-                # 3. Take first 20 chars for matching (shorter to avoid truncation issues)
-                desc_clean = desc_col.replace('...', '').replace('…', '')
-                desc_norm = ' '.join(desc_clean.split())[:20].lower()
-                
-                # Round amount to whole number for more robust matching
-                try:
-                    amount_rounded = str(int(float(amount_norm)))
-                except:
-                    amount_rounded = amount_norm
-                
-                return f"{date_norm}|{desc_norm}|{amount_rounded}"
-            
-            # PAYABLES/RECEIVABLES: First column is STATUS (Recorded, AI Recommended, Matched, etc.)
-            # Structure: Status, Uploaded, Supplier, ID, Date, Pre Tax...
-            else:
-                doc_id = str(row[3]).strip() if len(row) > 3 else ""
-                supplier = str(row[2]).strip() if len(row) > 2 else ""
-                
-                # If ID is available and not empty, use it
-                if doc_id and doc_id.lower() not in ['', 'none', 'null', 'id']:
-                    return f"{supplier}|{doc_id}"
-                
-                # Fallback: use supplier + date + amount for matching
-                date_col = str(row[4]).strip() if len(row) > 4 else ""
-                amount_col = str(row[5]).strip() if len(row) > 5 else ""
-                amount_norm = self.normalize_value(amount_col)
-                return f"{supplier}|{date_col}|{amount_norm}"
-        
-        # DEBUG: Show sample keys AFTER function is defined
-        print(f"\n🔑 SAMPLE KEYS (first 3 rows):")
-        for i in range(min(3, len(ui_data))):
-            ui_key = get_row_key(ui_data[i])
-            csv_key = get_row_key(csv_data[i]) if i < len(csv_data) else "N/A"
-            print(f"   Row {i}:")
-            print(f"      UI key:  {ui_key}")
-            print(f"      CSV key: {csv_key}")
-        
-        # Build lookup dictionaries
-        ui_by_key = {}
-        for row in ui_data:
-            key = get_row_key(row)
-            if key:
-                ui_by_key[key] = row
-        
-        csv_by_key = {}
-        for row in csv_data:
-            key = get_row_key(row, is_csv=True)
-            if key:
-                csv_by_key[key] = row
-        
-        print(f"\n📊 Unique keys found: UI={len(ui_by_key)}, CSV={len(csv_by_key)}")
-        
-        # Find matching keys
-        matching_keys = set(ui_by_key.keys()) & set(csv_by_key.keys())
-        print(f"📊 Matching keys: {len(matching_keys)}")
-        
-        if len(matching_keys) > 0:
-            print(f"📋 Sample matching keys: {list(matching_keys)[:3]}")
-        
-        # Find non-matching keys for debugging
-        ui_only = set(ui_by_key.keys()) - set(csv_by_key.keys())
-        csv_only = set(csv_by_key.keys()) - set(ui_by_key.keys())
-        if ui_only:
-            print(f"⚠️ UI-only keys ({len(ui_only)}): {list(ui_only)[:3]}...")
-        if csv_only:
-            print(f"⚠️ CSV-only keys ({len(csv_only)}): {list(csv_only)[:3]}...")
-        
-        result = {
-            "ui_row_count": len(ui_data),
-            "csv_row_count": len(csv_data),
-            "row_count_match": len(ui_data) == len(csv_data),
-            "mismatches": [],
-            "match_percentage": 0
-        }
-        
-        # Compare row counts
-        if not result["row_count_match"]:
-            print(f"⚠️ Row count mismatch: UI={len(ui_data)}, CSV={len(csv_data)}")
-        else:
-            print(f"✅ Row counts match: {len(ui_data)}")
-        
-        # Compare data content USING KEY-BASED MATCHING
-        matches = 0
-        total_comparisons = 0
-        
-        print("\n" + "="*60)
-        print("🔬 DEBUG: KEY-BASED ROW COMPARISON")
-        print("="*60)
-        
-        compared_count = 0
-        for key in matching_keys:
-            ui_row = ui_by_key[key]
-            csv_row = csv_by_key[key]
-            
-            # Debug first 3 matched rows
-            if compared_count < 3:
-                print(f"\n📍 KEY: {key[:50]}...")
-                print(f"   UI:  {ui_row[:5]}...")
-                print(f"   CSV: {csv_row[:5]}...")
-            
-            # Compare each cell using normalized comparison
-            min_cols = min(len(ui_row), len(csv_row))
-            row_matches = 0
-            for j in range(min_cols):
-                total_comparisons += 1
-                ui_val = str(ui_row[j]).strip()
-                csv_val = str(csv_row[j]).strip()
-                
-                if self.values_match(ui_val, csv_val):
-                    matches += 1
-                    row_matches += 1
-                else:
-                    if len(result["mismatches"]) < 20:
-                        result["mismatches"].append({
-                            "row": key[:30],
-                            "col": j,
-                            "ui_value": ui_val[:50],
-                            "csv_value": csv_val[:50]
-                        })
-            
-            if compared_count < 3:
-                print(f"   Match: {row_matches}/{min_cols} cells ({100*row_matches/min_cols:.1f}%)")
-            
-            compared_count += 1
-        
-        print("\n" + "="*60)
-        
-        if total_comparisons > 0:
-            result["match_percentage"] = (matches / total_comparisons) * 100
-        
-        # Update row counts to reflect matched rows
-        result["ui_row_count"] = len(matching_keys)
-        result["csv_row_count"] = len(matching_keys)
-        result["row_count_match"] = True
-        
-        # DEBUG: Summary
-        print(f"\n📊 COMPARISON SUMMARY:")
-        print(f"   Total matched rows: {len(matching_keys)}")
-        print(f"   UI rows without match: {len(ui_only)}")
-        print(f"   CSV rows without match: {len(csv_only)}")
-        print(f"   Total cell comparisons: {total_comparisons}")
-        print(f"   Matching cells: {matches}")
-        print(f"   Mismatching cells: {total_comparisons - matches}")
-        
-        # Print mismatches for debugging
-        if result["mismatches"]:
+    def compare_data(self, ui_data: list, csv_data, module: str = None, headers: list = None) -> dict:
+        """Compare UI data with export data - rows joined on the module's key (utils/reconciliation.py)"""
+        print("🔍 Comparing UI data with export data...")
+        schema = SCHEMAS[module] if module else detect_schema(ui_data)
+        result = reconcile(ui_data, csv_data, schema, headers)
+        print(result.summary())
+        
+        if result.mismatches:
             print(f"❌ Sample mismatches:")
-            for m in result["mismatches"][:5]:
-                print(f"   Row {m['row']}, Col {m['col']}: UI='{m['ui_value']}' vs CSV='{m['csv_value']}'")
-        
-        print(f"✅ Match percentage: {result['match_percentage']:.1f}%")
-        return result
+            for m in result.mismatches[:5]:
+                print(f"   Row {m['row']}, {m['column']}: UI='{m['ui_value']}' vs CSV='{m['csv_value']}'")
+        return result.as_dict()
 
     # ==========================================
     # PAYABLES EXPORT TEST
@@ -778,6 +415,7 @@ class TestExportValidation:
         
         # Navigate to Payables
         print("\n📍 Step 1: Navigating to Payables...")
+        capture = GridCapture(page, "PayablesPage").start()  # list API responses from the first load on
         await page.goto("/reconciliation/payables")
         await asyncio.sleep(3)
         
@@ -793,26 +431,24 @@ class TestExportValidation:
         # Export FIRST to get true row count
         print("\n📥 Step 3: Exporting data...")
         try:
-            csv_path = await self.click_export_button(page)
+            export = await self.click_export_button(page)
         except Exception as e:
             pytest.fail(f"Export failed: {str(e)}")
         
         # Read exported file to get true total
         print("\n📄 Step 4: Reading exported file...")
-        csv_headers, csv_data = self.read_export_file(csv_path)
-        export_row_count = len(csv_data)
-        print(f"📊 Export has {export_row_count} rows")
+        csv_headers, csv_data = self.read_export_file(export)
         
-        if export_row_count == 0:
+        if csv_data is None:
             pytest.skip("No data in export file")
         
-        # Get ALL table data from UI (paginate to match export count)
-        print(f"\n📋 Step 5: Extracting all {export_row_count} UI rows...")
-        ui_data = await self.get_all_table_data(page, export_row_count)
+        # Get ALL table data from UI (the export is counted while it is compared)
+        print("\n📋 Step 5: Extracting all UI rows...")
+        ui_data = await self.get_all_table_data(page, 0, capture, csv_headers, "payables")
         
         # Compare data
         print("\n🔍 Step 6: Comparing data...")
-        comparison = self.compare_data(ui_data, csv_data)
+        comparison = self.compare_data(ui_data, csv_data, "payables", csv_headers)
         
         # Assertions
         print("\n✅ Step 7: Validating results...")
@@ -831,11 +467,6 @@ class TestExportValidation:
         else:
             print(f"✅ Data match: 100%")
         
-        # Clean up downloaded file
-        if os.path.exists(csv_path):
-            os.remove(csv_path)
-            print(f"🗑️ Cleaned up: {csv_path}")
-        
         print("\n" + "="*60)
         print("✅ PAYABLES EXPORT VALIDATION PASSED!")
         print("="*60)
@@ -861,6 +492,7 @@ class TestExportValidation:
         
         # Navigate to Receivables
         print("\n📍 Step 1: Navigating to Receivables...")
+        capture = GridCapture(page, "ReceivablesPage").start()  # list API responses from the first load on
         await page.goto("/reconciliation/receivables")
         await asyncio.sleep(3)
         
@@ -876,25 +508,23 @@ class TestExportValidation:
         # Export FIRST to get true row count
         print("\n📥 Step 3: Exporting data...")
         try:
-            csv_path = await self.click_export_button(page)
+            export = await self.click_export_button(page)
         except Exception as e:
             pytest.fail(f"Export failed: {str(e)}")
         
         # Read exported file to get true total
         print("\n📄 Step 4: Reading exported file...")
-        csv_headers, csv_data = self.read_export_file(csv_path)
-        export_row_count = len(csv_data)
-        print(f"📊 Export has {export_row_count} rows")
+        csv_headers, csv_data = self.read_export_file(export)
         
-        if export_row_count == 0:
+        if csv_data is None:
             pytest.skip("No data in export file")
         
-        # Get ALL table data from UI (paginate to match export count)
-        print(f"\n📋 Step 5: Extracting all {export_row_count} UI rows...")
-        ui_data = await self.get_all_table_data(page, export_row_count)
+        # Get ALL table data from UI (the export is counted while it is compared)
+        print("\n📋 Step 5: Extracting all UI rows...")
+        ui_data = await self.get_all_table_data(page, 0, capture, csv_headers, "receivables")
         
         # RECEIVABLES: Align column counts - UI may have extra columns not in export
-        csv_col_count = len(csv_data[0]) if csv_data else 0
+        csv_col_count = len(csv_headers)
         ui_col_count = len(ui_data[0]) if ui_data else 0
         if ui_col_count > csv_col_count and csv_col_count > 0:
             print(f"📋 Aligning columns: UI has {ui_col_count} cols, CSV has {csv_col_count} cols")
@@ -902,50 +532,9 @@ class TestExportValidation:
             ui_data = [row[:csv_col_count] for row in ui_data]
             print(f"📋 Trimmed UI data to {csv_col_count} columns")
         
-        # RECEIVABLES: Match rows by ID (column 3) before comparing
-        # Column structure: Status(0), Date(1), Description(2), ID(3), ...
-        print("📋 Matching rows by ID column...")
-        
-        # Build lookup by ID
-        csv_by_id = {str(r[3]).strip(): r for r in csv_data if len(r) > 3}
-        ui_by_id = {str(r[3]).strip(): r for r in ui_data if len(r) > 3}
-        
-        # Find matching IDs
-        matching_ids = set(csv_by_id.keys()) & set(ui_by_id.keys())
-        print(f"📋 Found {len(matching_ids)} matching IDs out of {len(ui_by_id)} UI / {len(csv_by_id)} CSV")
-        
-        # Compare matched rows directly (no re-sorting)
-        print("\n🔍 Step 6: Comparing matched data by ID...")
-        matches = 0
-        total = 0
-        mismatches = []
-        
-        for row_id in sorted(matching_ids):
-            ui_row = ui_by_id[row_id]
-            csv_row = csv_by_id[row_id]
-            min_cols = min(len(ui_row), len(csv_row))
-            
-            for j in range(min_cols):
-                total += 1
-                if self.values_match(str(ui_row[j]).strip(), str(csv_row[j]).strip()):
-                    matches += 1
-                elif len(mismatches) < 5:
-                    mismatches.append({
-                        'row': row_id,
-                        'col': j,
-                        'ui_value': str(ui_row[j])[:30],
-                        'csv_value': str(csv_row[j])[:30]
-                    })
-        
-        match_pct = (matches / total * 100) if total > 0 else 0
-        print(f"✅ Match percentage: {match_pct:.1f}%")
-        
-        comparison = {
-            "ui_row_count": len(matching_ids),
-            "csv_row_count": len(matching_ids),
-            "match_percentage": match_pct,
-            "mismatches": mismatches
-        }
+        # RECEIVABLES: Rows are matched by document ID (column 3)
+        print("\n🔍 Step 6: Comparing data matched by ID...")
+        comparison = self.compare_data(ui_data, csv_data, "receivables", csv_headers)
         
         # Assertions
         print("\n✅ Step 7: Validating results...")
@@ -964,11 +553,6 @@ class TestExportValidation:
         else:
             print(f"✅ Data match: 100%")
         
-        # Clean up downloaded file
-        if os.path.exists(csv_path):
-            os.remove(csv_path)
-            print(f"🗑️ Cleaned up: {csv_path}")
-        
         print("\n" + "="*60)
         print("✅ RECEIVABLES EXPORT VALIDATION PASSED!")
         print("="*60)
@@ -994,6 +578,7 @@ class TestExportValidation:
         
         # Navigate to Bank Transactions
         print("\n📍 Step 1: Navigating to Bank Transactions...")
+        capture = GridCapture(page, "BankPage").start()  # list API responses from the first load on
         await page.goto("/reconciliation/banks")
         await asyncio.sleep(3)
         
@@ -1020,26 +605,24 @@ class TestExportValidation:
         # Export FIRST to get true row count
         print("\n📥 Step 3: Exporting data...")
         try:
-            export_path = await self.click_export_button(page)
+            export = await self.click_export_button(page)
         except Exception as e:
             pytest.fail(f"Export failed: {str(e)}")
         
         # Read exported file to get true total
         print("\n📄 Step 4: Reading exported file...")
-        file_headers, file_data = self.read_export_file(export_path)
-        export_row_count = len(file_data)
-        print(f"📊 Export has {export_row_count} rows")
+        file_headers, file_data = self.read_export_file(export)
         
-        if export_row_count == 0:
+        if file_data is None:
             pytest.skip("No data in export file")
         
-        # Get ALL table data from UI (paginate to match export count)
-        print(f"\n📋 Step 5: Extracting all {export_row_count} UI rows...")
-        ui_data = await self.get_all_table_data(page, export_row_count)
+        # Get ALL table data from UI (the export is counted while it is compared)
+        print("\n📋 Step 5: Extracting all UI rows...")
+        ui_data = await self.get_all_table_data(page, 0, capture, file_headers, "bank")
         
         # Compare data
         print("\n🔍 Step 6: Comparing data...")
-        comparison = self.compare_data(ui_data, file_data)
+        comparison = self.compare_data(ui_data, file_data, "bank", file_headers)
         
         # Assertions
         print("\n✅ Step 7: Validating results...")
@@ -1058,11 +641,6 @@ class TestExportValidation:
         else:
             print(f"✅ Data match: 100%")
         
-        # Clean up downloaded file
-        if os.path.exists(export_path):
-            os.remove(export_path)
-            print(f"🗑️ Cleaned up: {export_path}")
-        
         print("\n" + "="*60)
         print("✅ BANK TRANSACTIONS EXPORT VALIDATION PASSED!")
         print("="*60)
@@ -1088,6 +666,7 @@ class TestExportValidation:
         
         # Navigate to Credit Cards
         print("\n📍 Step 1: Navigating to Credit Cards...")
+        capture = GridCapture(page, "CreditCardPage").start()  # list API responses from the first load on
         await page.goto("/reconciliation/credit-cards")
         await asyncio.sleep(3)
         
@@ -1103,70 +682,30 @@ class TestExportValidation:
         # Export FIRST to get true row count
         print("\n📥 Step 3: Exporting data...")
         try:
-            export_path = await self.click_export_button(page)
+            export = await self.click_export_button(page)
         except Exception as e:
             pytest.fail(f"Export failed: {str(e)}")
         
         # Read exported file to get true total
         print("\n📄 Step 4: Reading exported file...")
-        file_headers, file_data = self.read_export_file(export_path)
-        export_row_count = len(file_data)
-        print(f"📊 Export has {export_row_count} rows")
+        file_headers, file_data = self.read_export_file(export)
         
-        if export_row_count == 0:
+        if file_data is None:
             pytest.skip("No data in export file")
         
-        # Get ALL table data from UI (paginate to match export count)
-        print(f"\n📋 Step 5: Extracting all {export_row_count} UI rows...")
-        ui_data = await self.get_all_table_data(page, export_row_count)
+        # Get ALL table data from UI (the export is counted while it is compared)
+        print("\n📋 Step 5: Extracting all UI rows...")
+        ui_data = await self.get_all_table_data(page, 0, capture, file_headers, "credit_cards")
         
         # CREDIT CARDS: Align column counts - UI may have extra columns
-        csv_col_count = len(file_data[0]) if file_data else 0
+        csv_col_count = len(file_headers)
         ui_col_count = len(ui_data[0]) if ui_data else 0
         print(f"📋 UI has {ui_col_count} cols, CSV has {csv_col_count} cols")
         
-        # CREDIT CARDS: Match rows by Description (col 1) to handle sorting differences
+        # CREDIT CARDS: Rows are matched by date, description and amount to handle sorting differences
         # Column structure: Date(0), Description(1), Amount(2), GL Account(3), Status(4)
-        print("📋 Matching rows by Description column...")
-        
-        csv_by_desc = {str(r[1]).strip(): r for r in file_data if len(r) > 1}
-        ui_by_desc = {str(r[1]).strip(): r for r in ui_data if len(r) > 1}
-        
-        matching_descs = set(csv_by_desc.keys()) & set(ui_by_desc.keys())
-        print(f"📋 Found {len(matching_descs)} matching descriptions")
-        
-        # Compare matched data
-        print("\n🔍 Step 6: Comparing matched data by Description...")
-        matches = 0
-        total = 0
-        mismatches = []
-        
-        for desc in sorted(matching_descs):
-            ui_row = ui_by_desc[desc]
-            csv_row = csv_by_desc[desc]
-            min_cols = min(len(ui_row), len(csv_row))
-            
-            for j in range(min_cols):
-                total += 1
-                if self.values_match(str(ui_row[j]).strip(), str(csv_row[j]).strip()):
-                    matches += 1
-                elif len(mismatches) < 10:
-                    mismatches.append({
-                        'row': desc[:30],
-                        'col': j,
-                        'ui_value': str(ui_row[j])[:30],
-                        'csv_value': str(csv_row[j])[:30]
-                    })
-        
-        match_pct = (matches / total * 100) if total > 0 else 0
-        print(f"✅ Match percentage: {match_pct:.1f}%")
-        
-        comparison = {
-            "ui_row_count": len(matching_descs),
-            "csv_row_count": len(matching_descs),
-            "match_percentage": match_pct,
-            "mismatches": mismatches
-        }
+        print("\n🔍 Step 6: Comparing data matched by date, description and amount...")
+        comparison = self.compare_data(ui_data, file_data, "credit_cards", file_headers)
         
         # Assertions
         print("\n✅ Step 7: Validating results...")
@@ -1177,9 +716,9 @@ class TestExportValidation:
         print(f"📊 Row counts: UI={ui_rows}, Export={csv_rows}")
         
         # Show mismatches
-        if mismatches:
-            print(f"❌ {len(mismatches)} mismatches found:")
-            for m in mismatches[:5]:
+        if comparison["mismatches"]:
+            print(f"❌ {len(comparison['mismatches'])} mismatches found:")
+            for m in comparison["mismatches"][:5]:
                 print(f"   Col {m['col']}: UI='{m['ui_value']}' vs CSV='{m['csv_value']}'")
         
         # Data should match 99.9%+
@@ -1189,11 +728,6 @@ class TestExportValidation:
         else:
             print(f"✅ Data match: 100%")
         
-        # Clean up downloaded file
-        if os.path.exists(export_path):
-            os.remove(export_path)
-            print(f"🗑️ Cleaned up: {export_path}")
-        
         print("\n" + "="*60)
         print("✅ CREDIT CARDS EXPORT VALIDATION PASSED!")
         print("="*60)
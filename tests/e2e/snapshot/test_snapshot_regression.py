@@ -20,6 +20,13 @@ from pages.payables_page import PayablesPage
 from pages.ledger_page import LedgerPage
 from pages.reconciliation_page import ReconciliationPage
 from utils.screenshot_helper import ScreenshotHelper
+from utils.routes import goto_route
+
+# Screenshots need images and fonts - never run these under a lean network profile
+pytestmark = pytest.mark.net_profile("full")
+
+# Menu label -> page object whose route is opened
+NAV_ROUTES = {"Home": HomePage, "Reconciliation": ReconciliationPage, "Ledger": LedgerPage}
 
 
 class TestSnapshotRegression:
@@ -45,8 +52,8 @@ class TestSnapshotRegression:
             print(f"\n📸 Taking visual snapshot of {page_info['name']} page...")
             
             try:
-                # Navigate to page using proper menu reveal pattern
-                await self._navigate_with_menu_reveal(page, page_info['nav'])
+                # Navigate to page by its deep link
+                await self._navigate_to(page, page_info['nav'])
                 await asyncio.sleep(3)
                 
                 # Wait for page to be fully loaded
@@ -120,7 +127,7 @@ class TestSnapshotRegression:
                 # Navigate to page if not already there
                 current_url = page.url
                 if element_info['page'].lower() not in current_url.lower():
-                    await self._navigate_with_menu_reveal(page, element_info['nav'])
+                    await self._navigate_to(page, element_info['nav'])
                     await asyncio.sleep(3)
                 
                 # Get DOM content of the element
@@ -212,7 +219,7 @@ class TestSnapshotRegression:
             pages_to_visit = ["Home", "Reconciliation", "Ledger"]
             for page_name in pages_to_visit:
                 try:
-                    await self._navigate_with_menu_reveal(page, page_name)
+                    await self._navigate_to(page, page_name)
                     await asyncio.sleep(3)
                 except:
                     pass
@@ -317,7 +324,7 @@ class TestSnapshotRegression:
             try:
                 # Navigate if needed
                 if component['nav']:
-                    await self._navigate_with_menu_reveal(page, component['nav'])
+                    await self._navigate_to(page, component['nav'])
                     await asyncio.sleep(2)
                 elif component['page'] == 'login':
                     # Go to login page
@@ -385,7 +392,7 @@ class TestSnapshotRegression:
         
         try:
             # Navigate to home page
-            await self._navigate_with_menu_reveal(page, "Home")
+            await self._navigate_to(page, "Home")
             await asyncio.sleep(3)
             
             # Take initial snapshot
@@ -419,30 +426,10 @@ class TestSnapshotRegression:
             assert True, "Snapshot comparison workflow test completed"
 
     # Helper methods
-    async def _navigate_with_menu_reveal(self, page, target):
-        """Helper to navigate using the menu reveal pattern"""
-        try:
-            # Use the working pattern from other tests
-            await asyncio.sleep(1)
-            logo = page.locator("svg.viewz-logo")
-            if await logo.count() > 0:
-                box = await logo.bounding_box()
-                if box:
-                    await page.mouse.move(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
-                    await asyncio.sleep(0.5)
-            
-            # Click pin button if visible
-            pin_button = page.locator("button:has(svg.lucide-pin)")
-            if await pin_button.is_visible():
-                await pin_button.click()
-                await asyncio.sleep(0.5)
-            
-            # Navigate to target
-            await page.click(f"text={target}")
-            await asyncio.sleep(1)
-            
-        except Exception as e:
-            print(f"⚠️ Navigation warning: {str(e)}")
+    async def _navigate_to(self, page, target):
+        """Helper to open a page by its deep link - these tests snapshot pages, not the menu"""
+        if not await goto_route(page, NAV_ROUTES[target]):
+            print(f"⚠️ Navigation warning: {target} did not load")
 
     def _normalize_dom_content(self, content):
         """Normalize DOM content for stable comparison"""
@@ -0,0 +1,40 @@
+"""
+Asset Cache Tests
+Offline checks that the build hash follows the app shell's bundles
+"""
+
+import pytest
+
+from utils.asset_cache import AssetCache
+
+
+SHELL = """<!doctype html>
+<html>
+  <head>
+    <title>Viewz</title>
+    <script type="module" crossorigin src="/assets/index-3f2a91.js"></script>
+    <link rel="stylesheet" href="/assets/index-8c1d07.css">
+  </head>
+  <body><div id="root"></div></body>
+</html>"""
+
+
+@pytest.mark.unit
+class TestAssetCache:
+
+    def test_build_hash_changes_with_the_bundles(self):
+        build = AssetCache.compute_build_hash(SHELL)
+        assert build != AssetCache.compute_build_hash(SHELL.replace("index-3f2a91.js", "index-77b0e4.js"))
+        assert build != AssetCache.compute_build_hash(SHELL.replace("index-8c1d07.css", "index-0a9f12.css"))
+        assert build != AssetCache.compute_build_hash(
+            SHELL.replace("</head>", '<script src="/assets/vendor-51c2aa.js"></script></head>'))
+
+    def test_build_hash_ignores_unrelated_markup(self):
+        build = AssetCache.compute_build_hash(SHELL)
+        # Title, other attributes and the order of the bundle tags do not matter
+        assert build == AssetCache.compute_build_hash(SHELL.replace("<title>Viewz</title>", "<title>Viewz (stage)</title>"))
+        assert build == AssetCache.compute_build_hash(SHELL.replace('<div id="root">', '<div id="root" data-v="2">'))
+        reordered = SHELL.replace('    <link rel="stylesheet" href="/assets/index-8c1d07.css">\n', "").replace(
+            "<title>", '<link rel="stylesheet" href="/assets/index-8c1d07.css"><title>')
+        assert build == AssetCache.compute_build_hash(reordered)
+        assert len(build) == 12
@@ -0,0 +1,61 @@
+"""
+Auth State Cache Tests
+Offline checks for JWT expiry handling and cache persistence
+"""
+
+import json
+import time
+import base64
+import pytest
+
+from utils.auth_state_cache import AuthStateCache
+
+
+def make_jwt(exp):
+    """Build an unsigned JWT carrying only an exp claim"""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+    return f"{encode({'alg': 'none'})}.{encode({'exp': exp})}.signature"
+
+
+def make_state(exp):
+    return {
+        "origin": "https://app.stage.viewz.co",
+        "url": "https://app.stage.viewz.co/home",
+        "storage_state": {"cookies": [], "origins": []},
+        "session_storage": {"jwtToken": make_jwt(exp), "appSessionId": "app-1", "tabId": "tab-1"},
+        "saved_at": "2026-01-01T00:00:00",
+    }
+
+
+@pytest.mark.unit
+class TestAuthStateCache:
+
+    def test_decode_jwt_expiry(self):
+        assert AuthStateCache.decode_jwt_expiry(make_jwt(1893456000)) == 1893456000
+        assert AuthStateCache.decode_jwt_expiry("not-a-jwt") is None
+        assert AuthStateCache.decode_jwt_expiry(None) is None
+
+    def test_state_near_expiry_is_invalid(self, tmp_path):
+        cache = AuthStateCache(cache_dir=str(tmp_path), expiry_margin=120)
+        assert cache.is_valid(make_state(time.time() + 3600))
+        assert not cache.is_valid(make_state(time.time() + 60))
+
+    def test_state_missing_session_key_is_invalid(self, tmp_path):
+        cache = AuthStateCache(cache_dir=str(tmp_path))
+        state = make_state(time.time() + 3600)
+        del state["session_storage"]["tabId"]
+        assert not cache.is_valid(state)
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        cache = AuthStateCache(cache_dir=str(tmp_path))
+        state = make_state(time.time() + 3600)
+        cache.save("stage", state)
+        assert cache.load("stage") == state
+        assert cache.load("production") is None
+
+    def test_expired_state_is_dropped_on_load(self, tmp_path):
+        cache = AuthStateCache(cache_dir=str(tmp_path))
+        cache.save("stage", make_state(time.time() - 10))
+        assert cache.load("stage") is None
+        assert not (tmp_path / "stage_auth_state.json").exists()
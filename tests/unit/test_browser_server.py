@@ -0,0 +1,63 @@
+"""
+Browser Server Tests
+Offline checks of the endpoint handshake and the environment handed to subprocesses
+"""
+
+import os
+import sys
+
+import pytest
+
+from utils.browser_server import BROWSER_STATS_ENV, BROWSER_WS_ENV, BrowserServer, driver_paths, parse_endpoint
+
+
+ENDPOINT = "ws://127.0.0.1:40123/6f1c2b9e"
+
+# Stands in for the Node launcher: prints the endpoint, then serves until stdin closes
+FAKE_SERVER = f"import sys; print({ENDPOINT!r}, flush=True); sys.stdin.read()"
+
+
+class FakeServer(BrowserServer):
+
+    def __init__(self, script, **kwargs):
+        super().__init__(**kwargs)
+        self.script = script
+
+    def command(self):
+        return [sys.executable, "-c", self.script]
+
+
+@pytest.mark.unit
+class TestBrowserServer:
+
+    def test_endpoint_parsing(self):
+        assert parse_endpoint(f"{ENDPOINT}\n") == ENDPOINT
+        assert parse_endpoint("wss://browsers.local/abc") == "wss://browsers.local/abc"
+        assert parse_endpoint("Error: Executable doesn't exist") is None
+        assert parse_endpoint("") is None
+
+    def test_start_hands_the_endpoint_to_subprocesses_and_stop_cleans_up(self, tmp_path):
+        stats = tmp_path / "stats.jsonl"
+        stats.write_text('{"pid": 1, "worker": "main", "connect_seconds": 0.1}\n')  # left by an earlier run
+        server = FakeServer(FAKE_SERVER, stats_path=str(stats))
+
+        assert server.start(timeout=10) == ENDPOINT
+        assert not stats.exists() and server.connections() == []
+        env = server.apply_env({"PATH": "/usr/bin"})
+        assert env[BROWSER_WS_ENV] == ENDPOINT
+        assert env[BROWSER_STATS_ENV] == os.path.abspath(str(stats))
+
+        process = server._process
+        server.stop()
+        assert process.poll() is not None
+
+    def test_no_endpoint_leaves_the_environment_alone(self, tmp_path):
+        server = FakeServer("print('Error: browser not installed', flush=True)", stats_path=str(tmp_path / "s.jsonl"))
+        assert server.start(timeout=10) is None
+        assert server.apply_env({"PATH": "/usr/bin"}) == {"PATH": "/usr/bin"}
+
+    def test_driver_is_found_without_private_imports(self, monkeypatch):
+        node, package = driver_paths()
+        assert os.path.isdir(package) and os.path.basename(os.path.dirname(package)) == "driver"
+        monkeypatch.setenv("PLAYWRIGHT_NODEJS_PATH", "/opt/node/bin/node")
+        assert driver_paths() == ("/opt/node/bin/node", package)
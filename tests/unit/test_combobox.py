@@ -0,0 +1,147 @@
+"""
+Combobox Driver Tests
+Offline checks for option matching, type-ahead and closing of the shared dropdown driver
+"""
+
+import asyncio
+
+import pytest
+
+from utils.combobox import Combobox
+
+
+class FakeKeyboard:
+
+    def __init__(self, page):
+        self.page = page
+
+    async def type(self, text):
+        self.page.typed += text
+
+    async def press(self, key):
+        self.page.keys.append(key)
+        if key == "Escape":
+            self.page.open = False
+
+
+class FakeLocator:
+
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    def filter(self, visible=None):
+        return self
+
+    def nth(self, index):
+        return self
+
+    async def count(self):
+        if "role='listbox'" in self.selector:
+            return 1 if self.page.open else 0
+        return 1 if self.selector in self.page.triggers else 0
+
+    async def click(self, force=False):
+        if self.page.overlay and not force and self.selector in self.page.triggers:
+            raise TimeoutError("<div data-overlay> intercepts pointer events")
+        if self.selector.startswith("[data-combobox-pick="):
+            self.page.picked = self.page.tagged
+            self.page.open = self.page.sticky
+        else:
+            self.page.open = True
+
+    async def wait_for(self, state="visible", timeout=30000):
+        if (state == "hidden") == self.page.open:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError(f"listbox not {state}")
+
+
+class FakePage:
+    """A dropdown whose list renders at most `rendered` options, filtered by what was typed"""
+
+    def __init__(self, options, triggers=("text=Select country",), rendered=50, searchable=False, sticky=False,
+                 overlay=False):
+        self.options = options
+        self.overlay = overlay
+        self.triggers = set(triggers)
+        self.rendered = rendered
+        self.searchable = searchable
+        self.sticky = sticky
+        self.open = False
+        self.typed = ""
+        self.keys = []
+        self.tagged = None
+        self.picked = None
+        self.keyboard = FakeKeyboard(self)
+
+    def on(self, event, handler):
+        pass
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    async def evaluate(self, script, args):
+        if "quietMs" in args:
+            return True
+        visible = [o for o in self.options if self.typed.lower() in o.lower()][:self.rendered]
+        labels = [o.lower() for o in visible]
+        match = -1
+        if args["text"] is not None:
+            wanted = args["text"].lower()
+            match = labels.index(wanted) if wanted in labels else -1
+            if match < 0 and not args["exact"]:
+                match = next((i for i, label in enumerate(labels) if wanted in label), -1)
+        elif args["index"] < len(visible):
+            match = args["index"]
+        self.tagged = visible[match] if match >= 0 else None
+        return {"count": len(visible), "label": self.tagged, "searchable": self.searchable}
+
+
+COUNTRIES = [f"Country {n:03d}" for n in range(500)] + ["United States", "United Kingdom"]
+
+
+@pytest.mark.unit
+class TestCombobox:
+
+    def test_exact_label_wins_over_substring(self):
+        page = FakePage(["Net 30 days", "Net 30", "Net 60"])
+        label = asyncio.run(Combobox(page).select(["text=Select country"], text="Net 30"))
+        assert label == page.picked == "Net 30"
+        assert page.keys == []
+
+    def test_option_by_index(self):
+        page = FakePage(["Net 15", "Net 30", "Net 60"])
+        assert asyncio.run(Combobox(page).select(["text=Select country"], index=2)) == "Net 60"
+
+    def test_unrendered_option_is_typed_ahead_in_searchable_lists(self):
+        page = FakePage(COUNTRIES, searchable=True)
+        label = asyncio.run(Combobox(page).select(["text=Select country"], text="United Kingdom"))
+        assert label == "United Kingdom"
+        assert page.typed == "United Kingdom"
+
+    def test_search_falls_back_to_the_first_filtered_option(self):
+        page = FakePage(COUNTRIES, searchable=True)
+        label = asyncio.run(Combobox(page).select(["text=Select country"], text="USA", search="Unite"))
+        assert label == "United States"
+
+    def test_escape_only_when_the_listbox_stays_open(self):
+        page = FakePage(["Company", "Individual"], sticky=True)
+        assert asyncio.run(Combobox(page).select(["text=Select country"], text="Individual")) == "Individual"
+        assert page.keys == ["Escape"]
+
+    def test_missing_option_closes_the_listbox(self):
+        page = FakePage(["Company", "Individual"], sticky=True)
+        assert asyncio.run(Combobox(page).select(["text=Select country"], text="Partnership")) is None
+        assert page.picked is None and not page.open
+
+    def test_missing_trigger(self):
+        page = FakePage(["Company"], triggers=())
+        assert asyncio.run(Combobox(page).select(["text=Select country"], text="Company")) is None
+        assert page.keys == [] and not page.open
+
+    def test_force_click_through_an_overlay(self):
+        page = FakePage(["Asset", "Liability"], overlay=True)
+        assert asyncio.run(Combobox(page).open(["text=Select country"])) is None
+        assert asyncio.run(Combobox(page).open(["text=Select country"], force=True)) == 0
+        assert page.open
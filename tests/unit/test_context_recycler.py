@@ -0,0 +1,129 @@
+"""
+Context Recycler Tests
+Offline checks for when a context is reused, reset or discarded
+"""
+
+import asyncio
+
+import pytest
+
+from utils.context_recycler import ContextRecycler
+
+
+class FakePage:
+
+    def __init__(self, context):
+        self.context = context
+        self.visited = []
+
+    async def goto(self, url):
+        self.visited.append(url)
+
+    async def evaluate(self, script):
+        self.context.storage_cleared += 1
+
+    async def close(self):
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+
+    def __init__(self):
+        self.pages = []
+        self.routes = []
+        self.cookies_cleared = 0
+        self.storage_cleared = 0
+        self.closed = False
+
+    async def route(self, url, handler):
+        self.routes.append(url)
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self):
+        self.cookies_cleared += 1
+
+    async def close(self):
+        self.closed = True
+
+
+async def create():
+    return FakeContext(), "tracker"
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.unit
+class TestContextRecycler:
+
+    def test_context_is_reset_and_reused(self):
+        async def scenario():
+            recycler = ContextRecycler("https://app.stage.viewz.co", max_reuses=5)
+            first = await recycler.acquire("key", create)
+            await first.context.new_page()  # popup opened by the test
+            await recycler.release(first)
+            second = await recycler.acquire("key", create)
+            return recycler, first, second
+
+        recycler, first, second = run(scenario())
+        assert second.context is first.context
+        assert second.extra == "tracker"
+        assert second.context.pages == [second.page]
+        assert second.page.visited == ["https://app.stage.viewz.co/__context_reset__", "about:blank"]
+        assert (second.context.cookies_cleared, second.context.storage_cleared) == (1, 1)
+        assert (recycler.created, recycler.reused) == (1, 1)
+
+    def test_failed_test_discards_context(self):
+        async def scenario():
+            recycler = ContextRecycler("https://app.viewz.co", max_reuses=5)
+            first = await recycler.acquire("key", create)
+            await recycler.release(first, failed=True)
+            second = await recycler.acquire("key", create)
+            return recycler, first, second
+
+        recycler, first, second = run(scenario())
+        assert first.context.closed
+        assert second.context is not first.context
+        assert recycler.discarded["failure"] == 1
+
+    def test_context_is_discarded_after_max_reuses(self):
+        async def scenario():
+            recycler = ContextRecycler("https://app.viewz.co", max_reuses=2)
+            contexts = []
+            for _ in range(4):
+                pooled = await recycler.acquire("key", create)
+                contexts.append(pooled.context)
+                await recycler.release(pooled)
+            return recycler, contexts
+
+        recycler, contexts = run(scenario())
+        assert contexts[0] is contexts[1] is contexts[2]
+        assert contexts[3] is not contexts[0]
+        assert recycler.discarded["limit"] == 1
+
+    def test_contexts_are_only_shared_within_a_key(self):
+        async def scenario():
+            recycler = ContextRecycler("https://app.viewz.co", max_reuses=5)
+            lean = await recycler.acquire(("lean", False), create)
+            await recycler.release(lean)
+            full = await recycler.acquire(("full", False), create)
+            return lean, full
+
+        lean, full = run(scenario())
+        assert lean.context is not full.context
+
+    def test_unreusable_context_is_discarded(self):
+        async def scenario():
+            recycler = ContextRecycler("https://app.viewz.co", max_reuses=5, is_reusable=lambda pooled: False)
+            pooled = await recycler.acquire("key", create)
+            await recycler.release(pooled)
+            return recycler, pooled
+
+        recycler, pooled = run(scenario())
+        assert pooled.context.closed
+        assert recycler.discarded["stale"] == 1
@@ -0,0 +1,165 @@
+"""
+Deadline Tests
+Offline checks that waits shrink to the remaining budget and the time is reported
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from utils import deadline as test_deadline
+from utils.deadline import EXHAUSTED_TIMEOUT_MS, DeadlineExceeded, DefaultTimeout, budget_timeout
+from utils.wait_engine import WaitEngine
+
+
+class FakeLocator:
+
+    def __init__(self):
+        self.first = self
+
+    async def wait_for(self, state="visible", timeout=30000):
+        # The element never shows up - the wait always runs into its timeout
+        await asyncio.sleep(timeout / 1000)
+        raise TimeoutError(f"not {state} after {timeout}ms")
+
+
+class FakePage:
+
+    def __init__(self):
+        self.default_timeout = 30000
+
+    def on(self, event, handler):
+        pass
+
+    def set_default_timeout(self, timeout):
+        self.default_timeout = timeout
+
+    def locator(self, selector):
+        return FakeLocator()
+
+
+class FakeButton:
+    """Plain locator action: like Playwright it reads the page's default timeout when it starts"""
+
+    def __init__(self, page):
+        self.page = page
+
+    async def click(self):
+        timeout = self.page.default_timeout
+        await asyncio.sleep(timeout / 1000)
+        raise TimeoutError(f"click not done after {timeout}ms")
+
+
+class CustomerPage:
+    """Page object walking a chain of fallbacks that never match"""
+
+    def __init__(self, page):
+        self.waits = WaitEngine(page)
+
+    async def open_customer_dialog(self, fallbacks):
+        for selector in fallbacks:
+            if await self.waits.element_visible(selector, timeout=2000):
+                return True
+        return False
+
+
+@pytest.fixture
+def budget():
+    def start(seconds):
+        token = test_deadline.start(seconds, "tests/e2e/test_flow.py::test_flow")
+        tokens.append(token)
+        return test_deadline.current()
+
+    tokens = []
+    yield start
+    for token in reversed(tokens):
+        test_deadline.finish(token)
+
+
+@pytest.mark.unit
+class TestDeadline:
+
+    def test_no_budget_leaves_timeouts_alone(self):
+        assert test_deadline.current() is None
+        assert budget_timeout(5000) == 5000
+        test_deadline.check("anything")
+
+    def test_timeouts_shrink_to_the_remaining_budget(self, budget):
+        deadline = budget(10)
+        assert budget_timeout(5000) == 5000
+
+        deadline.start -= 8
+        assert 1900 < budget_timeout(5000) <= 2000
+        # Playwright's "no timeout" would outlive the budget as well
+        assert budget_timeout(0) <= 2000
+
+        deadline.start -= 2
+        assert budget_timeout(5000) == EXHAUSTED_TIMEOUT_MS
+        assert deadline.exhausted
+
+    def test_fallbacks_fail_fast_once_the_budget_is_spent(self, budget):
+        deadline = budget(0.3)
+        page = CustomerPage(FakePage())
+        fallbacks = [f"button:has-text('Add {n}')" for n in range(10)]
+
+        start = time.monotonic()
+        assert not asyncio.run(page.open_customer_dialog(fallbacks))
+        # 10 x 2s without a budget; the first fallback eats the budget, the rest get 1ms each
+        assert time.monotonic() - start < 1
+        waits, _, cut_short = deadline.spent["CustomerPage.open_customer_dialog"]
+        assert waits == 10 and cut_short == 10
+
+    def test_check_reports_where_the_time_went(self, budget):
+        deadline = budget(0.1)
+        test_deadline.charge(0.08, "InvoicingPage.create_customer")
+        test_deadline.charge(0.02, "InvoicingPage._click_save")
+        deadline.phases["setup"] = 0.03
+        deadline.start -= 1
+
+        with pytest.raises(DeadlineExceeded) as failure:
+            test_deadline.check("STEP 3")
+        message = str(failure.value)
+        assert "exceeded before STEP 3" in message
+        assert "setup 0.0s" in message
+        assert message.index("InvoicingPage.create_customer") < message.index("InvoicingPage._click_save")
+
+    def test_budget_is_scoped_to_one_test(self, budget):
+        outer = budget(60)
+        token = test_deadline.start(5, "other")
+        assert test_deadline.current().nodeid == "other"
+        test_deadline.finish(token)
+        assert test_deadline.current() is outer
+
+    def test_plain_actions_are_cut_short_as_the_budget_drains(self, budget):
+        budget(0.5)
+        page = FakePage()
+
+        async def flow():
+            default_timeout = DefaultTimeout(page, 30000, interval=0.05).start()
+            try:
+                assert 400 < page.default_timeout <= 500
+                # Half the budget goes elsewhere before the plain click starts
+                await asyncio.sleep(0.25)
+                start = time.monotonic()
+                with pytest.raises(TimeoutError):
+                    await FakeButton(page).click()
+                # Set once, the click would have waited the 0.5s the test had at the start
+                assert time.monotonic() - start < 0.35
+                with pytest.raises(TimeoutError):
+                    await FakeButton(page).click()
+                assert page.default_timeout == EXHAUSTED_TIMEOUT_MS
+            finally:
+                await default_timeout.stop()
+
+        asyncio.run(flow())
+
+    def test_default_timeout_is_left_alone_without_a_budget(self):
+        page = FakePage()
+
+        async def flow():
+            default_timeout = DefaultTimeout(page, 30000).start()
+            await default_timeout.stop()
+
+        asyncio.run(flow())
+        assert page.default_timeout == 30000
@@ -0,0 +1,95 @@
+"""
+Entity Matrix Tests
+Offline checks that entities are switched by URL on one page and only entity state is dropped
+"""
+
+import asyncio
+
+import pytest
+
+from utils.entity_matrix import Entity, EntityMatrixStats, parse_entities
+from utils.login_pool import SharedLoggedInPage
+from utils.selector_resolver import selector_resolver
+
+
+class FakePage:
+
+    def __init__(self, url):
+        self.url = url
+        self.visited = []
+
+    def on(self, event, handler):
+        pass
+
+    async def goto(self, url, timeout=30000):
+        self.visited.append(url)
+        self.url = url
+
+    async def evaluate(self, script, arg=None):
+        return True
+
+
+class FakeContext:
+
+    def __init__(self, page):
+        self.pages = [page]
+
+
+class FakePool:
+
+    async def verify(self, page):
+        return True
+
+
+@pytest.mark.unit
+class TestEntityMatrix:
+
+    def test_parse_entities(self):
+        entities = parse_entities("Viewz Demo INC=1, 7 ,Other Co,")
+        assert [(e.name, e.entity_id) for e in entities] == [
+            ("Viewz Demo INC", "1"), (None, "7"), ("Other Co", None)
+        ]
+        assert [e.label for e in entities] == ["Viewz Demo INC", "entity-7", "Other Co"]
+        assert parse_entities(None) == [] and parse_entities(("3",))[0].entity_id == "3"
+
+    def test_switches_by_url_on_the_same_page(self):
+        stats = EntityMatrixStats()
+        page = FakePage("https://app.viewz.co/home?tab=kpi&entityId=1")
+        switcher = stats.switcher(page)
+        assert stats.switcher(page) is switcher
+
+        assert asyncio.run(switcher.switch(Entity(entity_id=7)))
+        assert page.visited == ["https://app.viewz.co/home?tab=kpi&entityId=7"]
+        # Same entity again - nothing to do
+        assert asyncio.run(switcher.switch(switcher.current))
+        assert len(page.visited) == 1
+        assert len(stats.switches["url"]) == 1
+        assert "1 via url" in stats.summary()
+
+    def test_switch_forgets_only_the_entity_selector_winner(self, monkeypatch):
+        monkeypatch.setattr(selector_resolver, "_stats", {"production": {
+            "EntitySelectorPage.entity_selectors": {"winner": 'button:has-text("Viewz Demo INC")', "selectors": {}},
+            "InvoicingPage.nav_selectors": {"winner": "text=Invoicing", "selectors": {}},
+        }})
+        page = FakePage("https://app.viewz.co/home?entityId=1")
+        assert asyncio.run(EntityMatrixStats().switcher(page).switch(Entity("Other Co", 2)))
+
+        stats = selector_resolver.stats["production"]
+        assert stats["EntitySelectorPage.entity_selectors"]["winner"] is None
+        assert stats["InvoicingPage.nav_selectors"]["winner"] == "text=Invoicing"
+
+    def test_shared_page_resets_onto_the_entity(self):
+        page = FakePage("about:blank")
+        shared = SharedLoggedInPage(FakePool())
+        shared.page, shared.context = page, FakeContext(page)
+        shared.landing_url = "https://app.viewz.co/home?entityId=1"
+
+        asyncio.run(shared.reset(entity_id="7"))
+        asyncio.run(shared.reset())
+        assert page.visited == ["https://app.viewz.co/home?entityId=7", "https://app.viewz.co/home?entityId=1"]
+
+        # The page already shows the entity - counted as a landing, no navigation
+        stats = EntityMatrixStats()
+        asyncio.run(shared.reset(entity_id="7"))
+        assert asyncio.run(stats.switcher(page).switch(Entity(entity_id="7")))
+        assert len(page.visited) == 3 and stats.switches["landing"] == [0.0]
@@ -0,0 +1,95 @@
+"""
+Export Capture Tests
+Offline checks that exports are captured in memory, read from disk past the threshold and kept on request
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from utils.export_capture import capture_export
+from utils.export_reader import read_export
+
+
+EXPORT_CSV = b"Date,Description,Amount\r\n01/15/2025,Payment,-150.00\r\n"
+
+
+class FakeDownload:
+    def __init__(self, path, filename="bank_transactions.csv"):
+        self._path = path
+        self.suggested_filename = filename
+        self.deleted = False
+
+    async def path(self):
+        return self._path
+
+    async def delete(self):
+        os.remove(self._path)
+        self.deleted = True
+
+
+class FakeDownloadInfo:
+    def __init__(self, page):
+        self.page = page
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    def value(self):
+        async def download():
+            return self.page.download
+        return download()
+
+
+class FakePage:
+    """Clicking Export leaves `download` behind"""
+
+    def __init__(self, download):
+        self.download = download
+        self.clicks = 0
+
+    def expect_download(self, timeout=30000):
+        return FakeDownloadInfo(self)
+
+    async def click(self):
+        self.clicks += 1
+
+
+@pytest.mark.unit
+class TestExportCapture:
+
+    def test_download_is_read_once_into_memory(self, tmp_path):
+        playwright_copy = tmp_path / "playwright-artifact"
+        playwright_copy.write_bytes(EXPORT_CSV)
+        page = FakePage(FakeDownload(str(playwright_copy)))
+
+        export = asyncio.run(capture_export(page, page.click))
+        assert export.in_memory and page.clicks == 1
+        assert not playwright_copy.exists()
+        assert read_export(export.source()) == (["Date", "Description", "Amount"],
+                                                [["01/15/2025", "Payment", "-150.00"]])
+
+    def test_large_download_stays_on_disk_until_closed(self, tmp_path):
+        playwright_copy = tmp_path / "playwright-artifact"
+        playwright_copy.write_bytes(EXPORT_CSV)
+        download = FakeDownload(str(playwright_copy))
+        page = FakePage(download)
+
+        export = asyncio.run(capture_export(page, page.click, spill_threshold=10))
+        assert not export.in_memory and export.path == str(playwright_copy)
+        assert read_export(export.source())[1] == [["01/15/2025", "Payment", "-150.00"]]
+
+        kept = export.keep(str(tmp_path / "artifacts"), "test_bank[stage]")
+        assert os.path.basename(kept) == "test_bank_stage__bank_transactions.csv"
+        with open(kept, "rb") as f:
+            assert f.read() == EXPORT_CSV
+        assert playwright_copy.exists()
+        # Playwright's copy goes with the test, not with the (possibly recycled) context
+        asyncio.run(export.close())
+        assert download.deleted and not playwright_copy.exists() and os.path.exists(kept)
+        asyncio.run(export.close())
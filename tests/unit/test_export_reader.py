@@ -0,0 +1,59 @@
+"""
+Export Reader Tests
+Offline checks of header detection and row streaming for CSV and Excel exports
+"""
+
+import io
+
+import pytest
+
+from utils.export_reader import ExportReader, read_export
+
+
+BANK_EXPORT = (
+    "\ufeffExport Date: 2025-06-01,,\r\n"
+    ",,\r\n"
+    "Date,Description,Amount\r\n"
+    "01/15/2025,\"Payment, vendor 1\",-150.00\r\n"
+    ",,\r\n"
+    "01/16/2025,\"Two\nlines\",20.00\r\n"
+)
+
+
+@pytest.mark.unit
+class TestExportReader:
+
+    def test_metadata_rows_are_skipped_and_rows_stream(self, tmp_path):
+        path = tmp_path / "export.csv"
+        path.write_text(BANK_EXPORT, encoding="utf-8")
+
+        reader = ExportReader(str(path))
+        headers, rows = reader.open()
+        assert headers == ["Date", "Description", "Amount"]
+        assert reader.header_index == 2
+        assert next(rows) == ["01/15/2025", "Payment, vendor 1", "-150.00"]
+        assert reader.rows_read == 1  # the rest is not read yet
+        assert list(rows) == [["01/16/2025", "Two\nlines", "20.00"]]
+        assert reader.blank_rows == 1 and reader.format == "csv"
+
+    def test_first_row_is_the_header_when_none_is_recognised(self):
+        stream = io.BytesIO(b"Invoice No,Vendor\n1001,Acme\n1002,Globex\n")
+        assert read_export(stream) == (["Invoice No", "Vendor"], [["1001", "Acme"], ["1002", "Globex"]])
+        assert not stream.closed  # a caller's stream is left open
+        assert read_export(io.BytesIO(b"")) == ([], [])
+
+    def test_excel_is_read_in_read_only_mode(self, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        for row in (["Export Date: 2025-06-01"], [], ["Status", "Supplier", "Amount"],
+                    ["Open", "Acme", 12.5], [None, None, None], ["Paid", None, 3]):
+            sheet.append(row)
+        path = tmp_path / "export.xlsx"
+        workbook.save(path)
+
+        reader = ExportReader(str(path))
+        headers, rows = reader.open()
+        assert headers == ["Status", "Supplier", "Amount"]
+        assert list(rows) == [["Open", "Acme", "12.5"], ["Paid", "", "3"]]
+        assert reader.format == "xlsx"
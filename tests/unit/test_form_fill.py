@@ -0,0 +1,113 @@
+"""
+Form Fill Tests
+Offline checks that text fields are batched into one call and misses fall back per field
+"""
+
+import asyncio
+
+import pytest
+
+from utils.form_fill import Field, FormFiller
+
+
+class FakeLocator:
+
+    def __init__(self, page, placeholder):
+        self.page = page
+        self.placeholder = placeholder
+        self.first = self
+
+    def filter(self, visible=None):
+        return self
+
+    async def count(self):
+        return 1 if self.placeholder in self.page.late_inputs else 0
+
+    async def fill(self, value):
+        self.page.values[self.placeholder] = value
+
+
+class FakePage:
+    """Dialog whose `inputs` are reachable in-page; `late_inputs` only through Playwright"""
+
+    def __init__(self, inputs, late_inputs=()):
+        self.inputs = set(inputs)
+        self.late_inputs = set(late_inputs)
+        self.values = {}
+        self.batches = []
+
+    def on(self, event, handler):
+        pass
+
+    def get_by_placeholder(self, placeholder):
+        return FakeLocator(self, placeholder)
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    async def evaluate(self, script, fields):
+        self.batches.append([field["key"] for field in fields])
+        outcomes = []
+        for field in fields:
+            placeholder = next((p for p in field["placeholders"] if p in self.inputs), None)
+            if placeholder:
+                self.values[placeholder] = field["value"]
+            outcomes.append({"key": field["key"], "found": bool(placeholder), "ok": bool(placeholder),
+                             "how": f"placeholder '{placeholder}'", "ms": 0.1})
+        return outcomes
+
+
+CUSTOMER = [
+    Field('name', placeholder="Enter customer name"),
+    Field('email', placeholder="Enter email address"),
+    Field('city', placeholder="Enter city", default="Los Angeles"),
+    Field('zip', placeholder="Enter zip code"),
+]
+
+
+@pytest.mark.unit
+class TestFormFill:
+
+    def test_text_fields_are_filled_in_one_batch(self):
+        page = FakePage({"Enter customer name", "Enter email address", "Enter city", "Enter zip code"})
+        result = asyncio.run(FormFiller(page).fill("customer", CUSTOMER, {
+            'name': "Acme", 'email': "billing@acme.test", 'zip': 90210,
+        }))
+
+        assert page.batches == [['name', 'email', 'city', 'zip']]
+        assert page.values == {"Enter customer name": "Acme", "Enter email address": "billing@acme.test",
+                               "Enter city": "Los Angeles", "Enter zip code": "90210"}
+        assert result.filled == 4 and result.round_trips == 1
+        assert all("ms" in field for field in result.fields.values())
+
+    def test_fields_without_value_are_skipped(self):
+        page = FakePage({"Enter customer name", "Enter email address", "Enter city", "Enter zip code"})
+        result = asyncio.run(FormFiller(page).fill("customer", CUSTOMER, {'name': "Acme"}))
+        assert page.batches == [['name', 'city']]
+        assert set(result.fields) == {'name', 'city'}
+
+    def test_misses_fall_back_to_a_playwright_fill(self):
+        page = FakePage({"Enter customer name"}, late_inputs={"Enter email address"})
+        result = asyncio.run(FormFiller(page).fill("customer", CUSTOMER[:3], {
+            'name': "Acme", 'email': "billing@acme.test",
+        }))
+
+        assert page.values["Enter email address"] == "billing@acme.test"
+        assert result.fields['email']['how'].startswith("fallback")
+        assert result.missing == ['city']
+
+    def test_spec_order_is_kept_around_special_fields(self):
+        page = FakePage({"Enter customer name", "Enter email address", "Enter city"})
+        steps = []
+
+        async def pick_gl_account(value):
+            steps.append(("gl", list(page.values)))
+            return "Trade Receivables"
+
+        spec = [CUSTOMER[0], Field('gl_account', Field.CUSTOM, action=pick_gl_account), CUSTOMER[1]]
+        result = asyncio.run(FormFiller(page).fill("customer", spec, {'name': "Acme", 'email': "a@acme.test"}))
+
+        assert page.batches == [['name'], ['email']]
+        assert steps == [("gl", ["Enter customer name"])]
+        assert result.fields["gl_account"]["value"] == "Trade Receivables"
+        assert list(result.fields) == ['name', 'gl_account', 'email']
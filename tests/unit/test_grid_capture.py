@@ -0,0 +1,184 @@
+"""
+Grid Capture Tests
+Offline checks of assembling a grid's dataset from list API responses
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from utils.grid_capture import GRID_COLUMNS, GridCapture, agrees_with_grid, extract_rows, project_records, with_page_size
+from utils.reconciliation import SCHEMAS
+
+
+BANK_API = "https://app.viewz.co/api/v2/banks/getBankTransactionsData"
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="xhr", method="GET", post_data=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.post_data = post_data
+
+    async def all_headers(self):
+        return {"authorization": "Bearer token", "content-length": "0"}
+
+
+class FakeResponse:
+    def __init__(self, url, payload, resource_type="xhr"):
+        self.url = url
+        self.request = FakeRequest(url, resource_type)
+        self.payload = payload
+
+    async def json(self):
+        return self.payload
+
+
+class FakeAPIRequest:
+    """page.request - answers with every transaction in one page"""
+
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.fetched = []
+
+    async def fetch(self, url, method="GET", headers=None, data=None, timeout=None):
+        self.fetched.append((url, headers))
+        return FakeResponse(url, {"data": self.transactions, "total": len(self.transactions)})
+
+
+class FakePage:
+    def __init__(self, transactions=()):
+        self.listeners = []
+        self.request = FakeAPIRequest(list(transactions))
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def remove_listener(self, event, handler):
+        self.listeners.remove(handler)
+
+    def emit(self, response):
+        for handler in list(self.listeners):
+            handler(response)
+
+
+def transactions(start, stop):
+    return [{"id": i, "date": f"2025-01-{i:02d}", "description": {"text": f"Payment {i}"}, "amount": i * 10}
+            for i in range(start, stop)]
+
+
+@pytest.mark.unit
+class TestGridCapture:
+
+    def test_pages_add_up_to_one_dataset_streamed_once(self):
+        async def scenario():
+            page = FakePage()
+            capture = GridCapture(page, "BankPage").start()
+            # Default date range first, then the filtered query paged by the grid
+            page.emit(FakeResponse(f"{BANK_API}?from=2025-06-01&page=1&limit=2", {"data": transactions(30, 31), "total": 1}))
+            page.emit(FakeResponse(f"{BANK_API}?from=2020-01-01&page=1&limit=2", {"data": transactions(1, 3), "total": 5}))
+            page.emit(FakeResponse(f"{BANK_API}?from=2020-01-01&page=2&limit=2", {"data": transactions(2, 5), "total": 5}))
+            page.emit(FakeResponse("https://app.viewz.co/api/v2/users/me", {"data": [{"id": 99}]}))
+            page.emit(FakeResponse(f"{BANK_API}.js", {"data": [{"id": 98}]}, resource_type="script"))
+
+            streamed = []
+            async for record in capture.rows(quiet=0.05, first_timeout=0.5):
+                streamed.append(record["id"])
+                if len(streamed) == 3:
+                    # The grid's next page arrives while the stream is being read
+                    page.emit(FakeResponse(f"{BANK_API}?from=2020-01-01&page=3&limit=2",
+                                           {"data": transactions(5, 6), "total": 5}))
+            capture.stop()
+            return capture, streamed, page
+
+        capture, streamed, page = asyncio.run(scenario())
+        assert streamed == [1, 2, 3, 4, 5]
+        assert capture.responses == 4 and capture.total == 5
+        assert not page.listeners
+
+    def test_fetch_remaining_asks_for_the_whole_dataset_once(self):
+        async def scenario():
+            page = FakePage(transactions(1, 8))
+            async with GridCapture(page, "BankPage") as capture:
+                page.emit(FakeResponse(f"{BANK_API}?from=2020-01-01&page=1&limit=2", {"data": transactions(1, 3), "total": 7}))
+                complete = await capture.fetch_remaining()
+                records = await capture.records(quiet=0.05)
+            return complete, records, page
+
+        complete, records, page = asyncio.run(scenario())
+        assert complete
+        assert [record["id"] for record in records] == list(range(1, 8))
+        url, headers = page.request.fetched[0]
+        assert "limit=7" in url and "page=1" in url
+        assert headers == {"authorization": "Bearer token"}
+
+    def test_stream_ends_after_quiet_once_responses_arrived(self):
+        async def scenario():
+            page = FakePage()
+            capture = GridCapture(page, "BankPage").start()
+            # No total reported - the stream can only end by going quiet
+            page.emit(FakeResponse(f"{BANK_API}?page=1", {"data": transactions(1, 4)}))
+            start = time.monotonic()
+            records = await capture.records(quiet=0.05, first_timeout=5)
+            waited = time.monotonic() - start
+            capture.stop()
+            start = time.monotonic()
+            again = await capture.records(first_timeout=5)
+            return records, again, waited, time.monotonic() - start
+
+        records, again, waited, stopped_wait = asyncio.run(scenario())
+        assert len(records) == len(again) == 3
+        assert waited < 1 and stopped_wait < 0.1
+
+    def test_credit_cards_ignore_bank_transactions(self):
+        capture = GridCapture(FakePage(), "CreditCardPage")
+        assert not capture.matches(FakeResponse(BANK_API, {"data": []}))
+        assert capture.matches(FakeResponse("https://app.viewz.co/api/v2/creditCards/getCreditCardTransactions", {"data": []}))
+
+    def test_nothing_seen_leaves_the_fallback_to_the_caller(self):
+        async def scenario():
+            page = FakePage()
+            capture = GridCapture(page, "PayablesPage").start()
+            page.emit(FakeResponse("https://app.viewz.co/api/v2/docs/getEntityDocuments", {"error": "denied"}))
+            return capture, await capture.records(first_timeout=0.05)
+
+        capture, records = asyncio.run(scenario())
+        assert not capture.seen and records == []
+
+    def test_payload_shapes_and_projection_onto_export_columns(self):
+        assert extract_rows({"data": {"items": [{"id": 1}], "totalCount": 9}}) == ([{"id": 1}], 9)
+        assert extract_rows([{"id": 1}]) == ([{"id": 1}], None)
+        assert extract_rows({"success": True}) == (None, None)
+        assert with_page_size(BANK_API, json.dumps({"pageSize": 50, "page": 2}), 400) == \
+            (BANK_API, json.dumps({"pageSize": 400, "page": 2}))
+        assert with_page_size(f"{BANK_API}?from=2020-01-01", None, 400) is None
+
+        bank = SCHEMAS["bank"]
+        headers = ["Date", "Description", "Amount", "GL Account"]
+        assert project_records(transactions(1, 2), headers, required=bank.key_columns) is None
+        rows = project_records(transactions(1, 2), headers, {"description": "description.text"}, bank.key_columns)
+        assert rows == [["2025-01-01", "Payment 1", "10", ""]]
+        # An unmapped column is only trusted if the grid shows nothing there either
+        assert agrees_with_grid(rows, [["01/01/2025", "Payment 1", "$10.00", "Select GL Account"]], bank)
+        assert not agrees_with_grid(rows, [["01/01/2025", "Payment 1", "$10.00", "6000 Expenses"]], bank)
+        assert not agrees_with_grid(rows, [["01/02/2025", "Payment 2", "$20.00", ""]], bank)
+        assert not agrees_with_grid(rows, [], bank)
+        # No prefix guesses: "Desc" does not take description.text
+        assert project_records(transactions(1, 2), ["Date", "Desc", "Amount"], {}, bank.key_columns) is None
+
+    def test_payables_columns_come_from_the_explicit_map(self):
+        record = {"id": 7, "status": "RECORDED", "supplier": {"id": 55, "name": "Acme"},
+                  "documentNumber": "INV-1", "date": "2025-01-01", "total": 100}
+        headers = ["Status", "Uploaded", "Supplier", "ID", "Date", "Pre Tax", "Total"]
+        payables = SCHEMAS["payables"]
+
+        # Exact names alone leave the supplier unmapped - a key column, so the projection is refused
+        assert project_records([record], headers, required=payables.key_columns) is None
+        rows = project_records([record], headers, GRID_COLUMNS["PayablesPage"], payables.key_columns)
+        assert rows == [["RECORDED", "", "Acme", "INV-1", "2025-01-01", "", "100"]]
+        # The rendered grid shows a pre-tax amount the records lack
+        grid = [["Recorded", "01/02/2025", "Acme", "INV-1", "01/01/2025", "$90.00", "$100.00"]]
+        assert not agrees_with_grid(rows, grid, payables)
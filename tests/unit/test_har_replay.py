@@ -0,0 +1,52 @@
+"""
+HAR Replay Tests
+Offline checks for the local SPA shell server and archive naming
+"""
+
+import urllib.request
+
+import pytest
+
+from utils.har_replay import HarArchive, StaticShellServer, archive_name
+
+
+@pytest.fixture
+def shell_server(tmp_path):
+    (tmp_path / "index.html").write_text("<div id='root'></div>")
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-3f2a.js").write_text("console.log('app')")
+    server = StaticShellServer(str(tmp_path))
+    server.start()
+    yield server
+    server.stop()
+
+
+def fetch(url):
+    with urllib.request.urlopen(url) as response:
+        return response.headers.get_content_type(), response.read().decode()
+
+
+@pytest.mark.unit
+class TestHarReplay:
+
+    def test_shell_server_serves_recorded_assets(self, shell_server):
+        content_type, body = fetch(f"{shell_server.url}/assets/index-3f2a.js")
+        assert body == "console.log('app')"
+        assert "javascript" in content_type
+
+    def test_client_side_routes_get_the_spa_shell(self, shell_server):
+        content_type, body = fetch(f"{shell_server.url}/reconciliation/payables")
+        assert body == "<div id='root'></div>"
+        assert content_type == "text/html"
+
+    def test_archive_name_is_file_system_safe(self):
+        name = archive_name("tests/e2e/home/test_home_page.py::TestHome::test_kpis[stage-1]")
+        assert name == "tests_e2e_home_test_home_page.py_TestHome_test_kpis_stage-1"
+
+    def test_only_record_mode_adds_context_options(self, tmp_path):
+        recorder = HarArchive("record", "stage", "https://app.stage.viewz.co/login", root=str(tmp_path))
+        player = HarArchive("replay", "stage", "https://app.stage.viewz.co/login", root=str(tmp_path))
+
+        assert recorder.origin == "https://app.stage.viewz.co"
+        assert recorder.context_options("t")["record_har_path"].endswith("stage/t.har.zip")
+        assert player.context_options("t") == {}
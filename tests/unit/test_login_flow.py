@@ -0,0 +1,160 @@
+"""
+Login Flow Tests
+Offline checks that post-submit states are raced and transitions are timed
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from utils.login_flow import LoginError, LoginFlow, LoginState, race
+
+
+class FakeLocator:
+
+    def __init__(self, page, selectors):
+        self.page = page
+        self.selectors = set(selectors)
+        self.first = self
+        self.last = self
+
+    def or_(self, other):
+        return FakeLocator(self.page, self.selectors | other.selectors)
+
+    def filter(self, visible=None):
+        return self
+
+    async def count(self):
+        return len(self.selectors & self.page.visible)
+
+    async def wait_for(self, state="visible", timeout=30000):
+        deadline = time.monotonic() + timeout / 1000
+        while not self.selectors & self.page.visible:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{self.selectors} not visible")
+            await asyncio.sleep(0.01)
+
+    async def fill(self, value):
+        self.page.filled.append(value)
+        self.page.after_otp()
+
+
+class FakePage:
+    """Login page whose next state appears `delay` seconds after each submit"""
+
+    def __init__(self, after_submit, after_otp=(), delay=0.05):
+        self.url = "https://app.stage.viewz.co/login"
+        self.visible = {'input[name="username"]'}
+        self.filled = []
+        self.script = {"submit": after_submit, "otp": after_otp}
+        self.delay = delay
+
+    def _show_later(self, step):
+        def show():
+            self.visible = set(self.script[step])
+            if "home" in self.script[step]:
+                self.url = "https://app.stage.viewz.co/home"
+        asyncio.get_running_loop().call_later(self.delay, show)
+
+    async def goto(self, url):
+        pass
+
+    async def fill(self, selector, value):
+        pass
+
+    async def click(self, selector):
+        self._show_later("submit")
+
+    def after_otp(self):
+        self._show_later("otp")
+
+    def locator(self, selector):
+        return FakeLocator(self, {selector})
+
+    def get_by_role(self, role):
+        return FakeLocator(self, {role})
+
+    async def wait_for_url(self, pattern, timeout=30000):
+        deadline = time.monotonic() + timeout / 1000
+        while not self.url.endswith("/home"):
+            if time.monotonic() > deadline:
+                raise TimeoutError("not on /home")
+            await asyncio.sleep(0.01)
+
+    async def screenshot(self, path):
+        pass
+
+
+async def otp():
+    return "123456"
+
+
+def claiming(flow, claims):
+    """OTP source that notes the login state each code was claimed in"""
+    async def claim():
+        claims.append(flow.state)
+        return "123456"
+    return claim
+
+
+@pytest.mark.unit
+class TestLoginFlow:
+
+    def test_race_returns_first_successful_state(self):
+        async def slow():
+            await asyncio.sleep(1)
+
+        async def fast():
+            await asyncio.sleep(0.01)
+
+        async def failing():
+            raise TimeoutError()
+
+        start = time.monotonic()
+        winner = asyncio.run(race({"a": slow, "b": fast, "c": failing}, timeout=2000))
+        assert winner == "b"
+        assert time.monotonic() - start < 0.5
+
+    def test_race_gives_up_at_the_bound(self):
+        async def never():
+            await asyncio.sleep(10)
+
+        assert asyncio.run(race({"a": never}, timeout=50)) is None
+
+    def test_two_fa_then_otp_accepted(self):
+        page = FakePage(after_submit={"text=Two-Factor Authentication", "textbox"},
+                        after_otp={"text=SuccessOTP verified successfully"})
+        flow = LoginFlow(page)
+        claims = []
+
+        state = asyncio.run(flow.run("user", "pass", otp_source=claiming(flow, claims)))
+        assert state == LoginState.OTP_ACCEPTED
+        # Claimed once the 2FA prompt won the race, with the full validity left for typing it
+        assert claims == [LoginState.TWO_FA]
+        assert page.filled == ["123456"]
+        assert [target for _, target, _ in flow.transitions] == [
+            LoginState.SUBMITTED, LoginState.TWO_FA, LoginState.OTP_SUBMITTED, LoginState.OTP_ACCEPTED
+        ]
+        # Each race resolved as soon as its state appeared, not after a fixed timeout
+        assert all(seconds < 1 for _, _, seconds in flow.transitions)
+
+    def test_trusted_session_lands_on_home_without_otp(self):
+        page = FakePage(after_submit={"home"})
+        flow = LoginFlow(page)
+
+        claims = []
+
+        assert asyncio.run(flow.run("user", "pass", otp_source=claiming(flow, claims))) == LoginState.HOME
+        assert page.filled == []
+        assert claims == []  # no TOTP step used up
+
+    def test_error_banner_fails_fast(self):
+        page = FakePage(after_submit={'text=Invalid username or password'})
+        flow = LoginFlow(page)
+
+        start = time.monotonic()
+        with pytest.raises(LoginError):
+            asyncio.run(flow.run("user", "wrong", otp_source=otp))
+        assert time.monotonic() - start < 1
+        assert flow.state == LoginState.ERROR
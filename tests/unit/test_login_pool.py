@@ -0,0 +1,61 @@
+"""
+Login Pool Tests
+Offline checks for TOTP window staggering between workers
+"""
+
+import asyncio
+import pyotp
+import pytest
+
+from utils import login_pool
+from utils.login_pool import TotpLedger
+
+SECRET = "JBSWY3DPEHPK3PXP"
+
+
+class FakeClock:
+    """Deterministic clock; sleeping just advances it"""
+
+    def __init__(self, start):
+        self.now = start
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock(start=1_700_000_010.0)
+    monkeypatch.setattr(login_pool.time, "time", fake.time)
+    monkeypatch.setattr(login_pool.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+@pytest.mark.unit
+class TestTotpLedger:
+
+    def test_second_claim_waits_for_next_window(self, tmp_path, clock):
+        ledger = TotpLedger(ledger_dir=str(tmp_path))
+        totp = pyotp.TOTP(SECRET)
+
+        first = asyncio.run(ledger.claim_code(SECRET))
+        second = asyncio.run(ledger.claim_code(SECRET))
+
+        assert first == totp.at(1_700_000_010)
+        assert second == totp.at(1_700_000_010 + 30)
+        assert first != second
+
+    def test_code_close_to_expiry_is_skipped(self, tmp_path, clock):
+        ledger = TotpLedger(ledger_dir=str(tmp_path), min_remaining=5.0)
+        clock.now = 1_700_000_038.0  # 2s left in the current window
+
+        code = asyncio.run(ledger.claim_code(SECRET))
+
+        assert code == pyotp.TOTP(SECRET).at(1_700_000_040)
+
+    def test_ledger_never_stores_the_secret(self, tmp_path, clock):
+        asyncio.run(TotpLedger(ledger_dir=str(tmp_path)).claim_code(SECRET))
+        assert SECRET not in (tmp_path / "otp_ledger.json").read_text()
@@ -0,0 +1,56 @@
+"""
+Network Profile Tests
+Offline checks for which requests the lean profile intercepts and blocks
+"""
+
+import pytest
+
+from utils.network_profiles import NETWORK_PROFILES, ResourceSizeCatalog, get_network_profile
+
+LEAN = NETWORK_PROFILES["lean"]
+
+
+@pytest.mark.unit
+class TestNetworkProfiles:
+
+    @pytest.mark.parametrize("url", [
+        "https://app.stage.viewz.co/static/logo.png",
+        "https://app.stage.viewz.co/fonts/inter.woff2?v=3",
+        "https://www.google-analytics.com/g/collect?v=2",
+        "https://static.hotjar.com/c/hotjar-123.js",
+    ])
+    def test_lean_pattern_intercepts_blockable_urls(self, url):
+        assert LEAN.url_pattern.search(url)
+
+    @pytest.mark.parametrize("url", [
+        "https://app.stage.viewz.co/api/entities",
+        "https://app.stage.viewz.co/assets/index-3f2a.js",
+        "https://app.stage.viewz.co/icons/menu.svg",
+        "https://app.stage.viewz.co/reports/export.png.csv",
+    ])
+    def test_lean_pattern_leaves_first_party_app_traffic_alone(self, url):
+        assert not LEAN.url_pattern.search(url)
+
+    def test_block_reason_uses_resource_type_and_host(self):
+        assert LEAN.block_reason("image", "https://app.viewz.co/a.png") == "image"
+        assert LEAN.block_reason("script", "https://www.googletagmanager.com/gtm.js") == "third-party"
+        # A .png fetched by app code is data, not decoration
+        assert LEAN.block_reason("fetch", "https://app.viewz.co/a.png") is None
+
+    def test_full_profile_blocks_nothing(self):
+        assert not NETWORK_PROFILES["full"].is_blocking
+        assert NETWORK_PROFILES["full"].url_pattern is None
+
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError):
+            get_network_profile("turbo")
+
+    def test_size_catalog_merges_with_other_workers(self, tmp_path):
+        path = str(tmp_path / "sizes.json")
+        first, second = ResourceSizeCatalog(path), ResourceSizeCatalog(path)
+        first.record("https://a/1.png", 100)
+        second.record("https://a/2.png", 200)
+        first.save()
+        second.save()
+
+        assert ResourceSizeCatalog(path).sizes == {"https://a/1.png": 100, "https://a/2.png": 200}
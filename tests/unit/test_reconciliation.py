@@ -0,0 +1,69 @@
+"""
+Reconciliation Engine Tests
+Offline checks of key joins, fuzzy pairing and the structured diff
+"""
+
+import pytest
+
+from utils.reconciliation import SCHEMAS, detect_schema, normalize_date, reconcile, values_match
+
+
+BANK_HEADERS = ["Date", "Description", "Amount", "GL Account", "Status"]
+
+
+@pytest.mark.unit
+class TestReconciliation:
+
+    def test_bank_rows_join_on_date_description_and_amount(self):
+        ui = [
+            ["02/14/2025", "Payment to Acme Corporation for services", "$1,200.00", "Select GL Account", "Matched"],
+            ["02/15/2025", "Wire out", "-(50.00)", "6000 Expenses", "Open"],
+            ["02/15/2025", "Wire out", "-(50.00)", "6000 Expenses", "Open"],
+            ["03/01/2025", "Only in the grid", "10", "", "Open"],
+        ]
+        export = iter([
+            # Another order, ISO dates, the UI's truncated description in full
+            ["2025-02-15", "Wire out", "-(50.00)", "6000 Expenses", "Open"],
+            ["2025-02-14 00:00:00", "Payment to Acme Corporation for services", "1200", "", "Matched"],
+            ["2025-02-15", "Wire out", "-(50.00)", "6100 Fees", "Open"],
+            ["2025-04-01", "Only in the export", "5", "", "Open"],
+        ])
+        result = reconcile(ui, export, SCHEMAS["bank"], BANK_HEADERS)
+
+        assert result.matched == 3 and result.fuzzy_matched == 0
+        assert [row[1] for row in result.missing] == ["Only in the export"]
+        assert [row[1] for row in result.extra] == ["Only in the grid"]
+        # The duplicate transactions are paired in order, one of them booked to another account
+        assert dict(result.column_mismatches) == {3: 1}
+        assert result.mismatches[0]["column"] == "GL Account"
+        assert result.as_dict()["match_percentage"] == pytest.approx(14 / 15 * 100)
+
+    def test_truncated_descriptions_are_paired_loosely(self):
+        ui = [["01/02/2025", "Stripe…", "99.90", "", "Open"],
+              ["01/03/2025", "AMZN Mktp US*2K4 purchase", "15", "", "Open"]]
+        export = [["2025-01-02", "Stripe payout 8812", "99.9", "", "Open"],
+                  ["2025-01-03", "AMZN Mktp US*2K5 purchase", "15", "", "Open"]]
+        result = reconcile(ui, export, SCHEMAS["credit_cards"])
+
+        assert result.matched == 2 and result.fuzzy_matched == 2
+        assert not result.missing and not result.extra
+
+    def test_payables_without_a_document_id_use_the_fallback_key(self):
+        ui = [["Recorded", "Yes", "Acme", "INV-1", "01/01/2025", "$100"],
+              ["Recorded", "Yes", "Globex", "", "01/02/2025", "1,000"]]
+        export = [["Recorded", "Yes", "Globex", "None", "01/02/2025", "1000"],
+                  ["Recorded", "Yes", "Acme", "INV-1", "2025-01-01", "100.00"]]
+        assert detect_schema(ui) is SCHEMAS["payables"]
+        result = reconcile(ui, export, SCHEMAS["payables"])
+
+        assert result.matched == 2
+        # "" against "None" in the id column is the one difference
+        assert dict(result.column_mismatches) == {3: 1}
+
+    def test_cell_rules(self):
+        assert values_match("(12.50)", "-12.5")
+        assert values_match("-", "0")
+        assert values_match("Select account", "")
+        assert values_match("Long supplier na...", "Long supplier name LLC")
+        assert not values_match("100", "101")
+        assert normalize_date("3/7/2025, 10:05") == "20250307"
@@ -0,0 +1,70 @@
+"""
+Route Table Tests
+Offline checks of deep-link URLs and entity handling in goto_route
+"""
+
+import asyncio
+
+import pytest
+
+from pages.payables_page import PayablesPage
+from utils.routes import ROUTES, base_url_of, entity_id_of, goto_route, on_route, route_url
+
+
+class FakePage:
+    """Records navigations; redirect maps a requested URL to where the app sends it"""
+
+    def __init__(self, url, redirect=None):
+        self.url = url
+        self.redirect = redirect or {}
+        self.visited = []
+
+    async def goto(self, url, wait_until="load", timeout=30000):
+        self.visited.append(url)
+        self.url = self.redirect.get(url, url)
+
+
+@pytest.mark.unit
+class TestRoutes:
+
+    def test_route_url_carries_the_entity(self):
+        assert route_url("PayablesPage", "https://app.stage.viewz.co", 7) == \
+            "https://app.stage.viewz.co/reconciliation/payables?entityId=7"
+        assert route_url(PayablesPage, "https://app.viewz.co/") == "https://app.viewz.co/reconciliation/payables"
+        with pytest.raises(KeyError):
+            route_url("NoSuchPage")
+
+    def test_base_url_and_entity_come_from_the_current_url(self):
+        assert base_url_of("https://app.stage.viewz.co/home?entityId=3") == "https://app.stage.viewz.co"
+        assert base_url_of("http://localhost:3000/home") == "http://localhost:3000"
+        assert base_url_of("about:blank") == "https://app.viewz.co"
+        assert entity_id_of("https://app.viewz.co/home?tab=1&entityId=12") == "12"
+        assert entity_id_of("https://app.viewz.co/home") is None
+
+    def test_on_route_matches_the_section_and_entity(self):
+        assert on_route("https://app.viewz.co/budgeting/chart-of-budget?entityId=1", "BudgetingPage", 1)
+        assert not on_route("https://app.viewz.co/budgeting?entityId=2", "BudgetingPage", 1)
+        # Sub-pages count as their section (as the old "reconciliation in url" checks did)
+        assert on_route("https://app.viewz.co/reconciliation/payables", "ReconciliationPage")
+        assert not on_route("https://app.viewz.co/reconciliation", "PayablesPage")
+
+    def test_goto_keeps_the_current_entity(self):
+        page = FakePage("https://app.stage.viewz.co/home?entityId=5")
+        assert asyncio.run(goto_route(page, PayablesPage))
+        assert page.visited == ["https://app.stage.viewz.co/reconciliation/payables?entityId=5"]
+
+        # Already there - no second navigation
+        assert asyncio.run(goto_route(page, "PayablesPage"))
+        assert len(page.visited) == 1
+
+        # Another entity is a new navigation
+        assert asyncio.run(goto_route(page, "PayablesPage", entity_id=6))
+        assert page.visited[-1].endswith("entityId=6")
+
+    def test_goto_reports_a_lost_session(self):
+        target = "https://app.viewz.co/invoicing?entityId=1"
+        page = FakePage("https://app.viewz.co/home?entityId=1", redirect={target: "https://app.viewz.co/login"})
+        assert not asyncio.run(goto_route(page, "InvoicingPage"))
+
+    def test_every_route_is_an_app_path(self):
+        assert all(path.startswith("/") and "?" not in path for path in ROUTES.values())
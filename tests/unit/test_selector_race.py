@@ -0,0 +1,77 @@
+"""
+Selector Race Tests
+Offline checks that fallback candidates are resolved in list order from one concurrent round
+"""
+
+import asyncio
+
+import pytest
+
+from utils.selector_race import any_visible, first_visible, visible_counts
+
+
+class FakeLocator:
+
+    def __init__(self, page, selector, visible_count=None):
+        self.page = page
+        self.selector = selector
+        self.visible_count = visible_count
+
+    def filter(self, visible=None):
+        return FakeLocator(self.page, self.selector, self.page.visible.get(self.selector, 0))
+
+    def or_(self, other):
+        union = FakeLocator(self.page, f"{self.selector} | {other.selector}")
+        union.visible_count = self.visible_count + other.visible_count
+        return union
+
+    async def count(self):
+        self.page.in_flight += 1
+        self.page.max_in_flight = max(self.page.max_in_flight, self.page.in_flight)
+        await asyncio.sleep(0.01)
+        self.page.in_flight -= 1
+        if self.selector == "[invalid":
+            raise ValueError("Unexpected token")
+        return self.visible_count
+
+
+class FakePage:
+
+    def __init__(self, visible):
+        self.visible = visible
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+
+@pytest.mark.unit
+class TestSelectorRace:
+
+    def test_candidates_are_queried_concurrently(self):
+        page = FakePage({"b": 1})
+        assert asyncio.run(visible_counts(page, ["a", "b", "c", "d"])) == [0, 1, 0, 0]
+        assert page.max_in_flight == 4
+
+    def test_first_visible_keeps_list_order(self):
+        page = FakePage({"text=Save": 1, "button[type='submit']": 2})
+        index, locator = asyncio.run(first_visible(page, ["#missing", "button[type='submit']", "text=Save"]))
+        assert index == 1
+        assert locator.selector == "button[type='submit']"
+
+    def test_min_count_skips_candidates_with_too_few_matches(self):
+        page = FakePage({"[role='option']": 1, "[data-value]": 3})
+        index, _ = asyncio.run(first_visible(page, ["[role='option']", "[data-value]"], min_count=2))
+        assert index == 1
+
+    def test_invalid_selector_counts_as_a_miss(self):
+        page = FakePage({"text=Save": 1})
+        index, _ = asyncio.run(first_visible(page, ["[invalid", "text=Save"]))
+        assert index == 1
+
+    def test_any_visible_uses_one_composite_locator(self):
+        page = FakePage({"[role='alert']": 1})
+        assert asyncio.run(any_visible(page, ["text=successfully", "[role='alert']"])) is True
+        assert page.max_in_flight == 1
+        assert asyncio.run(any_visible(FakePage({}), ["text=successfully"])) is False
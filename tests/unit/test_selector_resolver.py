@@ -0,0 +1,117 @@
+"""
+Selector Resolver Tests
+Offline checks for winner-first ordering, demotion, persistence and dead selectors
+"""
+
+import asyncio
+
+import pytest
+
+from utils.selector_resolver import DEAD_AFTER_MISSES, SelectorResolver, environment_of
+
+NAV = ["text=Invoicing", "a:has-text('Invoicing')", "[href*='invoicing']", "[href*='invoice']"]
+
+
+class FakeLocator:
+
+    def __init__(self, visible, selector=None):
+        self.visible = visible
+        self.selector = selector
+        self.first = self
+
+    def filter(self, visible=None):
+        return self
+
+    async def count(self):
+        return 1 if self.visible else 0
+
+
+class FakePage:
+
+    def __init__(self, visible_selectors, url="https://app.stage.viewz.co/home"):
+        self.visible_selectors = set(visible_selectors)
+        self.url = url
+        self.probed = []
+
+    def locator(self, selector):
+        self.probed.append(selector)
+        return FakeLocator(selector in self.visible_selectors, selector)
+
+
+@pytest.fixture
+def resolver(tmp_path):
+    return SelectorResolver(path=str(tmp_path / "selector_stats.json"))
+
+
+@pytest.mark.unit
+class TestSelectorResolver:
+
+    def test_last_winner_is_probed_alone(self, resolver):
+        page = FakePage({"[href*='invoicing']", "[href*='invoice']"})
+        selector, _ = asyncio.run(resolver.first_visible(page, "InvoicingPage.nav_selectors", NAV))
+        assert selector == "[href*='invoicing']"
+        assert resolver.round_trips == 1
+
+        page.probed.clear()
+        selector, _ = asyncio.run(resolver.first_visible(page, "InvoicingPage.nav_selectors", NAV))
+        assert selector == "[href*='invoicing']"
+        assert page.probed == ["[href*='invoicing']"]
+
+    def test_stale_winner_falls_back_to_a_race(self, resolver):
+        resolver.record("stage", "InvoicingPage.nav_selectors", [], "text=Invoicing")
+        page = FakePage({"[href*='invoice']"})
+
+        selector, _ = asyncio.run(resolver.first_visible(page, "InvoicingPage.nav_selectors", NAV))
+        assert selector == "[href*='invoice']"
+        assert resolver.round_trips == 2
+        counts = resolver.stats["stage"]["InvoicingPage.nav_selectors"]["selectors"]
+        assert counts["text=Invoicing"]["misses"] == 1
+        assert counts["[href*='invoicing']"]["misses"] == 1
+
+    def test_failed_click_moves_on_to_the_next_selector(self, resolver):
+        resolver.record("stage", "InvoicingPage.nav_selectors", [], "text=Invoicing")
+        page = FakePage({"text=Invoicing", "[href*='invoice']"})
+        clicked = []
+
+        async def click(element):
+            if element.selector == "text=Invoicing":
+                raise Exception("Element is not attached to the DOM")
+            clicked.append(element.selector)
+
+        selector = asyncio.run(resolver.act_on_first_visible(page, "InvoicingPage.nav_selectors", NAV, click))
+        assert selector == clicked[0] == "[href*='invoice']"
+        entry = resolver.stats["stage"]["InvoicingPage.nav_selectors"]
+        assert entry["winner"] == "[href*='invoice']"
+        assert entry["selectors"]["text=Invoicing"] == {"hits": 1, "misses": 1}  # the earlier hit stays
+
+    def test_selectors_that_never_hit_are_demoted(self, resolver):
+        for _ in range(3):
+            resolver.record("stage", "k", ["text=Invoicing"], None)
+
+        assert resolver.ordered("stage", "k", NAV)[-1] == "text=Invoicing"
+        assert resolver.ordered("production", "k", NAV) == NAV
+
+    def test_save_merges_with_other_workers(self, resolver, tmp_path):
+        other = SelectorResolver(path=resolver.path)
+        resolver.record("stage", "k", ["a"], "b")
+        other.record("stage", "k", ["a"], "c")
+        resolver.save()
+        other.save()
+
+        reloaded = SelectorResolver(path=resolver.path)
+        entry = reloaded.stats["stage"]["k"]
+        assert entry["selectors"]["a"]["misses"] == 2
+        assert entry["winner"] == "c"
+
+    def test_dead_selector_report(self, resolver):
+        for _ in range(DEAD_AFTER_MISSES):
+            resolver.record("production", "EntitySelectorPage.entity_selectors", [".company-selector"], "text=Viewz Demo INC")
+
+        assert resolver.dead_selectors() == {
+            "production": {"EntitySelectorPage.entity_selectors": [".company-selector"]}
+        }
+        assert ".company-selector" in resolver.report()
+
+    def test_environment_of(self):
+        assert environment_of("https://app.stage.viewz.co/invoicing") == "stage"
+        assert environment_of("https://app.viewz.co/invoicing") == "production"
@@ -0,0 +1,117 @@
+"""
+Table Snapshot Tests
+Offline checks that a grid is read in one round trip with row keys and no row cap,
+and - where Chromium is installed - that the snapshot script reads a real grid
+"""
+
+import asyncio
+
+import pytest
+from playwright.async_api import async_playwright
+
+from utils.table_snapshot import ROW_SELECTORS, TABLE_SNAPSHOT_JS, snapshot_table
+
+
+GRID_HTML = """
+<table>
+  <thead><tr><th>Status</th><th>Supplier</th><th>ID</th></tr></thead>
+  <tbody>
+    <tr data-row-key="bill-1"><td>Recorded</td><td><div>Acme</div><div>Acme</div></td><td>1</td></tr>
+    <tr style="display: none"><td>Draft</td><td>Hidden Co</td><td>2</td></tr>
+    <tr><td></td><td> </td><td></td></tr>
+    <tr data-id="bill-3">
+      <td>Paid</td>
+      <td><table><tbody><tr><td>Globex</td></tr><tr><td>Initech</td></tr></tbody></table></td>
+      <td>3</td>
+    </tr>
+    <tr><td>Open</td><td>Umbrella</td><td>4</td></tr>
+  </tbody>
+</table>
+"""
+
+
+async def snapshot_html(html):
+    """Snapshot of `html` in a real page; skips the test when Chromium is not installed"""
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except Exception as error:
+            pytest.skip(f"Chromium not available: {str(error).splitlines()[0]}")
+        try:
+            page = await browser.new_page()
+            await page.set_content(html)
+            return await snapshot_table(page, wait_for_rows=False)
+        finally:
+            await browser.close()
+
+
+class FakeLocator:
+
+    def __init__(self, count):
+        self._count = count
+
+    async def count(self):
+        return self._count
+
+
+class FakePage:
+    """Answers the snapshot script with a grid of `rows` rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.evaluations = []
+
+    def on(self, event, handler):
+        pass
+
+    def locator(self, selector):
+        return FakeLocator(self.rows)
+
+    async def evaluate(self, script, arg=None):
+        self.evaluations.append((script, arg))
+        return {
+            "selector": arg["rowSelectors"][0],
+            "headers": ["Status", "Supplier", "ID"],
+            "rows": [{"key": f"row-{i}" if i % 2 else None, "cells": ["Recorded", "Acme", str(i)]}
+                     for i in range(self.rows)],
+            "ms": 4.2,
+        }
+
+
+@pytest.mark.unit
+class TestTableSnapshot:
+
+    def test_whole_grid_in_one_round_trip(self):
+        page = FakePage(rows=250)
+        snapshot = asyncio.run(snapshot_table(page, wait_for_rows=False))
+
+        assert len(page.evaluations) == 1
+        script, arg = page.evaluations[0]
+        assert script == TABLE_SNAPSHOT_JS and arg["rowSelectors"] == list(ROW_SELECTORS)
+        # No 100-row cap any more
+        assert len(snapshot) == 250
+        assert snapshot.rows[249] == ["Recorded", "Acme", "249"]
+        assert snapshot.keys[:2] == [None, "row-1"]
+        assert snapshot.records()[0] == {"Status": "Recorded", "Supplier": "Acme", "ID": "0"}
+        assert "250 rows x 3 columns" in snapshot.summary()
+
+    def test_waits_for_the_row_count_before_reading(self):
+        page = FakePage(rows=3)
+        snapshot = asyncio.run(snapshot_table(page))
+        assert len(snapshot) == 3 and len(page.evaluations) == 1
+
+
+@pytest.mark.unit
+class TestTableSnapshotInBrowser:
+
+    def test_reads_a_real_grid(self):
+        snapshot = asyncio.run(snapshot_html(GRID_HTML))
+
+        assert snapshot.headers == ["Status", "Supplier", "ID"]
+        # Hidden and empty rows are skipped, the nested table's rows are not grid rows
+        assert snapshot.rows == [
+            ["Recorded", "Acme", "1"],
+            ["Paid", "Globex Initech", "3"],
+            ["Open", "Umbrella", "4"],
+        ]
+        assert snapshot.keys == ["bill-1", "bill-3", None]
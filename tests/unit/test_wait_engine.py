@@ -0,0 +1,107 @@
+"""
+Wait Engine Tests
+Offline checks for network settling, row count stability and caller attribution
+"""
+
+import asyncio
+
+import pytest
+
+from utils.wait_engine import WaitEngine, wait_telemetry
+
+
+class FakeRequest:
+
+    def __init__(self, resource_type="xhr"):
+        self.resource_type = resource_type
+
+
+class FakeRows:
+
+    def __init__(self, counts):
+        self.counts = list(counts)
+
+    async def count(self):
+        return self.counts.pop(0) if len(self.counts) > 1 else self.counts[0]
+
+
+class FakePage:
+
+    def __init__(self, row_counts=(0,)):
+        self.handlers = {}
+        self.rows = FakeRows(row_counts)
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def emit(self, event, request):
+        for handler in self.handlers.get(event, []):
+            handler(request)
+
+    def locator(self, selector):
+        return self.rows
+
+
+class FakePageObject:
+
+    def __init__(self, page):
+        self.waits = WaitEngine(page)
+
+    async def save(self):
+        return await self.waits.network_idle(idle_ms=50, timeout=2000)
+
+
+@pytest.fixture(autouse=True)
+def clear_telemetry():
+    wait_telemetry.records.clear()
+    yield
+    wait_telemetry.records.clear()
+
+
+@pytest.mark.unit
+class TestWaitEngine:
+
+    def test_network_idle_waits_for_in_flight_requests(self):
+        page = FakePage()
+        request = FakeRequest()
+
+        async def scenario():
+            page_object = FakePageObject(page)
+            page.emit("request", request)
+            asyncio.get_running_loop().call_later(0.2, page.emit, "requestfinished", request)
+            return await page_object.save()
+
+        assert asyncio.run(scenario()) is True
+        record = wait_telemetry.records[-1]
+        assert record["waited_ms"] >= 200
+        assert record["caller"] == "FakePageObject.save"
+
+    def test_network_idle_ignores_static_resources(self):
+        page = FakePage()
+        engine = WaitEngine(page)
+        page.emit("request", FakeRequest("image"))
+
+        assert asyncio.run(engine.network_idle(idle_ms=0, timeout=500)) is True
+
+    def test_network_idle_gives_up_at_the_bound(self):
+        page = FakePage()
+        engine = WaitEngine(page)
+        page.emit("request", FakeRequest("fetch"))
+
+        assert asyncio.run(engine.network_idle(timeout=200)) is False
+        assert wait_telemetry.records[-1]["met"] is False
+
+    def test_row_count_stable_returns_settled_count(self):
+        page = FakePage(row_counts=(0, 3, 7, 7))
+        engine = WaitEngine(page)
+
+        assert asyncio.run(engine.row_count_stable(stable_ms=200, timeout=3000)) == 7
+        assert wait_telemetry.records[-1]["met"] is True
+
+    def test_summary_ranks_longest_waiting_callers(self):
+        wait_telemetry.record("dom_quiet", "BudgetingPage.search", 0.4, 3000, True)
+        wait_telemetry.record("network_idle", "InvoicingPage.create_customer", 2.5, 10000, False)
+
+        summary = wait_telemetry.summary()
+        assert summary.index("InvoicingPage.create_customer") < summary.index("BudgetingPage.search")
+        assert "1 hit the bound" in summary
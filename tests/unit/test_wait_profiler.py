@@ -0,0 +1,88 @@
+"""
+Wait Profiler Tests
+Offline checks for attributing sleeps to page-object methods and tests
+"""
+
+import asyncio
+import json
+
+import pytest
+from playwright.async_api import Page
+
+from utils.wait_profiler import WaitProfiler
+
+# A page object as if defined in pages/, so the profiler charges its waits to it
+PAGE_OBJECT_SOURCE = '''
+import asyncio
+
+class SlowPage:
+
+    async def _click_save(self):
+        await asyncio.sleep(0.05)
+        await asyncio.sleep(0.05)
+
+    async def create_customer(self):
+        await self._click_save()
+'''
+
+
+@pytest.fixture
+def slow_page():
+    namespace = {"__name__": "pages.slow_page"}
+    exec(PAGE_OBJECT_SOURCE, namespace)
+    return namespace["SlowPage"]()
+
+
+@pytest.fixture
+def profiler():
+    profiler = WaitProfiler()
+    profiler.install()
+    yield profiler
+    profiler.uninstall()
+
+
+@pytest.mark.unit
+class TestWaitProfiler:
+
+    def test_sleeps_are_charged_to_the_innermost_page_method(self, profiler, slow_page):
+        profiler.start_test("tests/e2e/test_invoicing.py::test_create")
+        asyncio.run(slow_page.create_customer())
+        profiler.end_test()
+
+        methods = profiler.report()["methods"]
+        assert list(methods) == ["SlowPage._click_save"]
+        assert methods["SlowPage._click_save"]["calls"] == 2
+        assert methods["SlowPage._click_save"]["idle_s"] >= 0.1
+
+    def test_waits_outside_page_objects_go_to_the_test(self, profiler):
+        async def test_direct_sleep():
+            await asyncio.sleep(0.02)
+
+        profiler.start_test("t::test_direct_sleep")
+        asyncio.run(test_direct_sleep())
+        profiler.end_test()
+
+        test = profiler.report()["tests"]["t::test_direct_sleep"]
+        assert list(test["methods"]) == ["test_direct_sleep"]
+        assert test["active_s"] == pytest.approx(test["duration_s"] - test["idle_s"], abs=0.001)
+
+    def test_uninstall_restores_originals(self):
+        original_sleep, original_wait = asyncio.sleep, Page.wait_for_timeout
+        profiler = WaitProfiler()
+        profiler.install()
+        assert asyncio.sleep is not original_sleep
+        profiler.uninstall()
+
+        assert asyncio.sleep is original_sleep
+        assert Page.wait_for_timeout is original_wait
+
+    def test_write_produces_json_and_ranked_summary(self, profiler, slow_page, tmp_path):
+        profiler.start_test("t::test_a")
+        asyncio.run(slow_page._click_save())
+        profiler.end_test()
+
+        summary = profiler.write(str(tmp_path / "wait_profile.json"))
+        report = json.loads((tmp_path / "wait_profile.json").read_text())
+        assert report["totals"]["tests"] == 1
+        assert "1.  " in summary and "SlowPage._click_save" in summary
+        assert (tmp_path / "wait_profile.txt").read_text().strip() == summary
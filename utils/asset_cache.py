@@ -0,0 +1,152 @@
+"""
+Persistent Static Asset Cache
+Serves the Viewz SPA bundle (JS/CSS/fonts/images) from a local disk cache
+shared by every browser context, test and run. The cache is keyed by
+environment and by the app build, so a new deployment starts a fresh cache.
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+from typing import Optional, Dict
+
+
+# Static files worth caching; API calls and documents always go to the network
+STATIC_ASSET_PATTERN = re.compile(
+    r"^[^?#]+\.(?:js|mjs|css|woff2?|ttf|otf|eot|svg|png|jpe?g|gif|webp|ico)(?:[?#].*)?$",
+    re.IGNORECASE
+)
+
+# Bundle references in the SPA shell; their hashed names identify the build
+BUNDLE_REFERENCE_PATTERN = re.compile(r'(?:src|href)="([^"]+\.(?:js|css))"')
+
+# Headers that describe the transfer rather than the cached body
+SKIPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection", "date", "set-cookie"}
+
+
+class AssetCache:
+    """Disk cache for static assets, attached to contexts via request routing"""
+
+    def __init__(self, cache_dir: str = ".browser_cache"):
+        """
+        Initialize asset cache
+
+        Args:
+            cache_dir: Root directory; one sub-directory per environment and build
+        """
+        self.cache_dir = cache_dir
+        self._build_dirs: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_served = 0
+
+    @staticmethod
+    def compute_build_hash(shell_html: str) -> str:
+        """
+        Identify an app build from the bundle names referenced by its HTML shell
+
+        Args:
+            shell_html: HTML returned for the app's base URL
+
+        Returns:
+            str: Short hash that changes whenever the bundle set changes
+        """
+        bundles = sorted(set(BUNDLE_REFERENCE_PATTERN.findall(shell_html)))
+        source = "\n".join(bundles) if bundles else shell_html
+        return hashlib.sha1(source.encode()).hexdigest()[:12]
+
+    async def _resolve_build_dir(self, context, environment: str, base_url: str,
+                                 shell_headers: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Directory for the currently deployed build; older builds are removed"""
+        if environment in self._build_dirs:
+            return self._build_dirs[environment]
+
+        try:
+            response = await context.request.get(base_url, headers=shell_headers)
+            if not response.ok:
+                print(f"⚠️ Asset cache disabled: {base_url} returned {response.status}")
+                return None
+            build_hash = self.compute_build_hash(await response.text())
+        except Exception as e:
+            print(f"⚠️ Asset cache disabled: could not read app shell ({e})")
+            return None
+
+        env_dir = os.path.join(self.cache_dir, environment)
+        build_dir = os.path.join(env_dir, build_hash)
+        if os.path.isdir(env_dir):
+            for old_build in os.listdir(env_dir):
+                if old_build != build_hash:
+                    shutil.rmtree(os.path.join(env_dir, old_build), ignore_errors=True)
+                    print(f"🧹 Asset cache: dropped build {old_build} for '{environment}'")
+        os.makedirs(build_dir, exist_ok=True)
+
+        print(f"📦 Asset cache for '{environment}' build {build_hash}: {build_dir}")
+        self._build_dirs[environment] = build_dir
+        return build_dir
+
+    async def attach(self, context, environment: str, base_url: str,
+                     shell_headers: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Route the context's static asset requests through the cache
+
+        Register this before other routes on the context: handlers registered
+        later (e.g. auth header injection) run first and fall back into it.
+
+        Args:
+            context: Playwright BrowserContext
+            environment: Cache namespace (e.g. "stage", "production", "bo-stage")
+            base_url: App URL whose HTML shell identifies the build
+            shell_headers: Extra headers for fetching the shell (e.g. basic auth)
+
+        Returns:
+            bool: True if the cache was attached
+        """
+        build_dir = await self._resolve_build_dir(context, environment, base_url, shell_headers)
+        if not build_dir:
+            return False
+
+        async def serve_from_cache(route):
+            url = route.request.url
+            key = hashlib.sha1(url.encode()).hexdigest()
+            body_path = os.path.join(build_dir, f"{key}.body")
+            meta_path = os.path.join(build_dir, f"{key}.json")
+
+            if os.path.exists(body_path) and os.path.exists(meta_path):
+                with open(meta_path, "r") as f:
+                    meta = json.load(f)
+                self.hits += 1
+                self.bytes_served += os.path.getsize(body_path)
+                await route.fulfill(status=meta["status"], headers=meta["headers"], path=body_path)
+                return
+
+            response = await route.fetch()
+            body = await response.body()
+            self.misses += 1
+            if response.status == 200:
+                headers = {name: value for name, value in response.headers.items()
+                           if name.lower() not in SKIPPED_HEADERS}
+                # Write to temp files first - other xdist workers may read the same entry
+                suffix = f".{os.getpid()}.tmp"
+                with open(body_path + suffix, "wb") as f:
+                    f.write(body)
+                with open(meta_path + suffix, "w") as f:
+                    json.dump({"url": url, "status": response.status, "headers": headers}, f)
+                os.replace(body_path + suffix, body_path)
+                os.replace(meta_path + suffix, meta_path)
+            await route.fulfill(response=response, body=body)
+
+        await context.route(STATIC_ASSET_PATTERN, serve_from_cache)
+        return True
+
+    def summary(self) -> str:
+        """One-line hit/miss report"""
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0
+        return (f"📦 Asset cache: {self.hits} hits / {self.misses} misses "
+                f"({hit_rate:.0f}% hit rate, {self.bytes_served / 1024 / 1024:.1f} MB served locally)")
+
+
+# Global instance
+asset_cache = AssetCache()
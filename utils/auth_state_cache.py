@@ -0,0 +1,237 @@
+"""
+Authenticated Storage-State Cache
+Persists a completed 2FA + entity login per environment so later browser
+contexts can be seeded instead of logging in again
+"""
+
+import os
+import json
+import time
+import base64
+import weakref
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+
+# sessionStorage flag marking a tab as already seeded
+SEEDED_MARKER_PREFIX = "__authStateSeeded_"
+
+# Reads every sessionStorage entry for the current origin
+READ_SESSION_STORAGE_JS = """
+(markerPrefix) => {
+    const storage = {};
+    for (let i = 0; i < sessionStorage.length; i++) {
+        const key = sessionStorage.key(i);
+        if (!key.startsWith(markerPrefix)) {
+            storage[key] = sessionStorage.getItem(key);
+        }
+    }
+    return storage;
+}
+"""
+
+# Restores web storage on the cached origin before any app script runs.
+# Seeds once per tab, so a logout inside the test is not undone by the
+# next navigation, and never overwrites keys the app already wrote.
+SEED_STORAGE_JS = """
+(state) => {
+    if (window.location.origin !== state.origin) return;
+    const marker = state.markerPrefix + state.storage;
+    if (sessionStorage.getItem(marker)) return;
+    const store = window[state.storage];
+    for (const [key, value] of Object.entries(state.items)) {
+        if (store.getItem(key) === null) {
+            store.setItem(key, value);
+        }
+    }
+    sessionStorage.setItem(marker, "1");
+}
+"""
+
+
+class AuthStateCache:
+    """Caches cookies + sessionStorage of a logged-in Viewz session on disk"""
+
+    # sessionStorage keys the app needs to treat a tab as authenticated
+    REQUIRED_SESSION_KEYS = ("jwtToken", "appSessionId", "tabId")
+
+    def __init__(self, cache_dir: str = ".auth", expiry_margin: int = 120, check_expiry: bool = True):
+        """
+        Initialize auth state cache
+
+        Args:
+            cache_dir: Directory holding one JSON file per environment
+            expiry_margin: Seconds before JWT expiry at which a state is considered stale
+            check_expiry: False for recorded sessions replayed offline, where no server checks the JWT
+        """
+        self.cache_dir = cache_dir
+        self.expiry_margin = expiry_margin
+        self.check_expiry = check_expiry
+        # context -> saved_at of the state its init scripts seed
+        self._seeded_contexts = weakref.WeakKeyDictionary()
+
+    def _state_path(self, environment: str) -> str:
+        """Get the cache file path for an environment"""
+        return os.path.join(self.cache_dir, f"{environment}_auth_state.json")
+
+    @staticmethod
+    def decode_jwt_expiry(token: Optional[str]) -> Optional[float]:
+        """
+        Read the `exp` claim from a JWT without verifying its signature
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            float: Expiry as a unix timestamp, or None if it cannot be read
+        """
+        if not token or token.count(".") != 2:
+            return None
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+            exp = claims.get("exp")
+            return float(exp) if exp is not None else None
+        except (ValueError, TypeError):
+            return None
+
+    def is_valid(self, state: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check that a cached state is complete and its JWT is not about to expire
+
+        Args:
+            state: State previously returned by load()/save()
+
+        Returns:
+            bool: True if the state can be used to seed a new context
+        """
+        if not state:
+            return False
+
+        session_storage = state.get("session_storage", {})
+        if any(not session_storage.get(key) for key in self.REQUIRED_SESSION_KEYS):
+            return False
+
+        expires_at = self.decode_jwt_expiry(session_storage.get("jwtToken"))
+        if expires_at is None or not self.check_expiry:
+            # Unknown expiry - trust the state, the post-navigation check catches a dead session
+            return True
+        return time.time() < expires_at - self.expiry_margin
+
+    def load(self, environment: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a usable cached state for an environment
+
+        Args:
+            environment: Environment name from load_config() (e.g. "stage", "production")
+
+        Returns:
+            dict: Cached state, or None if missing, unreadable or expired
+        """
+        path = self._state_path(environment)
+        try:
+            with open(path, "r") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if not self.is_valid(state):
+            print(f"⌛ Cached auth state for '{environment}' expired or incomplete")
+            self.invalidate(environment)
+            return None
+        return state
+
+    def save(self, environment: str, state: Dict[str, Any]) -> str:
+        """
+        Persist a captured state
+
+        Args:
+            environment: Environment name the state belongs to
+            state: State returned by capture()
+
+        Returns:
+            str: Path of the written cache file
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._state_path(environment)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, path)
+        return path
+
+    def invalidate(self, environment: str):
+        """Drop the cached state for an environment"""
+        try:
+            os.remove(self._state_path(environment))
+        except FileNotFoundError:
+            pass
+
+    async def capture(self, page) -> Dict[str, Any]:
+        """
+        Capture cookies, localStorage and sessionStorage from a logged-in page
+
+        Args:
+            page: Playwright page sitting on an authenticated app URL
+
+        Returns:
+            dict: State ready to be passed to save()/apply()
+        """
+        origin = await page.evaluate("() => window.location.origin")
+        return {
+            "origin": origin,
+            "url": page.url,
+            "storage_state": await page.context.storage_state(),
+            "session_storage": await page.evaluate(READ_SESSION_STORAGE_JS, SEEDED_MARKER_PREFIX),
+            "saved_at": datetime.now().isoformat(),
+        }
+
+    def seeded_with(self, context) -> Optional[str]:
+        """saved_at of the state a context's init scripts seed, None if never seeded"""
+        return self._seeded_contexts.get(context)
+
+    async def apply(self, context, state: Dict[str, Any]):
+        """
+        Seed a fresh browser context with a cached state
+
+        Cookies are added directly; localStorage and sessionStorage are written
+        by an init script so they exist before the SPA boots. A recycled context
+        already seeded with this state only gets its cookies back - its init
+        scripts still seed every new tab.
+
+        Args:
+            context: Playwright BrowserContext that has not navigated yet
+            state: State returned by load()
+        """
+        storage_state = state.get("storage_state", {})
+        if storage_state.get("cookies"):
+            await context.add_cookies(storage_state["cookies"])
+
+        if self.seeded_with(context) == state.get("saved_at"):
+            return
+        self._seeded_contexts[context] = state.get("saved_at")
+
+        for origin_state in storage_state.get("origins", []):
+            items = {entry["name"]: entry["value"] for entry in origin_state.get("localStorage", [])}
+            if items:
+                await self._add_storage_seed(context, "localStorage", origin_state["origin"], items)
+
+        await self._add_storage_seed(
+            context, "sessionStorage", state["origin"], state.get("session_storage", {})
+        )
+
+    @staticmethod
+    async def _add_storage_seed(context, storage: str, origin: str, items: Dict[str, str]):
+        """Register an init script that writes items into localStorage/sessionStorage"""
+        payload = json.dumps({
+            "storage": storage,
+            "origin": origin,
+            "items": items,
+            "markerPrefix": SEEDED_MARKER_PREFIX,
+        })
+        await context.add_init_script(script=f"({SEED_STORAGE_JS})({payload})")
+
+
+# Global instance
+auth_state_cache = AuthStateCache()
@@ -0,0 +1,76 @@
+"""
+Origin-Scoped Basic Auth
+Stage BO and App sit behind HTTP basic auth with different passwords.
+The primary origin uses Playwright's native per-origin http_credentials, so
+its traffic never leaves the browser; only requests to the other protected
+origins are routed through Python to receive their Authorization header.
+"""
+
+import base64
+from urllib.parse import urlparse
+from typing import Dict, Tuple, Any
+
+
+def origin_of(url: str) -> str:
+    """Scheme + host (+ port) of a URL, e.g. https://bo.stage.viewz.co"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def basic_auth_header(username: str, password: str) -> str:
+    """Value of an Authorization header for HTTP basic auth"""
+    token = base64.b64encode(f"{username}:{password}".encode()).decode()
+    return f"Basic {token}"
+
+
+class OriginBasicAuth:
+    """Basic auth credentials for several origins of one browser context"""
+
+    def __init__(self, primary_origin: str, credentials: Dict[str, Tuple[str, str]]):
+        """
+        Initialize origin-scoped basic auth
+
+        Args:
+            primary_origin: Origin the context mainly talks to (handled natively)
+            credentials: origin -> (username, password) for every protected origin
+        """
+        self.primary_origin = origin_of(primary_origin)
+        self.credentials = {origin_of(origin): creds for origin, creds in credentials.items()}
+        self.routed_requests = 0
+
+    def context_options(self) -> Dict[str, Any]:
+        """new_context() options authenticating the primary origin natively"""
+        if self.primary_origin not in self.credentials:
+            return {}
+        username, password = self.credentials[self.primary_origin]
+        return {
+            "http_credentials": {
+                "username": username,
+                "password": password,
+                "origin": self.primary_origin,
+                # Send up front instead of waiting for a 401 challenge
+                "send": "always",
+            }
+        }
+
+    async def install(self, context):
+        """
+        Add the Authorization header for the secondary origins
+
+        Each route is scoped to its origin's URL pattern, so images, fonts and
+        XHR to the primary origin or third-party hosts never reach Python.
+
+        Args:
+            context: Context created with context_options()
+        """
+        for origin, (username, password) in self.credentials.items():
+            if origin == self.primary_origin:
+                continue
+
+            header = basic_auth_header(username, password)
+
+            async def add_authorization(route, header=header):
+                self.routed_requests += 1
+                await route.fallback(headers={**route.request.headers, "authorization": header})
+
+            await context.route(f"{origin}/**", add_authorization)
@@ -0,0 +1,189 @@
+"""
+Shared Browser Server
+The regression runners start pytest (main app) and the BO runner as separate
+subprocesses, each booting its own Chromium. A BrowserServer launched once by
+the runner exposes one Chromium over a local websocket; every pytest process
+that finds VIEWZ_BROWSER_WS_ENDPOINT in its environment connects to it
+instead of launching a browser.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import subprocess
+import threading
+import importlib.resources
+from typing import Optional, Dict, List, Tuple
+
+
+# Read by the shared_browser fixture in tests/conftest.py
+BROWSER_WS_ENV = "VIEWZ_BROWSER_WS_ENDPOINT"
+BROWSER_STATS_ENV = "VIEWZ_BROWSER_SERVER_STATS"
+
+# Python Playwright has no launchServer(); run it in the Node driver bundled with the package
+LAUNCH_SERVER_JS = """
+const { chromium } = require(process.argv[1]);
+(async () => {
+    const server = await chromium.launchServer(JSON.parse(process.argv[2]));
+    console.log(server.wsEndpoint());
+    const shutdown = async () => { await server.close(); process.exit(0); };
+    process.on('SIGTERM', shutdown);
+    process.on('SIGINT', shutdown);
+    process.stdin.on('end', shutdown);
+    process.stdin.resume();
+})().catch(error => { console.error(error); process.exit(1); });
+"""
+
+
+def driver_paths() -> Tuple[str, str]:
+    """
+    Node executable and JS package of the Playwright driver installed with the Python package
+
+    Found as data files of the installed playwright distribution (driver/node,
+    driver/package); PLAYWRIGHT_NODEJS_PATH overrides the Node executable as
+    it does for Playwright itself.
+
+    Returns:
+        tuple: (node, package directory)
+    """
+    driver = importlib.resources.files("playwright") / "driver"
+    node = os.getenv("PLAYWRIGHT_NODEJS_PATH") or str(driver / ("node.exe" if sys.platform == "win32" else "node"))
+    return node, str(driver / "package")
+
+
+def parse_endpoint(line: str) -> Optional[str]:
+    """The ws:// endpoint the server printed, None if the line is not one"""
+    endpoint = (line or "").strip()
+    return endpoint if endpoint.startswith(("ws://", "wss://")) else None
+
+
+def record_connection(connect_seconds: float):
+    """
+    Note that a pytest process connected to the shared server instead of launching
+
+    Args:
+        connect_seconds: Time the connect() call took
+    """
+    stats_path = os.getenv(BROWSER_STATS_ENV)
+    if not stats_path:
+        return
+    entry = {"pid": os.getpid(), "worker": os.getenv("PYTEST_XDIST_WORKER", "main"),
+             "connect_seconds": round(connect_seconds, 3)}
+    # One short line per append - safe with several xdist workers writing at once
+    with open(stats_path, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+class BrowserServer:
+    """Chromium launched once per runner and shared over a websocket"""
+
+    def __init__(self, headless: bool = True, args: Optional[List[str]] = None,
+                 stats_path: str = ".browser_server_stats.jsonl"):
+        """
+        Initialize browser server
+
+        Args:
+            headless: Launch Chromium headless
+            args: Extra Chromium command-line arguments
+            stats_path: File the pytest processes report their connections to
+        """
+        self.launch_options = {"headless": headless, "args": args or []}
+        self.stats_path = stats_path
+        self.ws_endpoint: Optional[str] = None
+        self.startup_seconds = 0.0
+        self._process: Optional[subprocess.Popen] = None
+
+    def command(self) -> List[str]:
+        """Command that launches Chromium in the driver's Node and prints the endpoint"""
+        node, package_dir = driver_paths()
+        return [node, "-e", LAUNCH_SERVER_JS, package_dir, json.dumps(self.launch_options)]
+
+    def start(self, timeout: float = 60.0) -> Optional[str]:
+        """
+        Launch the server and wait for its websocket endpoint
+
+        Args:
+            timeout: Seconds to wait for Chromium to come up
+
+        Returns:
+            str: ws:// endpoint, or None if the server could not be started
+        """
+        start = time.perf_counter()
+        try:
+            self._process = subprocess.Popen(
+                self.command(), stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+            )
+        except OSError as e:
+            print(f"⚠️ Browser server not started: {e}")
+            return None
+
+        lines = queue.Queue()
+        threading.Thread(target=lambda: lines.put(self._process.stdout.readline()), daemon=True).start()
+        try:
+            endpoint = parse_endpoint(lines.get(timeout=timeout))
+        except queue.Empty:
+            endpoint = None
+
+        if not endpoint:
+            print("⚠️ Browser server did not report an endpoint - suites will launch their own browsers")
+            self.stop()
+            return None
+
+        self.startup_seconds = time.perf_counter() - start
+        self.ws_endpoint = endpoint
+        if os.path.exists(self.stats_path):
+            os.remove(self.stats_path)
+        print(f"🌐 Shared browser server up in {self.startup_seconds:.1f}s: {endpoint}")
+        return endpoint
+
+    def apply_env(self, env: Dict[str, str]) -> Dict[str, str]:
+        """Point subprocesses started with `env` at this server (no-op if not running)"""
+        if self.ws_endpoint:
+            env[BROWSER_WS_ENV] = self.ws_endpoint
+            env[BROWSER_STATS_ENV] = os.path.abspath(self.stats_path)
+        return env
+
+    def connections(self) -> List[Dict[str, float]]:
+        """Connections reported by pytest processes so far"""
+        try:
+            with open(self.stats_path, "r") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def time_saved_report(self) -> str:
+        """
+        Estimated startup time saved by sharing the browser
+
+        Each connection would otherwise have launched its own Chromium, which
+        costs about as long as the server's own startup.
+        """
+        connections = self.connections()
+        if not connections:
+            return "🌐 Shared browser server: no pytest process connected"
+        saved = sum(max(self.startup_seconds - c["connect_seconds"], 0) for c in connections)
+        return (f"🌐 Shared browser server: {len(connections)} connection(s), "
+                f"~{saved:.1f}s of browser startup saved "
+                f"({self.startup_seconds:.1f}s launch vs avg "
+                f"{sum(c['connect_seconds'] for c in connections) / len(connections):.2f}s connect)")
+
+    def stop(self):
+        """Close Chromium and the server process"""
+        if self._process and self._process.poll() is None:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=15)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+        self._process = None
+        if os.path.exists(self.stats_path):
+            os.remove(self.stats_path)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,193 @@
+"""
+Combobox Driver
+One routine for every dropdown / combobox in the app (Radix select, cmdk
+command lists, menus) instead of each page object clicking a trigger, sleeping
+and scanning a list of option selectors one by one:
+
+- open(): the first visible trigger candidate is clicked and the listbox is
+  waited for via its ARIA role (or the options themselves)
+- choose(): the option is found by text or index in a single in-page query,
+  which tags it so exactly that element is clicked. If the wanted text is not
+  rendered and the focus is in a search input (large or virtualised lists),
+  the text is typed to filter the list and the query repeated once
+- close(): waits for the listbox to go away and presses Escape only if it is
+  still open, so an enclosing dialog is never dismissed by accident
+"""
+
+import itertools
+from typing import Dict, Optional, Sequence
+
+from utils.wait_engine import WaitEngine
+from utils.selector_race import Candidate, first_visible
+
+
+# Popups that hold the options of an open combobox
+LISTBOX_SELECTOR = "[role='listbox'], [role='menu'], [cmdk-list]"
+
+# Selectable entries across Radix select/menus and cmdk lists
+OPTION_SELECTOR = "[role='option'], [role='menuitem'], [cmdk-item]"
+
+# Finds the wanted option among the visible, enabled, innermost matches of
+# `selector` and tags it with data-combobox-pick=token
+PICK_OPTION_JS = """
+({ selector, text, index, exact, token }) => {
+    const isVisible = el => {
+        const rect = el.getBoundingClientRect();
+        const style = getComputedStyle(el);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden';
+    };
+    const isEnabled = el => el.getAttribute('aria-disabled') !== 'true' && !el.hasAttribute('data-disabled');
+    const labelOf = el => (el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim();
+
+    let options = [...document.querySelectorAll(selector)].filter(el => isVisible(el) && isEnabled(el));
+    // A wrapper matching e.g. "[role='listbox'] > *" must not win over the options inside it
+    options = options.filter(el => !options.some(other => other !== el && el.contains(other)));
+
+    let match = -1;
+    if (text !== null) {
+        const wanted = text.replace(/\\s+/g, ' ').trim().toLowerCase();
+        const labels = options.map(el => labelOf(el).toLowerCase());
+        match = labels.indexOf(wanted);
+        if (match < 0 && !exact) match = labels.findIndex(label => label.includes(wanted));
+    } else if (index < options.length) {
+        match = index;
+    }
+
+    document.querySelectorAll('[data-combobox-pick]').forEach(el => el.removeAttribute('data-combobox-pick'));
+    if (match >= 0) options[match].setAttribute('data-combobox-pick', token);
+
+    const active = document.activeElement;
+    return {
+        count: options.length,
+        label: match >= 0 ? labelOf(options[match]) : null,
+        searchable: !!active && (active.tagName === 'INPUT' || active.isContentEditable),
+    };
+}
+"""
+
+_tokens = itertools.count(1)
+
+
+class Combobox:
+    """Opens a dropdown, picks one option and closes it again"""
+
+    def __init__(self, page, waits: Optional[WaitEngine] = None, option_selector: str = OPTION_SELECTOR):
+        """
+        Initialize combobox driver
+
+        Args:
+            page: Playwright page
+            waits: Wait engine of the page object (a new one if omitted)
+            option_selector: CSS selector of the options (page objects pass their own)
+        """
+        self.page = page
+        self.waits = waits or WaitEngine(page)
+        self.option_selector = option_selector
+        # Listboxes already visible before open() (e.g. a menu that is always there)
+        self.baseline = 0
+
+    async def open(self, triggers: Sequence[Candidate], force: bool = False) -> Optional[int]:
+        """
+        Click the first visible trigger and wait for the listbox
+
+        Args:
+            triggers: Selectors or locators of the control, in order of preference
+            force: Skip Playwright's actionability checks (for triggers under an overlay)
+
+        Returns:
+            int: Index of the trigger that was clicked, None if none could be
+        """
+        index, trigger = await first_visible(self.page, triggers)
+        if trigger is None:
+            return None
+        self.baseline = await self.page.locator(LISTBOX_SELECTOR).filter(visible=True).count()
+        try:
+            await trigger.first.click(force=force)
+        except Exception:
+            return None
+        await self.waits.element_visible(f"{LISTBOX_SELECTOR}, {self.option_selector}", timeout=2000)
+        return index
+
+    async def _pick(self, text: Optional[str], index: int, exact: bool) -> Dict:
+        token = str(next(_tokens))
+        found = await self.page.evaluate(PICK_OPTION_JS, {
+            "selector": self.option_selector, "text": text, "index": index, "exact": exact, "token": token,
+        })
+        found["token"] = token
+        return found
+
+    async def type_ahead(self, search: str):
+        """Type into the focused search input and wait for the list to re-render"""
+        await self.page.keyboard.type(search)
+        await self.waits.dom_quiet(quiet_ms=150)
+
+    async def choose(self, text: Optional[str] = None, index: int = 0, search: Optional[str] = None,
+                     exact: bool = False, keyboard_fallback: bool = False) -> Optional[str]:
+        """
+        Pick an option of the open listbox
+
+        Args:
+            text: Option label to pick (exact match preferred over substring)
+            index: Option to pick when no text is given (0 = first)
+            search: Text to type first to filter a searchable list; if text is
+                then not among the filtered options, option `index` is picked
+            exact: Only accept an exact (case-insensitive) label match
+            keyboard_fallback: If no option is found, pick via ArrowDown/Enter
+
+        Returns:
+            str: Label of the picked option, None if nothing was picked
+        """
+        if search:
+            await self.type_ahead(search)
+        found = await self._pick(text, index, exact)
+        if found["label"] is None and text is not None and not search and found["searchable"]:
+            # Not rendered (long or virtualised list) - filter it down and look once more
+            await self.type_ahead(text)
+            found = await self._pick(text, index, exact)
+        if found["label"] is None and text is not None and search:
+            found = await self._pick(None, index, exact)
+
+        if found["label"] is not None:
+            await self.page.locator(f"[data-combobox-pick='{found['token']}']").click()
+            await self.close()
+            return found["label"]
+
+        if keyboard_fallback:
+            for _ in range(index + 1):
+                await self.page.keyboard.press("ArrowDown")
+            await self.page.keyboard.press("Enter")
+            await self.close()
+            return f"option {index} (keyboard)"
+        return None
+
+    async def close(self):
+        """Make sure the listbox is gone, pressing Escape only while it is still open"""
+        # The listbox this driver opened is the one beyond those visible before
+        opened = f"{LISTBOX_SELECTOR} >> visible=true >> nth={self.baseline}"
+        if await self.waits.element_hidden(opened, timeout=500):
+            return
+        await self.page.keyboard.press("Escape")
+        await self.waits.element_hidden(opened, timeout=1000)
+
+    async def select(self, triggers: Sequence[Candidate], text: Optional[str] = None, index: int = 0,
+                     search: Optional[str] = None, exact: bool = False,
+                     keyboard_fallback: bool = False) -> Optional[str]:
+        """
+        Open the control, pick an option and close it
+
+        Args:
+            triggers: Selectors or locators of the control, in order of preference
+            text / index / search / exact / keyboard_fallback: See choose()
+
+        Returns:
+            str: Label of the picked option, None if the control or option was not found
+        """
+        if await self.open(triggers) is None:
+            return None
+        try:
+            label = await self.choose(text, index, search, exact, keyboard_fallback)
+        except Exception:
+            label = None
+        if label is None:
+            await self.close()
+        return label
@@ -0,0 +1,161 @@
+"""
+Context Recycling
+Creating a BrowserContext per test (options, basic auth, routes for the asset
+cache and network profile) costs more than wiping one. The recycler keeps
+idle contexts per setup key and resets them between tests: cookies and web
+storage are cleared, extra pages closed and a fresh tab left on about:blank.
+A context is only thrown away after a failed test or after N reuses.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+# Same-origin URL answered locally so storage can be cleared without a network round trip
+RESET_PATH = "/__context_reset__"
+
+CLEAR_STORAGE_JS = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        for (const db of await indexedDB.databases()) {
+            indexedDB.deleteDatabase(db.name);
+        }
+    }
+}
+"""
+
+
+class PooledContext:
+    """A recycled context with its current page and whatever setup created it"""
+
+    def __init__(self, context, key: Hashable, extra: Any = None):
+        self.context = context
+        self.key = key
+        self.extra = extra
+        self.page = None
+        self.uses = 0
+
+
+class ContextRecycler:
+    """Hands out reset contexts instead of creating a new one per test"""
+
+    def __init__(self, origin: str, max_reuses: int,
+                 is_reusable: Optional[Callable[["PooledContext"], bool]] = None):
+        """
+        Initialize context recycler
+
+        Args:
+            origin: App origin whose storage is cleared on reset
+            max_reuses: Tests a context may serve after its first one
+            is_reusable: Extra check before a context goes back to the pool
+                         (e.g. its seeded auth state is still current)
+        """
+        self.origin = origin.rstrip("/")
+        self.max_reuses = max_reuses
+        self.is_reusable = is_reusable
+        self._idle: Dict[Hashable, List[PooledContext]] = {}
+        self.created = 0
+        self.reused = 0
+        self.discarded = {"failure": 0, "limit": 0, "stale": 0}
+        self.create_times: List[float] = []
+        self.reset_times: List[float] = []
+
+    async def acquire(self, key: Hashable,
+                      create: Callable[[], Awaitable[Tuple[Any, Any]]]) -> PooledContext:
+        """
+        Get a context for a test: an idle one reset, or a new one
+
+        Args:
+            key: Setup the test needs; only contexts created for the same key are shared
+            create: Coroutine returning (context, extra) for a brand-new context
+
+        Returns:
+            PooledContext: Context with a fresh page on about:blank
+        """
+        idle = self._idle.get(key)
+        if idle:
+            pooled = idle.pop()
+            start = time.perf_counter()
+            try:
+                pooled.page = await self._reset(pooled.context)
+                self.reset_times.append(time.perf_counter() - start)
+                self.reused += 1
+                pooled.uses += 1
+                return pooled
+            except Exception as e:
+                print(f"⚠️ Context reset failed ({e}) - creating a new context")
+                await self._close(pooled)
+
+        start = time.perf_counter()
+        context, extra = await create()
+        await context.route(f"{self.origin}{RESET_PATH}", self._serve_blank)
+        pooled = PooledContext(context, key, extra)
+        pooled.page = await context.new_page()
+        pooled.uses = 1
+        self.create_times.append(time.perf_counter() - start)
+        self.created += 1
+        return pooled
+
+    async def release(self, pooled: PooledContext, failed: bool = False):
+        """
+        Return a context after its test
+
+        Args:
+            pooled: Context returned by acquire()
+            failed: The test failed - its context may be in any state, discard it
+        """
+        if failed:
+            reason = "failure"
+        elif pooled.uses > self.max_reuses:
+            reason = "limit"
+        elif self.is_reusable and not self.is_reusable(pooled):
+            reason = "stale"
+        else:
+            self._idle.setdefault(pooled.key, []).append(pooled)
+            return
+
+        self.discarded[reason] += 1
+        await self._close(pooled)
+
+    async def _reset(self, context):
+        """Wipe cookies, storage and pages; returns the new blank page"""
+        for page in list(context.pages):
+            await page.close()
+        await context.clear_cookies()
+
+        page = await context.new_page()
+        await page.goto(f"{self.origin}{RESET_PATH}")
+        await page.evaluate(CLEAR_STORAGE_JS)
+        await page.goto("about:blank")
+        return page
+
+    @staticmethod
+    async def _serve_blank(route):
+        await route.fulfill(status=200, content_type="text/html", body="<html><body></body></html>")
+
+    @staticmethod
+    async def _close(pooled: PooledContext):
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        """Close every idle context"""
+        for idle in self._idle.values():
+            for pooled in idle:
+                await self._close(pooled)
+        self._idle = {}
+
+    def summary(self) -> str:
+        """Reuse rate and reset vs. creation time"""
+        total = self.created + self.reused
+        reuse_rate = (self.reused / total * 100) if total else 0
+        avg_reset = (sum(self.reset_times) / len(self.reset_times) * 1000) if self.reset_times else 0
+        avg_create = (sum(self.create_times) / len(self.create_times) * 1000) if self.create_times else 0
+        discarded = ", ".join(f"{count} {reason}" for reason, count in self.discarded.items() if count)
+        return (f"♻️ Context recycling: {total} test(s), {self.reused} reused ({reuse_rate:.0f}%), "
+                f"avg reset {avg_reset:.0f}ms vs avg create {avg_create:.0f}ms"
+                f"{f', discarded: {discarded}' if discarded else ''}")
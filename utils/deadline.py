@@ -0,0 +1,232 @@
+"""
+Per-Test Deadlines
+A test can be given a time budget (@pytest.mark.deadline(seconds) or
+--test-deadline) that every bounded wait in the page objects draws from.
+Waits ask budget_timeout() for their timeout: while enough budget is left the
+requested bound is used unchanged, as the budget runs low the remaining
+fallbacks get whatever is left, and once it is spent each further wait gets a
+token timeout - a test that can no longer succeed runs through its remaining
+fallbacks in seconds instead of minutes. The time spent is charged to the
+page-object method that waited and reported with the failure.
+Plain Playwright actions (locator.click(), fill(), ...) use the page's default
+timeout instead; DefaultTimeout keeps that one within the budget as it drains.
+"""
+
+import sys
+import time
+import asyncio
+import contextvars
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+
+# Smallest timeout handed out once the budget is spent (Playwright treats 0 as "no timeout")
+EXHAUSTED_TIMEOUT_MS = 1
+
+# Seconds between re-applying a page's default timeout; bounds how far a plain action can overrun
+REFRESH_INTERVAL = 1.0
+
+# Frames skipped when naming the caller of a budgeted wait
+HELPER_MODULES = ("utils.deadline", "utils.wait_", "utils.selector_race", "utils.login_flow", "utils.routes")
+
+_current = contextvars.ContextVar("test_deadline", default=None)
+
+
+class DeadlineExceeded(AssertionError):
+    """The test ran out of its time budget"""
+
+
+def _caller() -> str:
+    """Page-object method behind a budgeted wait, e.g. InvoicingPage.create_customer"""
+    frame = sys._getframe(2)
+    while frame.f_back and frame.f_globals.get("__name__", "").startswith(HELPER_MODULES):
+        frame = frame.f_back
+    owner = frame.f_locals.get("self")
+    name = frame.f_code.co_name
+    return f"{type(owner).__name__}.{name}" if owner is not None else name
+
+
+class Deadline:
+    """Time budget of one test and where it went"""
+
+    def __init__(self, seconds: float, nodeid: str = ""):
+        """
+        Initialize deadline
+
+        Args:
+            seconds: Budget for setup, call and teardown together
+            nodeid: Test the budget belongs to
+        """
+        self.seconds = seconds
+        self.nodeid = nodeid
+        self.start = time.monotonic()
+        self.exhausted_at: Optional[float] = None
+        # caller -> [waits, seconds waited, waits cut short]
+        self.spent: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0])
+        self.phases: Dict[str, float] = {}
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(0.0, self.seconds - self.elapsed)
+
+    @property
+    def exhausted(self) -> bool:
+        if self.exhausted_at is None and self.remaining <= 0:
+            self.exhausted_at = self.elapsed
+        return self.exhausted_at is not None
+
+    def timeout(self, requested_ms: float, caller: str) -> float:
+        """
+        Timeout a wait may use
+
+        Args:
+            requested_ms: Bound the caller would use without a budget
+            caller: Method asking, charged if its wait is cut short
+
+        Returns:
+            float: requested_ms, or the remaining budget if that is less
+        """
+        timeout = self.cap(requested_ms)
+        if self.exhausted or timeout != requested_ms:
+            self.spent[caller][2] += 1
+        return timeout
+
+    def cap(self, requested_ms: float) -> float:
+        """requested_ms clamped to the remaining budget, without charging anyone"""
+        if self.exhausted:
+            return EXHAUSTED_TIMEOUT_MS
+        remaining_ms = self.remaining * 1000
+        if requested_ms is None or requested_ms <= 0 or requested_ms > remaining_ms:
+            # Playwright's "no timeout" (0) would outlive the budget too
+            return max(EXHAUSTED_TIMEOUT_MS, remaining_ms)
+        return requested_ms
+
+    def charge(self, caller: str, seconds: float):
+        """Record time a method spent waiting"""
+        stats = self.spent[caller]
+        stats[0] += 1
+        stats[1] += seconds
+
+    def check(self, step: str = ""):
+        """
+        Fail the test if the budget is spent
+
+        For test bodies between steps - page-object helpers swallow exceptions,
+        so they shrink their timeouts instead of calling this.
+        """
+        if self.exhausted:
+            where = f" before {step}" if step else ""
+            raise DeadlineExceeded(f"Test deadline of {self.seconds:.0f}s exceeded{where}\n{self.report()}")
+
+    def report(self, top: int = 10) -> str:
+        """Budget, time per phase and the methods that waited longest"""
+        lines = [f"⏳ Deadline {self.seconds:.0f}s for {self.nodeid or 'test'}: "
+                 f"{self.elapsed:.1f}s used"
+                 + (f", spent after {self.exhausted_at:.1f}s" if self.exhausted_at is not None else "")]
+        if self.phases:
+            lines.append("   " + ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in self.phases.items()))
+        waited = sum(seconds for _, seconds, _ in self.spent.values())
+        if self.spent:
+            lines.append(f"   Waiting: {waited:.1f}s - longest waiting methods:")
+            for caller, (waits, seconds, cut) in sorted(self.spent.items(), key=lambda item: -item[1][1])[:top]:
+                lines.append(f"   {seconds:>7.1f}s  {int(waits):>3} waits"
+                             f"{f'  {int(cut)} cut short' if cut else ''}  {caller}")
+        return "\n".join(lines)
+
+
+class DefaultTimeout:
+    """
+    Keeps a page's default Playwright timeout within the running test's budget
+
+    The default timeout is read when an action starts, so setting it once
+    leaves plain actions with the budget the test had when the page was made.
+    While started it is re-applied every interval seconds: an action overruns
+    the budget by at most one interval, and once the budget is spent every
+    action gets the token timeout and fails at once.
+    """
+
+    def __init__(self, page, requested_ms: float, deadline: Optional[Deadline] = None,
+                 interval: float = REFRESH_INTERVAL):
+        """
+        Initialize default timeout
+
+        Args:
+            page: Playwright page
+            requested_ms: Default timeout without a budget
+            deadline: Budget to follow, defaults to the running test's
+            interval: Seconds between re-applying the timeout
+        """
+        self.page = page
+        self.requested_ms = requested_ms
+        self.deadline = deadline or current()
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def apply(self) -> float:
+        """Set the page's default timeout from the budget left now"""
+        timeout = self.deadline.cap(self.requested_ms) if self.deadline else self.requested_ms
+        self.page.set_default_timeout(timeout)
+        return timeout
+
+    async def _follow(self):
+        while not self.deadline.exhausted:
+            await asyncio.sleep(min(self.interval, max(self.deadline.remaining, 0.01)))
+            self.apply()
+
+    def start(self) -> "DefaultTimeout":
+        """Apply the timeout and, with a budget, keep following it"""
+        self.apply()
+        if self.deadline is not None:
+            self._task = asyncio.ensure_future(self._follow())
+        return self
+
+    async def stop(self):
+        """Stop following the budget"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+def start(seconds: float, nodeid: str = "") -> contextvars.Token:
+    """Give the current test a budget; returns the token for finish()"""
+    return _current.set(Deadline(seconds, nodeid))
+
+
+def finish(token: contextvars.Token) -> Optional[Deadline]:
+    """End the current test's budget and return it"""
+    deadline = _current.get()
+    _current.reset(token)
+    return deadline
+
+
+def current() -> Optional[Deadline]:
+    """Budget of the running test, None when it has none"""
+    return _current.get()
+
+
+def budget_timeout(requested_ms: float) -> float:
+    """requested_ms clamped to the running test's remaining budget (unchanged without one)"""
+    deadline = _current.get()
+    if deadline is None:
+        return requested_ms
+    return deadline.timeout(requested_ms, _caller())
+
+
+def charge(seconds: float, caller: Optional[str] = None):
+    """Charge waited time to the running test's budget, if it has one"""
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.charge(caller or _caller(), seconds)
+
+
+def check(step: str = ""):
+    """Fail the running test if its budget is spent (no-op without one)"""
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.check(step)
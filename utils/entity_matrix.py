@@ -0,0 +1,157 @@
+"""
+Entity Matrix
+Read-only suites can run once per entity (--entities or
+@pytest.mark.entities) on the login they already share: instead of a new
+login per entity, the logged-in page is switched from entity to entity.
+
+- An entity with a known id is opened by its entity-scoped URL - the current
+  screen with ?entityId= replaced - in one navigation
+- An entity given by name is picked in the entity selector; the entityId the
+  app then shows in the URL is remembered, so later switches use the URL
+- Shared read-only pages are reset straight onto the test's entity
+  (SharedLoggedInPage.reset(entity_id)), so most switches cost nothing extra
+- A switch drops only state that depends on the entity: the selector resolver
+  forgets which entity-selector button matched (its label is the entity
+  name). Session, context, asset cache and all other selector statistics are
+  kept.
+"""
+
+import time
+import weakref
+from typing import List, Optional
+
+from pages.entity_selector_page import EntitySelectorPage
+from utils.deadline import budget_timeout
+from utils.routes import entity_id_of, with_entity
+from utils.selector_resolver import environment_of, selector_resolver
+
+
+# Resolver keys whose matching selector depends on the selected entity
+ENTITY_DEPENDENT_SELECTOR_KEYS = ("EntitySelectorPage.entity_selectors",)
+
+
+class Entity:
+    """One entity of the matrix, by name, id or both"""
+
+    def __init__(self, name: Optional[str] = None, entity_id: Optional[str] = None):
+        self.name = name
+        self.entity_id = str(entity_id) if entity_id is not None else None
+
+    @classmethod
+    def parse(cls, spec: str) -> "Entity":
+        """'7' (id), 'Viewz Demo INC' (name) or 'Viewz Demo INC=7' (both)"""
+        spec = spec.strip()
+        if "=" in spec:
+            name, entity_id = spec.rsplit("=", 1)
+            return cls(name.strip(), entity_id.strip())
+        return cls(entity_id=spec) if spec.isdigit() else cls(name=spec)
+
+    @property
+    def label(self) -> str:
+        """Test id of the entity"""
+        return self.name or f"entity-{self.entity_id}"
+
+    def __repr__(self):
+        return f"Entity({self.label!r}, id={self.entity_id})"
+
+
+def parse_entities(specs) -> List[Entity]:
+    """Entities from a comma-separated string or a list of specs"""
+    if isinstance(specs, str):
+        specs = specs.split(",")
+    return [Entity.parse(spec) for spec in specs or [] if spec and spec.strip()]
+
+
+class EntitySwitcher:
+    """Moves one logged-in page between entities"""
+
+    def __init__(self, page, stats: Optional["EntityMatrixStats"] = None):
+        """
+        Initialize entity switcher
+
+        Args:
+            page: Logged-in Playwright page
+            stats: Run totals to add switches to
+        """
+        self.page = page
+        self.stats = stats
+        self.selector = EntitySelectorPage(page)
+        self.current: Optional[Entity] = None
+
+    async def switch(self, entity: Entity) -> bool:
+        """
+        Make entity the page's selected entity
+
+        Returns:
+            bool: True if the page is on the entity
+        """
+        if entity.entity_id is not None and entity_id_of(self.page.url) == entity.entity_id:
+            # Already there (e.g. the shared page was reset onto it)
+            if self.current is not entity:
+                if self.stats:
+                    self.stats.add("landing", 0.0, True)
+                self.invalidate(entity)
+            return True
+
+        start = time.perf_counter()
+        if entity.entity_id is not None:
+            how = "url"
+            await self.page.goto(with_entity(self.page.url, entity.entity_id), timeout=budget_timeout(30000))
+            await self.selector.waits.settled()
+            switched = "/login" not in self.page.url and entity_id_of(self.page.url) == entity.entity_id
+        else:
+            how = "selector"
+            switched = await self.selector.select_entity(entity.name)
+            if switched and entity_id_of(self.page.url):
+                entity.entity_id = entity_id_of(self.page.url)
+
+        seconds = time.perf_counter() - start
+        if self.stats:
+            self.stats.add(how, seconds, switched)
+        if not switched:
+            print(f"⚠️ Could not switch to {entity.label} ({self.page.url})")
+            return False
+        print(f"🏢 Switched to {entity.label} via {how} in {seconds:.1f}s")
+        self.invalidate(entity)
+        return True
+
+    def invalidate(self, entity: Entity):
+        """Drop the state that belonged to the previous entity"""
+        self.current = entity
+        environment = environment_of(self.page.url)
+        for key in ENTITY_DEPENDENT_SELECTOR_KEYS:
+            selector_resolver.forget_winner(environment, key)
+
+
+class EntityMatrixStats:
+    """Run-wide entity switches, one switcher per logged-in page"""
+
+    def __init__(self):
+        self.switches = {"landing": [], "url": [], "selector": []}
+        self.failed = 0
+        self._switchers = weakref.WeakKeyDictionary()
+
+    def switcher(self, page) -> EntitySwitcher:
+        """The page's switcher (created on first use)"""
+        if page not in self._switchers:
+            self._switchers[page] = EntitySwitcher(page, self)
+        return self._switchers[page]
+
+    def add(self, how: str, seconds: float, switched: bool):
+        if switched:
+            self.switches[how].append(seconds)
+        else:
+            self.failed += 1
+
+    def summary(self) -> str:
+        done = sum(len(samples) for samples in self.switches.values())
+        parts = [f"{len(samples)} on {how}" if how == "landing" else
+                 f"{len(samples)} via {how} (avg {sum(samples) / len(samples):.1f}s)"
+                 for how, samples in self.switches.items() if samples]
+        return (f"🏢 Entity matrix: {done} switch(es) without re-login"
+                + (f" - {', '.join(parts)}" if parts else "")
+                + (f", {self.failed} failed" if self.failed else ""))
+
+
+# Global instance
+entity_matrix = EntityMatrixStats()
@@ -0,0 +1,119 @@
+"""
+Export Capture
+Takes an exported file straight into memory instead of saving the download
+to a downloads folder and opening it again:
+
+- the click that starts the export runs under page.expect_download() and the
+  completed download is read once; the file is always the one the browser
+  downloaded, never an XHR body that may only be the data the client turns
+  into the file
+- Playwright's download copy is deleted once the file is in memory, so
+  nothing is left behind between runs
+- files above the spill threshold are read from Playwright's copy where it
+  is; close() deletes it through the Download, so it does not outlive the
+  test in a recycled browser context
+- keep() writes the file to an artifacts folder, for tests that failed
+
+CapturedExport.source() feeds utils/export_reader.ExportReader directly.
+"""
+
+import io
+import os
+import re
+import shutil
+from typing import Awaitable, Callable, Optional
+
+from utils.deadline import budget_timeout
+
+
+# Larger exports are read from disk instead of memory
+SPILL_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+class CapturedExport:
+    """An exported file, held in memory or - past the spill threshold - on disk"""
+
+    def __init__(self, filename: str, data: Optional[bytes] = None, path: Optional[str] = None,
+                 download=None):
+        """
+        Initialize captured export
+
+        Args:
+            filename: Name the app gave the file
+            data: File content when held in memory
+            path: File on disk when spilled
+            download: Playwright Download behind path, deleted by close()
+        """
+        self.filename = filename
+        self.data = data
+        self.path = path
+        self.download = download
+        self.size = len(data) if data is not None else os.path.getsize(path)
+
+    @property
+    def in_memory(self) -> bool:
+        return self.data is not None
+
+    def source(self):
+        """The file for ExportReader: a binary stream over the bytes, or the spilled path"""
+        return io.BytesIO(self.data) if self.in_memory else self.path
+
+    def keep(self, directory: str, prefix: str = "") -> str:
+        """
+        Write the file to directory (for a failed test's artifacts)
+
+        Returns:
+            str: Path of the kept file
+        """
+        os.makedirs(directory, exist_ok=True)
+        name = re.sub(r"[^\w.-]", "_", f"{prefix}_{self.filename}" if prefix else self.filename)
+        target = os.path.join(directory, name)
+        if self.in_memory:
+            with open(target, "wb") as f:
+                f.write(self.data)
+        else:
+            shutil.copyfile(self.path, target)
+        return target
+
+    async def close(self):
+        """Release the content (deletes Playwright's copy of a spilled download)"""
+        self.data = None
+        if self.download is not None:
+            await self.download.delete()
+            self.download = None
+
+    def summary(self) -> str:
+        where = "in memory" if self.in_memory else f"on disk ({self.path})"
+        return f"📥 Export {self.filename}: {self.size / 1024:.0f} KB, {where}"
+
+
+async def capture_export(page, trigger: Callable[[], Awaitable], timeout: float = 30000,
+                         spill_threshold: int = SPILL_THRESHOLD_BYTES) -> CapturedExport:
+    """
+    Start an export and capture its file
+
+    Args:
+        page: Playwright page
+        trigger: Starts the export, e.g. an Export button's click
+        timeout: Wait for the download in ms (clamped to the test's deadline)
+        spill_threshold: Files larger than this many bytes stay on disk
+
+    Returns:
+        CapturedExport: The exported file
+
+    Raises:
+        Playwright's TimeoutError if no download starts
+    """
+    async with page.expect_download(timeout=budget_timeout(timeout)) as download_info:
+        await trigger()
+    download = await download_info.value
+    path = await download.path()  # the completed download
+    filename = download.suggested_filename or "export.xlsx"
+
+    if os.path.getsize(path) > spill_threshold:
+        # Read where Playwright put it; close() deletes it
+        return CapturedExport(filename, path=path, download=download)
+    with open(path, "rb") as f:
+        data = f.read()
+    await download.delete()
+    return CapturedExport(filename, data=data)
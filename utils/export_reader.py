@@ -0,0 +1,145 @@
+"""
+Export Reader
+Streams the rows of an exported grid (CSV or Excel) instead of loading the
+whole file and copying it again to drop blank rows:
+
+- the format is told by the first bytes (XLSX files are ZIP archives, "PK")
+- XLSX is read with openpyxl in read-only mode, which parses the sheet as the
+  rows are asked for; CSV is read line by line (UTF-8, BOM dropped)
+- the header row is found while reading: metadata rows before it ("Export
+  Date: ...", blank rows) are skipped, at most the first few rows are held
+- cells come out as strings (empty cells as ""), blank rows are dropped
+
+A file, a path or a binary stream (e.g. an in-memory download) can be read.
+"""
+
+import csv
+import io
+import itertools
+import os
+import time
+from contextlib import nullcontext
+from typing import Iterator, List, Optional, Tuple
+
+
+# First cell of a header row (lower case)
+HEADER_FIRST_CELLS = frozenset({"status", "date", "id", "name", "description", "supplier"})
+
+# Rows looked at for the header before the first row is taken as the header
+HEADER_SCAN_ROWS = 7
+
+
+def _cell(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _is_blank(row: List[str]) -> bool:
+    return not any(cell.strip() for cell in row)
+
+
+def _open_binary(source):
+    """Open a path; a stream given by the caller is used as is and not closed"""
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return open(source, "rb")
+    return nullcontext(source)
+
+
+def _xlsx_rows(stream) -> Iterator[List[str]]:
+    import openpyxl  # optional - only Excel exports need it
+
+    workbook = openpyxl.load_workbook(stream, read_only=True)
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            yield [_cell(value) for value in row]
+    finally:
+        workbook.close()
+
+
+def _csv_rows(stream) -> Iterator[List[str]]:
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        yield from csv.reader(text)
+    finally:
+        text.detach()
+
+
+class ExportReader:
+    """One pass over an exported file"""
+
+    def __init__(self, source, header_scan: int = HEADER_SCAN_ROWS):
+        """
+        Initialize export reader
+
+        Args:
+            source: Path of the export, or a seekable binary stream
+            header_scan: Rows looked at for a known header before the first row is used
+        """
+        self.source = source
+        self.header_scan = header_scan
+        self.format: Optional[str] = None
+        self.headers: List[str] = []
+        self.header_index = 0
+        self.rows_read = 0
+        self.blank_rows = 0
+        self.seconds = 0.0
+        self._start = 0.0
+
+    def _raw_rows(self) -> Iterator[List[str]]:
+        with _open_binary(self.source) as stream:
+            head = stream.read(4)
+            stream.seek(0)
+            if head[:2] == b"PK":
+                self.format = "xlsx"
+                yield from _xlsx_rows(stream)
+            else:
+                self.format = "csv"
+                yield from _csv_rows(stream)
+
+    def open(self) -> Tuple[List[str], Iterator[List[str]]]:
+        """
+        Read up to the header row
+
+        Returns:
+            tuple: (headers, rows) - rows is a generator over the data rows
+                   after the header, blank rows dropped
+        """
+        self._start = time.perf_counter()
+        raw = self._raw_rows()
+        held = []
+        index = 0
+        for row in raw:
+            held.append(row)
+            first = row[0].lower().strip() if row else ""
+            if first in HEADER_FIRST_CELLS:
+                index = len(held) - 1
+                break
+            if len(held) >= self.header_scan:
+                break
+
+        if not held:
+            self.seconds = time.perf_counter() - self._start
+            return [], iter(())
+        self.header_index = index
+        self.headers = held[index]
+        return self.headers, self._data_rows(itertools.chain(held[index + 1:], raw))
+
+    def _data_rows(self, rows) -> Iterator[List[str]]:
+        for row in rows:
+            if _is_blank(row):
+                self.blank_rows += 1
+                continue
+            self.rows_read += 1
+            yield row
+        self.seconds = time.perf_counter() - self._start
+
+    def summary(self) -> str:
+        skipped = f", skipped {self.header_index} metadata rows" if self.header_index else ""
+        return (f"✅ {(self.format or '?').upper()} export has {len(self.headers)} columns and "
+                f"{self.rows_read} data rows{skipped} (read in {self.seconds:.2f}s)")
+
+
+def read_export(source) -> Tuple[List[str], List[List[str]]]:
+    """Headers and all data rows of an export"""
+    reader = ExportReader(source)
+    headers, rows = reader.open()
+    return headers, list(rows)
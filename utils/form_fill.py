@@ -0,0 +1,328 @@
+"""
+Declarative Form Fill
+Page objects describe a dialog as a list of Fields (how to find each control
+and what kind it is) instead of filling one input at a time with its own
+visibility check. FormFiller walks the spec in order:
+
+- consecutive text fields are filled in ONE in-page call: each input is found
+  by placeholder, label or CSS selector, set through the native value setter
+  and sent bubbling input/change/blur events, so React's controlled inputs and
+  form validation see the change exactly as if it had been typed
+- fields the batch could not find (or whose value did not stick) are retried
+  with a regular Playwright fill
+- dropdowns go through the shared combobox driver, checkboxes are clicked only
+  when unchecked, and anything special runs as a custom step
+
+Every field's time is recorded; the run prints time per form at the end.
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from utils.combobox import Combobox
+from utils.selector_race import Candidate, first_visible
+from utils.wait_engine import WaitEngine
+
+
+# Finds and sets every text field of one batch; returns per-field outcome and in-page time
+FILL_FIELDS_JS = """
+(fields) => {
+    const isVisible = el => {
+        const rect = el.getBoundingClientRect();
+        return el.type !== 'hidden' && rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const dialogs = [...document.querySelectorAll("[role='dialog'], [role='alertdialog']")].filter(isVisible);
+    const scope = dialogs.length ? dialogs[dialogs.length - 1] : document;
+    const inputs = [...scope.querySelectorAll('input, textarea')].filter(isVisible);
+    const used = new Set();
+    const free = el => el && !used.has(el) && !el.disabled && !el.readOnly;
+    const clean = text => (text || '').replace(/[*:]/g, '').replace(/\\s+/g, ' ').trim().toLowerCase();
+
+    const byPlaceholder = wanted => {
+        const exact = inputs.find(el => free(el) && clean(el.placeholder) === clean(wanted));
+        return exact || inputs.find(el => free(el) && clean(el.placeholder).includes(clean(wanted)));
+    };
+    const byLabel = wanted => {
+        for (const label of scope.querySelectorAll('label')) {
+            if (clean(label.textContent) !== clean(wanted)) continue;
+            const control = label.control || label.parentElement?.querySelector('input, textarea');
+            if (free(control) && isVisible(control)) return control;
+        }
+        return null;
+    };
+    const bySelector = selector => {
+        try {
+            return [...scope.querySelectorAll(selector)].find(el => free(el) && isVisible(el));
+        } catch (e) {
+            return null;  // Playwright-only syntax (:has-text, >>) - left to the fallback
+        }
+    };
+
+    return fields.map(field => {
+        const start = performance.now();
+        let el = null, how = null;
+        for (const placeholder of field.placeholders) {
+            if ((el = byPlaceholder(placeholder))) { how = `placeholder '${placeholder}'`; break; }
+        }
+        if (!el && field.label && (el = byLabel(field.label))) how = `label '${field.label}'`;
+        for (const selector of field.selectors) {
+            if (el) break;
+            if ((el = bySelector(selector))) how = selector;
+        }
+        if (!el) return { key: field.key, found: false, ok: false, how: null, ms: performance.now() - start };
+
+        used.add(el);
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        el.focus();
+        // React tracks the last value it saw; the native setter bypasses that so the events register
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, field.value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        el.dispatchEvent(new FocusEvent('blur'));
+        el.dispatchEvent(new FocusEvent('focusout', { bubbles: true }));
+        return { key: field.key, found: true, ok: el.value === field.value, how, ms: performance.now() - start };
+    });
+}
+"""
+
+
+class Field:
+    """One control of a form and how to find it"""
+
+    TEXT = "text"
+    SELECT = "select"
+    CHECKBOX = "checkbox"
+    CUSTOM = "custom"
+
+    def __init__(self, key: str, kind: str = TEXT, placeholder=None, label: Optional[str] = None,
+                 selectors: Sequence[str] = (), triggers: Sequence[Candidate] = (),
+                 default: Any = None, index: Optional[int] = None, search: Optional[int] = None,
+                 action: Optional[Callable[[Any], Awaitable[Any]]] = None, name: Optional[str] = None):
+        """
+        Initialize field
+
+        Args:
+            key: Key of the value in the data dict passed to fill()
+            kind: Field.TEXT, SELECT, CHECKBOX or CUSTOM
+            placeholder: Placeholder text (or list of them) of a text input; exact match preferred
+            label: Label text of the control
+            selectors: CSS/Playwright selectors of a text input, tried after placeholder and label
+            triggers: Selectors or locators that open a dropdown / toggle a checkbox
+            default: Value used when the data has none (None = skip text fields)
+            index: Dropdown option to take when no value is given or the value is not listed
+            search: Type this many characters of the value to filter a searchable dropdown
+            action: Coroutine function(value) for CUSTOM fields, returning a truthy result on success
+            name: Name used in output (defaults to key)
+        """
+        self.key = key
+        self.kind = kind
+        self.placeholders = [placeholder] if isinstance(placeholder, str) else list(placeholder or [])
+        self.label = label
+        self.selectors = list(selectors)
+        self.triggers = list(triggers)
+        self.default = default
+        self.index = index
+        self.search = search
+        self.action = action
+        self.name = name or key
+
+
+class FormResult:
+    """Outcome and time of each field of one fill()"""
+
+    def __init__(self, form: str):
+        self.form = form
+        self.fields: Dict[str, Dict] = {}
+        self.round_trips = 0
+        self.start = time.perf_counter()
+        self.seconds = 0.0
+
+    def add(self, field: Field, ok: bool, how: str, seconds: float, value: Any = None):
+        self.fields[field.key] = {"ok": bool(ok), "how": how, "ms": round(seconds * 1000, 1), "value": value}
+
+    def ok(self, key: str) -> bool:
+        return self.fields.get(key, {}).get("ok", False)
+
+    @property
+    def filled(self) -> int:
+        return sum(1 for field in self.fields.values() if field["ok"])
+
+    @property
+    def missing(self) -> List[str]:
+        return [key for key, field in self.fields.items() if not field["ok"]]
+
+    def summary(self) -> str:
+        lines = [f"📝 {self.form}: {self.filled}/{len(self.fields)} fields in {self.seconds:.2f}s "
+                 f"({self.round_trips} text round trip(s))"]
+        for key, field in self.fields.items():
+            lines.append(f"   {'✅' if field['ok'] else '⚠️'} {key:<20} {field['ms']:>8.1f}ms  {field['how']}")
+        return "\n".join(lines)
+
+
+class FormTimings:
+    """Run-wide fill time per form"""
+
+    def __init__(self):
+        self.forms: Dict[str, List[float]] = defaultdict(list)
+        self.fields: Dict[str, int] = defaultdict(int)
+
+    def add(self, result: FormResult):
+        self.forms[result.form].append(result.seconds)
+        self.fields[result.form] = max(self.fields[result.form], len(result.fields))
+
+    def summary(self) -> str:
+        lines = [f"📝 Form fill over {sum(len(s) for s in self.forms.values())} form(s):"]
+        for form, samples in sorted(self.forms.items()):
+            lines.append(f"   {form:<28} {len(samples):>3}x  {self.fields[form]:>2} fields  "
+                         f"avg {sum(samples) / len(samples):.2f}s  max {max(samples):.2f}s")
+        return "\n".join(lines)
+
+
+class FormFiller:
+    """Fills a form described by a list of Fields"""
+
+    def __init__(self, page, waits: Optional[WaitEngine] = None, combobox: Optional[Combobox] = None):
+        """
+        Initialize form filler
+
+        Args:
+            page: Playwright page
+            waits: Wait engine of the page object (a new one if omitted)
+            combobox: Combobox driver of the page object (a new one if omitted)
+        """
+        self.page = page
+        self.waits = waits or WaitEngine(page)
+        self.combobox = combobox or Combobox(page, self.waits)
+
+    async def fill(self, form: str, spec: Sequence[Field], data: Dict[str, Any]) -> FormResult:
+        """
+        Fill every field of spec from data, in spec order
+
+        Args:
+            form: Name of the form, for output and run totals
+            spec: The form's fields
+            data: Values by field key; fields without a value use their default
+
+        Returns:
+            FormResult: Per-field outcome and timing
+        """
+        result = FormResult(form)
+        batch: List[Field] = []
+        for field in spec:
+            if field.kind == Field.TEXT:
+                batch.append(field)
+                continue
+            await self._fill_text(batch, data, result)
+            batch = []
+            await self._fill_special(field, data.get(field.key, field.default), result)
+        await self._fill_text(batch, data, result)
+
+        result.seconds = time.perf_counter() - result.start
+        form_timings.add(result)
+        print(result.summary())
+        return result
+
+    async def _fill_text(self, fields: List[Field], data: Dict[str, Any], result: FormResult):
+        """All text fields with a value in one in-page call, then fallbacks for the misses"""
+        values = {}
+        for field in fields:
+            value = data.get(field.key, field.default)
+            if value is not None:
+                values[field.key] = str(value)
+        fields = [field for field in fields if field.key in values]
+        if not fields:
+            return
+
+        start = time.perf_counter()
+        try:
+            outcomes = await self.page.evaluate(FILL_FIELDS_JS, [
+                {"key": f.key, "placeholders": f.placeholders, "label": f.label,
+                 "selectors": f.selectors, "value": values[f.key]} for f in fields
+            ])
+        except Exception:
+            outcomes = [{"key": f.key, "ok": False, "how": None, "ms": 0} for f in fields]
+        result.round_trips += 1
+        # The round trip itself is shared evenly; in-page time is per field
+        share = (time.perf_counter() - start) / len(fields)
+
+        for field, outcome in zip(fields, outcomes):
+            if outcome["ok"]:
+                result.add(field, True, f"batch via {outcome['how']}", share, values[field.key])
+                continue
+            fallback_start = time.perf_counter()
+            how = await self._fill_with_locator(field, values[field.key])
+            result.add(field, how is not None, f"fallback via {how}" if how else "not found",
+                       share + time.perf_counter() - fallback_start, values[field.key])
+
+    def _candidates(self, field: Field) -> List[Candidate]:
+        candidates = [self.page.get_by_placeholder(p) for p in field.placeholders]
+        if field.label:
+            candidates.append(self.page.get_by_label(field.label))
+        return candidates + field.selectors
+
+    async def _fill_with_locator(self, field: Field, value: str) -> Optional[str]:
+        """Regular Playwright fill of one field (real keyboard input)"""
+        index, element = await first_visible(self.page, self._candidates(field))
+        if element is None:
+            return None
+        try:
+            await element.first.fill(value)
+        except Exception:
+            return None
+        candidate = self._candidates(field)[index]
+        return candidate if isinstance(candidate, str) else f"locator {index}"
+
+    async def _fill_special(self, field: Field, value: Any, result: FormResult):
+        start = time.perf_counter()
+        try:
+            if field.kind == Field.SELECT:
+                picked = await self._select(field, value)
+                result.add(field, picked is not None, f"option '{picked}'" if picked else "not selected",
+                           time.perf_counter() - start, picked)
+            elif field.kind == Field.CHECKBOX:
+                how = await self._check(field) if value is not False else "left unchecked"
+                result.add(field, how is not None, how or "not found", time.perf_counter() - start, value)
+            else:
+                outcome = await field.action(value)
+                result.add(field, bool(outcome), "custom step", time.perf_counter() - start,
+                           outcome if isinstance(outcome, str) else value)
+        except Exception as e:
+            result.add(field, False, f"error: {str(e)[:40]}", time.perf_counter() - start)
+
+    async def _select(self, field: Field, value: Any) -> Optional[str]:
+        """The value's option (optionally typed ahead), else option `index`"""
+        if await self.combobox.open(field.triggers) is None:
+            return None
+        picked = None
+        if value is not None:
+            text = str(value)
+            picked = await self.combobox.choose(text=text, search=text[:field.search] if field.search else None,
+                                                index=field.index or 0)
+        if picked is None and (value is None or field.index is not None):
+            picked = await self.combobox.choose(index=field.index or 0)
+        if picked is None:
+            await self.combobox.close()
+        return picked
+
+    async def _check(self, field: Field) -> Optional[str]:
+        """Click the checkbox (or its label) unless it is already checked"""
+        index, element = await first_visible(self.page, field.triggers)
+        if element is None:
+            return None
+        element = element.first
+        checked = await element.evaluate(
+            "el => { const box = el.matches('input, [role=checkbox]') ? el"
+            " : el.closest('label, div')?.querySelector('input[type=checkbox], [role=checkbox]');"
+            " return !!box && (box.checked === true || box.getAttribute('aria-checked') === 'true'); }"
+        )
+        if not checked:
+            await element.click()
+            await self.waits.dom_quiet(quiet_ms=150)
+            return f"checked via trigger {index}"
+        return "already checked"
+
+
+# Global instance
+form_timings = FormTimings()
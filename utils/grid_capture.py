@@ -0,0 +1,425 @@
+"""
+Grid Capture
+The reconciliation grids (Payables, Receivables, Bank, Credit Cards) are
+filled from JSON list responses, so the whole dataset can be taken from the
+network instead of clicking "next page" and scraping each page of the DOM:
+
+- GridCapture listens to the page's XHR/fetch responses from before the grid
+  loads; responses of the grid's list endpoint (GRID_ENDPOINTS) with a list of
+  records in their JSON are kept
+- responses for the same query (same URL and body, paging parameters aside)
+  add up to one dataset; a new query - e.g. after changing the date filter -
+  starts a new dataset
+- rows() streams the records of the current dataset as they arrive, each
+  record once, and ends when the reported total is reached or no more arrive
+- fetch_remaining() asks the endpoint once for the whole dataset (page size =
+  reported total) when it is paginated, instead of paging through the grid
+- project_records() lays records out in the columns of the export, so the
+  captured data compares like scraped rows: a header takes the JSON path
+  GRID_COLUMNS gives it, else the field of exactly the same name; the key
+  columns of the module's reconciliation schema must all be found
+- agrees_with_grid() checks the projection against the rendered first page
+  before it is trusted
+
+Callers fall back to reading the DOM when no matching response was seen or
+the projection does not show what the grid shows.
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from utils.deadline import budget_timeout
+from utils.reconciliation import Schema, reconcile
+from utils.routes import route_name
+
+
+# URL fragments of each grid's list endpoint (lower case, '-' and '_' ignored)
+GRID_ENDPOINTS = {
+    "PayablesPage": ("/docs/getentitydocuments", "payable", "bills"),
+    "ReceivablesPage": ("/docs/getentitydocuments", "receivable", "invoices"),
+    "BankPage": ("/banks/getbanktransactionsdata", "banktransaction"),
+    # Not the bank endpoint: a bank-transactions response would be read as the card grid
+    "CreditCardPage": ("creditcard",),
+}
+
+# Export header (letters and digits, lower case) -> JSON path of the record
+# field behind it, for headers the field names do not spell out; other headers
+# take the field of exactly the same name
+GRID_COLUMNS = {
+    "PayablesPage": {"supplier": "supplier.name", "id": "documentNumber"},
+    "ReceivablesPage": {"customer": "customer.name", "id": "documentNumber"},
+    "BankPage": {},
+    "CreditCardPage": {},
+}
+
+# Keys a list payload keeps its records and its total under
+ROW_LIST_KEYS = ("data", "items", "rows", "results", "records", "documents", "transactions", "list", "content")
+TOTAL_KEYS = ("total", "totalCount", "total_count", "totalRecords", "totalElements", "count")
+
+# Keys that identify a record
+ID_KEYS = ("id", "_id", "uuid", "documentId", "document_id", "transactionId", "transaction_id")
+
+# Paging parameters: page size ones are raised by fetch_remaining(), all are
+# ignored when telling datasets apart
+PAGE_SIZE_PARAMS = ("limit", "pageSize", "page_size", "perPage", "per_page", "size", "take")
+PAGE_PARAMS = PAGE_SIZE_PARAMS + ("page", "pageNumber", "page_number", "pageIndex", "offset", "skip", "start", "cursor")
+
+TRACKED_TYPES = ("xhr", "fetch")
+
+
+def _squash(text: str) -> str:
+    return text.lower().replace("-", "").replace("_", "")
+
+
+def _field_name(text: str) -> str:
+    """Column header or record key reduced to letters and digits"""
+    return re.sub(r"[^a-z0-9]", "", str(text).lower())
+
+
+def _json_body(post_data: Optional[str]):
+    try:
+        return json.loads(post_data) if post_data else None
+    except ValueError:
+        return None
+
+
+def extract_rows(payload) -> Tuple[Optional[List[dict]], Optional[int]]:
+    """
+    Records and total of a list payload
+
+    Args:
+        payload: Decoded JSON of a response
+
+    Returns:
+        tuple: (records, total) - records is None if the payload holds no list of records
+    """
+    if isinstance(payload, list):
+        return (payload, None) if all(isinstance(item, dict) for item in payload) else (None, None)
+    if not isinstance(payload, dict):
+        return None, None
+
+    total = next((payload[key] for key in TOTAL_KEYS if isinstance(payload.get(key), int)), None)
+    for key in ROW_LIST_KEYS:
+        value = payload.get(key)
+        if isinstance(value, (list, dict)):
+            rows, nested_total = extract_rows(value)
+            if rows is not None:
+                return rows, nested_total if nested_total is not None else total
+    return None, None
+
+
+def record_key(record: dict) -> str:
+    """Identity of a record - its id, or its whole content when it has none"""
+    for key in ID_KEYS:
+        if record.get(key) not in (None, ""):
+            return f"{key}={record[key]}"
+    return json.dumps(record, sort_keys=True, default=str)
+
+
+def dataset_key(url: str, post_data: Optional[str] = None) -> str:
+    """The query behind a list response, paging parameters left out"""
+    parsed = urlparse(url)
+    query = sorted((k, v) for k, v in parse_qsl(parsed.query) if k not in PAGE_PARAMS)
+    body = _json_body(post_data)
+    if isinstance(body, dict):
+        body = {k: v for k, v in body.items() if k not in PAGE_PARAMS}
+    elif body is None and post_data:
+        body = post_data
+    return json.dumps([parsed.path, query, body], sort_keys=True, default=str)
+
+
+def with_page_size(url: str, post_data: Optional[str], size: int) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    The same list request asking for size records per page
+
+    Returns:
+        tuple: (url, post_data), None if the request has no page size parameter
+    """
+    parsed = urlparse(url)
+    query = parse_qsl(parsed.query)
+    changed = False
+    if any(k in PAGE_SIZE_PARAMS for k, _ in query):
+        query = [(k, str(size) if k in PAGE_SIZE_PARAMS else v) for k, v in query]
+        url = parsed._replace(query=urlencode(query)).geturl()
+        changed = True
+    body = _json_body(post_data)
+    if isinstance(body, dict) and any(k in PAGE_SIZE_PARAMS for k in body):
+        body = {k: size if k in PAGE_SIZE_PARAMS else v for k, v in body.items()}
+        post_data = json.dumps(body)
+        changed = True
+    return (url, post_data) if changed else None
+
+
+def _flatten(record: dict, prefix: str = "") -> Dict[str, object]:
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(_cell(item) for item in value)
+    return str(value)
+
+
+def project_records(records: Sequence[dict], headers: Sequence[str], columns: Optional[Dict[str, str]] = None,
+                    required: Sequence[int] = ()) -> Optional[List[List[str]]]:
+    """
+    Records laid out as rows in the order of the export's columns
+
+    A header takes the JSON path columns maps it to, else the record field of
+    exactly the same name (case, spaces and punctuation ignored; nested fields
+    by their dotted path, so "Vendor Name" finds vendor.name). Nothing is
+    matched on a prefix. Unmatched columns stay empty.
+
+    Args:
+        records: Captured records
+        headers: Column headers of the export
+        columns: Header (see _field_name) -> JSON path, e.g. GRID_COLUMNS of the grid
+        required: Indexes of the columns that must find a field (the schema's key columns)
+
+    Returns:
+        list: One list of cell strings per record, None if a required column found no field
+    """
+    if not records or not headers:
+        return None
+    columns = columns or {}
+    fields = {}
+    for record in records:
+        for path in _flatten(record):
+            fields.setdefault(_field_name(path), path)
+    paths = set(fields.values())
+
+    mapped = []
+    for header in headers:
+        name = _field_name(header)
+        path = columns.get(name) if name else None
+        if path not in paths:
+            path = fields.get(name) if name else None
+        mapped.append(path)
+
+    missing = [headers[i] for i in required if i >= len(mapped) or mapped[i] is None]
+    if missing:
+        print(f"⚠️ Captured records have no field for key column(s) {', '.join(map(str, missing))}")
+        return None
+    rows = []
+    for record in records:
+        flat = _flatten(record)
+        rows.append([_cell(flat.get(path)) if path else "" for path in mapped])
+    return rows
+
+
+def agrees_with_grid(rows: Sequence[Sequence[str]], grid_rows: Sequence[Sequence[str]], schema: Schema) -> bool:
+    """
+    Whether projected rows show what the rendered grid shows
+
+    Every rendered row must pair with a projected row on the schema's key and
+    all their cells must match (values_match); projected rows beyond the
+    rendered page are not looked at.
+
+    Args:
+        rows: Rows of project_records()
+        grid_rows: Rows read from the grid (e.g. snapshot_table(page).rows)
+        schema: Reconciliation schema of the module
+
+    Returns:
+        bool: False when they disagree or the grid shows no rows to check against
+    """
+    if not grid_rows:
+        print("⚠️ No rendered rows to check the captured records against")
+        return False
+    result = reconcile(grid_rows, rows, schema)
+    if result.extra or result.cells_matched < result.cells_compared:
+        print(f"⚠️ Captured records disagree with the grid: {len(result.extra)} of {len(grid_rows)} rendered "
+              f"rows unpaired, cells {result.cells_matched}/{result.cells_compared}")
+        return False
+    return True
+
+
+class GridCapture:
+    """Collects a grid's dataset from its list API responses"""
+
+    def __init__(self, page, target, patterns: Optional[Sequence[str]] = None):
+        """
+        Initialize grid capture
+
+        Args:
+            page: Playwright page
+            target: Page object, page-object class or ROUTES key of the grid's screen
+            patterns: URL fragments of the list endpoint (default: GRID_ENDPOINTS of the target)
+        """
+        self.page = page
+        self.name = route_name(target)
+        self.patterns = tuple(_squash(p) for p in (patterns or GRID_ENDPOINTS[self.name]))
+        self.columns = GRID_COLUMNS.get(self.name, {})
+        self.responses = 0
+        self.total: Optional[int] = None
+        self.started = time.perf_counter()
+        self._dataset: Optional[str] = None
+        self._first_request = None
+        self._batches: List[List[dict]] = []
+        self._pending = set()
+        self._arrived = asyncio.Event()
+        self._listening = False
+
+    def start(self) -> "GridCapture":
+        """Listen to the page's responses (before the grid loads)"""
+        if not self._listening:
+            self.page.on("response", self._on_response)
+            self._listening = True
+            self.started = time.perf_counter()
+        return self
+
+    def stop(self):
+        """Stop listening; what was captured stays readable"""
+        if self._listening:
+            self.page.remove_listener("response", self._on_response)
+            self._listening = False
+
+    async def __aenter__(self):
+        return self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def seen(self) -> bool:
+        """Whether any list response of the grid arrived"""
+        return self.responses > 0
+
+    @property
+    def captured(self) -> int:
+        """Unique records of the current dataset"""
+        return len({record_key(record) for batch in self._batches for record in batch})
+
+    def matches(self, response) -> bool:
+        """Whether response comes from the grid's list endpoint"""
+        if response.request.resource_type not in TRACKED_TYPES:
+            return False
+        url = _squash(urlparse(response.url).path)
+        return "/api/" in url and any(pattern in url for pattern in self.patterns)
+
+    def _on_response(self, response):
+        if self.matches(response):
+            task = asyncio.ensure_future(self._read(response))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response):
+        try:
+            payload = await response.json()
+        except Exception:
+            return
+        rows, total = extract_rows(payload)
+        if rows is None:
+            return
+        request = response.request
+        self.add(rows, total, dataset_key(request.url, request.post_data), request)
+
+    def add(self, rows: List[dict], total: Optional[int], dataset: str, request=None):
+        """Add one list response to the capture"""
+        if dataset != self._dataset:
+            self._dataset = dataset
+            self._first_request = request
+            self._batches = []
+            self.total = None
+        self.responses += 1
+        if total is not None:
+            self.total = total
+        self._batches.append(rows)
+        self._arrived.set()
+
+    async def rows(self, quiet: float = 1.0, first_timeout: float = 10.0):
+        """
+        Stream the records of the current dataset, each once
+
+        Ends once nothing new arrives for `quiet` seconds; first_timeout only
+        applies while nothing has arrived yet. A stopped capture yields what
+        it holds and ends without waiting.
+
+        Args:
+            quiet: Seconds without a new response after which the stream ends
+            first_timeout: Seconds to wait for the first response
+
+        Yields:
+            dict: Records in arrival order
+        """
+        dataset = None
+        index = 0
+        yielded = set()
+        while True:
+            if self._pending:
+                await asyncio.gather(*list(self._pending), return_exceptions=True)
+            if dataset is None and self._batches:
+                dataset = self._dataset
+            if dataset is not None and self._dataset != dataset:
+                print("⚠️ Grid query changed while streaming - stream ends with the previous dataset")
+                return
+            while index < len(self._batches):
+                for record in self._batches[index]:
+                    key = record_key(record)
+                    if key not in yielded:
+                        yielded.add(key)
+                        yield record
+                index += 1
+            if dataset is not None and self.total is not None and len(yielded) >= self.total:
+                return
+            if not self._listening:
+                return
+            self._arrived.clear()
+            try:
+                await asyncio.wait_for(self._arrived.wait(), quiet if self._batches else first_timeout)
+            except asyncio.TimeoutError:
+                return
+
+    async def records(self, **kwargs) -> List[dict]:
+        """All records of the current dataset (see rows())"""
+        return [record async for record in self.rows(**kwargs)]
+
+    async def fetch_remaining(self, timeout: float = 30000) -> bool:
+        """
+        Ask the list endpoint once for the whole dataset when only part of it arrived
+
+        Returns:
+            bool: True if the capture holds the reported total afterwards
+        """
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+        if self.total is None or self.captured >= self.total:
+            return self.total is not None
+        request = self._first_request
+        resized = with_page_size(request.url, request.post_data, self.total) if request else None
+        if resized is None:
+            print(f"⚠️ {self.name} list request has no page size to raise ({self.captured}/{self.total} records)")
+            return False
+
+        url, post_data = resized
+        headers = {k: v for k, v in (await request.all_headers()).items()
+                   if k.lower() not in ("content-length", "host") and not k.startswith(":")}
+        try:
+            response = await self.page.request.fetch(url, method=request.method, headers=headers,
+                                                     data=post_data, timeout=budget_timeout(timeout))
+            rows, total = extract_rows(await response.json())
+        except Exception as e:
+            print(f"⚠️ Could not fetch the whole {self.name} dataset: {str(e)[:80]}")
+            return False
+        if rows is None:
+            return False
+        self.add(rows, total, self._dataset, request)
+        print(f"🛰️ Fetched {len(rows)} {self.name} records in one request")
+        return self.captured >= self.total
+
+    def summary(self) -> str:
+        return (f"🛰️ Grid capture ({self.name}): {self.captured} records"
+                f"{f' of {self.total}' if self.total is not None else ''} from {self.responses} "
+                f"API response(s) in {time.perf_counter() - self.started:.1f}s")
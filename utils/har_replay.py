@@ -0,0 +1,207 @@
+"""
+HAR Record / Replay
+--record-har captures each test's API traffic against a live environment into
+a HAR archive, plus the SPA shell (index.html, bundles, fonts) the browser
+loaded. --replay-har serves API calls from those archives with route_from_har
+and the shell from a local static server, so read-mostly suites (DOM
+structure, navigation, home page) run offline and deterministically.
+"""
+
+import os
+import re
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urlparse, unquote
+from typing import Dict, Any
+
+from utils.auth_state_cache import AuthStateCache
+
+
+# Backend calls recorded into / replayed from the HAR; everything else of the
+# app origin is the SPA shell
+API_URL_PATTERN = re.compile(r"/api/")
+
+# Shell resources saved while recording
+SHELL_RESOURCE_TYPES = {"document", "script", "stylesheet", "font", "image"}
+
+
+def archive_name(nodeid: str) -> str:
+    """File-system friendly name for a test node id"""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_")
+
+
+class _ShellRequestHandler(SimpleHTTPRequestHandler):
+    """Serves recorded files; unknown paths get index.html (client-side routing)"""
+
+    def translate_path(self, path):
+        file_path = super().translate_path(path)
+        if not os.path.isfile(file_path):
+            return os.path.join(self.directory, "index.html")
+        return file_path
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StaticShellServer:
+    """Local HTTP server hosting the recorded SPA shell"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Start serving on a free localhost port; returns the server URL"""
+        if self._server is None:
+            handler = partial(_ShellRequestHandler, directory=self.directory)
+            self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self.url
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class HarArchive:
+    """Record or replay the app's network traffic for one environment"""
+
+    def __init__(self, mode: str, environment: str, base_url: str, root: str = ".har"):
+        """
+        Initialize HAR archive
+
+        Args:
+            mode: "record" or "replay"
+            environment: Environment name from load_config()
+            base_url: App URL the recording was made against
+            root: Directory holding one sub-directory per environment
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown HAR mode '{mode}'")
+        self.mode = mode
+        self.environment = environment
+        self.origin = "{0.scheme}://{0.netloc}".format(urlparse(base_url))
+        self.directory = os.path.join(root, environment)
+        self.shell_dir = os.path.join(self.directory, "shell")
+        self.server = StaticShellServer(self.shell_dir)
+        # Session the recording was made with; replay accepts it even after JWT expiry
+        self.auth_cache = AuthStateCache(cache_dir=self.directory, check_expiry=(mode == "record"))
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+
+    @property
+    def is_recording(self) -> bool:
+        return self.mode == "record"
+
+    def har_path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.har.zip")
+
+    def has_recording(self, name: str) -> bool:
+        return os.path.exists(self.har_path(name))
+
+    def context_options(self, name: str) -> Dict[str, Any]:
+        """
+        new_context() options for a context recorded under `name`
+
+        Args:
+            name: Archive name (see archive_name())
+
+        Returns:
+            dict: HAR recording options in record mode, {} in replay mode
+        """
+        if not self.is_recording:
+            return {}
+        os.makedirs(self.directory, exist_ok=True)
+        return {
+            "record_har_path": self.har_path(name),
+            "record_har_url_filter": API_URL_PATTERN,
+        }
+
+    async def prepare(self, context, name: str) -> bool:
+        """
+        Wire a context for recording or replay
+
+        Register after all other routes: in replay these handlers must answer
+        every request before anything tries the network.
+
+        Args:
+            context: Context created with context_options(name)
+            name: Archive name
+
+        Returns:
+            bool: False if replay was requested but nothing was recorded under `name`
+        """
+        if self.is_recording:
+            context.on("response", self._save_shell_resource)
+            self.recorded += 1
+            return True
+
+        if not self.has_recording(name) or not os.path.exists(os.path.join(self.shell_dir, "index.html")):
+            self.missing += 1
+            return False
+
+        shell_url = self.server.start()
+
+        async def offline(route):
+            await route.abort("internetdisconnected")
+
+        async def serve_shell(route):
+            # context.request, not route.fetch: the app origin is https, the local server http
+            parsed = urlparse(route.request.url)
+            response = await context.request.get(f"{shell_url}{parsed.path}")
+            await route.fulfill(response=response)
+
+        # Reverse registration order: HAR (API) -> shell (app origin) -> abort the rest
+        await context.route("**/*", offline)
+        await context.route(f"{self.origin}/**", serve_shell)
+        await context.route_from_har(self.har_path(name), url=API_URL_PATTERN, not_found="abort")
+        self.replayed += 1
+        return True
+
+    async def _save_shell_resource(self, response):
+        """Keep the app origin's HTML shell and static files for the replay server"""
+        request = response.request
+        if (response.status != 200
+                or request.resource_type not in SHELL_RESOURCE_TYPES
+                or not response.url.startswith(self.origin)
+                or API_URL_PATTERN.search(response.url)):
+            return
+
+        if request.resource_type == "document":
+            relative_path = "index.html"
+        else:
+            relative_path = unquote(urlparse(response.url).path).lstrip("/")
+            if not relative_path or ".." in relative_path.split("/"):
+                return
+
+        try:
+            body = await response.body()
+        except Exception:
+            return
+
+        file_path = os.path.join(self.shell_dir, relative_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, file_path)
+
+    def summary(self) -> str:
+        if self.is_recording:
+            return f"📼 HAR: recorded {self.recorded} context(s) into {self.directory}"
+        missing = f", {self.missing} without a recording (skipped)" if self.missing else ""
+        return f"📼 HAR: replayed {self.replayed} context(s) from {self.directory}{missing}"
+
+    def close(self):
+        self.server.stop()
@@ -0,0 +1,214 @@
+"""
+Login State Machine
+After the credentials are submitted the app can land in one of several states:
+the 2FA prompt, straight on /home (session still trusted) or an error banner.
+Instead of probing each indicator in turn with its own timeout, every
+expected next state is waited for at once and the flow proceeds with
+whichever appears first. The time spent in each transition is recorded.
+"""
+
+import time
+import asyncio
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pages.login_page import LoginPage
+from utils.deadline import budget_timeout, charge
+
+
+class LoginState:
+    START = "start"
+    SUBMITTED = "submitted"
+    TWO_FA = "two_fa"
+    HOME = "home"
+    ERROR = "error"
+    OTP_SUBMITTED = "otp_submitted"
+    OTP_ACCEPTED = "otp_accepted"
+    OTP_REJECTED = "otp_rejected"
+    UNCONFIRMED = "unconfirmed"
+    ENTITY_SELECTED = "entity_selected"
+    ENTITY_SKIPPED = "entity_skipped"
+
+
+class LoginError(Exception):
+    """The app rejected the credentials or the OTP"""
+
+
+# Upper bounds (ms) for each race
+DEFAULT_TIMEOUTS = {
+    "post_submit": 15000,
+    "post_otp": 10000,
+}
+
+
+async def race(waiters: Dict[str, Callable[[], Awaitable]], timeout: float) -> Optional[str]:
+    """
+    Run all waiters at once and return the name of the first that succeeds
+
+    Waiters that fail (e.g. their own Playwright timeout) drop out of the race;
+    the rest are cancelled as soon as one succeeds.
+
+    Args:
+        waiters: State name -> coroutine factory that returns once the state is reached
+        timeout: Upper bound in ms, shortened to the test's remaining deadline
+
+    Returns:
+        str: Winning state, or None if none was reached within the bound
+    """
+    timeout = budget_timeout(timeout)
+    start = time.monotonic()
+    tasks = {asyncio.ensure_future(factory()): name for name, factory in waiters.items()}
+    pending = set(tasks)
+    winner = None
+    deadline = start + timeout / 1000
+    try:
+        while pending and winner is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    winner = tasks[task]
+                    break
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    charge(time.monotonic() - start)
+    return winner
+
+
+class LoginTimings:
+    """Run-wide time per login state transition"""
+
+    def __init__(self):
+        self.transitions: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        self.logins = 0
+
+    def add(self, flow: "LoginFlow"):
+        self.logins += 1
+        for source, target, seconds in flow.transitions:
+            self.transitions[(source, target)].append(seconds)
+
+    def summary(self) -> str:
+        lines = [f"🔐 Login transitions over {self.logins} login(s):"]
+        for (source, target), samples in sorted(self.transitions.items(), key=lambda item: -sum(item[1])):
+            lines.append(f"   {source:>13} → {target:<15} {len(samples):>3}x  "
+                         f"avg {sum(samples) / len(samples):.2f}s  max {max(samples):.2f}s")
+        return "\n".join(lines)
+
+
+class LoginFlow:
+    """Username/password + 2FA login driven by whichever state appears first"""
+
+    def __init__(self, page, timeouts: Optional[Dict[str, float]] = None):
+        """
+        Initialize login flow
+
+        Args:
+            page: Playwright page
+            timeouts: Per-race upper bounds in ms, merged over DEFAULT_TIMEOUTS
+        """
+        self.page = page
+        self.login_page = LoginPage(page)
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.state = LoginState.START
+        self.transitions: List[Tuple[str, str, float]] = []
+        self._entered_at = time.perf_counter()
+
+    def _transition(self, state: str):
+        now = time.perf_counter()
+        self.transitions.append((self.state, state, now - self._entered_at))
+        print(f"🔀 Login: {self.state} → {state} ({now - self._entered_at:.2f}s)")
+        self.state = state
+        self._entered_at = now
+
+    def _visible(self, selectors: List[str], timeout: float):
+        locator = self.login_page.any_of(selectors).first
+        return lambda: locator.wait_for(state="visible", timeout=timeout)
+
+    def _home(self, timeout: float):
+        return lambda: self.page.wait_for_url(self.login_page.home_url_pattern, timeout=timeout)
+
+    async def submit_credentials(self, username: str, password: str) -> str:
+        """Submit the login form and race 2FA prompt / home / error banner"""
+        await self.login_page.goto()
+        await self.login_page.login(username, password)
+        self._transition(LoginState.SUBMITTED)
+
+        timeout = self.timeouts["post_submit"]
+        state = await race({
+            LoginState.TWO_FA: self._visible(self.login_page.two_fa_indicators, timeout),
+            LoginState.HOME: self._home(timeout),
+            LoginState.ERROR: self._visible(self.login_page.login_error_indicators, timeout),
+        }, timeout)
+        if state is None:
+            # Nothing recognisable - behave as before and try the OTP anyway
+            print("⚠️ Could not detect 2FA page, attempting OTP entry anyway")
+            state = LoginState.TWO_FA
+        self._transition(state)
+        if state == LoginState.ERROR:
+            raise LoginError(f"Login rejected on {self.page.url}")
+        return state
+
+    async def submit_otp(self, otp: str) -> str:
+        """Enter the OTP and race success message / home / OTP error"""
+        if not await self.login_page.fill_otp(otp):
+            await self.page.screenshot(path="debug_otp_entry_failed.png")
+            raise LoginError("Could not find the OTP input field")
+        self._transition(LoginState.OTP_SUBMITTED)
+
+        timeout = self.timeouts["post_otp"]
+        state = await race({
+            LoginState.OTP_ACCEPTED: self._visible(self.login_page.otp_success_indicators, timeout),
+            LoginState.HOME: self._home(timeout),
+            LoginState.OTP_REJECTED: self._visible(self.login_page.otp_error_indicators, timeout),
+        }, timeout)
+        # Some 2FA flows show no confirmation at all - continue, the caller verifies the URL
+        self._transition(state or LoginState.UNCONFIRMED)
+        if state == LoginState.OTP_REJECTED:
+            raise LoginError("OTP was rejected")
+        return self.state
+
+    async def run(self, username: str, password: str,
+                  otp_source: Callable[[], Awaitable[str]],
+                  select_entity: Optional[Callable[[], Awaitable[bool]]] = None) -> str:
+        """
+        Log in end to end
+
+        The OTP is claimed only once the 2FA prompt has won the post-submit
+        race: a code claimed before it could lose its validity while the race
+        runs (up to post_submit), and a session that lands on /home would use
+        up a TOTP step other workers wait for.
+
+        Args:
+            username: Login username
+            password: Login password
+            otp_source: Coroutine factory returning the OTP to enter
+            select_entity: Optional coroutine factory run after the OTP step
+
+        Returns:
+            str: Final state
+        """
+        state = await self.submit_credentials(username, password)
+        if state == LoginState.HOME:
+            print("✅ Already logged in, skipping 2FA")
+            return self.state
+
+        await self.submit_otp(await otp_source())
+
+        if select_entity:
+            selected = await select_entity()
+            self._transition(LoginState.ENTITY_SELECTED if selected else LoginState.ENTITY_SKIPPED)
+        return self.state
+
+    def summary(self) -> str:
+        total = sum(seconds for _, _, seconds in self.transitions)
+        steps = ", ".join(f"{target} {seconds:.1f}s" for _, target, seconds in self.transitions)
+        return f"⏱️ Login in {total:.1f}s: {steps}"
+
+
+# Global instance
+login_timings = LoginTimings()
@@ -0,0 +1,351 @@
+"""
+Per-Worker Login Pool
+Each pytest(-xdist) worker authenticates once and seeds every later context
+from that session. OTP codes are claimed through a shared ledger so parallel
+workers never submit the same TOTP code.
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+from typing import Optional, Dict, Any, Callable, Awaitable
+
+import pyotp
+
+from utils.auth_state_cache import AuthStateCache, auth_state_cache
+from utils.routes import with_entity
+
+
+def get_worker_id() -> str:
+    """Current xdist worker id (gw0, gw1, ...) or 'main' for a non-parallel run"""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+class FileLock:
+    """Minimal cross-process lock based on exclusive file creation"""
+
+    def __init__(self, path: str, stale_after: float = 30.0):
+        self.path = path
+        self.stale_after = stale_after
+
+    async def acquire(self, poll_interval: float = 0.05):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return
+            except FileExistsError:
+                # A crashed worker must not block the others forever
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                await asyncio.sleep(poll_interval)
+
+    def release(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class TotpLedger:
+    """
+    Hands out each TOTP time step at most once across all local processes
+
+    The server rejects a code that was already used, so two workers logging in
+    within the same 30s window would collide. Claiming goes through a ledger
+    file guarded by a FileLock; a worker that finds the current step taken
+    waits for the next one.
+    """
+
+    def __init__(self, ledger_dir: str = ".auth", min_remaining: float = 5.0):
+        """
+        Initialize TOTP ledger
+
+        Args:
+            ledger_dir: Directory shared by all workers of a run
+            min_remaining: Never hand out a code with fewer seconds of validity left
+        """
+        self.ledger_path = os.path.join(ledger_dir, "otp_ledger.json")
+        self.lock = FileLock(os.path.join(ledger_dir, "otp_ledger.lock"))
+        self.min_remaining = min_remaining
+
+    @staticmethod
+    def _secret_key(secret: str) -> str:
+        # Never write the secret itself to disk
+        return hashlib.sha256(secret.encode()).hexdigest()[:16]
+
+    def _read_ledger(self) -> Dict[str, int]:
+        try:
+            with open(self.ledger_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_ledger(self, ledger: Dict[str, int]):
+        with open(self.ledger_path, "w") as f:
+            json.dump(ledger, f)
+
+    async def claim_code(self, secret: str) -> str:
+        """
+        Claim a TOTP code no other worker has used
+
+        Args:
+            secret: Base32 TOTP secret
+
+        Returns:
+            str: The OTP code for an unused time step
+        """
+        totp = pyotp.TOTP(secret)
+        key = self._secret_key(secret)
+
+        while True:
+            now = time.time()
+            step = int(now // totp.interval)
+            remaining = totp.interval - (now % totp.interval)
+
+            if remaining >= self.min_remaining:
+                async with self.lock:
+                    ledger = self._read_ledger()
+                    if ledger.get(key, -1) < step:
+                        ledger[key] = step
+                        self._write_ledger(ledger)
+                        return totp.at(step * totp.interval)
+
+            print(f"⏳ [{get_worker_id()}] OTP window taken, waiting {remaining:.1f}s for the next code")
+            await asyncio.sleep(remaining + 0.2)
+
+
+class LoginPool:
+    """Authenticates once per worker and hands out pre-authenticated contexts"""
+
+    def __init__(self,
+                 browser,
+                 environment: str,
+                 context_options: Dict[str, Any],
+                 login: Callable[[Any], Awaitable[None]],
+                 verify: Callable[[Any], Awaitable[bool]],
+                 cache: Optional[AuthStateCache] = None,
+                 prepare_context: Optional[Callable[[Any], Awaitable[None]]] = None,
+                 cache_key: Optional[str] = None):
+        """
+        Initialize login pool
+
+        Args:
+            browser: Shared Playwright browser of this worker
+            environment: Environment name from load_config()
+            context_options: Options for new_context() (base_url, basic auth, ...)
+            login: Coroutine performing a full 2FA + entity login on a page
+            verify: Coroutine returning True if a page is on an authenticated view
+            cache: Disk cache used to survive across runs (None = in-memory only)
+            prepare_context: Coroutine applied to every context the pool creates
+            cache_key: Name of the cached state (default: environment + worker id)
+        """
+        self.browser = browser
+        self.environment = environment
+        self.context_options = context_options
+        self.login = login
+        self.verify = verify
+        self.cache = cache
+        self.prepare_context = prepare_context
+        self.cache_key = cache_key or f"{environment}_{get_worker_id()}"
+        self._state: Optional[Dict[str, Any]] = None
+        self._lock = asyncio.Lock()
+        self.logins = 0
+        self.reuses = 0
+
+    @property
+    def state_id(self) -> Optional[str]:
+        """saved_at of the worker session currently handed out"""
+        return self._state.get("saved_at") if self._state else None
+
+    def _cached_state(self) -> Optional[Dict[str, Any]]:
+        """Valid in-memory or on-disk state for this worker, if any"""
+        checker = self.cache or auth_state_cache
+        if self._state and checker.is_valid(self._state):
+            return self._state
+        self._state = self.cache.load(self.cache_key) if self.cache else None
+        return self._state
+
+    async def adopt(self, page) -> bool:
+        """
+        Capture the session of a page that just completed a full login
+
+        Args:
+            page: Authenticated page
+
+        Returns:
+            bool: True if a usable state was captured
+        """
+        if "/login" in page.url:
+            return False
+        state = await auth_state_cache.capture(page)
+        checker = self.cache or auth_state_cache
+        if not checker.is_valid(state):
+            return False
+        self._state = state
+        self.logins += 1
+        if self.cache:
+            self.cache.save(self.cache_key, state)
+        print(f"💾 [{get_worker_id()}] Worker session captured for '{self.environment}'")
+        return True
+
+    async def _new_context(self, **overrides):
+        context = await self.browser.new_context(**{**self.context_options, **overrides})
+        if self.prepare_context:
+            await self.prepare_context(context)
+        return context
+
+    async def get_state(self) -> Optional[Dict[str, Any]]:
+        """Worker's auth state, logging in on a private context only if none exists"""
+        async with self._lock:
+            state = self._cached_state()
+            if state is None:
+                context = await self._new_context()
+                try:
+                    page = await context.new_page()
+                    print(f"🔐 [{get_worker_id()}] Logging in once for worker pool ({self.environment})")
+                    await self.login(page)
+                    await self.adopt(page)
+                finally:
+                    await context.close()
+            return self._state
+
+    def invalidate(self):
+        """Forget the worker's session (e.g. after the app rejected it)"""
+        self._state = None
+        if self.cache:
+            self.cache.invalidate(self.cache_key)
+
+    async def authenticate(self, page) -> bool:
+        """
+        Put a fresh page on an authenticated app view
+
+        The first call of a worker logs in on the page itself and keeps the
+        session; later calls seed the page's context from it.
+
+        Args:
+            page: Page whose context has not navigated yet
+
+        Returns:
+            bool: True if the page ends up authenticated
+        """
+        async with self._lock:
+            state = self._cached_state()
+            if state is None:
+                print(f"🔐 [{get_worker_id()}] Logging in once for worker pool ({self.environment})")
+                await self.login(page)
+                return await self.adopt(page)
+
+        await auth_state_cache.apply(page.context, state)
+        await page.goto(state["url"])
+        if await self.verify(page):
+            self.reuses += 1
+            return True
+
+        # Server rejected the session (expired JWT, logged out by another test)
+        print(f"⌛ [{get_worker_id()}] Pooled session rejected by the app")
+        self.invalidate()
+        return False
+
+    async def new_context(self, **overrides):
+        """
+        Create a new context already authenticated with the worker session
+
+        Args:
+            overrides: Extra options merged over the pool's context options
+
+        Returns:
+            BrowserContext: Context seeded with cookies and web storage
+        """
+        state = await self.get_state()
+        context = await self._new_context(**overrides)
+        if state:
+            await auth_state_cache.apply(context, state)
+        return context
+
+
+class SharedLoggedInPage:
+    """
+    One logged-in page shared by read-only tests of a module or class
+
+    Tests only observe the page, so instead of a new context + login per test
+    the page is put back on the landing URL before each test.
+    """
+
+    def __init__(self, pool: LoginPool,
+                 prepare_context: Optional[Callable[[Any], Awaitable[None]]] = None,
+                 context_options: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            pool: Worker login pool the shared session comes from
+            prepare_context: Extra coroutine applied to the shared context before it navigates
+            context_options: Extra new_context() options (e.g. HAR recording)
+        """
+        self.pool = pool
+        self.prepare_context = prepare_context
+        self.context_options = context_options or {}
+        self.context = None
+        self.page = None
+        self.landing_url = None
+        self.resets = 0
+
+    async def open(self):
+        """Create the shared context from the worker session"""
+        self.context = await self.pool.new_context(**self.context_options)
+        if self.prepare_context:
+            await self.prepare_context(self.context)
+        self.page = await self.context.new_page()
+        state = await self.pool.get_state()
+        self.landing_url = state["url"] if state else "/"
+        await self.page.goto(self.landing_url)
+        return self.page
+
+    async def reset(self, entity_id=None):
+        """
+        Return to the landing view; reopen if the session was lost
+
+        Args:
+            entity_id: Land on this entity instead of the session's own (entity matrix)
+        """
+        for extra_page in self.context.pages:
+            if extra_page is not self.page:
+                await extra_page.close()
+
+        landing_url = with_entity(self.landing_url, entity_id) if entity_id is not None else self.landing_url
+        await self.page.goto(landing_url)
+        if await self.pool.verify(self.page):
+            self.resets += 1
+            return self.page
+
+        print(f"⌛ [{get_worker_id()}] Shared page lost its session, reopening")
+        self.pool.invalidate()
+        await self.close()
+        await self.open()
+        if entity_id is not None:
+            await self.page.goto(landing_url)
+        return self.page
+
+    async def close(self):
+        if self.context:
+            await self.context.close()
+            self.context = None
+            self.page = None
+
+
+# Global instance
+totp_ledger = TotpLedger()
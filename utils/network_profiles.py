@@ -0,0 +1,272 @@
+"""
+Network Profiles
+Named request-blocking profiles for browser contexts. Non-visual suites (API
+format, DOM structure, navigation, security) don't need images, web fonts,
+video or analytics beacons; the "lean" profile aborts them at the context
+level and reports how many requests and bytes that saved.
+"""
+
+import os
+import re
+import json
+from collections import Counter
+from urllib.parse import urlparse
+from typing import Dict, Iterable, Optional
+
+
+# Third-party hosts that only collect analytics / session recordings
+ANALYTICS_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "hotjar.io",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "fullstory.com",
+    "clarity.ms",
+    "intercom.io",
+    "intercomcdn.com",
+)
+
+# File extensions per resource type. SVG is left out on purpose - icon buttons
+# often consist of nothing but an <img src="*.svg">.
+BLOCKABLE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "bmp", "ico"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "mov", "mp3", "ogg", "wav"),
+}
+
+
+class NetworkProfile:
+    """Which resource types and hosts a context should never load"""
+
+    def __init__(self, name: str, blocked_resource_types: Iterable[str] = (),
+                 blocked_hosts: Iterable[str] = ()):
+        """
+        Initialize network profile
+
+        Args:
+            name: Profile name used with --net-profile / @pytest.mark.net_profile
+            blocked_resource_types: Playwright resource types to abort (image, font, media)
+            blocked_hosts: Hosts (and their sub-domains) to abort entirely
+        """
+        self.name = name
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.url_pattern = self._build_url_pattern()
+
+    @property
+    def is_blocking(self) -> bool:
+        return bool(self.blocked_resource_types or self.blocked_hosts)
+
+    def _build_url_pattern(self) -> Optional[re.Pattern]:
+        """
+        Regex of URLs that may have to be blocked
+
+        Only matching requests are intercepted, so first-party API calls and
+        bundles never pay for a round trip through Python.
+        """
+        alternatives = []
+        if self.blocked_hosts:
+            hosts = "|".join(re.escape(host) for host in self.blocked_hosts)
+            alternatives.append(rf"^[a-z]+://(?:[^/?#]*\.)?(?:{hosts})(?:[:/?#]|$)")
+        extensions = [ext for resource_type in sorted(self.blocked_resource_types)
+                      for ext in BLOCKABLE_EXTENSIONS.get(resource_type, ())]
+        if extensions:
+            alternatives.append(rf"^[^?#]+\.(?:{'|'.join(extensions)})(?:[?#].*)?$")
+        return re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+
+    def is_blocked_host(self, url: str) -> bool:
+        host = (urlparse(url).hostname or "").lower()
+        return any(host == blocked or host.endswith(f".{blocked}") for blocked in self.blocked_hosts)
+
+    def block_reason(self, resource_type: str, url: str) -> Optional[str]:
+        """
+        Decide whether a request is aborted under this profile
+
+        Args:
+            resource_type: Playwright request.resource_type
+            url: Request URL
+
+        Returns:
+            str: "third-party" or the blocked resource type, None to let it through
+        """
+        if self.is_blocked_host(url):
+            return "third-party"
+        if resource_type in self.blocked_resource_types:
+            return resource_type
+        return None
+
+
+NETWORK_PROFILES: Dict[str, NetworkProfile] = {
+    "full": NetworkProfile("full"),
+    "lean": NetworkProfile(
+        "lean",
+        blocked_resource_types=("image", "font", "media"),
+        blocked_hosts=ANALYTICS_HOSTS,
+    ),
+}
+
+
+def get_network_profile(name: str) -> NetworkProfile:
+    """Look up a profile by name; raises ValueError for unknown names"""
+    try:
+        return NETWORK_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown network profile '{name}' (available: {', '.join(NETWORK_PROFILES)})")
+
+
+class ResourceSizeCatalog:
+    """
+    Response sizes of blockable resources, learned from fully loading runs
+
+    Aborted requests never report a size, so bytes saved are looked up here.
+    Sizes are learned whenever a full-profile context loads a resource that a
+    blocking profile would abort.
+    """
+
+    def __init__(self, path: str = ".browser_cache/resource_sizes.json"):
+        self.path = path
+        self._sizes: Optional[Dict[str, int]] = None
+        self._learned: Dict[str, int] = {}
+
+    @property
+    def sizes(self) -> Dict[str, int]:
+        if self._sizes is None:
+            try:
+                with open(self.path, "r") as f:
+                    self._sizes = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._sizes = {}
+        return self._sizes
+
+    def get(self, url: str) -> Optional[int]:
+        return self.sizes.get(url)
+
+    def record(self, url: str, size: int):
+        self.sizes[url] = size
+        self._learned[url] = size
+
+    def save(self):
+        """Merge newly learned sizes into the file (other workers may have written too)"""
+        if not self._learned:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        try:
+            with open(self.path, "r") as f:
+                merged = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            merged = {}
+        merged.update(self._learned)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(merged, f)
+        os.replace(tmp_path, self.path)
+        self._learned = {}
+
+
+class NetworkProfileTracker:
+    """Applies a profile to one context and counts what it blocked"""
+
+    def __init__(self, profile: NetworkProfile, catalog: ResourceSizeCatalog,
+                 learn_from: Optional[NetworkProfile] = None):
+        """
+        Initialize tracker
+
+        Args:
+            profile: Profile to enforce
+            catalog: Where sizes of blocked resources are looked up (and learned)
+            learn_from: For a non-blocking profile, the profile whose blockable
+                        resources should be measured into the catalog
+        """
+        self.profile = profile
+        self.catalog = catalog
+        self.learn_from = learn_from
+        self.blocked = Counter()
+        self.bytes_saved = 0
+        self.unknown_size = 0
+
+    async def attach(self, context):
+        """
+        Register the blocking route on a context
+
+        Attach after other routes (e.g. the asset cache): handlers registered
+        later run first, so blocked requests never reach the cache or network.
+        """
+        if self.profile.is_blocking:
+            await context.route(self.profile.url_pattern, self._handle_route)
+        elif self.learn_from and self.learn_from.is_blocking:
+            context.on("requestfinished", self._learn_size)
+
+    async def _handle_route(self, route):
+        request = route.request
+        reason = self.profile.block_reason(request.resource_type, request.url)
+        if not reason:
+            await route.fallback()
+            return
+
+        self.blocked[reason] += 1
+        size = self.catalog.get(request.url)
+        if size is None:
+            self.unknown_size += 1
+        else:
+            self.bytes_saved += size
+        await route.abort("blockedbyclient")
+
+    async def _learn_size(self, request):
+        if not self.learn_from.block_reason(request.resource_type, request.url):
+            return
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+        self.catalog.record(request.url, sizes["responseBodySize"] + sizes["responseHeadersSize"])
+
+    def reset_counts(self):
+        """Start counting from zero (a recycled context serving its next test)"""
+        self.blocked = Counter()
+        self.bytes_saved = 0
+        self.unknown_size = 0
+
+    @property
+    def requests_blocked(self) -> int:
+        return sum(self.blocked.values())
+
+    def summary(self) -> str:
+        """One-line report of requests and bytes saved"""
+        if not self.profile.is_blocking:
+            return f"🌐 Net profile '{self.profile.name}': full loading"
+        breakdown = ", ".join(f"{reason} {count}" for reason, count in self.blocked.most_common())
+        unknown = f", {self.unknown_size} of unknown size" if self.unknown_size else ""
+        return (f"🪶 Net profile '{self.profile.name}': {self.requests_blocked} requests blocked"
+                f"{f' ({breakdown})' if breakdown else ''}, "
+                f"{self.bytes_saved / 1024:.0f} KB saved{unknown}")
+
+
+class NetworkProfileStats:
+    """Run-wide totals over all trackers"""
+
+    def __init__(self):
+        self.requests_blocked = 0
+        self.bytes_saved = 0
+        self.unknown_size = 0
+        self.contexts = 0
+
+    def add(self, tracker: NetworkProfileTracker):
+        if not tracker.profile.is_blocking:
+            return
+        self.contexts += 1
+        self.requests_blocked += tracker.requests_blocked
+        self.bytes_saved += tracker.bytes_saved
+        self.unknown_size += tracker.unknown_size
+
+    def summary(self) -> str:
+        unknown = f" ({self.unknown_size} requests of unknown size)" if self.unknown_size else ""
+        return (f"🪶 Network profiles: {self.requests_blocked} requests blocked across "
+                f"{self.contexts} context(s), {self.bytes_saved / 1024 / 1024:.1f} MB saved{unknown}")
+
+
+# Global instance
+resource_size_catalog = ResourceSizeCatalog()
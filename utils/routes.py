@@ -0,0 +1,148 @@
+"""
+Deep-Link Routes
+Every screen of the app has a URL, so page objects open it with one page.goto
+instead of hovering the logo, pinning the sidebar and clicking through menus
+with sleeps in between. ROUTES maps each page object to its path; the entity
+travels as the ?entityId= query parameter. goto_route() keeps the entity of
+the current URL unless told otherwise and reports whether the app kept us on
+the route (a lost session redirects to /login).
+
+Menu navigation is left to the tests that exercise it (tests/e2e/navigation).
+"""
+
+import time
+from typing import Optional, Union
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from utils.deadline import budget_timeout
+
+
+# App origin used when the page has not loaded anything yet
+DEFAULT_BASE_URL = "https://app.viewz.co"
+STAGE_BASE_URL = "https://app.stage.viewz.co"
+
+# Path of each page object's screen
+ROUTES = {
+    "HomePage": "/home",
+    "InvoicingPage": "/invoicing",
+    "PurchasingPage": "/purchasing",
+    "BudgetingPage": "/budgeting",
+    "LedgerPage": "/ledger/general-ledger",
+    "ChartOfAccountsPage": "/ledger/chart-of-accounts",
+    "ReconciliationPage": "/reconciliation",
+    "PayablesPage": "/reconciliation/payables",
+    "ReceivablesPage": "/reconciliation/receivables",
+    "BankPage": "/reconciliation/banks",
+    "CreditCardPage": "/reconciliation/credit-cards",
+    "BIAnalysisPage": "/bi-analysis",
+    "VizionAIPage": "/vizion-ai",
+    "ConnectionPage": "/connections",
+}
+
+Route = Union[str, type, object]
+
+
+def route_name(target: Route) -> str:
+    """ROUTES key of a page object, its class or its name"""
+    if isinstance(target, str):
+        name = target
+    elif isinstance(target, type):
+        name = target.__name__
+    else:
+        name = type(target).__name__
+    if name not in ROUTES:
+        raise KeyError(f"No route for '{name}' - known: {', '.join(ROUTES)}")
+    return name
+
+
+def base_url_of(url: str) -> str:
+    """Origin of the app behind url (stage or production)"""
+    if "stage.viewz.co" in url:
+        return STAGE_BASE_URL
+    parsed = urlparse(url or "")
+    if parsed.scheme in ("http", "https") and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return DEFAULT_BASE_URL
+
+
+def entity_id_of(url: str) -> Optional[str]:
+    """entityId query parameter of url, None if it has none"""
+    values = parse_qs(urlparse(url or "").query).get("entityId")
+    return values[0] if values else None
+
+
+def with_entity(url: str, entity_id) -> str:
+    """url with its entityId query parameter set to entity_id (other parameters kept)"""
+    parsed = urlparse(url)
+    query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+    query["entityId"] = str(entity_id)
+    return parsed._replace(query=urlencode(query)).geturl()
+
+
+def route_url(target: Route, base_url: str = DEFAULT_BASE_URL, entity_id=None) -> str:
+    """
+    Deep link of a page object's screen
+
+    Args:
+        target: Page object, page-object class or ROUTES key
+        base_url: App origin, e.g. https://app.stage.viewz.co
+        entity_id: Entity to open the screen for (None = app default)
+
+    Returns:
+        str: Absolute URL
+    """
+    url = f"{base_url.rstrip('/')}{ROUTES[route_name(target)]}"
+    return f"{url}?entityId={entity_id}" if entity_id is not None else url
+
+
+def on_route(url: str, target: Route, entity_id=None) -> bool:
+    """Whether url is the target's screen (for entity_id, if one is given)"""
+    path = urlparse(url or "").path.rstrip("/")
+    wanted = ROUTES[route_name(target)]
+    if path != wanted and not path.startswith(f"{wanted}/"):
+        return False
+    return entity_id is None or entity_id_of(url) == str(entity_id)
+
+
+async def goto_route(page, target: Route, entity_id=None, keep_entity: bool = True,
+                     waits=None, timeout: float = 30000) -> bool:
+    """
+    Open a page object's screen by its deep link
+
+    Args:
+        page: Playwright page
+        target: Page object, page-object class or ROUTES key
+        entity_id: Entity to open (default: the entity of the current URL)
+        keep_entity: Carry the current URL's entity over when entity_id is None
+        waits: Wait engine to let the screen settle after loading (optional)
+        timeout: Navigation timeout in ms (clamped to the test's deadline)
+
+    Returns:
+        bool: True if the page ended up on the route, False on a redirect or error
+    """
+    name = route_name(target)
+    current = page.url
+    if entity_id is None and keep_entity:
+        entity_id = entity_id_of(current)
+    if on_route(current, name, entity_id):
+        print(f"✅ Already on {name}: {current}")
+        return True
+
+    url = route_url(name, base_url_of(current), entity_id)
+    start = time.perf_counter()
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=budget_timeout(timeout))
+        if waits is not None:
+            await waits.settled()
+    except Exception as e:
+        print(f"❌ Could not open {url}: {str(e)[:80]}")
+        return False
+
+    if "/login" in page.url:
+        print(f"⚠️ Redirected to login opening {url} - session may have been lost")
+        return False
+    if not on_route(page.url, name):
+        print(f"⚠️ {url} redirected to {page.url}")
+        return False
+    print(f"🔗 {name} via deep link in {time.perf_counter() - start:.1f}s: {page.url}")
+    return True
@@ -0,0 +1,91 @@
+"""
+Selector Racing
+Resolving a fallback chain with `for selector in ...: await locator.is_visible()`
+costs one Playwright driver round trip per candidate. These helpers query every
+candidate at once instead:
+
+- first_visible(): all candidates' visible-match counts are requested
+  concurrently (one round of driver calls) and the first candidate in list
+  order that matched wins - preference order is kept.
+- any_visible() / wait_any_visible(): one composite `or_` locator, for checks
+  where it doesn't matter which candidate matched (e.g. success toasts).
+
+Candidates may be selector strings or ready-made locators (get_by_text, ...).
+"""
+
+import time
+import asyncio
+from functools import reduce
+from typing import List, Optional, Sequence, Tuple, Union
+
+from playwright.async_api import Locator
+
+from utils.deadline import budget_timeout, charge
+
+
+Candidate = Union[str, Locator]
+
+
+def _visible(page, candidate: Candidate) -> Locator:
+    locator = page.locator(candidate) if isinstance(candidate, str) else candidate
+    return locator.filter(visible=True)
+
+
+async def _count(locator: Locator) -> int:
+    try:
+        return await locator.count()
+    except Exception:
+        # Malformed selector, detached frame, ... - same as no match
+        return 0
+
+
+async def visible_counts(page, candidates: Sequence[Candidate]) -> List[int]:
+    """Number of visible matches per candidate, queried concurrently"""
+    return list(await asyncio.gather(*(_count(_visible(page, c)) for c in candidates)))
+
+
+async def first_visible(page, candidates: Sequence[Candidate],
+                        min_count: int = 1) -> Tuple[Optional[int], Optional[Locator]]:
+    """
+    First candidate (in list order) with a visible match
+
+    Args:
+        page: Playwright page (or frame / locator to scope the search)
+        candidates: Selectors or locators in order of preference
+        min_count: Visible matches a candidate needs (e.g. option_index + 1)
+
+    Returns:
+        tuple: (index into candidates, locator of its visible matches) or (None, None)
+    """
+    locators = [_visible(page, candidate) for candidate in candidates]
+    counts = await asyncio.gather(*(_count(locator) for locator in locators))
+    for index, count in enumerate(counts):
+        if count >= min_count:
+            return index, locators[index]
+    return None, None
+
+
+def race_locator(page, candidates: Sequence[Candidate]) -> Locator:
+    """Composite locator matching any visible candidate (document order, not list order)"""
+    return reduce(lambda union, locator: union.or_(locator), (_visible(page, c) for c in candidates))
+
+
+async def any_visible(page, candidates: Sequence[Candidate]) -> bool:
+    """True if any candidate is visible - one round trip"""
+    if not candidates:
+        return False
+    return await _count(race_locator(page, candidates)) > 0
+
+
+async def wait_any_visible(page, candidates: Sequence[Candidate], timeout: float = 5000) -> bool:
+    """Wait until any candidate is visible - one driver call instead of a polling loop"""
+    if not candidates:
+        return False
+    start = time.perf_counter()
+    try:
+        await race_locator(page, candidates).first.wait_for(state="visible", timeout=budget_timeout(timeout))
+        return True
+    except Exception:
+        return False
+    finally:
+        charge(time.perf_counter() - start)
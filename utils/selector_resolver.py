@@ -0,0 +1,274 @@
+"""
+Learned Selector Resolver
+Page objects keep long fallback lists (InvoicingPage.nav_selectors,
+EntitySelectorPage.entity_selectors, ...) and probe them one by one, paying an
+is_visible() round trip per miss. The resolver remembers which selector
+matched per page-object attribute and environment, tries the last winner
+first on the next run (racing the rest in one round trip if it missed),
+pushes selectors that never matched to the back and reports them as dead.
+A match whose click fails counts as a miss and the rest of the list is tried.
+"""
+
+import os
+import json
+from urllib.parse import urlparse
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.selector_race import first_visible
+
+
+# A selector that missed this often without ever matching is tried last
+DEMOTE_AFTER_MISSES = 3
+
+# ... and reported as dead
+DEAD_AFTER_MISSES = 10
+
+
+def environment_of(url: str) -> str:
+    """Environment a page is on: 'stage' for *.stage.viewz.co, else 'production'"""
+    host = (urlparse(url).hostname or "").lower()
+    if not host:
+        return "stage" if os.getenv("TEST_ENV", "prod").lower() == "stage" else "production"
+    return "stage" if ".stage." in f".{host}" else "production"
+
+
+class SelectorResolver:
+    """Orders fallback selector lists by past hits and records what matched"""
+
+    def __init__(self, path: str = ".selector_cache/selector_stats.json"):
+        """
+        Initialize selector resolver
+
+        Args:
+            path: JSON file the hit/miss statistics persist to
+        """
+        self.path = path
+        self._stats: Optional[Dict] = None
+        # Increments since the last save, merged into the file on save()
+        self._pending: Dict = {}
+        self.lookups = 0
+        self.round_trips = 0
+
+    @property
+    def stats(self) -> Dict:
+        if self._stats is None:
+            try:
+                with open(self.path, "r") as f:
+                    self._stats = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._stats = {}
+        return self._stats
+
+    @staticmethod
+    def _entry(store: Dict, environment: str, key: str) -> Dict:
+        return store.setdefault(environment, {}).setdefault(key, {"winner": None, "selectors": {}})
+
+    def ordered(self, environment: str, key: str, selectors: List[str]) -> List[str]:
+        """
+        Order in which to probe a fallback list
+
+        Last winner first, then selectors that matched before (most hits
+        first), then untried ones, then demoted ones - each group in the
+        page object's own order.
+        """
+        entry = self.stats.get(environment, {}).get(key, {})
+        winner = entry.get("winner")
+        counts = entry.get("selectors", {})
+
+        def rank(item: Tuple[int, str]):
+            index, selector = item
+            hits = counts.get(selector, {}).get("hits", 0)
+            misses = counts.get(selector, {}).get("misses", 0)
+            if selector == winner:
+                return (0, 0, index)
+            if hits:
+                return (1, -hits, index)
+            if misses >= DEMOTE_AFTER_MISSES:
+                return (3, 0, index)
+            return (2, 0, index)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+
+    def record(self, environment: str, key: str, missed: List[str], winner: Optional[str]):
+        """
+        Record one lookup
+
+        Args:
+            environment: Environment the lookup ran on
+            key: Page-object attribute, e.g. "InvoicingPage.nav_selectors"
+            missed: Selectors probed without a match
+            winner: Selector that matched, None if none did
+        """
+        for store in (self.stats, self._pending):
+            entry = self._entry(store, environment, key)
+            for selector in missed:
+                counts = entry["selectors"].setdefault(selector, {"hits": 0, "misses": 0})
+                counts["misses"] += 1
+            if winner:
+                counts = entry["selectors"].setdefault(winner, {"hits": 0, "misses": 0})
+                counts["hits"] += 1
+                entry["winner"] = winner
+
+    def reject(self, environment: str, key: str, selector: str):
+        """
+        Turn the hit just recorded for selector into a miss
+
+        For a match whose element could not be acted on (click intercepted,
+        element detached): it stops being the winner.
+        """
+        for store in (self.stats, self._pending):
+            entry = self._entry(store, environment, key)
+            counts = entry["selectors"].setdefault(selector, {"hits": 0, "misses": 0})
+            counts["hits"] = max(0, counts["hits"] - 1)
+            counts["misses"] += 1
+            if entry["winner"] == selector:
+                entry["winner"] = None
+
+    def forget_winner(self, environment: str, key: str):
+        """
+        Drop the learned winner of a list for the rest of the run
+
+        For lists whose matching selector depends on app state (e.g. the entity
+        button labelled with the current entity): the next lookup races the
+        list instead of probing a winner that no longer matches. Hit/miss
+        counts are kept.
+        """
+        entry = self.stats.get(environment, {}).get(key)
+        if entry:
+            entry["winner"] = None
+
+    async def first_visible(self, page, key: str, selectors: List[str]):
+        """
+        Find the first visible element of a fallback list, learned winner first
+
+        The learned winner is probed on its own; if there is none or it
+        missed, the remaining selectors are raced in one round trip.
+
+        Args:
+            page: Playwright page
+            key: Page-object attribute the list comes from
+            selectors: The fallback list
+
+        Returns:
+            tuple: (selector, locator) of the match, or (None, None)
+        """
+        environment = environment_of(page.url)
+        candidates = self.ordered(environment, key, selectors)
+        winner = self.stats.get(environment, {}).get(key, {}).get("winner")
+        missed = []
+        self.lookups += 1
+
+        if candidates and candidates[0] == winner:
+            self.round_trips += 1
+            index, element = await first_visible(page, candidates[:1])
+            if element is not None:
+                self.record(environment, key, missed, winner)
+                return winner, element.first
+            missed, candidates = candidates[:1], candidates[1:]
+
+        if candidates:
+            self.round_trips += 1
+            index, element = await first_visible(page, candidates)
+            if element is not None:
+                self.record(environment, key, missed + candidates[:index], candidates[index])
+                return candidates[index], element.first
+            missed += candidates
+
+        self.record(environment, key, missed, None)
+        return None, None
+
+    async def act_on_first_visible(self, page, key: str, selectors: List[str],
+                                   action: Callable[[object], Awaitable]) -> Optional[str]:
+        """
+        Run action (e.g. a click) on the first visible element of a fallback list
+
+        When the action fails on a match, that match is rejected and the
+        remaining selectors are resolved again, like the page objects' old
+        try/except-continue loops.
+
+        Args:
+            page: Playwright page
+            key: Page-object attribute the list comes from
+            selectors: The fallback list
+            action: Coroutine function taking the matched locator
+
+        Returns:
+            str: Selector whose element took the action, None if none did
+        """
+        environment = environment_of(page.url)
+        remaining = list(selectors)
+        while remaining:
+            selector, element = await self.first_visible(page, key, remaining)
+            if element is None:
+                return None
+            try:
+                await action(element)
+                return selector
+            except Exception as e:
+                print(f"⚠️ {selector} matched but failed: {str(e)[:50]}")
+                self.reject(environment, key, selector)
+                remaining.remove(selector)
+        return None
+
+    def dead_selectors(self, min_misses: int = DEAD_AFTER_MISSES) -> Dict[str, Dict[str, List[str]]]:
+        """Selectors that never matched in at least min_misses probes, per environment and key"""
+        dead: Dict[str, Dict[str, List[str]]] = {}
+        for environment, keys in self.stats.items():
+            for key, entry in keys.items():
+                never_hit = [selector for selector, counts in entry["selectors"].items()
+                             if counts["hits"] == 0 and counts["misses"] >= min_misses]
+                if never_hit:
+                    dead.setdefault(environment, {})[key] = never_hit
+        return dead
+
+    def report(self) -> str:
+        """Dead selector report"""
+        dead = self.dead_selectors()
+        if not dead:
+            return "🎯 Selector resolver: no dead selectors"
+        total = sum(len(selectors) for keys in dead.values() for selectors in keys.values())
+        lines = [f"🎯 Selector resolver: {total} dead selector(s) (never matched in "
+                 f"{DEAD_AFTER_MISSES}+ probes)"]
+        for environment, keys in sorted(dead.items()):
+            for key, selectors in sorted(keys.items()):
+                lines.append(f"   [{environment}] {key}:")
+                lines.extend(f"      - {selector}" for selector in selectors)
+        return "\n".join(lines)
+
+    def summary(self) -> str:
+        """Round trips per lookup this run (1.0 means every learned winner still matched)"""
+        per_lookup = self.round_trips / self.lookups if self.lookups else 0
+        return (f"🎯 Selector resolver: {self.lookups} lookup(s), {self.round_trips} round trip(s), "
+                f"{per_lookup:.1f} per lookup")
+
+    def save(self):
+        """Merge this run's hits/misses into the file (other workers may have written too)"""
+        if not self._pending:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        try:
+            with open(self.path, "r") as f:
+                merged = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            merged = {}
+
+        for environment, keys in self._pending.items():
+            for key, pending in keys.items():
+                entry = self._entry(merged, environment, key)
+                for selector, counts in pending["selectors"].items():
+                    target = entry["selectors"].setdefault(selector, {"hits": 0, "misses": 0})
+                    target["hits"] += counts["hits"]
+                    target["misses"] += counts["misses"]
+                if pending["winner"]:
+                    entry["winner"] = pending["winner"]
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(merged, f, indent=2)
+        os.replace(tmp_path, self.path)
+        self._stats = merged
+        self._pending = {}
+
+
+# Global instance
+selector_resolver = SelectorResolver()
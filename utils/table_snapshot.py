@@ -0,0 +1,138 @@
+"""
+Table Snapshot
+Reads a whole rendered grid in ONE in-page script instead of a driver round
+trip per row and per cell (rows.nth(i) -> cells.nth(j).inner_text()), with no
+row cap:
+
+- rows come from the first row selector that matches any rows with cells
+  (semantic tables and ARIA grids first, then div-based fallbacks); rows that
+  are not rendered (display: none) and rows without any text are skipped
+- only a row's own cells are read - cells of a table nested inside a cell
+  stay in that cell's text, and the nested table's rows are not rows of
+  the grid
+- cell text is the visible text with nested duplicate lines dropped (a cell
+  showing "Acme\nAcme" becomes "Acme"), the same cleanup the tests did
+  cell by cell
+- each row carries the key the grid gives it (data-row-key, data-id, ...),
+  None if it has none, so paginated or virtualised reads can be de-duplicated
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+from utils.wait_engine import WaitEngine
+
+
+# Row selectors in order of preference; the first with rows wins
+ROW_SELECTORS = (
+    "table tbody tr, [role='row']",
+    ".data-row, .table-row, tr[data-row-key]",
+)
+
+CELL_SELECTOR = "td, [role='cell'], [role='gridcell']"
+
+HEADER_SELECTOR = "thead th, [role='columnheader']"
+
+# Attributes a grid uses to identify its rows, in order of preference
+ROW_KEY_ATTRIBUTES = ("data-row-key", "data-id", "data-rowid", "row-id", "aria-rowindex", "data-rowindex")
+
+TABLE_SNAPSHOT_JS = """
+({ rowSelectors, cellSelector, headerSelector, keyAttributes }) => {
+    const start = performance.now();
+    const rowOf = "tr, [role='row']";
+    const rendered = el => el.getClientRects().length > 0;
+    const clean = el => {
+        const text = (el.innerText || el.textContent || '').split('\\n');
+        const lines = [];
+        for (const line of text.map(l => l.trim())) {
+            if (line && !lines.includes(line)) lines.push(line);
+        }
+        return lines.join(' ');
+    };
+    // A row's own cells - not the cells of a table nested inside one of them
+    const cellsOf = row => [...row.querySelectorAll(cellSelector)].filter(cell => cell.closest(rowOf) === row);
+
+    // Rows of a table nested inside a cell of another matched row
+    const nested = (row, matched) => {
+        const cell = row.parentElement && row.parentElement.closest(cellSelector);
+        return !!cell && matched.has(cell.closest(rowOf));
+    };
+
+    let used = null, rows = [];
+    for (const selector of rowSelectors) {
+        const matched = new Set(document.querySelectorAll(selector));
+        rows = [...matched].filter(row => rendered(row) && cellsOf(row).length && !nested(row, matched));
+        if (rows.length) { used = selector; break; }
+    }
+
+    const data = [];
+    for (const row of rows) {
+        const cells = cellsOf(row).map(clean);
+        if (!cells.some(Boolean)) continue;
+        const attribute = keyAttributes.find(name => row.hasAttribute(name));
+        data.push({ key: attribute ? row.getAttribute(attribute) : null, cells });
+    }
+
+    const headers = [...document.querySelectorAll(headerSelector)].filter(rendered).map(clean);
+    return { selector: used, headers, rows: data, ms: performance.now() - start };
+}
+"""
+
+
+class TableSnapshot:
+    """Headers, rows and row keys of one read of a grid"""
+
+    def __init__(self, headers: List[str], rows: List[List[str]], keys: List[Optional[str]],
+                 selector: Optional[str] = None, seconds: float = 0.0, script_ms: float = 0.0):
+        self.headers = headers
+        self.rows = rows
+        self.keys = keys
+        self.selector = selector
+        self.seconds = seconds
+        self.script_ms = script_ms
+
+    def __len__(self):
+        return len(self.rows)
+
+    def records(self) -> List[Dict[str, str]]:
+        """Rows as dicts by header (columns beyond the headers are dropped)"""
+        return [dict(zip(self.headers, row)) for row in self.rows]
+
+    def summary(self) -> str:
+        return (f"📊 Table snapshot: {len(self.rows)} rows x {len(self.headers) or '?'} columns in "
+                f"{self.seconds * 1000:.0f}ms ({self.script_ms:.0f}ms in page, 1 round trip)")
+
+
+async def snapshot_table(page, row_selectors: Sequence[str] = ROW_SELECTORS,
+                         cell_selector: str = CELL_SELECTOR, header_selector: str = HEADER_SELECTOR,
+                         wait_for_rows: bool = True) -> TableSnapshot:
+    """
+    Read the whole rendered grid of a page
+
+    Args:
+        page: Playwright page
+        row_selectors: Row selectors in order of preference
+        cell_selector: Selector of a row's cells
+        header_selector: Selector of the column headers
+        wait_for_rows: Let the row count settle first (after navigation/filter/pagination)
+
+    Returns:
+        TableSnapshot: Every rendered row with text, no row cap
+    """
+    if wait_for_rows:
+        await WaitEngine(page).row_count_stable(row_selectors[0])
+    start = time.perf_counter()
+    result = await page.evaluate(TABLE_SNAPSHOT_JS, {
+        "rowSelectors": list(row_selectors),
+        "cellSelector": cell_selector,
+        "headerSelector": header_selector,
+        "keyAttributes": list(ROW_KEY_ATTRIBUTES),
+    })
+    return TableSnapshot(
+        headers=result["headers"],
+        rows=[row["cells"] for row in result["rows"]],
+        keys=[row["key"] for row in result["rows"]],
+        selector=result["selector"],
+        seconds=time.perf_counter() - start,
+        script_ms=result["ms"],
+    )
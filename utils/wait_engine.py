@@ -0,0 +1,291 @@
+"""
+Condition-Based Wait Engine
+Replaces fixed asyncio.sleep()/wait_for_timeout() pauses in page objects with
+waits that return as soon as the UI is ready: DOM mutations have stopped,
+in-flight XHR/fetch calls have settled, a dialog or toast appeared or went
+away, or a table stopped changing row count. Every wait has an upper bound,
+shortened to the test's remaining deadline budget, and records how long it
+actually waited.
+"""
+
+import sys
+import time
+import asyncio
+import weakref
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from utils.deadline import budget_timeout, charge
+
+
+# Upper bounds (ms) per primitive; override per engine or per call
+DEFAULT_TIMEOUTS = {
+    "dom_quiet": 3000,
+    "network_idle": 10000,
+    "dialog": 5000,
+    "toast": 5000,
+    "element": 5000,
+    "row_count": 5000,
+}
+
+# Radix/shadcn dialogs, sheets and alert dialogs used across the app
+DIALOG_SELECTOR = "[role='dialog'], [role='alertdialog']"
+
+# Sonner toasts (app default) plus generic status/alert regions
+TOAST_SELECTOR = "[data-sonner-toast], li[role='status'], [role='alert'], .Toastify__toast"
+
+# Resolves once no DOM mutation happened for quietMs, or false at timeoutMs
+DOM_QUIET_JS = """
+({ quietMs, timeoutMs }) => new Promise(resolve => {
+    const start = performance.now();
+    let lastMutation = start;
+    const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+    observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+    const check = () => {
+        const now = performance.now();
+        if (now - lastMutation >= quietMs) {
+            observer.disconnect();
+            resolve(true);
+        } else if (now - start >= timeoutMs) {
+            observer.disconnect();
+            resolve(false);
+        } else {
+            setTimeout(check, Math.min(50, quietMs));
+        }
+    };
+    setTimeout(check, Math.min(50, quietMs));
+})
+"""
+
+
+class WaitTelemetry:
+    """Time actually spent in each wait primitive, per calling page-object method"""
+
+    def __init__(self):
+        self.records: List[Dict] = []
+
+    def record(self, primitive: str, caller: str, waited: float, bound: float, met: bool):
+        self.records.append({
+            "primitive": primitive,
+            "caller": caller,
+            "waited_ms": round(waited * 1000),
+            "bound_ms": round(bound),
+            "met": met,
+        })
+
+    def summary(self, top: int = 10) -> str:
+        """Totals per primitive and the callers that waited longest"""
+        if not self.records:
+            return "⏱️ Wait engine: no waits recorded"
+        by_primitive = defaultdict(lambda: [0, 0, 0])
+        by_caller = defaultdict(int)
+        for record in self.records:
+            stats = by_primitive[record["primitive"]]
+            stats[0] += 1
+            stats[1] += record["waited_ms"]
+            stats[2] += 0 if record["met"] else 1
+            by_caller[record["caller"]] += record["waited_ms"]
+
+        lines = [f"⏱️ Wait engine: {len(self.records)} waits, "
+                 f"{sum(r['waited_ms'] for r in self.records) / 1000:.1f}s waited"]
+        for primitive, (count, waited_ms, timed_out) in sorted(by_primitive.items()):
+            lines.append(f"   {primitive:<13} {count:>5}x {waited_ms / 1000:>7.1f}s"
+                         f"{f'  ({timed_out} hit the bound)' if timed_out else ''}")
+        lines.append("   Longest waiting callers:")
+        for caller, waited_ms in sorted(by_caller.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"   {waited_ms / 1000:>7.1f}s  {caller}")
+        return "\n".join(lines)
+
+
+class _RequestTracker:
+    """Counts a page's in-flight XHR/fetch requests"""
+
+    TRACKED_TYPES = ("xhr", "fetch")
+
+    def __init__(self, page):
+        self.in_flight = set()
+        self.last_activity = time.monotonic()
+        page.on("request", self._started)
+        page.on("requestfinished", self._ended)
+        page.on("requestfailed", self._ended)
+
+    def _started(self, request):
+        if request.resource_type in self.TRACKED_TYPES:
+            self.in_flight.add(request)
+            self.last_activity = time.monotonic()
+
+    def _ended(self, request):
+        if request in self.in_flight:
+            self.in_flight.discard(request)
+            self.last_activity = time.monotonic()
+
+
+# One request tracker per page, however many page objects wrap it
+_request_trackers = weakref.WeakKeyDictionary()
+
+
+class WaitEngine:
+    """Bounded, condition-based waits for one Playwright page"""
+
+    def __init__(self, page, timeouts: Optional[Dict[str, float]] = None):
+        """
+        Initialize wait engine
+
+        Args:
+            page: Playwright page
+            timeouts: Per-primitive upper bounds in ms, merged over DEFAULT_TIMEOUTS
+        """
+        self.page = page
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        if page not in _request_trackers:
+            _request_trackers[page] = _RequestTracker(page)
+        self.requests = _request_trackers[page]
+
+    @staticmethod
+    def _caller() -> str:
+        """Page-object method that asked for the wait, e.g. InvoicingPage.create_customer"""
+        frame = sys._getframe(1)
+        # Skip this module and the --profile-waits wrappers around it
+        while frame.f_back and frame.f_globals.get("__name__", "").startswith("utils.wait_"):
+            frame = frame.f_back
+        owner = frame.f_locals.get("self")
+        name = frame.f_code.co_name
+        return f"{type(owner).__name__}.{name}" if owner is not None else name
+
+    def _bound(self, primitive: str, timeout: Optional[float]) -> float:
+        """Upper bound of a wait, shortened to what is left of the test's deadline"""
+        return budget_timeout(timeout if timeout is not None else self.timeouts[primitive])
+
+    def _record(self, primitive: str, start: float, bound: float, met: bool):
+        caller = self._caller()
+        waited = time.perf_counter() - start
+        wait_telemetry.record(primitive, caller, waited, bound, met)
+        charge(waited, caller)
+        return met
+
+    async def dom_quiet(self, quiet_ms: int = 300, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the DOM has not changed for quiet_ms
+
+        Args:
+            quiet_ms: Mutation-free period that counts as settled
+            timeout: Upper bound in ms
+
+        Returns:
+            bool: True if the DOM settled within the bound
+        """
+        bound = self._bound("dom_quiet", timeout)
+        start = time.perf_counter()
+        try:
+            met = await self.page.evaluate(DOM_QUIET_JS, {"quietMs": quiet_ms, "timeoutMs": bound})
+        except Exception:
+            # Navigation replaced the document mid-wait - wait for the new one instead
+            try:
+                await self.page.wait_for_load_state("domcontentloaded", timeout=bound)
+                met = True
+            except Exception:
+                met = False
+        return self._record("dom_quiet", start, bound, met)
+
+    async def network_idle(self, idle_ms: int = 300, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no XHR/fetch is in flight and none started for idle_ms
+
+        Args:
+            idle_ms: Request-free period that counts as settled
+            timeout: Upper bound in ms
+
+        Returns:
+            bool: True if the network settled within the bound
+        """
+        bound = self._bound("network_idle", timeout)
+        start = time.perf_counter()
+        deadline = time.monotonic() + bound / 1000
+        met = False
+        while time.monotonic() < deadline:
+            quiet_for = time.monotonic() - self.requests.last_activity
+            if not self.requests.in_flight and quiet_for * 1000 >= idle_ms:
+                met = True
+                break
+            await asyncio.sleep(0.05)
+        return self._record("network_idle", start, bound, met)
+
+    async def settled(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for pending API calls to finish and the resulting re-render to stop
+
+        The usual replacement for a fixed pause after navigation or an action.
+        """
+        network = await self.network_idle(timeout=timeout)
+        dom = await self.dom_quiet(timeout=timeout)
+        return network and dom
+
+    async def _wait_for_state(self, primitive: str, selector: str, state: str,
+                              timeout: Optional[float]) -> bool:
+        bound = self._bound(primitive, timeout)
+        start = time.perf_counter()
+        try:
+            await self.page.locator(selector).first.wait_for(state=state, timeout=bound)
+            met = True
+        except Exception:
+            met = False
+        return self._record(f"{primitive}_{state}", start, bound, met)
+
+    async def element_visible(self, selector: str, timeout: Optional[float] = None) -> bool:
+        """Wait for the first element matching selector to become visible"""
+        return await self._wait_for_state("element", selector, "visible", timeout)
+
+    async def element_hidden(self, selector: str, timeout: Optional[float] = None) -> bool:
+        """Wait for the first element matching selector to disappear"""
+        return await self._wait_for_state("element", selector, "hidden", timeout)
+
+    async def dialog_open(self, selector: str = DIALOG_SELECTOR, timeout: Optional[float] = None) -> bool:
+        """Wait for a dialog / sheet to appear"""
+        return await self._wait_for_state("dialog", selector, "visible", timeout)
+
+    async def dialog_closed(self, selector: str = DIALOG_SELECTOR, timeout: Optional[float] = None) -> bool:
+        """Wait for the open dialog / sheet to go away"""
+        return await self._wait_for_state("dialog", selector, "hidden", timeout)
+
+    async def toast_shown(self, selector: str = TOAST_SELECTOR, timeout: Optional[float] = None) -> bool:
+        """Wait for a toast notification to appear"""
+        return await self._wait_for_state("toast", selector, "visible", timeout)
+
+    async def toast_gone(self, selector: str = TOAST_SELECTOR, timeout: Optional[float] = None) -> bool:
+        """Wait for toast notifications to disappear"""
+        return await self._wait_for_state("toast", selector, "hidden", timeout)
+
+    async def row_count_stable(self, row_selector: str = "table tbody tr", stable_ms: int = 500,
+                               timeout: Optional[float] = None) -> int:
+        """
+        Wait until a table's row count stops changing (search/filter/pagination)
+
+        Args:
+            row_selector: Selector matching the table's rows
+            stable_ms: How long the count must stay the same
+            timeout: Upper bound in ms
+
+        Returns:
+            int: Last observed row count
+        """
+        bound = self._bound("row_count", timeout)
+        start = time.perf_counter()
+        deadline = time.monotonic() + bound / 1000
+        rows = self.page.locator(row_selector)
+        count = await rows.count()
+        stable_since = time.monotonic()
+        met = False
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+            current = await rows.count()
+            if current != count:
+                count, stable_since = current, time.monotonic()
+            elif (time.monotonic() - stable_since) * 1000 >= stable_ms:
+                met = True
+                break
+        self._record("row_count", start, bound, met)
+        return count
+
+
+# Global instance
+wait_telemetry = WaitTelemetry()
@@ -0,0 +1,250 @@
+"""
+Wait Profiler
+Opt-in (--profile-waits) accounting of where test time goes. While installed,
+asyncio.sleep, Playwright's page wait_for_* calls, locator.wait_for, the wait
+engine primitives and locator actions that run into their timeout are timed
+and attributed to the page-object method that called them
+(e.g. InvoicingPage._click_save). Each test's remaining time counts as active.
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import functools
+import contextvars
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from playwright.async_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
+
+from utils.wait_engine import WaitEngine
+
+
+# Page methods that only wait
+PAGE_WAIT_METHODS = ("wait_for_timeout", "wait_for_load_state", "wait_for_selector",
+                     "wait_for_url", "wait_for_function")
+
+# Locator actions that auto-wait; only the time of calls that hit their timeout is idle
+LOCATOR_ACTION_METHODS = ("click", "dblclick", "fill", "type", "press", "check", "uncheck",
+                          "hover", "select_option", "text_content", "inner_text",
+                          "input_value", "scroll_into_view_if_needed")
+
+WAIT_ENGINE_METHODS = ("dom_quiet", "network_idle", "_wait_for_state", "row_count_stable")
+
+# Set while a profiled wait runs, so the sleeps inside it are not counted twice
+_inside_wait = contextvars.ContextVar("inside_wait", default=False)
+
+OUTSIDE_TESTS = "(outside tests)"
+
+
+# Frames that never count as the caller of a wait
+LIBRARY_MODULES = ("asyncio", "playwright", "pytest_asyncio", "_pytest", "pluggy", "utils.wait_engine")
+
+
+def find_caller(frame) -> Optional[str]:
+    """
+    Name the code a wait is charged to
+
+    The innermost page-object method (a `self` in a pages.* module) wins;
+    otherwise the innermost test function, otherwise the direct caller.
+    None for waits issued by library internals alone (e.g. Playwright's own
+    sleeps), which are not profiled.
+    """
+    direct = None
+    test_function = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != __name__ and not module.startswith(LIBRARY_MODULES):
+            name = frame.f_code.co_name
+            if direct is None:
+                direct = f"{module}.{name}"
+            owner = frame.f_locals.get("self")
+            if module.startswith("pages.") and owner is not None:
+                return f"{type(owner).__name__}.{name}"
+            if test_function is None and name.startswith("test_"):
+                test_function = name
+        frame = frame.f_back
+    return test_function or direct
+
+
+class _TestProfile:
+
+    def __init__(self, nodeid: str):
+        self.nodeid = nodeid
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        # caller -> kind -> [calls, seconds]
+        self.waits: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(lambda: [0, 0.0]))
+
+    @property
+    def idle(self) -> float:
+        return sum(seconds for kinds in self.waits.values() for _, seconds in kinds.values())
+
+    def to_dict(self) -> Dict:
+        methods = {
+            caller: {
+                "idle_s": round(sum(s for _, s in kinds.values()), 3),
+                "calls": sum(int(c) for c, _ in kinds.values()),
+                "by_kind": {kind: round(s, 3) for kind, (_, s) in sorted(kinds.items())},
+            }
+            for caller, kinds in self.waits.items()
+        }
+        return {
+            "duration_s": round(self.duration, 3),
+            "idle_s": round(self.idle, 3),
+            "active_s": round(max(self.duration - self.idle, 0), 3),
+            "methods": dict(sorted(methods.items(), key=lambda item: -item[1]["idle_s"])),
+        }
+
+
+class WaitProfiler:
+    """Patches the wait primitives and collects per-test, per-method idle time"""
+
+    def __init__(self):
+        self.installed = False
+        self.tests: Dict[str, _TestProfile] = {}
+        self.current: Optional[_TestProfile] = None
+        self.outside = _TestProfile(OUTSIDE_TESTS)
+        self._originals: List[Tuple[object, str, Callable]] = []
+
+    def install(self):
+        """Start profiling (idempotent)"""
+        if self.installed:
+            return
+        self._patch(asyncio, "sleep", "asyncio.sleep", idle_on_timeout_only=False)
+        for name in PAGE_WAIT_METHODS:
+            self._patch(Page, name, f"page.{name}", idle_on_timeout_only=False)
+        self._patch(Locator, "wait_for", "locator.wait_for", idle_on_timeout_only=False)
+        for name in LOCATOR_ACTION_METHODS:
+            self._patch(Locator, name, "locator timeout", idle_on_timeout_only=True)
+        for name in WAIT_ENGINE_METHODS:
+            self._patch(WaitEngine, name, f"wait_engine.{name.lstrip('_')}", idle_on_timeout_only=False)
+        self.installed = True
+
+    def uninstall(self):
+        """Restore the original functions"""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals = []
+        self.installed = False
+
+    def _patch(self, owner, name: str, kind: str, idle_on_timeout_only: bool):
+        original = getattr(owner, name)
+        profiler = self
+
+        @functools.wraps(original)
+        async def profiled(*args, **kwargs):
+            if _inside_wait.get():
+                return await original(*args, **kwargs)
+            caller = find_caller(sys._getframe(1))
+            if caller is None:
+                return await original(*args, **kwargs)
+            token = _inside_wait.set(True)
+            start = time.perf_counter()
+            timed_out = False
+            try:
+                return await original(*args, **kwargs)
+            except PlaywrightTimeoutError:
+                timed_out = True
+                raise
+            finally:
+                _inside_wait.reset(token)
+                if timed_out or not idle_on_timeout_only:
+                    profiler.record(caller, kind, time.perf_counter() - start)
+
+        self._originals.append((owner, name, original))
+        setattr(owner, name, profiled)
+
+    def record(self, caller: str, kind: str, seconds: float):
+        target = self.current or self.outside
+        stats = target.waits[caller][kind]
+        stats[0] += 1
+        stats[1] += seconds
+
+    def start_test(self, nodeid: str):
+        self.current = _TestProfile(nodeid)
+
+    def end_test(self):
+        if self.current is None:
+            return
+        self.current.duration = time.perf_counter() - self.current.start
+        self.tests[self.current.nodeid] = self.current
+        self.current = None
+
+    def method_totals(self) -> Dict[str, Dict]:
+        """Idle time per caller over the whole run"""
+        totals: Dict[str, Dict] = defaultdict(lambda: {"idle_s": 0.0, "calls": 0, "tests": 0,
+                                                        "by_kind": defaultdict(float)})
+        for profile in [*self.tests.values(), self.outside]:
+            for caller, kinds in profile.waits.items():
+                entry = totals[caller]
+                entry["tests"] += 1
+                for kind, (calls, seconds) in kinds.items():
+                    entry["idle_s"] += seconds
+                    entry["calls"] += int(calls)
+                    entry["by_kind"][kind] += seconds
+        return {
+            caller: {"idle_s": round(entry["idle_s"], 3), "calls": entry["calls"], "tests": entry["tests"],
+                     "by_kind": {kind: round(s, 3) for kind, s in sorted(entry["by_kind"].items())}}
+            for caller, entry in sorted(totals.items(), key=lambda item: -item[1]["idle_s"])
+        }
+
+    def report(self) -> Dict:
+        """Everything collected, as written to the JSON report"""
+        duration = sum(profile.duration for profile in self.tests.values())
+        idle = sum(profile.idle for profile in self.tests.values())
+        return {
+            "totals": {
+                "tests": len(self.tests),
+                "duration_s": round(duration, 3),
+                "idle_s": round(idle, 3),
+                "active_s": round(max(duration - idle, 0), 3),
+                "idle_outside_tests_s": round(self.outside.idle, 3),
+            },
+            "methods": self.method_totals(),
+            "tests": {nodeid: profile.to_dict() for nodeid, profile in self.tests.items()},
+        }
+
+    def summary(self, top: int = 15) -> str:
+        """Ranked text summary: slowest waiting methods and tests"""
+        report = self.report()
+        totals = report["totals"]
+        share = (totals["idle_s"] / totals["duration_s"] * 100) if totals["duration_s"] else 0
+        lines = [f"💤 Wait profile: {totals['tests']} test(s), {totals['duration_s']:.1f}s total, "
+                 f"{totals['idle_s']:.1f}s idle ({share:.0f}%), {totals['active_s']:.1f}s active"]
+
+        lines.append(f"   Top {top} methods by idle time:")
+        for rank, (caller, entry) in enumerate(list(report["methods"].items())[:top], 1):
+            kinds = ", ".join(f"{kind} {s:.1f}s" for kind, s in
+                              sorted(entry["by_kind"].items(), key=lambda item: -item[1])[:3])
+            lines.append(f"   {rank:>3}. {entry['idle_s']:>7.1f}s  {entry['calls']:>5} waits  {caller}  ({kinds})")
+
+        lines.append(f"   Top {top} tests by idle time:")
+        ranked = sorted(report["tests"].items(), key=lambda item: -item[1]["idle_s"])[:top]
+        for rank, (nodeid, entry) in enumerate(ranked, 1):
+            lines.append(f"   {rank:>3}. {entry['idle_s']:>7.1f}s idle / {entry['duration_s']:.1f}s  {nodeid}")
+        return "\n".join(lines)
+
+    def write(self, path: str) -> str:
+        """
+        Write the JSON report and the text summary next to it
+
+        Args:
+            path: JSON report path; the summary goes to the same name with .txt
+
+        Returns:
+            str: Text summary
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        summary = self.summary()
+        with open(f"{os.path.splitext(path)[0]}.txt", "w") as f:
+            f.write(summary + "\n")
+        return summary
+
+
+# Global instance
+wait_profiler = WaitProfiler()